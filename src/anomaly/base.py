@@ -3,15 +3,18 @@ Base Anomaly Detector Class
 
 Provides base class for all anomaly detectors with multiple detection methods.
 Thread-safe implementation with rolling window buffers.
+Z-score and IQR run on incremental window statistics (see rolling.py).
 """
 
+import math
 import threading
 import numpy as np
-from typing import Optional, List
+from typing import Optional
 from enum import Enum
-from collections import deque
 import logging
 
+from .rolling import RollingWindow, is_density_noise
+
 try:
     from sklearn.cluster import DBSCAN
     SKLEARN_AVAILABLE = True
@@ -21,11 +24,31 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def density_params(count: int, std: float, ptp: float):
+    """
+    DBSCAN parameters used for a window (shared by DBSCAN and DENSITY_1D).
+
+    Args:
+        count: Samples in the window
+        std: Window standard deviation
+        ptp: Window peak-to-peak (max - min)
+
+    Returns:
+        Tuple of (eps, min_samples)
+    """
+    # eps: fraction of spread, always positive (DBSCAN requires eps > 0)
+    eps = max(std * 0.5, ptp * 0.1, 1e-6)
+    # min_samples: 10% of buffer size, minimum 2
+    min_samples = max(2, int(count * 0.1))
+    return eps, min_samples
+
+
 class DetectionMethod(Enum):
     """Anomaly detection methods"""
     IQR = "iqr"
     Z_SCORE = "z_score"
     DBSCAN = "dbscan"
+    DENSITY_1D = "density_1d"
 
 
 class BaseAnomalyDetector:
@@ -50,7 +73,7 @@ class BaseAnomalyDetector:
         Args:
             sensor_name: Sensor name (e.g., 'serit_sapmasi')
             data_key: Key in data dictionary (e.g., 'serit_sapmasi')
-            method: Detection method (IQR, Z_SCORE, DBSCAN)
+            method: Detection method (IQR, Z_SCORE, DBSCAN, DENSITY_1D)
             buffer_size: Rolling window size
             min_samples: Minimum samples required for detection
         """
@@ -60,8 +83,8 @@ class BaseAnomalyDetector:
         self.buffer_size = buffer_size
         self.min_samples = min_samples
 
-        # Thread-safe data buffer
-        self._buffer = deque(maxlen=buffer_size)
+        # Thread-safe data buffer (ring buffer + incremental statistics)
+        self._window = RollingWindow(buffer_size)
         self._lock = threading.Lock()
 
         # Anomaly state
@@ -73,6 +96,7 @@ class BaseAnomalyDetector:
             DetectionMethod.IQR: self._detect_iqr,
             DetectionMethod.Z_SCORE: self._detect_z_score,
             DetectionMethod.DBSCAN: self._detect_dbscan,
+            DetectionMethod.DENSITY_1D: self._detect_density,
         }
 
         logger.debug(f"{sensor_name} detector initialized: method={method.value}, buffer={buffer_size}")
@@ -86,13 +110,15 @@ class BaseAnomalyDetector:
             is_cutting: Whether cutting is active
         """
         try:
+            value = float(value)
+            if not math.isfinite(value):
+                # NaN/inf would break the sorted window ordering
+                logger.debug(f"{self.sensor_name}: non-finite value ignored")
+                return
+
             with self._lock:
-                self._buffer.append({
-                    'value': float(value),
-                    'is_cutting': is_cutting,
-                    'timestamp': None  # Can be added if needed
-                })
-                self._last_value = float(value)
+                self._window.push(value)
+                self._last_value = value
         except Exception as e:
             logger.error(f"{self.sensor_name} data add error: {e}")
 
@@ -105,13 +131,7 @@ class BaseAnomalyDetector:
         """
         try:
             with self._lock:
-                if len(self._buffer) < self.min_samples:
-                    return False
-
-                # Extract values from buffer
-                values = [item['value'] for item in self._buffer]
-
-                if not values:
+                if len(self._window) < self.min_samples or len(self._window) == 0:
                     return False
 
                 # Detect using selected method
@@ -120,7 +140,7 @@ class BaseAnomalyDetector:
                     logger.warning(f"{self.sensor_name}: Unknown detection method: {self.method}")
                     return False
 
-                is_anomaly = detection_func(values)
+                is_anomaly = detection_func()
                 self._is_anomaly = is_anomaly
                 return is_anomaly
 
@@ -128,42 +148,40 @@ class BaseAnomalyDetector:
             logger.error(f"{self.sensor_name} detection error: {e}")
             return False
 
-    def _detect_iqr(self, values: List[float]) -> bool:
+    def _detect_iqr(self) -> bool:
         """
         IQR (Interquartile Range) anomaly detection.
 
         More robust to outliers than z-score.
         Anomalies are values outside Q1 - 1.5*IQR to Q3 + 1.5*IQR range.
-
-        Args:
-            values: Data list
+        Quartiles come from the sorted window (same values as np.percentile).
 
         Returns:
             True if anomaly detected
         """
         try:
-            if len(values) < 4:
+            window = self._window
+            if len(window) < 4:
                 return False
 
-            values_array = np.array(values)
-            q1 = np.percentile(values_array, 25)
-            q3 = np.percentile(values_array, 75)
+            q1 = window.quantile(0.25)
+            q3 = window.quantile(0.75)
             iqr = q3 - q1
 
             if iqr == 0:
                 # If IQR is zero, use standard deviation
-                std = np.std(values_array)
-                mean = np.mean(values_array)
+                std = window.std
+                mean = window.mean
                 if std == 0:
                     return False
                 # Anomaly if last value is > 3 sigma from mean
-                last_value = values[-1]
+                last_value = window.last
                 return abs(last_value - mean) > 3 * std
 
             # IQR method: values outside Q1 - 1.5*IQR and Q3 + 1.5*IQR are anomalies
             lower_bound = q1 - 1.5 * iqr
             upper_bound = q3 + 1.5 * iqr
-            last_value = values[-1]
+            last_value = window.last
 
             return last_value < lower_bound or last_value > upper_bound
 
@@ -171,32 +189,29 @@ class BaseAnomalyDetector:
             logger.error(f"{self.sensor_name} IQR detection error: {e}")
             return False
 
-    def _detect_z_score(self, values: List[float]) -> bool:
+    def _detect_z_score(self) -> bool:
         """
         Z-score anomaly detection.
 
         Fast statistical method using 3-sigma rule.
-        Assumes normal distribution.
-
-        Args:
-            values: Data list
+        Assumes normal distribution. Mean/std are maintained incrementally.
 
         Returns:
             True if anomaly detected
         """
         try:
-            if len(values) < 3:
+            window = self._window
+            if len(window) < 3:
                 return False
 
-            values_array = np.array(values)
-            mean = np.mean(values_array)
-            std = np.std(values_array)
+            mean = window.mean
+            std = window.std
 
             if std == 0:
                 return False
 
             # Calculate z-score of last value
-            last_value = values[-1]
+            last_value = window.last
             z_score = abs((last_value - mean) / std)
 
             # Anomaly if z-score > 3 (3-sigma rule)
@@ -206,7 +221,7 @@ class BaseAnomalyDetector:
             logger.error(f"{self.sensor_name} Z-score detection error: {e}")
             return False
 
-    def _detect_dbscan(self, values: List[float]) -> bool:
+    def _detect_dbscan(self) -> bool:
         """
         DBSCAN anomaly detection.
 
@@ -216,12 +231,22 @@ class BaseAnomalyDetector:
         - Points marked as noise are considered anomalies
 
         Most sophisticated method - can detect complex anomaly patterns.
+        Needs the full window, so this is the only O(n) method.
+
+        Returns:
+            True if anomaly detected (last value marked as noise)
+        """
+        return self._dbscan_decision(self._window.values())
+
+    def _dbscan_decision(self, values: np.ndarray) -> bool:
+        """
+        DBSCAN decision for an ordered window (oldest first).
 
         Args:
-            values: Data list
+            values: Window samples
 
         Returns:
-            True if anomaly detected (last value marked as noise)
+            True if the last value is marked as noise
         """
         try:
             if len(values) < 5:
@@ -247,18 +272,10 @@ class BaseAnomalyDetector:
             # DBSCAN parameters:
             # eps: Maximum distance between two samples to be considered neighbors
             # min_samples: Minimum points to form a cluster
-            # These should be tuned based on data distribution
-
-            # Dynamic eps calculation: fraction of standard deviation
+            # Dynamic: fraction of standard deviation / peak-to-peak
             std_value = np.std(values)
             ptp_value = np.max(values) - np.min(values)  # peak-to-peak (np.ptp removed in numpy 2.0)
-
-            # Ensure eps is always positive (DBSCAN requires eps > 0)
-            # Use a small minimum value when data has zero variance
-            eps = max(std_value * 0.5, ptp_value * 0.1, 1e-6)
-
-            # min_samples: 10% of buffer size, minimum 2
-            min_samples = max(2, int(len(values) * 0.1))
+            eps, min_samples = density_params(len(values), std_value, ptp_value)
 
             # Apply DBSCAN
             dbscan = DBSCAN(eps=eps, min_samples=min_samples, metric='euclidean')
@@ -290,6 +307,51 @@ class BaseAnomalyDetector:
             except:
                 return False
 
+    def _detect_density(self) -> bool:
+        """
+        1-D density anomaly detection (incremental DBSCAN equivalent).
+
+        Uses the same eps/min_samples rules as _detect_dbscan(), but decides
+        whether the newest point is DBSCAN noise by binary search on the
+        sorted window instead of clustering the whole window.
+
+        Returns:
+            True if anomaly detected (last value would be DBSCAN noise)
+        """
+        window = self._window
+        if len(window) < 5:
+            return False
+        return self._density_decision(window.sorted_values, window.last, window.std)
+
+    def _density_decision(self, sorted_values, last_value: float, std: float) -> bool:
+        """
+        Density decision for a sorted window.
+
+        Args:
+            sorted_values: Window samples in ascending order
+            last_value: Newest sample
+            std: Window standard deviation
+
+        Returns:
+            True if the newest sample would be DBSCAN noise
+        """
+        try:
+            count = len(sorted_values)
+            if count < 5:
+                return False
+
+            eps, min_samples = density_params(count, std, sorted_values[-1] - sorted_values[0])
+            is_anomaly = is_density_noise(sorted_values, last_value, eps, min_samples)
+
+            if is_anomaly:
+                logger.debug(f"{self.sensor_name}: density anomaly detected (eps: {eps:.3f})")
+
+            return is_anomaly
+
+        except Exception as e:
+            logger.error(f"{self.sensor_name} density detection error: {e}")
+            return False
+
     def get_last_value(self) -> Optional[float]:
         """Get last value (thread-safe)"""
         with self._lock:
@@ -308,10 +370,10 @@ class BaseAnomalyDetector:
     def clear_buffer(self) -> None:
         """Clear buffer (thread-safe)"""
         with self._lock:
-            self._buffer.clear()
+            self._window.clear()
             self._is_anomaly = False
 
     def get_buffer_size(self) -> int:
         """Get current buffer size (thread-safe)"""
         with self._lock:
-            return len(self._buffer)
+            return len(self._window)
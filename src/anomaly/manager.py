@@ -5,9 +5,13 @@ Manages all anomaly detectors with thread-safe operation and callback system.
 """
 
 import threading
-from typing import Dict, Optional, Callable
+from typing import Dict, Optional, Callable, Sequence
 import logging
 
+import numpy as np
+
+from .base import DetectionMethod
+from .batch import BatchRollingWindow
 from .detectors import (
     SeritSapmasiDetector,
     SeritMotorAkimDetector,
@@ -22,6 +26,22 @@ from .detectors import (
 
 logger = logging.getLogger(__name__)
 
+# (result key, detector name, data key) in processing order
+SENSOR_COLUMNS = (
+    ('SeritSapmasi', 'serit_sapmasi', 'serit_sapmasi'),
+    ('SeritAkim', 'serit_motor_akim', 'serit_motor_akim_a'),
+    ('SeritTork', 'serit_motor_tork', 'serit_motor_tork_percentage'),
+    ('KesmeHizi', 'serit_kesme_hizi', 'serit_kesme_hizi'),
+    ('IlerlemeHizi', 'serit_inme_hizi', 'serit_inme_hizi'),
+    ('TitresimX', 'titresim_x', 'ivme_olcer_x_hz'),
+    ('TitresimY', 'titresim_y', 'ivme_olcer_y_hz'),
+    ('TitresimZ', 'titresim_z', 'ivme_olcer_z_hz'),
+    ('SeritGerginligi', 'serit_gerginligi', 'serit_gerginligi_bar'),
+)
+
+# Data keys in SENSOR_COLUMNS order (input layout for process_values)
+SENSOR_DATA_KEYS = tuple(data_key for _, _, data_key in SENSOR_COLUMNS)
+
 
 class AnomalyManager:
     """
@@ -32,18 +52,30 @@ class AnomalyManager:
     - Thread-safe state management
     - Callback system for real-time UI updates
     - Runtime method switching
+    - Optional batch mode: one shared 2-D window, vectorized evaluation
     """
 
-    def __init__(self, buffer_size: int = 100, min_samples: int = 10):
+    def __init__(
+        self,
+        buffer_size: int = 100,
+        min_samples: int = 10,
+        batch_mode: bool = False,
+        sensor_methods: Optional[Dict[str, str]] = None
+    ):
         """
         Initialize anomaly manager.
 
         Args:
             buffer_size: Buffer size for each detector
             min_samples: Minimum samples required for detection
+            batch_mode: Evaluate all sensors in one vectorized pass over a
+                        shared window (detectors only supply method/DBSCAN)
+            sensor_methods: Detector name -> method name overrides
+                            (`anomaly_detection.sensors.*.method`)
         """
         self.buffer_size = buffer_size
         self.min_samples = min_samples
+        self.batch_mode = batch_mode
 
         # Thread-safe lock
         self._lock = threading.Lock()
@@ -88,6 +120,19 @@ class AnomalyManager:
             ),
         }
 
+        # Configured method overrides
+        for name, method_name in (sensor_methods or {}).items():
+            if name not in self.detectors:
+                logger.warning(f"Anomaly config: unknown sensor '{name}'")
+                continue
+            try:
+                method = DetectionMethod(method_name)
+            except ValueError:
+                logger.warning(f"Anomaly config: unknown method '{method_name}' for {name}")
+                continue
+            if method != self.detectors[name].method:
+                self.detectors[name].set_method(method)
+
         # Anomaly states (keys match pyside_sensor.py)
         self.anomaly_states = {
             'SeritSapmasi': False,
@@ -101,10 +146,17 @@ class AnomalyManager:
             'SeritTork': False,
         }
 
+        # Batch mode: shared (sensors x samples) window
+        self._batch_window: Optional[BatchRollingWindow] = None
+        self._batch_lock = threading.Lock()
+        self._column_detectors = [self.detectors[name] for _, name, _ in SENSOR_COLUMNS]
+        if batch_mode:
+            self._batch_window = BatchRollingWindow(len(SENSOR_COLUMNS), buffer_size)
+
         # Callback function for UI updates
         self._update_callback: Optional[Callable[[str, bool], None]] = None
 
-        logger.info("AnomalyManager initialized")
+        logger.info(f"AnomalyManager initialized ({'batch' if batch_mode else 'per-detector'} mode)")
         logger.info(f"  - Detector count: {len(self.detectors)}")
         logger.info(f"  - Buffer size: {buffer_size}")
         logger.info(f"  - Min samples: {min_samples}")
@@ -130,6 +182,13 @@ class AnomalyManager:
         Returns:
             Anomaly states dictionary
         """
+        if self.batch_mode:
+            return self.process_values(
+                [data.get(key, np.nan) for key in SENSOR_DATA_KEYS],
+                is_cutting,
+                present=[key in data for key in SENSOR_DATA_KEYS]
+            )
+
         try:
             results = {}
 
@@ -197,24 +256,78 @@ class AnomalyManager:
                 is_anomaly = self.detectors['serit_gerginligi'].detect()
                 results['SeritGerginligi'] = is_anomaly
 
-            # Update all anomaly states atomically (single lock acquisition)
-            with self._lock:
-                self.anomaly_states.update(results)
+            self._publish_results(results)
+            return results
 
-            # Call callback for each result (outside lock)
-            if self._update_callback:
-                for key, is_anomaly in results.items():
-                    try:
-                        self._update_callback(key, is_anomaly)
-                    except Exception as e:
-                        logger.error(f"Anomaly callback error ({key}): {e}")
+        except Exception as e:
+            logger.error(f"AnomalyManager process_data error: {e}")
+            return {}
 
+    def process_values(
+        self,
+        values: Sequence[float],
+        is_cutting: bool = False,
+        present: Optional[Sequence[bool]] = None
+    ) -> Dict[str, bool]:
+        """
+        Batch mode: process one sample per sensor in a single vectorized pass.
+
+        Args:
+            values: Sensor values in SENSOR_DATA_KEYS order (non-finite values
+                    are not added to the window)
+            is_cutting: Whether cutting is active
+            present: Sensors to report (default: all)
+
+        Returns:
+            Anomaly states dictionary
+        """
+        try:
+            row = np.array(values, dtype=np.float64)
+
+            with self._batch_lock:
+                window = self._batch_window
+                window.push(row)
+                methods = [detector.method for detector in self._column_detectors]
+                decisions = window.evaluate(methods, self.min_samples, self._dispatch_column)
+
+            results = {
+                SENSOR_COLUMNS[col][0]: bool(decisions[col])
+                for col in range(len(SENSOR_COLUMNS))
+                if present is None or present[col]
+            }
+
+            self._publish_results(results)
             return results
 
         except Exception as e:
-            logger.error(f"AnomalyManager process_data error: {e}")
+            logger.error(f"AnomalyManager process_values error: {e}")
             return {}
 
+    def _dispatch_column(self, col: int, values: np.ndarray) -> bool:
+        """Per-column dispatch for methods without a vectorized form."""
+        detector = self._column_detectors[col]
+        if detector.method == DetectionMethod.DBSCAN:
+            return detector._dbscan_decision(values)
+        if detector.method == DetectionMethod.DENSITY_1D:
+            return detector._density_decision(
+                sorted(values.tolist()), float(values[-1]), self._batch_window.column_std(col)
+            )
+        return False
+
+    def _publish_results(self, results: Dict[str, bool]) -> None:
+        """Store anomaly states and notify the UI callback."""
+        # Update all anomaly states atomically (single lock acquisition)
+        with self._lock:
+            self.anomaly_states.update(results)
+
+        # Call callback for each result (outside lock)
+        if self._update_callback:
+            for key, is_anomaly in results.items():
+                try:
+                    self._update_callback(key, is_anomaly)
+                except Exception as e:
+                    logger.error(f"Anomaly callback error ({key}): {e}")
+
     def get_anomaly_states(self) -> Dict[str, bool]:
         """
         Get current anomaly states (thread-safe).
@@ -235,6 +348,10 @@ class AnomalyManager:
             for detector in self.detectors.values():
                 detector.clear_buffer()
 
+        if self._batch_window is not None:
+            with self._batch_lock:
+                self._batch_window.clear()
+
         logger.info("AnomalyManager: All anomaly states reset")
 
     def get_detector(self, sensor_name: str):
@@ -306,8 +423,17 @@ class AnomalyManager:
                 name: detector.method.value
                 for name, detector in self.detectors.items()
             }
-            stats['buffer_fills'] = {
-                name: f"{detector.get_buffer_size()}/{detector.buffer_size}"
-                for name, detector in self.detectors.items()
-            }
+            if self._batch_window is not None:
+                with self._batch_lock:
+                    counts = self._batch_window.counts.tolist()
+                stats['buffer_fills'] = {
+                    name: f"{count}/{self.buffer_size}"
+                    for (_, name, _), count in zip(SENSOR_COLUMNS, counts)
+                }
+            else:
+                stats['buffer_fills'] = {
+                    name: f"{detector.get_buffer_size()}/{detector.buffer_size}"
+                    for name, detector in self.detectors.items()
+                }
+            stats['batch_mode'] = self.batch_mode
         return stats
@@ -0,0 +1,247 @@
+"""
+Streaming Rolling Statistics
+
+Fixed-size rolling window with incremental statistics for the anomaly
+detectors. Replaces per-cycle list rebuilds and full np.mean/np.std/
+np.percentile passes with:
+
+- Ring buffer: preallocated NumPy array, O(1) push/evict
+- Mean/variance: Welford's algorithm with removal, O(1) per sample
+- Quantiles: sorted window (bisect insert/remove), O(log n) search and
+  O(1) lookup; interpolation matches np.percentile (linear) exactly
+- Min/max: ends of the sorted window, O(1)
+- 1-D density (DBSCAN) noise test for the newest point: binary search on
+  the sorted window, see is_density_noise()
+
+Welford updates accumulate rounding error over long runs, so mean/M2 are
+recomputed from the ring once per `capacity` evictions (amortized O(1)).
+"""
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class RollingWindow:
+    """
+    Rolling window of the last `capacity` float samples.
+
+    Not thread-safe: callers (BaseAnomalyDetector) hold their own lock.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize rolling window.
+
+        Args:
+            capacity: Maximum number of samples kept
+        """
+        if capacity < 1:
+            raise ValueError("RollingWindow capacity must be >= 1")
+
+        self.capacity = int(capacity)
+        self._ring = np.zeros(self.capacity, dtype=np.float64)
+        self._head = 0          # Next write position
+        self._count = 0
+
+        self._sorted: List[float] = []
+
+        # Welford accumulators
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._evictions_since_resync = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push(self, value: float) -> Optional[float]:
+        """
+        Append a sample, evicting the oldest one when full.
+
+        Args:
+            value: New sample
+
+        Returns:
+            Evicted sample, or None if the window was not full
+        """
+        value = float(value)
+        evicted: Optional[float] = None
+
+        if self._count == self.capacity:
+            evicted = float(self._ring[self._head])
+            del self._sorted[bisect_left(self._sorted, evicted)]
+            self._ring[self._head] = value
+            insort(self._sorted, value)
+
+            # Replace evicted with value in one Welford step (count unchanged)
+            old_mean = self._mean
+            self._mean = old_mean + (value - evicted) / self._count
+            self._m2 += (value - evicted) * (value - self._mean + evicted - old_mean)
+
+            self._evictions_since_resync += 1
+            if self._evictions_since_resync >= self.capacity:
+                self._resync()
+        else:
+            self._ring[self._head] = value
+            insort(self._sorted, value)
+            self._count += 1
+
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+
+        self._head = (self._head + 1) % self.capacity
+        return evicted
+
+    def _resync(self):
+        """Recompute Welford accumulators from the ring (drops drift)."""
+        window = self._ring[:self._count]
+        self._mean = float(np.mean(window))
+        self._m2 = float(np.sum((window - self._mean) ** 2))
+        self._evictions_since_resync = 0
+
+    def clear(self):
+        """Remove all samples."""
+        self._head = 0
+        self._count = 0
+        self._sorted.clear()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._evictions_since_resync = 0
+
+    @property
+    def last(self) -> Optional[float]:
+        """Most recent sample."""
+        if self._count == 0:
+            return None
+        return float(self._ring[(self._head - 1) % self.capacity])
+
+    @property
+    def mean(self) -> float:
+        """Window mean."""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Population variance (ddof=0, like np.var)."""
+        if self._count == 0 or self.is_constant():
+            return 0.0
+        return max(self._m2, 0.0) / self._count
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation (ddof=0, like np.std)."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """Smallest sample in the window."""
+        return self._sorted[0]
+
+    @property
+    def max(self) -> float:
+        """Largest sample in the window."""
+        return self._sorted[-1]
+
+    def is_constant(self) -> bool:
+        """True if every sample in the window is identical (exact)."""
+        return self._count > 0 and self._sorted[0] == self._sorted[-1]
+
+    def quantile(self, q: float) -> float:
+        """
+        Quantile with np.percentile's default (linear) interpolation.
+
+        Args:
+            q: Quantile in [0, 1] (e.g. 0.25 for Q1)
+
+        Returns:
+            Interpolated quantile value
+        """
+        if self._count == 0:
+            raise ValueError("quantile of empty window")
+
+        position = (self._count - 1) * q
+        lower = int(position)
+        gamma = position - lower
+        a = self._sorted[lower]
+        if gamma == 0 or lower + 1 >= self._count:
+            return a
+        b = self._sorted[lower + 1]
+
+        # Same lerp as numpy (_lerp): stable form chosen by gamma
+        diff = b - a
+        if gamma >= 0.5:
+            return b - diff * (1 - gamma)
+        return a + diff * gamma
+
+    @property
+    def sorted_values(self) -> List[float]:
+        """Window samples in ascending order (internal list, do not modify)."""
+        return self._sorted
+
+    def values(self) -> np.ndarray:
+        """Samples in insertion order (oldest first) as a new array."""
+        if self._count < self.capacity:
+            return self._ring[:self._count].copy()
+        return np.concatenate((self._ring[self._head:], self._ring[:self._head]))
+
+
+def _neighborhood(sorted_values: Sequence[float], x: float, eps: float) -> Tuple[int, int]:
+    """
+    Index range [lo, hi) of samples y with |y - x| <= eps.
+
+    Bisects on x -/+ eps, then nudges the bounds so membership uses the
+    same |y - x| <= eps test as DBSCAN (x - eps itself may be rounded).
+    """
+    n = len(sorted_values)
+
+    lo = bisect_left(sorted_values, x - eps)
+    while lo > 0 and abs(sorted_values[lo - 1] - x) <= eps:
+        lo -= 1
+    while lo < n and abs(sorted_values[lo] - x) > eps:
+        lo += 1
+
+    hi = bisect_right(sorted_values, x + eps)
+    while hi < n and abs(sorted_values[hi] - x) <= eps:
+        hi += 1
+    while hi > lo and abs(sorted_values[hi - 1] - x) > eps:
+        hi -= 1
+
+    return lo, hi
+
+
+def is_density_noise(sorted_values: Sequence[float], x: float, eps: float, min_samples: int) -> bool:
+    """
+    DBSCAN noise label of point x in a 1-D sample set, without clustering.
+
+    x is noise iff it is not a core point (fewer than min_samples samples,
+    itself included, within eps) and no core point lies within eps of it.
+    Only x's neighbours (< min_samples of them) need a density check, so
+    the cost is O(min_samples * log n).
+
+    Args:
+        sorted_values: All samples (x included) in ascending order
+        x: Point to classify
+        eps: Neighbourhood radius (inclusive, like sklearn)
+        min_samples: Core point threshold (sklearn semantics)
+
+    Returns:
+        True if DBSCAN would label x as noise (-1)
+    """
+    lo, hi = _neighborhood(sorted_values, x, eps)
+    if hi - lo >= min_samples:
+        return False  # Core point
+
+    checked = None
+    for i in range(lo, hi):
+        y = sorted_values[i]
+        if y == checked:
+            continue
+        checked = y
+        y_lo, y_hi = _neighborhood(sorted_values, y, eps)
+        if y_hi - y_lo >= min_samples:
+            return False  # Border point of a core neighbour
+
+    return True
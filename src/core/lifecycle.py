@@ -12,13 +12,18 @@ from typing import Optional, Dict
 from .config import ConfigManager
 from .logger import setup_logging
 from ..services.database.sqlite_service import SQLiteService
+from ..services.database.partitions import migrate_sensor_data
 from ..services.database.postgres_service import PostgresService
 from ..services.database.schemas import SCHEMAS
 from ..services.modbus.client import AsyncModbusService
+from ..services.modbus.transaction_manager import ModbusTransactionManager
 from ..services.modbus.reader import ModbusReader
 from ..services.modbus.writer import ModbusWriter
+from ..services.modbus.write_scheduler import ModbusWriteScheduler
 from ..services.control.manager import ControlManager
+from ..services.control.machine_control import MachineControl
 from ..services.processing.data_processor import DataProcessingPipeline
+from ..services.processing.scheduler import DeadlineScheduler
 from ..services.iot.mqtt_client import MQTTService
 from ..services.iot.http_client import HTTPThingsBoardService
 
@@ -73,8 +78,10 @@ class ApplicationLifecycle:
         self.db_services: Dict[str, SQLiteService] = {}
         self.postgres_service: Optional[PostgresService] = None
         self.modbus_service: Optional[AsyncModbusService] = None
+        self.modbus_transactions: Optional[ModbusTransactionManager] = None
         self.modbus_reader: Optional[ModbusReader] = None
         self.modbus_writer: Optional[ModbusWriter] = None
+        self.write_scheduler: Optional[ModbusWriteScheduler] = None
         self.control_manager: Optional[ControlManager] = None
         self.data_pipeline: Optional[DataProcessingPipeline] = None
         self.mqtt_service: Optional[MQTTService] = None
@@ -202,12 +209,24 @@ class ApplicationLifecycle:
                 logger.info("Stopping data pipeline...")
                 await self.data_pipeline.stop(timeout=timeout)
 
+            if self.control_manager:
+                self.control_manager.ml_controller.shutdown()
+
             # 2. Stop IoT service (MQTT or HTTP)
             if self.iot_service:
                 logger.info("Stopping IoT service...")
                 await self.iot_service.stop(timeout=timeout)
 
-            # 3. Disconnect Modbus
+            # 3. Flush pending PLC writes, then disconnect Modbus
+            if self.write_scheduler:
+                logger.info("Stopping write scheduler...")
+                await self.write_scheduler.stop(timeout=timeout)
+
+            if self.modbus_transactions:
+                logger.info("Stopping Modbus transaction manager...")
+                MachineControl.use_shared_client(None)
+                await self.modbus_transactions.stop()
+
             if self.modbus_service:
                 logger.info("Disconnecting Modbus...")
                 await self.modbus_service.disconnect()
@@ -268,7 +287,19 @@ class ApplicationLifecycle:
             db_file = db_path / filename
             schema_sql = SCHEMAS.get(db_name, '')
 
-            service = SQLiteService(db_file, schema_sql)
+            # One-time move of legacy sensor_data rows into daily partitions
+            if db_name == 'total' and db_config.get('total_storage', 'legacy') == 'partitioned':
+                migrated = migrate_sensor_data(db_file)
+                if migrated:
+                    logger.info(f"  total.db: migrated {migrated} sensor_data rows to partitions")
+
+            service = SQLiteService(
+                db_file,
+                schema_sql,
+                queue_size=db_config.get('write_queue_size', 10000),
+                batch_size=db_config.get('batch_size', 100),
+                commit_interval=db_config.get('batch_timeout_seconds', 1.0)
+            )
             service.start()
 
             self.db_services[db_name] = service
@@ -317,17 +348,33 @@ class ApplicationLifecycle:
         else:
             logger.info(f"  Modbus connected: {modbus_config['host']}:{modbus_config['port']}")
 
+        # Every PLC transaction (pipeline and GUI) goes through one prioritized queue
+        self.modbus_transactions = ModbusTransactionManager(
+            self.modbus_service,
+            modbus_config.get('transactions')
+        )
+        await self.modbus_transactions.start()
+        MachineControl.use_shared_client(self.modbus_transactions.sync_client())
+
         # Create reader and writer regardless of connection status
         # They will handle disconnected state internally
         self.modbus_reader = ModbusReader(
-            self.modbus_service,
-            modbus_config['registers']
+            self.modbus_transactions,
+            modbus_config['registers'],
+            modbus_config.get('read_plan')
         )
 
+        # Write scheduler owns PLC speed writes (non-blocking for the pipeline)
+        scheduler_config = modbus_config.get('write_scheduler', {})
+        if scheduler_config.get('enabled', True):
+            self.write_scheduler = ModbusWriteScheduler(self.modbus_transactions, scheduler_config)
+            await self.write_scheduler.start()
+
         self.modbus_writer = ModbusWriter(
-            self.modbus_service,
+            self.modbus_transactions,
             modbus_config['registers'],
-            self.config['control']['speed_limits']
+            self.config['control']['speed_limits'],
+            scheduler=self.write_scheduler
         )
 
     async def _init_control_manager(self):
@@ -338,10 +385,14 @@ class ApplicationLifecycle:
 
         self.control_manager = ControlManager(
             self.config,
-            self.modbus_service,
-            self.db_services.get('ml')
+            self.modbus_transactions,
+            self.db_services.get('ml'),
+            write_scheduler=self.write_scheduler
         )
 
+        # Preload ML models in the background (first cut doesn't wait for them)
+        self.control_manager.ml_controller.start()
+
         mode = self.control_manager.get_current_mode()
         logger.info(f"  Control manager initialized: mode={mode.value}")
 
@@ -562,9 +613,12 @@ class ApplicationLifecycle:
         """
         logger.info("Health monitor started")
 
+        # Every 30 seconds on a fixed grid
+        scheduler = DeadlineScheduler(30.0, start_immediately=False, name='health_monitor')
+
         while not self._shutdown_event.is_set():
             try:
-                await asyncio.sleep(30.0)  # Every 30 seconds
+                await scheduler.wait()
 
                 # Check Modbus connection
                 if self.modbus_service:
@@ -590,9 +644,56 @@ class ApplicationLifecycle:
                         f"Pipeline stats: "
                         f"cycles={stats['cycles']}, "
                         f"errors={stats['errors']}, "
-                        f"commands={stats['speed_commands_sent']}"
+                        f"commands={stats['speed_commands_sent']} "
+                        f"(failed={stats['speed_commands_failed']})"
                     )
 
+                    logger.info(
+                        f"Pipeline latency p50/p99/max ms: "
+                        f"{self.data_pipeline.latency.format_summary()}"
+                    )
+
+                    sched = stats['scheduler']
+                    lateness = sched['lateness']
+                    if lateness['count']:
+                        logger.info(
+                            f"Pipeline jitter: lateness p50={lateness['p50_ms']:.2f}ms, "
+                            f"p99={lateness['p99_ms']:.2f}ms, "
+                            f"max={lateness['max_ms']:.2f}ms, "
+                            f"overruns={sched['overruns']}, "
+                            f"skipped={sched['skipped_ticks']}"
+                        )
+
+                    acquisition = stats.get('acquisition')
+                    if acquisition and acquisition['achieved_rate_hz'] is not None:
+                        logger.info(
+                            f"Acquisition: {acquisition['achieved_rate_hz']:.1f}/"
+                            f"{acquisition['target_rate_hz']:.0f} Hz, "
+                            f"read_errors={acquisition['read_errors']}, "
+                            f"dropped={acquisition['dropped']}, "
+                            f"skipped={acquisition['scheduler']['skipped_ticks']}"
+                        )
+
+                    read_plan = stats.get('modbus_reader', {}).get('read_plan', {})
+                    if read_plan.get('avg_latency_ms') is not None:
+                        logger.info(
+                            f"Read plan: requests={read_plan['requests']}, "
+                            f"avg={read_plan['avg_latency_ms']:.1f}ms, "
+                            f"max={read_plan['max_latency_ms']:.1f}ms, "
+                            f"failures={read_plan['failures']}"
+                        )
+
+                if self.write_scheduler:
+                    ws = self.write_scheduler.get_stats()
+                    if ws['avg_write_latency_ms'] is not None:
+                        logger.info(
+                            f"Write scheduler: queue={ws['queue_depth']}, "
+                            f"transactions={ws['transactions']}, "
+                            f"superseded={ws['superseded']}, "
+                            f"avg={ws['avg_write_latency_ms']:.1f}ms, "
+                            f"failures={ws['failures']}"
+                        )
+
             except asyncio.CancelledError:
                 logger.info("Health monitor cancelled")
                 break
@@ -602,6 +703,17 @@ class ApplicationLifecycle:
 
         logger.info("Health monitor ended")
 
+    def dump_latency(self) -> Optional[str]:
+        """
+        Write the pipeline latency histograms to processing.latency.dump_path.
+
+        Returns:
+            Path written, or None if the pipeline is not running
+        """
+        if not self.data_pipeline:
+            return None
+        return self.data_pipeline.dump_latency()
+
     def get_status(self) -> dict:
         """
         Get application status.
@@ -620,6 +732,12 @@ class ApplicationLifecycle:
         if self.modbus_service:
             status['modbus'] = self.modbus_service.get_health()
 
+        if self.modbus_transactions:
+            status['modbus_transactions'] = self.modbus_transactions.get_stats()
+
+        if self.write_scheduler:
+            status['write_scheduler'] = self.write_scheduler.get_stats()
+
         if self.control_manager:
             status['control'] = self.control_manager.get_status()
 
@@ -15,12 +15,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from ..refresh_scheduler import RefreshTask
+
 try:
     from PySide6.QtWidgets import (
         QWidget, QFrame, QPushButton, QLabel, QTableWidget,
         QTableWidgetItem, QHeaderView, QAbstractItemView,
     )
-    from PySide6.QtCore import Qt, QTimer
+    from PySide6.QtCore import Qt
     from PySide6.QtGui import QColor, QFont
 except ImportError:
     logging.warning("PySide6 not installed")
@@ -71,6 +73,9 @@ class AlarmController(QWidget):
         self.data_pipeline = data_pipeline
         self._switch_page = switch_page_callback
 
+        # Last pipeline snapshot version evaluated (skip when unchanged)
+        self._data_version: Optional[int] = None
+
         # Alarm tracking state
         self._prev_alarm_bits: int = 0
         self._active_alarm_ids: dict[int, int] = {}  # code → db row id
@@ -80,7 +85,6 @@ class AlarmController(QWidget):
 
         # UI
         self._setup_ui()
-        self._setup_timers()
         self._reload_table()
 
         logger.info("AlarmController initialized")
@@ -279,18 +283,13 @@ class AlarmController(QWidget):
     # Timers
     # ------------------------------------------------------------------
 
-    def _setup_timers(self):
-        self._poll_timer = QTimer(self)
-        self._poll_timer.setInterval(500)  # 2 Hz
-        self._poll_timer.timeout.connect(self._poll_alarms)
-        self._poll_timer.start()
+    def refresh_tasks(self) -> list:
+        # Alarms are recorded and auto-navigate from any page
+        return [RefreshTask("alarms", self._poll_alarms, 500, background=True)]  # 2 Hz
 
     def stop_timers(self):
-        try:
-            if hasattr(self, "_poll_timer") and self._poll_timer:
-                self._poll_timer.stop()
-        except Exception as e:
-            logger.error(f"Error stopping alarm timers: {e}")
+        # Polling runs on MainController's refresh scheduler; no own timers
+        logger.debug("AlarmController timers stopped")
 
     # ------------------------------------------------------------------
     # Alarm polling
@@ -298,11 +297,13 @@ class AlarmController(QWidget):
 
     def _poll_alarms(self):
         try:
-            if not self.data_pipeline or not hasattr(self.data_pipeline, "get_latest_data"):
+            if not self.data_pipeline or not hasattr(self.data_pipeline, "get_latest_snapshot"):
                 return
-            data = self.data_pipeline.get_latest_data()
-            if not data:
+            snapshot = self.data_pipeline.get_latest_snapshot()
+            if snapshot.version == self._data_version:
                 return
+            self._data_version = snapshot.version
+            data = snapshot.data
 
             alarm_status = int(data.get("alarm_status", 0))
             alarm_raw = data.get("alarm_bilgisi", "0x0000")
@@ -3,7 +3,7 @@ Camera page controller for Smart Band Saw.
 
 Displays live camera feed, broken/crack detection panels, sequential
 thumbnails, wear percentage, health score, and status — all driven
-by three QTimers reading from CameraResultsStore.snapshot().
+by three refresh tasks reading from CameraResultsStore.snapshot().
 
 Page size: 1528×1080 (content area)
 Framework: PySide6
@@ -13,9 +13,11 @@ import logging
 from collections import deque
 
 from PySide6.QtWidgets import QWidget, QFrame, QLabel, QProgressBar
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QImage, QPixmap, QFont, QColor
 
+from ..refresh_scheduler import RefreshTask
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -86,7 +88,8 @@ _INFO_STYLE = """
 class CameraController(QWidget):
     """Camera page widget — lives inside MainController's QStackedWidget.
 
-    Reads exclusively from *results_store* via three QTimers:
+    Reads exclusively from *results_store* via three refresh tasks
+    (run by MainController's GuiRefreshScheduler while the page is visible):
       - 500 ms  — frame + thumbnails
       - 1000 ms — detection stats
       - 2000 ms — health / wear
@@ -105,7 +108,6 @@ class CameraController(QWidget):
         self._thumb_pixmaps: deque[QPixmap] = deque(maxlen=self._MAX_THUMBNAILS)
 
         self._setup_ui()
-        self._setup_timers()
 
         logger.info("CameraController initialized")
 
@@ -338,42 +340,20 @@ class CameraController(QWidget):
     # Timers
     # ------------------------------------------------------------------
 
-    def _setup_timers(self):
-        """Create and start the three polling timers."""
-
-        self._frame_timer = QTimer(self)
-        self._frame_timer.setInterval(500)
-        self._frame_timer.timeout.connect(self._update_frame)
-
-        self._stats_timer = QTimer(self)
-        self._stats_timer.setInterval(1000)
-        self._stats_timer.timeout.connect(self._update_stats)
-
-        self._health_timer = QTimer(self)
-        self._health_timer.setInterval(2000)
-        self._health_timer.timeout.connect(self._update_health)
-
-        self._frame_timer.start()
-        self._stats_timer.start()
-        self._health_timer.start()
-
-        logger.debug("CameraController timers started (500/1000/2000 ms)")
+    def refresh_tasks(self) -> list:
+        """The three polling tasks (frame decode/scaling only while visible)."""
+        return [
+            RefreshTask("frame", self._update_frame, 500),
+            RefreshTask("stats", self._update_stats, 1000),
+            RefreshTask("health", self._update_health, 2000),
+        ]
 
     def stop_timers(self):
-        """Stop all QTimers — call from the GUI thread before window closes."""
-        try:
-            if hasattr(self, "_frame_timer") and self._frame_timer:
-                self._frame_timer.stop()
-            if hasattr(self, "_stats_timer") and self._stats_timer:
-                self._stats_timer.stop()
-            if hasattr(self, "_health_timer") and self._health_timer:
-                self._health_timer.stop()
-            logger.info("CameraController timers stopped")
-        except Exception as e:
-            logger.error(f"Error stopping CameraController timers: {e}")
+        """No own QTimers remain; the refresh scheduler is stopped by MainController."""
+        logger.info("CameraController timers stopped")
 
     # ------------------------------------------------------------------
-    # Timer callbacks
+    # Refresh task callbacks
     # ------------------------------------------------------------------
 
     def _update_frame(self):
@@ -12,23 +12,25 @@ import logging
 import os
 import queue
 import threading
-import collections
+import time
 import asyncio
 from pathlib import Path
 from typing import Optional, Dict, Callable
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import yaml
 
 from ...domain.enums import ControlMode
 from ...services.control.machine_control import MachineControl
+from ..refresh_scheduler import RefreshTask
+from ..widgets.polyline_plot import PolylinePlotWidget
 
 try:
     from PySide6.QtWidgets import (
         QWidget, QFrame, QPushButton, QLabel, QTextEdit, QToolButton,
         QProgressBar, QDialog, QVBoxLayout, QHBoxLayout, QApplication
     )
-    from PySide6.QtCore import Qt, QTimer, QDateTime, Slot, Signal, QPoint, QSize
+    from PySide6.QtCore import Qt, QTimer, QDateTime, Slot, Signal, QPointF, QSize
     from PySide6.QtGui import (
         QFont, QPixmap, QIcon, QTextCursor, QPainter, QPen,
         QColor, QBrush, QPolygon, QImage
@@ -59,6 +61,7 @@ except ImportError:
     QColor = object
     QBrush = object
     QPolygon = object
+    QPointF = object
     QImage = object
 
 logger = logging.getLogger(__name__)
@@ -216,7 +219,7 @@ class RoundedVerticalProgressBar(QWidget):
 # ============================================================================
 # BandDeviationGraphWidget - Real-time graph for band deviation
 # ============================================================================
-class BandDeviationGraphWidget(QWidget):
+class BandDeviationGraphWidget(PolylinePlotWidget):
     """
     Real-time graph widget for band deviation values.
 
@@ -224,50 +227,35 @@ class BandDeviationGraphWidget(QWidget):
     - Shows positive and negative values with zero line in center
     - Dashed white line at zero level
     - Dynamic range that adjusts to data
-    - Single line (no fill)
+    - Single line with hatched fill to zero (PolylinePlotWidget: cached
+      grid, decimated polyline, repaint only on new data)
     """
 
+    # Seconds of history shown
+    WINDOW_SECONDS = 30.0
+
     def __init__(self, parent=None):
-        super().__init__(parent)
+        # Repainted by the control panel's 'band_graph' refresh task (50 ms)
+        super().__init__(parent, capacity=300, padding=10, v_lines=16, h_lines=4, refresh_ms=None)
         self.setMinimumSize(278, 144)
 
-        # Data structure: (timestamp, value) tuples
-        self.data_points = collections.deque(maxlen=300)  # 30 seconds * 10 data/sec
-        self.max_points = 300
-
         # Max/min value tracking (for display labels)
         self.max_value = float('-inf')
         self.min_value = float('inf')
 
         # Graph settings
-        self.padding = 10
         self.grid_color = QColor(255, 255, 255, 30)  # Transparent white
         self.zero_line_color = QColor(255, 255, 255, 180)  # White for zero line
         self.line_color = QColor(149, 9, 82)  # Main color #950952
-
-        # Thread-safe data access lock
-        self._data_lock = threading.Lock()
-
-        # Update timer
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update)
-        self.update_timer.start(50)  # 20 FPS for smooth display
-
-        # Widget style
-        self.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        self.line_pen = QPen(self.line_color, 3)
+        self.marker_radius = 5
 
     def add_data_point(self, value: float):
         """Add new data point (thread-safe)."""
         try:
+            # X is the monotonic time of the sample (used by clear_old_data)
+            self.add_point(time.monotonic(), value)
             with self._data_lock:
-                timestamp = datetime.now()
-                self.data_points.append((timestamp, value))
-
                 # Update max/min values
                 if value > self.max_value:
                     self.max_value = value
@@ -280,15 +268,14 @@ class BandDeviationGraphWidget(QWidget):
         """Clear data older than 30 seconds and recalculate min/max."""
         try:
             with self._data_lock:
-                cutoff_time = datetime.now() - timedelta(seconds=30)
-                while self.data_points and self.data_points[0][0] < cutoff_time:
-                    self.data_points.popleft()
+                if self.points.drop_before(time.monotonic() - self.WINDOW_SECONDS):
+                    self._dirty = True
 
                 # Recalculate min/max from remaining data points
-                if self.data_points:
-                    values = [point[1] for point in self.data_points]
-                    self.max_value = max(values)
-                    self.min_value = min(values)
+                _, values = self.points.arrays()
+                if len(values):
+                    self.max_value = float(values.max())
+                    self.min_value = float(values.min())
                 else:
                     # No data points - reset to initial values
                     self.max_value = float('-inf')
@@ -321,174 +308,72 @@ class BandDeviationGraphWidget(QWidget):
     def get_axis_max(self) -> float:
         """Return maximum value of axis range (includes 0)."""
         with self._data_lock:
-            if not self.data_points:
+            _, values = self.points.arrays()
+            if not len(values):
                 return 0.0
-            values = [point[1] for point in self.data_points]
-            return max(max(values), 0)  # Ensure 0 is included
+            return max(float(values.max()), 0)  # Ensure 0 is included
 
     def get_axis_min(self) -> float:
         """Return minimum value of axis range (includes 0)."""
         with self._data_lock:
-            if not self.data_points:
+            _, values = self.points.arrays()
+            if not len(values):
                 return 0.0
-            values = [point[1] for point in self.data_points]
-            return min(min(values), 0)  # Ensure 0 is included
-
-    def paintEvent(self, event):
-        """Draw the graph."""
-        try:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-
-            # Transparent background
-            painter.fillRect(self.rect(), QColor(0, 0, 0, 0))
-
-            # Calculate drawing area
-            draw_rect = self.rect().adjusted(
-                self.padding, self.padding, -self.padding, -self.padding
-            )
-
-            # Draw data first to get zero_y position
-            zero_y = self._draw_data(painter, draw_rect)
-
-            # Draw grid with zero line
-            self._draw_grid(painter, draw_rect, zero_y)
-
-        except Exception as e:
-            logger.error(f"Graph drawing error: {e}")
-
-    def _draw_grid(self, painter: QPainter, rect, zero_y: int = None):
-        """Draw grid lines and zero line."""
-        try:
-            painter.setPen(QPen(self.grid_color, 1))
-
-            # Vertical lines (16 lines)
-            for i in range(17):
-                x = rect.left() + (rect.width() * i) // 16
-                painter.drawLine(x, rect.top(), x, rect.bottom())
-
-            # Horizontal lines (4 lines) - faint grid
-            for i in range(5):
-                y = rect.top() + (rect.height() * i) // 4
-                painter.drawLine(rect.left(), y, rect.right(), y)
-
-            # Draw zero line (dashed white) if provided
-            if zero_y is not None and rect.top() <= zero_y <= rect.bottom():
-                pen = QPen(self.zero_line_color, 2, Qt.DashLine)
-                painter.setPen(pen)
-                painter.drawLine(rect.left(), zero_y, rect.right(), zero_y)
-
-        except Exception as e:
-            logger.error(f"Grid drawing error: {e}")
-
-    def _draw_data(self, painter: QPainter, rect):
-        """
-        Draw data line with dynamic range and zero line at actual zero position.
-
-        Returns:
-            zero_y: Y coordinate of zero line for grid drawing
-        """
-        zero_y = None
-        try:
-            with self._data_lock:
-                if len(self.data_points) < 2:
-                    # No data - draw zero line at center
-                    return rect.top() + rect.height() // 2
-
-                # Calculate value range
-                values = [point[1] for point in self.data_points]
-                min_val = min(values)
-                max_val = max(values)
-
-                # Ensure zero is included in the range
-                range_min = min(min_val, 0)
-                range_max = max(max_val, 0)
-
-                # Add small padding if range is too small
-                if range_max - range_min < 0.1:
-                    padding = 0.05
-                    range_min -= padding
-                    range_max += padding
-
-                # Calculate zero line Y position at actual zero
-                if range_max != range_min:
-                    zero_normalized = (0 - range_min) / (range_max - range_min)
-                    zero_y = int(rect.bottom() - (rect.height() * zero_normalized))
-                else:
-                    zero_y = rect.top() + rect.height() // 2
-
-                # Calculate line points
-                points = []
-                for i, (timestamp, value) in enumerate(self.data_points):
-                    # X coordinate (time)
-                    x = rect.left() + (rect.width() * i) // (len(self.data_points) - 1)
-
-                    # Y coordinate (value) - normalized to actual range
-                    if range_max != range_min:
-                        normalized_value = (value - range_min) / (range_max - range_min)
-                    else:
-                        normalized_value = 0.5
-                    y = rect.bottom() - (rect.height() * normalized_value)
-                    points.append((x, y))
-
-                # Draw hatched fill between zero line and data line
-                if len(points) > 1 and zero_y is not None:
-                    # Create polygon for fill area
-                    fill_polygon = QPolygon()
-
-                    # Add all data points
-                    for x, y in points:
-                        fill_polygon.append(QPoint(int(x), int(y)))
-
-                    # Close polygon along zero line (right to left)
-                    fill_polygon.append(QPoint(int(points[-1][0]), zero_y))
-                    fill_polygon.append(QPoint(int(points[0][0]), zero_y))
-
-                    # First draw transparent solid fill
-                    painter.setPen(Qt.NoPen)
-                    fill_color = QColor(self.line_color)
-                    fill_color.setAlpha(40)  # ~15% opacity
-                    painter.setBrush(QBrush(fill_color))
-                    painter.drawPolygon(fill_polygon)
-
-                    # Then draw hatched pattern on top
-                    painter.setBrush(QBrush(self.line_color, Qt.BDiagPattern))
-                    painter.setOpacity(0.5)
-                    painter.drawPolygon(fill_polygon)
-                    painter.setOpacity(1.0)
-
-                # Draw main line
-                if len(points) > 1:
-                    painter.setPen(QPen(self.line_color, 3))
-                    painter.setBrush(Qt.NoBrush)
-
-                    for i in range(len(points) - 1):
-                        painter.drawLine(
-                            int(points[i][0]), int(points[i][1]),
-                            int(points[i+1][0]), int(points[i+1][1])
-                        )
+            return min(float(values.min()), 0)  # Ensure 0 is included
+
+    def _y_range(self, y_min: float, y_max: float):
+        """Value range always includes zero."""
+        range_min = min(y_min, 0)
+        range_max = max(y_max, 0)
+
+        # Add small padding if range is too small
+        if range_max - range_min < 0.1:
+            range_min -= 0.05
+            range_max += 0.05
+        return range_min, range_max
+
+    def _draw_zero_line(self, painter: QPainter, rect, zero_y: int):
+        """Dashed white line at zero level."""
+        if rect.top() <= zero_y <= rect.bottom():
+            painter.setPen(QPen(self.zero_line_color, 2, Qt.DashLine))
+            painter.drawLine(rect.left(), zero_y, rect.right(), zero_y)
+
+    def _draw_empty(self, painter: QPainter, rect):
+        """No data - zero line at center."""
+        self._draw_zero_line(painter, rect, rect.top() + rect.height() // 2)
+
+    def _draw_series(self, painter: QPainter, rect, px, py, y_min: float, y_max: float):
+        """Hatched fill between zero line and data, line, zero line, last-point dot."""
+        # Zero line Y position at actual zero
+        zero_y = int(rect.bottom() - rect.height() * (0 - y_min) / (y_max - y_min))
+
+        # Close polygon along zero line (right to left)
+        fill_polygon = self._polygon(px, py)
+        fill_polygon.append(QPointF(px[-1], zero_y))
+        fill_polygon.append(QPointF(px[0], zero_y))
+
+        # First draw transparent solid fill
+        painter.setPen(Qt.NoPen)
+        fill_color = QColor(self.line_color)
+        fill_color.setAlpha(40)  # ~15% opacity
+        painter.setBrush(QBrush(fill_color))
+        painter.drawPolygon(fill_polygon)
 
-                # Small dot marker for last point
-                if points:
-                    last_x, last_y = points[-1]
-                    dot_radius = 5
-                    painter.setBrush(QBrush(QColor(255, 0, 0)))
-                    painter.setPen(QPen(QColor(255, 0, 0), 1))
-                    painter.drawEllipse(
-                        QPoint(int(last_x), int(last_y)),
-                        dot_radius, dot_radius
-                    )
+        # Then draw hatched pattern on top
+        painter.setBrush(QBrush(self.line_color, Qt.BDiagPattern))
+        painter.setOpacity(0.5)
+        painter.drawPolygon(fill_polygon)
+        painter.setOpacity(1.0)
 
-        except Exception as e:
-            logger.error(f"Data drawing error: {e}")
+        # Main line
+        painter.setPen(self.line_pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawLines(self._segments(px, py))
 
-        return zero_y
+        self._draw_zero_line(painter, rect, zero_y)
 
-    def resizeEvent(self, event):
-        """Handle widget resize."""
-        super().resizeEvent(event)
-        self.update()
+        # Small dot marker for last point
+        self._draw_marker(painter, QPointF(px[-1], py[-1]))
 
 
 # ============================================================================
@@ -513,6 +398,18 @@ class ControlPanelController(QWidget):
     - Qt Signals/Slots for async operations
     """
 
+    # Machine status (testere_durumu) display texts
+    TESTERE_DURUMU_TEXT = {
+        -1: "BAĞLANTI BEKLENİYOR",  # Special value when Modbus not connected
+        0: "BOŞTA",
+        1: "HİDROLİK AKTİF",
+        2: "ŞERİT MOTOR ÇALIŞIYOR",
+        3: "KESİM YAPILIYOR",
+        4: "KESİM BİTTİ",
+        5: "ŞERİT YUKARI ÇIKIYOR",
+        6: "MALZEME BESLEME"
+    }
+
     def __init__(
         self,
         control_manager=None,
@@ -548,6 +445,11 @@ class ControlPanelController(QWidget):
         self.controller_factory = control_manager
         self.get_data_callback = data_pipeline
 
+        # Last pipeline snapshot versions handled (skip refresh when unchanged):
+        # status/cut tracking (background) and page values (visible only)
+        self._data_version: Optional[int] = None
+        self._values_version: Optional[int] = None
+
         # Initialize MachineControl singleton for speed/control operations
         try:
             self.machine_control = MachineControl()
@@ -592,9 +494,6 @@ class ControlPanelController(QWidget):
         # Setup UI
         self._setup_ui()
 
-        # Setup timers
-        self._setup_timers()
-
         logger.info("ControlPanelController initialized")
 
     @staticmethod
@@ -1424,24 +1323,25 @@ class ControlPanelController(QWidget):
         # Initialize status icon
         self._update_status_icon('Bağlantı Yok')
 
-    def _setup_timers(self):
-        """Setup all Qt timers for periodic updates."""
-        # Log processing timer
-        self._log_timer = QTimer(self)
-        self._log_timer.timeout.connect(self._process_logs)
-        self._log_timer.start(100)  # 100ms
+    def refresh_tasks(self) -> list:
+        """
+        Periodic updates, run by MainController's GuiRefreshScheduler.
 
-        # Data update timer (if callback provided)
+        Background (also while another page is shown): log queue, status bar,
+        cutting time tracking, deviation graph data and alarm auto-clear of
+        the machine start bit. Visible only: value labels, PLC button states
+        and graph repaints.
+        """
+        tasks = [RefreshTask('logs', self._process_logs, 100, background=True)]
+        if self.band_deviation_graph:
+            tasks.append(RefreshTask('band_graph', self.band_deviation_graph.refresh, 50))
         if self.get_data_callback:
-            self._data_timer = QTimer(self)
-            self._data_timer.timeout.connect(self._on_data_tick)
-            self._data_timer.start(200)  # 200ms
-
-        # Speed update timer (live reading from registers)
+            tasks.append(RefreshTask('status', self._on_data_tick, 200, background=True))
+            tasks.append(RefreshTask('values', self._on_values_tick, 200))
         if self.controller_factory:
-            self._speed_timer = QTimer(self)
-            self._speed_timer.timeout.connect(self._update_band_speeds_live)
-            self._speed_timer.start(300)  # 300ms
+            # Live band speeds from registers
+            tasks.append(RefreshTask('speeds', self._update_band_speeds_live, 300))
+        return tasks
 
     # ========================================================================
     # Mode and Speed Button Handlers
@@ -1906,24 +1806,64 @@ class ControlPanelController(QWidget):
     # ========================================================================
 
     def _on_data_tick(self):
-        """Called by data timer to fetch and update data."""
+        """Background tick: status bar, cutting time tracking and logs."""
         try:
-            if self.data_pipeline and hasattr(self.data_pipeline, 'get_latest_data'):
-                data = self.data_pipeline.get_latest_data()
-                if data:
-                    self.update_data(data)
+            # Refresh only when the pipeline published a new cycle
+            if self.data_pipeline and hasattr(self.data_pipeline, 'get_latest_snapshot'):
+                snapshot = self.data_pipeline.get_latest_snapshot()
+                if snapshot.version != self._data_version:
+                    self._data_version = snapshot.version
+                    self._update_status(snapshot.data)
 
-            # Poll machine start bit (100.1) to sync button state
-            self._poll_machine_start_status()
+            # Alarm active: clear the machine start bit even when the page is hidden
+            self._clear_machine_start_on_alarm()
 
             # Forward ML countdown logs to GUI
             self._poll_ml_countdown()
 
+        except Exception as e:
+            logger.error(f"Data tick error: {e}")
+
+    def _on_values_tick(self):
+        """Visible-page tick: value labels, machine start and mode buttons."""
+        try:
+            if self.data_pipeline and hasattr(self.data_pipeline, 'get_latest_snapshot'):
+                snapshot = self.data_pipeline.get_latest_snapshot()
+                if snapshot.version != self._values_version:
+                    self._values_version = snapshot.version
+                    self._update_values(snapshot.data)
+
+            # Poll machine start bit (100.1) to sync button state
+            self._poll_machine_start_status()
+
             # Sync mode buttons from control_manager
             self._sync_mode_buttons()
 
         except Exception as e:
-            logger.error(f"Data tick error: {e}")
+            logger.error(f"Values tick error: {e}")
+
+    def _clear_machine_start_on_alarm(self) -> bool:
+        """
+        Force-clear machine start (button and PLC bit) while an alarm is active.
+
+        Returns:
+            True if an alarm is active
+        """
+        if not self.machine_control:
+            return False
+        if not self.data_pipeline or not hasattr(self.data_pipeline, 'get_latest_snapshot'):
+            return False
+        data = self.data_pipeline.get_latest_snapshot().data
+        if int(data.get('alarm_status', 0)) != 1:
+            return False
+        if self.toolBtnMachineStart.isChecked():
+            # Clear the PLC bit too
+            self.machine_control.set_machine_start(False)
+            self.toolBtnMachineStart.blockSignals(True)
+            self.toolBtnMachineStart.setChecked(False)
+            self.toolBtnMachineStart.blockSignals(False)
+            self.add_log("Alarm aktif — makine başlat sıfırlandı.", "WARNING")
+        return True
 
     def _poll_machine_start_status(self):
         """Poll 100.1 bit and sync toggle button state. Auto-clear when alarm active."""
@@ -1932,17 +1872,8 @@ class ControlPanelController(QWidget):
                 return
 
             # Check alarm status — if alarm active, force-clear machine start
-            if self.data_pipeline and hasattr(self.data_pipeline, 'get_latest_data'):
-                data = self.data_pipeline.get_latest_data()
-                if data and int(data.get('alarm_status', 0)) == 1:
-                    if self.toolBtnMachineStart.isChecked():
-                        # Clear the PLC bit too
-                        self.machine_control.set_machine_start(False)
-                        self.toolBtnMachineStart.blockSignals(True)
-                        self.toolBtnMachineStart.setChecked(False)
-                        self.toolBtnMachineStart.blockSignals(False)
-                        self.add_log("Alarm aktif — makine başlat sıfırlandı.", "WARNING")
-                    return
+            if self._clear_machine_start_on_alarm():
+                return
 
             is_started = self.machine_control.is_machine_started()
             if is_started is None:
@@ -2015,6 +1946,21 @@ class ControlPanelController(QWidget):
         """
         Update display with latest data.
 
+        Args:
+            processed_data: Dictionary containing sensor and machine data
+        """
+        try:
+            self._update_status(processed_data)
+            self._update_values(processed_data)
+        except Exception as e:
+            logger.error(f"Data update error: {e}")
+
+    def _update_status(self, processed_data: Dict):
+        """
+        State that must keep up while the page is hidden: status bar (owned
+        by MainController), cutting time, deviation graph data and critical
+        value logs.
+
         Args:
             processed_data: Dictionary containing sensor and machine data
         """
@@ -2026,11 +1972,19 @@ class ControlPanelController(QWidget):
                     processed_data.get('modbus_ip', '')
                 )
 
-            # Update all values
-            self._update_values(processed_data)
+            # Update system status
+            testere_durumu = int(processed_data.get('testere_durumu', 0))
+            durum_text = self.TESTERE_DURUMU_TEXT.get(testere_durumu, "BİLİNMİYOR")
+            with self._values_lock:
+                self.current_values['testere_durumu'] = durum_text
+            self.labelSystemStatusInfo.setText(self._get_status_message(durum_text))
+
+            # Deviation graph data (30 s window; painted only while visible)
+            if self.band_deviation_graph:
+                self.band_deviation_graph.add_data_point(processed_data.get('serit_sapmasi', 0))
+                self.band_deviation_graph.clear_old_data()
 
             # Update cutting time tracking (with height and speed for remaining time)
-            testere_durumu = int(processed_data.get('testere_durumu', 0))
             kafa_yuksekligi = float(processed_data.get('kafa_yuksekligi_mm', 0))
             inme_hizi = float(processed_data.get('serit_inme_hizi', 0))
             self._update_cutting_time_labels(testere_durumu, kafa_yuksekligi, inme_hizi)
@@ -2039,7 +1993,7 @@ class ControlPanelController(QWidget):
             self._check_critical_values(processed_data)
 
         except Exception as e:
-            logger.error(f"Data update error: {e}")
+            logger.error(f"Status update error: {e}")
 
     def _update_values(self, processed_data: Dict):
         """Update all displayed values (thread-safe)."""
@@ -2077,19 +2031,6 @@ class ControlPanelController(QWidget):
                 self.current_values['kesme_hizi_hedef'] = f"{kesme_hizi_hedef:.1f}"
                 self.current_values['inme_hizi_hedef'] = f"{inme_hizi_hedef:.1f}"
 
-                # Machine status
-                testere_durumu = processed_data.get('testere_durumu', 0)
-                durum_text = {
-                    -1: "BAĞLANTI BEKLENİYOR",  # Special value when Modbus not connected
-                    0: "BOŞTA",
-                    1: "HİDROLİK AKTİF",
-                    2: "ŞERİT MOTOR ÇALIŞIYOR",
-                    3: "KESİM YAPILIYOR",
-                    4: "KESİM BİTTİ",
-                    5: "ŞERİT YUKARI ÇIKIYOR",
-                    6: "MALZEME BESLEME"
-                }.get(testere_durumu, "BİLİNMİYOR")
-                self.current_values['testere_durumu'] = durum_text
 
             # Update UI (outside lock)
             self.labelValue.setText(f"{kafa_yuksekligi:.1f}")
@@ -2111,11 +2052,8 @@ class ControlPanelController(QWidget):
             self.labelBandCuttingSpeedValue.setText(f"{kesme_hizi_hedef:.0f}")
             self.labelBandDescentSpeedValue.setText(f"{inme_hizi_hedef:.0f}")
 
-            # Update deviation graph
+            # Deviation graph axis labels (data added by _update_status)
             if self.band_deviation_graph:
-                self.band_deviation_graph.add_data_point(deviation_value)
-                self.band_deviation_graph.clear_old_data()
-
                 max_value = self.band_deviation_graph.get_axis_max()
                 min_value = self.band_deviation_graph.get_axis_min()
 
@@ -2125,9 +2063,6 @@ class ControlPanelController(QWidget):
                 else:
                     self.altdegerlabel.setText(f"{min_value:.2f}")
 
-            # Update system status
-            self.labelSystemStatusInfo.setText(self._get_status_message(durum_text))
-
             # Update coolant and chip cleaning button states from Modbus
             self._update_control_button_states()
 
@@ -2455,22 +2390,10 @@ class ControlPanelController(QWidget):
         """
         Stop all QTimers in this controller.
 
-        IMPORTANT: Must be called from the GUI thread before window closes
-        to avoid segmentation fault on Linux.
+        Periodic updates are refresh_tasks() run by MainController's
+        GuiRefreshScheduler, which is stopped there; no own timers remain.
         """
-        try:
-            if hasattr(self, '_log_timer') and self._log_timer:
-                self._log_timer.stop()
-            if hasattr(self, '_data_timer') and self._data_timer:
-                self._data_timer.stop()
-            if hasattr(self, '_speed_timer') and self._speed_timer:
-                self._speed_timer.stop()
-            if hasattr(self, 'band_deviation_graph') and self.band_deviation_graph:
-                if hasattr(self.band_deviation_graph, 'update_timer'):
-                    self.band_deviation_graph.update_timer.stop()
-            logger.debug("ControlPanelController timers stopped")
-        except Exception as e:
-            logger.error(f"Error stopping control panel timers: {e}")
+        logger.debug("ControlPanelController timers stopped")
 
 
     # ========================================================================
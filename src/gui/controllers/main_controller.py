@@ -13,7 +13,7 @@ try:
     from PySide6.QtWidgets import (
         QMainWindow, QWidget, QFrame, QPushButton, QStackedWidget, QLabel
     )
-    from PySide6.QtCore import QTimer, Signal, Slot, Qt, QSize
+    from PySide6.QtCore import Signal, Slot, Qt, QSize
     from PySide6.QtGui import QFont, QIcon, QKeyEvent
 except ImportError:
     logging.warning("PySide6 not installed")
@@ -21,6 +21,7 @@ except ImportError:
     Signal = lambda *args, **kwargs: None
     Slot = lambda *args, **kwargs: (lambda f: f)
 
+from ...services.control.machine_control import MachineControl
 from .alarm_controller import AlarmController
 from .control_panel_controller import ControlPanelController
 from .monitoring_controller import MonitoringController
@@ -28,6 +29,7 @@ from .otomatik_kesim_controller import OtomatikKesimController
 from .positioning_controller import PositioningController
 from .sensor_controller import SensorController
 from ..page_index import PageIndex
+from ..refresh_scheduler import GuiRefreshScheduler, RefreshTask
 
 logger = logging.getLogger(__name__)
 
@@ -55,17 +57,13 @@ class MainController(QMainWindow):
         self.event_loop = event_loop
         self.camera_results_store = camera_results_store
 
-        # Setup UI
-        self._setup_ui()
-
-        # Timers - parent is self, Qt will handle cleanup automatically
-        self._update_timer = QTimer(self)
-        self._update_timer.timeout.connect(self._on_timer_update)
-        self._update_timer.start(200)  # 5 Hz
+        # PLC status bits for the pages come from MachineControl's status
+        # cache (background poller), not from blocking reads on this thread
+        self.machine_control = MachineControl()
+        self.machine_control.start_status_polling()
 
-        self._datetime_timer = QTimer(self)
-        self._datetime_timer.timeout.connect(self._update_datetime)
-        self._datetime_timer.start(1000)  # 1 Hz
+        # Setup UI (pages and the refresh scheduler)
+        self._setup_ui()
 
         self.data_updated.connect(self._on_data_updated)
 
@@ -367,6 +365,27 @@ class MainController(QMainWindow):
         # Update date/time
         self._update_datetime()
 
+        # Periodic page updates: one master tick (parent is self, Qt handles
+        # cleanup), only the visible page plus background tasks run
+        self.refresh_scheduler = GuiRefreshScheduler(self)
+        self.refresh_scheduler.add_background('main', [
+            RefreshTask('datetime', self._update_datetime, 1000, background=True),  # 1 Hz
+        ])
+        pages = [
+            (PageIndex.KONTROL_PANELI, 'control_panel', self.control_panel_page),
+            (PageIndex.OTOMATIK_KESIM, 'otomatik_kesim', self.otomatik_kesim_page),
+            (PageIndex.KONUMLANDIRMA, 'positioning', self.positioning_page),
+            (PageIndex.SENSOR, 'sensor', self.sensor_page),
+            (PageIndex.IZLEME, 'monitoring', self.monitoring_page),
+            (PageIndex.ALARM, 'alarm', self.alarm_page),
+        ]
+        if self.camera_results_store is not None:
+            pages.append((PageIndex.KAMERA, 'camera', self.camera_page))
+        for index, name, page in pages:
+            self.refresh_scheduler.add_page(index, page.refresh_tasks(), name)
+        self.refresh_scheduler.set_current_page(self.stackedWidget.currentIndex())
+        self.refresh_scheduler.start()
+
     def _switch_page(self, index: int):
         """Switch to page by index."""
         try:
@@ -377,8 +396,9 @@ class MainController(QMainWindow):
             # Check clicked button
             self.nav_buttons[index].setChecked(True)
 
-            # Switch page
+            # Switch page (hidden pages stop refreshing, the new one refreshes now)
             self.stackedWidget.setCurrentIndex(index)
+            self.refresh_scheduler.set_current_page(index)
 
             logger.debug(f"Switched to page {index}")
 
@@ -411,18 +431,6 @@ class MainController(QMainWindow):
         except Exception as e:
             logger.error(f"Error updating datetime: {e}")
 
-    def _on_timer_update(self):
-        """Timer callback for periodic updates."""
-        try:
-            if self.data_pipeline:
-                # Get latest data from pipeline
-                stats = self.data_pipeline.get_stats()
-                # Emit signal for thread-safe update
-                # self.data_updated.emit(stats)
-
-        except Exception as e:
-            logger.error(f"Error in timer update: {e}")
-
     @Slot(dict)
     def _on_data_updated(self, data: dict):
         """Handle data updates (thread-safe)."""
@@ -462,11 +470,13 @@ class MainController(QMainWindow):
         logger.info("Main window closing - stopping all timers")
 
         try:
-            # Stop main controller timers
-            if hasattr(self, '_update_timer') and self._update_timer:
-                self._update_timer.stop()
-            if hasattr(self, '_datetime_timer') and self._datetime_timer:
-                self._datetime_timer.stop()
+            # Stop the refresh scheduler (page and date/time updates)
+            if hasattr(self, 'refresh_scheduler') and self.refresh_scheduler:
+                self.refresh_scheduler.stop()
+
+            # Stop the PLC status poller
+            if hasattr(self, 'machine_control') and self.machine_control:
+                self.machine_control.stop_status_polling()
 
             # Stop timers in child page controllers
             for page in [self.control_panel_page, self.otomatik_kesim_page,
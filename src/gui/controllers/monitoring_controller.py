@@ -12,9 +12,11 @@ import logging
 import threading
 from typing import Optional, Dict, Callable
 
+from ..refresh_scheduler import RefreshTask
+
 try:
     from PySide6.QtWidgets import QWidget, QFrame, QLabel
-    from PySide6.QtCore import Qt, QTimer, Slot, Signal
+    from PySide6.QtCore import Qt, Slot, Signal
     from PySide6.QtGui import QFont
 except ImportError:
     logging.warning("PySide6 not installed")
@@ -22,7 +24,6 @@ except ImportError:
     QFrame = object
     QLabel = object
     Qt = object
-    QTimer = object
     Slot = lambda *args, **kwargs: (lambda f: f)
     Signal = lambda *args: None
     QFont = object
@@ -69,6 +70,9 @@ class MonitoringController(QWidget):
         # Legacy compatibility
         self.get_data_callback = data_pipeline
 
+        # Last pipeline snapshot version rendered (skip refresh when unchanged)
+        self._data_version: Optional[int] = None
+
         # Data management
         self.current_values = {}
         self._values_lock = threading.Lock()
@@ -79,9 +83,6 @@ class MonitoringController(QWidget):
         # Setup UI
         self._setup_ui()
 
-        # Setup timers
-        self._setup_timers()
-
         logger.info("MonitoringController initialized")
 
     def _initialize_current_values(self):
@@ -658,28 +659,31 @@ class MonitoringController(QWidget):
         self.statusMotorFrame = self.Container_5
         self.labelMaxBandDeviationValue = self.labelSeritSapmasiValue  # Re-use same label
 
-    def _setup_timers(self):
-        """Setup all Qt timers for periodic updates."""
-        # Data update timer (if callback provided)
-        if self.get_data_callback:
-            self._data_timer = QTimer(self)
-            self._data_timer.timeout.connect(self._on_data_tick)
-            self._data_timer.start(200)  # 200ms
+    def refresh_tasks(self) -> list:
+        """
+        Periodic updates, run by MainController's GuiRefreshScheduler.
+
+        The page only displays data, so nothing runs while it is hidden.
+        """
+        if not self.get_data_callback:
+            return []
+        return [RefreshTask('values', self._on_data_tick, 200)]
 
     # ========================================================================
     # Data Update Methods
     # ========================================================================
 
     def _on_data_tick(self):
-        """Called by data timer to fetch and update data."""
+        """Called by the 'values' refresh task to fetch and update data."""
         try:
             if self.get_data_callback:
                 # get_data_callback is data_pipeline object
-                # Get latest sensor data for display
-                if hasattr(self.get_data_callback, 'get_latest_data'):
-                    data = self.get_data_callback.get_latest_data()
-                    if data:
-                        self.update_data(data)
+                # Get latest sensor data for display (only when a new cycle was published)
+                if hasattr(self.get_data_callback, 'get_latest_snapshot'):
+                    snapshot = self.get_data_callback.get_latest_snapshot()
+                    if snapshot.version != self._data_version:
+                        self._data_version = snapshot.version
+                        self.update_data(snapshot.data)
         except Exception as e:
             logger.error(f"Data tick error: {e}")
 
@@ -839,12 +843,7 @@ class MonitoringController(QWidget):
         """
         Stop all QTimers in this controller.
 
-        IMPORTANT: Must be called from the GUI thread before window closes
-        to avoid segmentation fault on Linux.
+        Periodic updates are refresh_tasks() run by MainController's
+        GuiRefreshScheduler, which is stopped there; no own timers remain.
         """
-        try:
-            if hasattr(self, '_data_timer') and self._data_timer:
-                self._data_timer.stop()
-            logger.debug("MonitoringController timers stopped")
-        except Exception as e:
-            logger.error(f"Error stopping monitoring controller timers: {e}")
+        logger.debug("MonitoringController timers stopped")
@@ -35,6 +35,7 @@ except ImportError:
 
 from ...domain.enums import ControlMode
 from ...services.control.machine_control import MachineControl
+from ..refresh_scheduler import RefreshTask
 from ..widgets.touch_button import TouchButton
 
 try:
@@ -124,6 +125,9 @@ class OtomatikKesimController(QWidget):
         self.data_pipeline = data_pipeline
         self.event_loop = event_loop
 
+        # Last pipeline snapshot version evaluated (skip when unchanged)
+        self._data_version: Optional[int] = None
+
         # MachineControl singleton
         self.machine_control: Optional[MachineControl] = None
         self._initialize_machine_control()
@@ -618,11 +622,21 @@ class OtomatikKesimController(QWidget):
         self._reset_tick_timer.setInterval(50)
         self._reset_tick_timer.timeout.connect(self._on_reset_tick)
 
-        # Speed sync timer — reads PLC target speeds and updates C/S labels
-        self._speed_sync_timer = QTimer(self)
-        self._speed_sync_timer.setInterval(500)
-        self._speed_sync_timer.timeout.connect(self._sync_speeds_from_plc)
-        self._speed_sync_timer.start()
+    def refresh_tasks(self) -> list:
+        """
+        Periodic updates, run by MainController's GuiRefreshScheduler.
+
+        Cut end detection (ML state reset) and the C/S target speeds follow
+        the pipeline snapshot in the background. Parameter, counter and mode
+        button reads from the PLC run only while the page is visible. The
+        polling and RESET hold timers sequence an operation the user started
+        and keep running as own QTimers.
+        """
+        return [
+            # Speed sync — PLC target speeds from the snapshot, C/S labels
+            RefreshTask('speeds', self._sync_speeds_from_plc, 500, background=True),
+            RefreshTask('params', self._sync_params_from_plc, 500),
+        ]
 
     # -------------------------------------------------------------------------
     # Public API
@@ -639,8 +653,6 @@ class OtomatikKesimController(QWidget):
             self._polling_timer.stop()
         if hasattr(self, '_reset_tick_timer') and self._reset_tick_timer:
             self._reset_tick_timer.stop()
-        if hasattr(self, '_speed_sync_timer') and self._speed_sync_timer:
-            self._speed_sync_timer.stop()
         logger.debug("OtomatikKesimController timers stopped")
 
     # -------------------------------------------------------------------------
@@ -648,13 +660,17 @@ class OtomatikKesimController(QWidget):
     # -------------------------------------------------------------------------
 
     def _sync_speeds_from_plc(self):
-        """Read PLC registers and update all param labels if changed externally."""
+        """Apply pipeline snapshot values: cut end detection and C/S target speeds."""
         try:
-            if not self.data_pipeline or not hasattr(self.data_pipeline, 'get_latest_data'):
+            if not self.data_pipeline or not hasattr(self.data_pipeline, 'get_latest_snapshot'):
                 return
-            data = self.data_pipeline.get_latest_data()
-            if not data:
+            snapshot = self.data_pipeline.get_latest_snapshot()
+
+            # Pipeline values only change with a new snapshot version
+            if snapshot.version == self._data_version:
                 return
+            self._data_version = snapshot.version
+            data = snapshot.data
 
             # Detect cut end (testere_durumu leaves 3) — reset speeds for next cut
             testere_durumu = int(data.get('testere_durumu', 0))
@@ -674,7 +690,12 @@ class OtomatikKesimController(QWidget):
             if self._s_value != descent_str:
                 self._s_value = descent_str
                 self.labelSValue.setText(descent_str)
+        except Exception as e:
+            logger.error(f"Speed sync error: {e}")
 
+    def _sync_params_from_plc(self):
+        """Read PLC registers and update P/X/L, counter and mode buttons if changed externally."""
+        try:
             # Read P, X, L, kesilmiş adet from MachineControl
             if self.machine_control:
                 # P (register 2050)
@@ -732,7 +753,7 @@ class OtomatikKesimController(QWidget):
                 self.btnManual.setChecked(current == ControlMode.MANUAL)
                 self.btnAI.setChecked(current == ControlMode.ML)
         except Exception as e:
-            logger.error(f"Speed sync error: {e}")
+            logger.error(f"Param sync error: {e}")
 
     # -------------------------------------------------------------------------
     # Helper Methods
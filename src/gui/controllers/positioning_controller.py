@@ -15,7 +15,7 @@ from typing import Optional, Dict, Callable
 
 try:
     from PySide6.QtWidgets import QWidget, QFrame, QPushButton, QLabel
-    from PySide6.QtCore import Qt, QTimer, Slot, Signal, QSize
+    from PySide6.QtCore import Qt, Slot, Signal, QSize
     from PySide6.QtGui import QFont, QPixmap, QIcon
 except ImportError:
     logging.warning("PySide6 not installed")
@@ -24,7 +24,6 @@ except ImportError:
     QPushButton = object
     QLabel = object
     Qt = object
-    QTimer = object
     Slot = lambda *args, **kwargs: (lambda f: f)
     Signal = lambda *args: None
     QSize = object
@@ -33,6 +32,7 @@ except ImportError:
     QIcon = object
 
 from ...services.control.machine_control import MachineControl
+from ..refresh_scheduler import RefreshTask
 from ..widgets.touch_button import TouchButton
 
 logger = logging.getLogger(__name__)
@@ -74,6 +74,9 @@ class PositioningController(QWidget):
         # Legacy compatibility
         self.get_data_callback = data_pipeline
 
+        # Last pipeline snapshot version rendered (skip refresh when unchanged)
+        self._data_version: Optional[int] = None
+
         # Initialize MachineControl from modbus service
         self.machine_control: Optional[MachineControl] = None
         self._initialize_machine_control()
@@ -87,9 +90,6 @@ class PositioningController(QWidget):
         # Setup UI
         self._setup_ui()
 
-        # Setup timers
-        self._setup_timers()
-
         logger.info("PositioningController initialized")
 
     def _initialize_machine_control(self) -> None:
@@ -386,18 +386,18 @@ class PositioningController(QWidget):
         self.btnEmergencyStop.clicked.connect(self._on_emergency_stop)
         self.btnEmergencyStop.raise_()  # Ensure it's on top
 
-    def _setup_timers(self):
-        """Setup all Qt timers for periodic updates."""
-        # Data update timer (if callback provided)
-        if self.get_data_callback:
-            self._data_timer = QTimer(self)
-            self._data_timer.timeout.connect(self._on_data_tick)
-            self._data_timer.start(200)  # 200ms
+    def refresh_tasks(self) -> list:
+        """
+        Periodic updates, run by MainController's GuiRefreshScheduler.
 
-        # Button state sync timer
-        self._button_state_timer = QTimer(self)
-        self._button_state_timer.timeout.connect(self._update_button_states)
-        self._button_state_timer.start(300)  # 300ms
+        Button states are read from the PLC only while the page is visible.
+        """
+        tasks = []
+        if self.get_data_callback:
+            tasks.append(RefreshTask('values', self._on_data_tick, 200))
+        # Button state sync
+        tasks.append(RefreshTask('buttons', self._update_button_states, 300))
+        return tasks
 
     # ========================================================================
     # Button Event Handlers
@@ -596,15 +596,16 @@ class PositioningController(QWidget):
     # ========================================================================
 
     def _on_data_tick(self):
-        """Called by data timer to fetch and update data."""
+        """Called by the 'values' refresh task to fetch and update data."""
         try:
             if self.get_data_callback:
                 # get_data_callback is data_pipeline object
-                # Get latest sensor data for display
-                if hasattr(self.get_data_callback, 'get_latest_data'):
-                    data = self.get_data_callback.get_latest_data()
-                    if data:
-                        self.update_data(data)
+                # Get latest sensor data for display (only when a new cycle was published)
+                if hasattr(self.get_data_callback, 'get_latest_snapshot'):
+                    snapshot = self.get_data_callback.get_latest_snapshot()
+                    if snapshot.version != self._data_version:
+                        self._data_version = snapshot.version
+                        self.update_data(snapshot.data)
         except Exception as e:
             logger.error(f"Data tick error: {e}")
 
@@ -623,7 +624,7 @@ class PositioningController(QWidget):
             logger.error(f"Data update error: {e}")
 
     def _update_button_states(self):
-        """Update button states from machine feedback (synchronous)."""
+        """Update button states from machine feedback (MachineControl status cache; stale bits are None and skipped)."""
         try:
             # Skip if no machine_control or not connected (avoid blocking reconnection attempts)
             if self.machine_control is None:
@@ -772,14 +773,7 @@ class PositioningController(QWidget):
         """
         Stop all QTimers in this controller.
 
-        IMPORTANT: Must be called from the GUI thread before window closes
-        to avoid segmentation fault on Linux.
+        Periodic updates are refresh_tasks() run by MainController's
+        GuiRefreshScheduler, which is stopped there; no own timers remain.
         """
-        try:
-            if hasattr(self, '_data_timer') and self._data_timer:
-                self._data_timer.stop()
-            if hasattr(self, '_button_state_timer') and self._button_state_timer:
-                self._button_state_timer.stop()
-            logger.debug("PositioningController timers stopped")
-        except Exception as e:
-            logger.error(f"Error stopping positioning controller timers: {e}")
+        logger.debug("PositioningController timers stopped")
@@ -2,7 +2,7 @@
 Sensor page controller for Smart Band Saw.
 
 This module provides real-time sensor monitoring with:
-- Custom cutting graph with QPainter (860x450)
+- Custom cutting graph (PolylinePlotWidget, 860x450)
 - Selectable X/Y axes (Time/Height, Speed/Current/Deviation/Torque)
 - 9 anomaly detection frames with visual indicators
 - Thread-safe data updates
@@ -10,46 +10,46 @@ This module provides real-time sensor monitoring with:
 """
 
 from typing import Callable, Dict, Optional
-from PySide6.QtCore import QTimer, QDateTime, Qt, QPoint
+from PySide6.QtCore import QDateTime, Qt, QPoint
 from PySide6.QtWidgets import QWidget, QButtonGroup, QLabel, QFrame, QPushButton
-from PySide6.QtGui import QIcon, QPainter, QPen, QColor, QBrush, QPolygon
+from PySide6.QtGui import QIcon, QPen, QColor, QPolygon
 import os
 from datetime import datetime, timedelta
 import threading
-import collections
 import logging
 
+from ..cut_buffer import CutBuffer
+from ..refresh_scheduler import RefreshTask
+from ..widgets.polyline_plot import PolylinePlotWidget
+
 logger = logging.getLogger(__name__)
 
 
-class CuttingGraphWidget(QWidget):
+class CuttingGraphWidget(PolylinePlotWidget):
     """
-    Custom cutting graph widget with QPainter.
+    Custom cutting graph widget (PolylinePlotWidget).
 
     Features:
     - Size: 860x450 pixels
-    - Grid: 20 vertical, 10 horizontal lines
-    - Line color: #F4F6FC (thickness 2)
-    - Fill color: rgba(149, 9, 82, 30)
+    - Grid: 20 vertical, 10 horizontal lines (cached, redrawn on resize)
+    - Line color: #F4F6FC (thickness 2), single decimated polyline
     - Grid color: rgba(255, 255, 255, 50)
-    - Max 1000 data points
+    - Plots the cut buffer columns of the selected axes (set_source, every
+      sample of the cut); add_data_point keeps max 1000 points otherwise
     - Red circle indicator (6px) at last point
-    - Real-time updates at 10 FPS
+    - Real-time updates at up to 10 FPS (only when new points arrived and
+      the page is visible)
     """
 
     def __init__(self, parent=None):
-        super().__init__(parent)
+        # Repainted by the sensor page's 'graph' refresh task (100 ms)
+        super().__init__(parent, capacity=1000, padding=20, v_lines=20, h_lines=10, refresh_ms=None)
         self.setMinimumSize(860, 450)
 
-        # Data structure: (x_value, y_value) tuples
-        self.data_points = collections.deque(maxlen=1000)
-        self.max_points = 1000
-
         # Graph settings
-        self.padding = 20
-        self.grid_color = QColor(255, 255, 255, 50)  # Transparent white
         self.line_color = QColor(0xF4, 0xF6, 0xFC)  # Line color (F4F6FC)
-        self.fill_color = QColor(149, 9, 82, 30)  # Fill color
+        self.line_pen = QPen(self.line_color, 2)
+        self.axis_pen = QPen(self.line_color, 2)
 
         # Axis information
         self.x_axis_type = "timestamp"  # Default
@@ -63,22 +63,6 @@ class CuttingGraphWidget(QWidget):
         self.start_height_value: Optional[float] = None
         self.current_height_value: Optional[float] = None
 
-        # Thread-safe data access lock
-        self._data_lock = threading.Lock()
-
-        # Timer for updates
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update)
-        self.update_timer.start(100)  # 10 FPS
-
-        # Widget style settings
-        self.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border: none;
-            }
-        """)
-
         # Create graph labels
         self._create_graph_labels()
 
@@ -88,8 +72,8 @@ class CuttingGraphWidget(QWidget):
             with self._data_lock:
                 self.x_axis_type = x_axis
                 self.y_axis_type = y_axis
-                # Clear data when axis changes
-                self.data_points.clear()
+            # Clear data when axis changes
+            self.clear_points()
             # Update axis title labels
             self.update_axis_titles(x_axis, y_axis)
         except Exception as e:
@@ -126,24 +110,19 @@ class CuttingGraphWidget(QWidget):
     def add_data_point(self, x_value: float, y_value: float):
         """Add new data point (thread-safe)"""
         try:
-            with self._data_lock:
-                self.data_points.append((x_value, y_value))
-                # Remove old data if exceeds max
-                if len(self.data_points) > self.max_points:
-                    self.data_points.popleft()
-                # Update last point time if using time axis
-                if self.x_axis_type == "timestamp":
-                    self.last_point_time = datetime.now()
+            self.add_point(x_value, y_value)
+            # Update last point time if using time axis
+            if self.x_axis_type == "timestamp":
+                self.last_point_time = datetime.now()
         except Exception as e:
             logger.error(f"Error adding data point: {e}")
 
     def clear_data(self):
         """Clear all data"""
         try:
-            with self._data_lock:
-                self.data_points.clear()
-                # Reset time info (will be set when cut starts)
-                self.last_point_time = None
+            self.clear_points()
+            # Reset time info (will be set when cut starts)
+            self.last_point_time = None
             # Reset labels - special format for time axis
             if self.x_axis_type == "timestamp" or self.y_axis_type == "timestamp":
                 self.update_label_values(0, 0, 0, 0)
@@ -152,134 +131,18 @@ class CuttingGraphWidget(QWidget):
         except Exception as e:
             logger.error(f"Error clearing data: {e}")
 
-    def paintEvent(self, event):
-        """Draw the graph"""
-        try:
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-
-            # Transparent background
-            painter.fillRect(self.rect(), QColor(0, 0, 0, 0))
-
-            # If no data, just draw grid
-            if not self.data_points:
-                self._draw_grid(painter, self.rect().adjusted(self.padding, self.padding, -self.padding, -self.padding))
-                return
-
-            # Calculate drawing area
-            draw_rect = self.rect().adjusted(self.padding, self.padding, -self.padding, -self.padding)
-
-            # Draw grid
-            self._draw_grid(painter, draw_rect)
-
-            # Draw data
-            self._draw_data(painter, draw_rect)
-
-        except Exception as e:
-            logger.error(f"Error drawing graph: {e}")
-
-    def _draw_grid(self, painter: QPainter, rect):
-        """Draw grid lines"""
-        try:
-            painter.setPen(QPen(self.grid_color, 1))
-
-            # Vertical lines (20)
-            for i in range(21):
-                x = rect.left() + (rect.width() * i) // 20
-                painter.drawLine(x, rect.top(), x, rect.bottom())
-
-            # Horizontal lines (10)
-            for i in range(11):
-                y = rect.top() + (rect.height() * i) // 10
-                painter.drawLine(rect.left(), y, rect.right(), y)
-            
-            painter.setPen(QPen(self.line_color, 2))
-            painter.drawLine(rect.left(), rect.top(), rect.left(), rect.bottom())
-            painter.drawLine(rect.left(), rect.bottom(), rect.right(), rect.bottom())
-
-        except Exception as e:
-            logger.error(f"Error drawing grid: {e}")
-
-    def _draw_data(self, painter: QPainter, rect):
-        """Draw data lines"""
-        try:
-            with self._data_lock:
-                if len(self.data_points) < 2:
-                    return
-
-                # Separate X and Y values
-                x_values = [point[0] for point in self.data_points]
-                y_values = [point[1] for point in self.data_points]
-
-                # Calculate value ranges
-                x_min, x_max = min(x_values), max(x_values)
-                y_min, y_max = min(y_values), max(y_values)
-
-                # Expand range if too small
-                if x_max - x_min < 0.1:
-                    mid_val = (x_min + x_max) / 2
-                    x_min = mid_val - 0.05
-                    x_max = mid_val + 0.05
-
-                if y_max - y_min < 0.1:
-                    mid_val = (y_min + y_max) / 2
-                    y_min = mid_val - 0.05
-                    y_max = mid_val + 0.05
-
-                # Update label values
-                if self.x_axis_type == "timestamp" and self.cut_start_time and self.last_point_time:
-                    # Special labels for time axis (start -> end)
-                    self._update_time_axis_labels(self.cut_start_time, self.last_point_time, y_min, y_max)
-                elif self.x_axis_type == "kafa_yuksekligi_mm" and self.start_height_value is not None and self.current_height_value is not None:
-                    # Special labels for height axis (start -> current)
-                    self._update_height_axis_labels(self.start_height_value, self.current_height_value, y_min, y_max)
-                else:
-                    self.update_label_values(x_min, x_max, y_min, y_max)
-
-                # Line color
-                painter.setPen(QPen(self.line_color, 2))
-
-                # Fill color
-                painter.setBrush(QBrush(self.fill_color))
-
-                # Calculate line points (new data appears from right, indexed)
-                points = []
-                total_points = len(self.data_points)
-                for i, (_x_value, y_value) in enumerate(self.data_points):
-                    # X coordinate: 0..N-1 evenly spaced, newest on right
-                    if total_points > 1:
-                        x = rect.left() + (rect.width() * i) // (total_points - 1)
-                    else:
-                        x = rect.left() + rect.width() // 2
-
-                    # Y coordinate (inverted - Qt y increases downward)
-                    if y_max != y_min:
-                        normalized_y = (y_value - y_min) / (y_max - y_min)
-                    else:
-                        normalized_y = 0.5
-                    y = rect.bottom() - (rect.height() * normalized_y)
-
-                    points.append((x, y))
-
-                # Draw line
-                if len(points) > 1:
-                    # Main line
-                    for i in range(len(points) - 1):
-                        painter.drawLine(int(points[i][0]), int(points[i][1]),
-                                       int(points[i+1][0]), int(points[i+1][1]))
-
-                # Draw red circle at last point
-                if points:
-                    last_x, last_y = points[-1]
-                    circle_size = 6
-                    painter.setBrush(QBrush(QColor(255, 0, 0)))
-                    painter.setPen(QPen(QColor(255, 0, 0), 1))
-                    painter.drawEllipse(int(last_x - circle_size), int(last_y - circle_size),
-                                      circle_size * 2, circle_size * 2)
-
-        except Exception as e:
-            logger.error(f"Error drawing data: {e}")
+    def _on_range(self, x_min: float, x_max: float, y_min: float, y_max: float):
+        """Update axis labels for the drawn range"""
+        if self.x_axis_type == "timestamp" and self.cut_start_time and self.last_point_time:
+            # Special labels for time axis (start -> end)
+            self._update_time_axis_labels(self.cut_start_time, self.last_point_time, y_min, y_max)
+        elif self.x_axis_type == "kafa_yuksekligi_mm" and self.start_height_value is not None and self.current_height_value is not None:
+            # Special labels for height axis (start -> current)
+            self._update_height_axis_labels(self.start_height_value, self.current_height_value, y_min, y_max)
+        else:
+            # Expand range if too small (same rule as the value axis)
+            x_min, x_max = self._y_range(x_min, x_max)
+            self.update_label_values(x_min, x_max, y_min, y_max)
 
     def resizeEvent(self, event):
         """Handle widget resize"""
@@ -287,7 +150,6 @@ class CuttingGraphWidget(QWidget):
         # Update label positions if labels exist
         if hasattr(self, 'yust') and self.yust:
             self._update_label_positions()
-        self.update()
 
     def _create_graph_labels(self):
         """Create graph axis labels"""
@@ -527,6 +389,11 @@ class SensorController(QWidget):
         self.control_manager = control_manager
         self.data_pipeline = data_pipeline
 
+        # Last pipeline snapshot versions handled (skip refresh when unchanged):
+        # page values (visible only) and cut buffer recording (background)
+        self._data_version: Optional[int] = None
+        self._cut_version: Optional[int] = None
+
         # Setup UI matching reference design (1528x1080 page size)
         self._setup_ui()
 
@@ -554,14 +421,11 @@ class SensorController(QWidget):
             data_pipeline.anomaly_manager.set_update_callback(self._update_anomaly_state)
             logger.info("Anomaly manager callback registered")
 
-        # Last cut data storage
-        self.last_cut_data = []
         self.is_cutting = False
         self.cut_start_time = None
 
-        # Buffer to store full current cut for all metrics (overflow protection)
-        from collections import deque
-        self.current_cut_buffer = deque(maxlen=2000)  # Max 2000 data points (~3-4 minutes cutting)
+        # Full current cut for all metrics, one column per field (graph plots column views)
+        self.current_cut_buffer = CutBuffer()
 
         # Thread-safety for buffer lock (MUST be before _setup_cutting_graph)
         self._buffer_lock = threading.Lock()
@@ -574,10 +438,7 @@ class SensorController(QWidget):
         self._thread_local = threading.local()
         logger.info("Thread-local database connection ready")
 
-        # Timers (data)
-        self._data_timer = QTimer(self)
-        self._data_timer.timeout.connect(self._on_data_tick)
-        self._data_timer.start(200)  # 200 ms
+        # Initial values (periodic updates: refresh_tasks)
         self._on_data_tick()
 
         # Optional reset button
@@ -966,6 +827,8 @@ class SensorController(QWidget):
 
                 # Set default axis types (Time - Cutting Speed)
                 self.cutting_graph.set_axis_types("timestamp", "serit_kesme_hizi")
+                # Plot the cut buffer columns of the selected axes
+                self.cutting_graph.set_source(self._graph_columns)
 
                 # Load last cut data
                 self._load_last_cut_data()
@@ -1147,15 +1010,42 @@ class SensorController(QWidget):
             self.data_pipeline.anomaly_manager.reset_anomaly_states()
             logger.info("Anomaly manager states reset")
 
+    def refresh_tasks(self) -> list:
+        """
+        Periodic updates, run by MainController's GuiRefreshScheduler.
+
+        The cut buffer keeps recording while another page is shown; sensor
+        values, anomaly frames and graph repaints only run while visible.
+        """
+        tasks = [
+            RefreshTask('cut_buffer', self._on_cut_tick, 200, background=True),
+            RefreshTask('values', self._on_data_tick, 200),
+        ]
+        if self.cutting_graph:
+            tasks.append(RefreshTask('graph', self.cutting_graph.refresh, 100))
+        return tasks
+
+    def _on_cut_tick(self):
+        """Background tick: record the current cut into the cut buffer"""
+        try:
+            if self.data_pipeline and hasattr(self.data_pipeline, 'get_latest_snapshot'):
+                snapshot = self.data_pipeline.get_latest_snapshot()
+                if snapshot.version != self._cut_version:
+                    self._cut_version = snapshot.version
+                    self._update_cutting_graph(snapshot.data)
+        except Exception as e:
+            logger.error(f"Error in cut tick: {e}")
+
     def _on_data_tick(self):
         """Periodic data update callback"""
         try:
             if self.data_pipeline:
-                # Use get_latest_data for sensor display
-                if hasattr(self.data_pipeline, 'get_latest_data'):
-                    data = self.data_pipeline.get_latest_data()
-                    if data and isinstance(data, dict):
-                        self._update_sensor_values(data)
+                # Use the latest snapshot for sensor display (only when a new cycle was published)
+                if hasattr(self.data_pipeline, 'get_latest_snapshot'):
+                    snapshot = self.data_pipeline.get_latest_snapshot()
+                    if snapshot.version != self._data_version:
+                        self._data_version = snapshot.version
+                        self._update_sensor_values(snapshot.data)
         except Exception as e:
             logger.error(f"Error in data tick: {e}")
 
@@ -1202,9 +1092,6 @@ class SensorController(QWidget):
             if hasattr(self, 'labelTitresimZValue'):
                 self.labelTitresimZValue.setText(f"{vib_z:.1f} Hz")
 
-            # Update cutting graph
-            self._update_cutting_graph(data)
-
             # Frame styles
             red_style = """
                 QFrame {
@@ -1285,20 +1172,25 @@ class SensorController(QWidget):
 
             # Check saw state
             testere_durumu = data.get('testere_durumu', 0)
+            kesim_id = data.get('cutting_session_id')
 
             # Thread-safe state check
             with self._buffer_lock:
                 is_currently_cutting = self.is_cutting
+                buffer_kesim_id = self.current_cut_buffer.kesim_id
+                if is_currently_cutting and buffer_kesim_id is None:
+                    # Session ID assigned after the first cutting sample
+                    self.current_cut_buffer.kesim_id = buffer_kesim_id = kesim_id
 
-            # Check if cutting started
+            # Check if cutting started (or a new session began without an idle sample)
             if testere_durumu == 3:  # CUTTING
-                if not is_currently_cutting:
+                new_session = kesim_id is not None and buffer_kesim_id is not None and kesim_id != buffer_kesim_id
+                if not is_currently_cutting or new_session:
                     # Cutting started (thread-safe)
                     with self._buffer_lock:
                         self.is_cutting = True
                         self.cut_start_time = datetime.now()
-                        self.last_cut_data = []
-                        self.current_cut_buffer = collections.deque(maxlen=2000)
+                        self.current_cut_buffer.start(kesim_id, self.cut_start_time)
 
                     # Transfer start time to graph for time labels
                     self.cutting_graph.cut_start_time = self.cut_start_time
@@ -1307,12 +1199,6 @@ class SensorController(QWidget):
                     self.cutting_graph.start_height_value = None
                     self.cutting_graph.current_height_value = None
                     self.cutting_graph.clear_data()
-                    # Restart real-time graph
-                    try:
-                        if self.cutting_graph and not self.cutting_graph.update_timer.isActive():
-                            self.cutting_graph.update_timer.start(100)
-                    except Exception:
-                        pass
                     logger.info("Cutting started - graph data cleared")
 
                 # Collect data during cutting
@@ -1322,14 +1208,8 @@ class SensorController(QWidget):
                 # Cutting finished (thread-safe)
                 with self._buffer_lock:
                     self.is_cutting = False
-                # Keep start time, show last cut
+                # Keep start time, show last cut (no new points, no repaints)
                 logger.info("Cutting finished")
-                # Stop real-time graph (show last cut)
-                try:
-                    if self.cutting_graph and self.cutting_graph.update_timer.isActive():
-                        self.cutting_graph.update_timer.stop()
-                except Exception:
-                    pass
 
         except Exception as e:
             logger.error(f"Error updating cutting graph: {e}")
@@ -1337,132 +1217,56 @@ class SensorController(QWidget):
     def _add_cutting_data_point(self, data: Dict):
         """Add data point during cutting (thread-safe)"""
         try:
-            # Thread-safe state check
-            with self._buffer_lock:
-                is_cutting = self.is_cutting
-                cut_start = self.cut_start_time
-
-            if not self.cutting_graph or not is_cutting:
-                return
-
-            # Add all metrics to buffer
             now_dt = datetime.now()
-            elapsed_s = (now_dt - cut_start).total_seconds() if cut_start else 0.0
-            buffer_row = {
-                'timestamp_dt': now_dt,
-                'elapsed_s': float(elapsed_s),
-                'serit_kesme_hizi': float(data.get('serit_kesme_hizi', 0.0)),
-                'serit_inme_hizi': float(data.get('serit_inme_hizi', 0.0)),
-                'serit_motor_akim_a': float(data.get('serit_motor_akim_a', 0.0)),
-                'serit_sapmasi': float(data.get('serit_sapmasi', 0.0)),
-                'serit_motor_tork_percentage': float(data.get('serit_motor_tork_percentage', 0.0)),
-                'kafa_yuksekligi_mm': float(data.get('kafa_yuksekligi_mm', 0.0)),
-                'ivme_olcer_x_hz': float(data.get('ivme_olcer_x_hz', 0.0)),
-                'ivme_olcer_y_hz': float(data.get('ivme_olcer_y_hz', 0.0)),
-                'ivme_olcer_z_hz': float(data.get('ivme_olcer_z_hz', 0.0)),
-            }
 
-            # Thread-safe buffer add
+            # Thread-safe buffer add (all metrics)
             with self._buffer_lock:
-                self.current_cut_buffer.append(buffer_row)
-
-            # Update height axis labels start/current values
-            try:
-                h = buffer_row['kafa_yuksekligi_mm']
-                if self.cutting_graph.start_height_value is None:
-                    self.cutting_graph.start_height_value = h
-                self.cutting_graph.current_height_value = h
-            except Exception:
-                pass
-
-            # Add last point to graph based on selected axes
-            x_axis = self.cutting_graph.x_axis_type
-            y_axis = self.cutting_graph.y_axis_type
-
-            x_value = self._get_value_for_axis_from_buffer(buffer_row, x_axis)
-            y_value = self._get_value_for_axis_from_buffer(buffer_row, y_axis)
-
-            self.cutting_graph.add_data_point(float(x_value), float(y_value))
-
-            # Save last cut data
-            self.last_cut_data.append({
-                'timestamp': datetime.now(),
-                'x_value': x_value,
-                'y_value': y_value,
-                'x_axis': x_axis,
-                'y_axis': y_axis
-            })
+                if not self.cutting_graph or not self.is_cutting:
+                    return
+                self.current_cut_buffer.append(data, now_dt)
+                start_h = self.current_cut_buffer.first('kafa_yuksekligi_mm')
+                current_h = self.current_cut_buffer.last('kafa_yuksekligi_mm')
+
+            # Update time/height axis labels start/current values
+            self.cutting_graph.last_point_time = now_dt
+            if self.cutting_graph.start_height_value is None:
+                self.cutting_graph.start_height_value = start_h
+            self.cutting_graph.current_height_value = current_h
+
+            # Graph plots the buffer columns; repaint on the next tick
+            self.cutting_graph.mark_dirty()
 
         except Exception as e:
             logger.error(f"Error adding data point: {e}")
 
-    def _get_value_for_axis_from_buffer(self, row: Dict, axis_type: str) -> float:
-        """Get axis value from buffer row"""
-        try:
-            if axis_type == "timestamp":
-                return float(row.get('elapsed_s', 0.0))
-            elif axis_type == "serit_kesme_hizi":
-                return float(row.get('serit_kesme_hizi', 0.0))
-            elif axis_type == "serit_inme_hizi":
-                return float(row.get('serit_inme_hizi', 0.0))
-            elif axis_type == "serit_motor_akim_a":
-                return float(row.get('serit_motor_akim_a', 0.0))
-            elif axis_type == "serit_sapmasi":
-                return float(row.get('serit_sapmasi', 0.0))
-            elif axis_type == "serit_motor_tork_percentage":
-                return float(row.get('serit_motor_tork_percentage', 0.0))
-            elif axis_type == "kafa_yuksekligi_mm":
-                return float(row.get('kafa_yuksekligi_mm', 0.0))
-            else:
-                return 0.0
-        except Exception:
-            return 0.0
+    def _graph_columns(self):
+        """Cut buffer column views for the selected graph axes (graph data source)."""
+        with self._buffer_lock:
+            return self.current_cut_buffer.columns(self.cutting_graph.x_axis_type, self.cutting_graph.y_axis_type)
 
     def _rebuild_graph_from_buffer(self):
-        """Rebuild graph from buffer based on selected axes (thread-safe)"""
+        """Show the buffered cut on the selected axes (thread-safe, no copy)"""
         try:
-            # Thread-safe buffer copy
             with self._buffer_lock:
-                if not self.cutting_graph or not self.current_cut_buffer:
+                buffer = self.current_cut_buffer
+                if not self.cutting_graph or not len(buffer):
                     return
-                buffer_copy = list(self.current_cut_buffer)
-                cut_start = self.cut_start_time
-
-            # Clear graph
-            self.cutting_graph.clear_data()
-
-            x_axis = self.cutting_graph.x_axis_type
-            y_axis = self.cutting_graph.y_axis_type
+                first_dt, last_dt = buffer.first_at, buffer.last_at
+                first_h = buffer.first('kafa_yuksekligi_mm')
+                last_h = buffer.last('kafa_yuksekligi_mm')
 
             # Time labels start/end
-            if cut_start:
-                self.cutting_graph.cut_start_time = cut_start
-            first_dt = buffer_copy[0].get('timestamp_dt', None)
-            last_dt = buffer_copy[-1].get('timestamp_dt', None)
             if first_dt and last_dt:
                 self.cutting_graph.cut_start_time = first_dt
                 self.cutting_graph.last_point_time = last_dt
             # Height start/current values from buffer
-            try:
-                first_h = buffer_copy[0].get('kafa_yuksekligi_mm', None)
-                last_h = buffer_copy[-1].get('kafa_yuksekligi_mm', None)
-                if first_h is not None and last_h is not None:
-                    self.cutting_graph.start_height_value = float(first_h)
-                    self.cutting_graph.current_height_value = float(last_h)
-            except Exception:
-                pass
-
-            for row in buffer_copy:
-                x_value = self._get_value_for_axis_from_buffer(row, x_axis)
-                y_value = self._get_value_for_axis_from_buffer(row, y_axis)
-                self.cutting_graph.add_data_point(float(x_value), float(y_value))
+            self.cutting_graph.start_height_value = first_h
+            self.cutting_graph.current_height_value = last_h
 
+            # Axis types already switched; the graph reads the new column pair
+            self.cutting_graph.mark_dirty()
+            self.cutting_graph.update()
             logger.info("Graph rebuilt from buffer")
-            # Redraw
-            try:
-                self.cutting_graph.update()
-            except Exception:
-                pass
         except Exception as e:
             logger.error(f"Error rebuilding graph from buffer: {e}")
 
@@ -1493,6 +1297,7 @@ class SensorController(QWidget):
         """
         try:
             self._update_sensor_values(data)
+            self._update_cutting_graph(data)
         except Exception as e:
             logger.error(f"Error updating data: {e}")
 
@@ -1500,15 +1305,7 @@ class SensorController(QWidget):
         """
         Stop all QTimers in this controller.
 
-        IMPORTANT: Must be called from the GUI thread before window closes
-        to avoid segmentation fault on Linux.
+        Periodic updates are refresh_tasks() run by MainController's
+        GuiRefreshScheduler, which is stopped there; no own timers remain.
         """
-        try:
-            if hasattr(self, '_data_timer') and self._data_timer:
-                self._data_timer.stop()
-            if hasattr(self, 'cutting_graph') and self.cutting_graph:
-                if hasattr(self.cutting_graph, 'update_timer'):
-                    self.cutting_graph.update_timer.stop()
-            logger.debug("SensorController timers stopped")
-        except Exception as e:
-            logger.error(f"Error stopping sensor controller timers: {e}")
+        logger.debug("SensorController timers stopped")
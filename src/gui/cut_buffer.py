@@ -0,0 +1,143 @@
+"""
+Columnar in-memory buffer of the current cut for the sensor page graph.
+
+One preallocated NumPy float64 column per plottable field, grown by
+doubling, so a cut keeps every sample (no row cap) and the graph can plot
+any X/Y pair straight from two column views: switching axes rebinds
+columns instead of rebuilding per-row dicts and re-adding every point.
+
+The buffer is keyed by kesim_id (cutting_session_id); start() reuses the
+allocated columns for the next cut.
+"""
+
+from datetime import datetime
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Plottable fields (snapshot keys); 'elapsed_s' is computed from the cut start
+CUT_FIELDS = (
+    'elapsed_s',
+    'serit_kesme_hizi',
+    'serit_inme_hizi',
+    'serit_motor_akim_a',
+    'serit_sapmasi',
+    'serit_motor_tork_percentage',
+    'serit_gerginligi_bar',
+    'kafa_yuksekligi_mm',
+    'ivme_olcer_x_hz',
+    'ivme_olcer_y_hz',
+    'ivme_olcer_z_hz',
+)
+
+# Graph axis types that are not field names
+AXIS_COLUMNS = {
+    'timestamp': 'elapsed_s',
+}
+
+
+class CutBuffer:
+    """
+    Growable column store for one cut.
+
+    Not thread-safe; the sensor controller guards it with its buffer lock.
+    Column views stay valid after later appends (growth allocates new
+    arrays and leaves existing views untouched).
+    """
+
+    def __init__(self, fields: Sequence[str] = CUT_FIELDS, initial_capacity: int = 1024):
+        """
+        Initialize buffer.
+
+        Args:
+            fields: Column names (snapshot keys, plus 'elapsed_s')
+            initial_capacity: Rows allocated up front (doubled when full)
+        """
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._capacity = max(1, int(initial_capacity))
+        self._columns: Dict[str, np.ndarray] = {name: np.zeros(self._capacity) for name in self.fields}
+        self._len = 0
+
+        self.kesim_id: Optional[int] = None
+        self.started_at: Optional[datetime] = None
+        self.first_at: Optional[datetime] = None
+        self.last_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def capacity(self) -> int:
+        """Rows allocated."""
+        return self._capacity
+
+    def start(self, kesim_id: Optional[int], started_at: datetime):
+        """
+        Begin a new cut (drops previous rows, keeps the allocation).
+
+        Args:
+            kesim_id: Cutting session ID (None until the pipeline assigns it)
+            started_at: Cut start time (elapsed_s reference)
+        """
+        self._len = 0
+        self.kesim_id = kesim_id
+        self.started_at = started_at
+        self.first_at = None
+        self.last_at = None
+
+    def append(self, data: Mapping, timestamp: datetime):
+        """
+        Add one sample.
+
+        Args:
+            data: Snapshot data (missing/invalid fields are stored as 0.0)
+            timestamp: Sample time
+        """
+        if self._len == self._capacity:
+            self._grow()
+        i = self._len
+        for name, column in self._columns.items():
+            if name == 'elapsed_s':
+                value = (timestamp - self.started_at).total_seconds() if self.started_at else 0.0
+            else:
+                try:
+                    value = float(data.get(name, 0.0))
+                except (TypeError, ValueError):
+                    value = 0.0
+            column[i] = value
+        self._len += 1
+        if self.first_at is None:
+            self.first_at = timestamp
+        self.last_at = timestamp
+
+    def _grow(self):
+        """Double the capacity of every column."""
+        self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.zeros(self._capacity)
+            grown[:self._len] = column[:self._len]
+            self._columns[name] = grown
+
+    def column(self, axis: str) -> np.ndarray:
+        """
+        Rows of one column as a view (no copy).
+
+        Args:
+            axis: Field name or graph axis type ('timestamp')
+
+        Raises:
+            KeyError: Unknown field
+        """
+        return self._columns[AXIS_COLUMNS.get(axis, axis)][:self._len]
+
+    def columns(self, x_axis: str, y_axis: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(x, y) views for the selected graph axes."""
+        return self.column(x_axis), self.column(y_axis)
+
+    def first(self, axis: str) -> Optional[float]:
+        """First value of a column (None when empty)."""
+        return float(self.column(axis)[0]) if self._len else None
+
+    def last(self, axis: str) -> Optional[float]:
+        """Last value of a column (None when empty)."""
+        return float(self.column(axis)[-1]) if self._len else None
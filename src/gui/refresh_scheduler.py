@@ -0,0 +1,224 @@
+"""
+Visibility-aware GUI refresh scheduler.
+
+Page controllers used to start their own QTimers (50 ms to 2 s) and keep
+them running while another page was shown in the main window stack, so
+hidden pages kept re-rendering labels and reading PLC bits over Modbus.
+
+MainController owns one GuiRefreshScheduler with a single master QTimer.
+Pages declare their periodic work as RefreshTask objects
+(refresh_tasks()); on every master tick the scheduler runs the due tasks
+of the currently visible page plus the tasks declared as background
+(alarm polling, cut buffer recording, cut timing, the status bar, ...).
+
+Redundant refreshes are collapsed: a task that missed several of its
+periods (slow tick, page hidden) runs once, not once per missed period,
+and a page that becomes visible runs all its tasks immediately so it never
+shows stale values.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+try:
+    from PySide6.QtCore import QTimer
+except ImportError:
+    logging.warning("PySide6 not installed")
+    QTimer = object
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RefreshTask:
+    """
+    Periodic GUI work declared by a page.
+
+    Attributes:
+        name: Task name (unique within the page)
+        callback: Called on the GUI thread when due
+        interval_ms: Minimum time between runs
+        background: Run while the page is hidden
+    """
+    name: str
+    callback: Callable[[], None] = field(repr=False)
+    interval_ms: int
+    background: bool = False
+
+    # Runtime state (scheduler owned)
+    next_due: float = field(default=0.0, repr=False)
+    runs: int = field(default=0, repr=False)
+    total_s: float = field(default=0.0, repr=False)
+    max_s: float = field(default=0.0, repr=False)
+
+
+class GuiRefreshScheduler:
+    """
+    One master tick dispatching refresh tasks by page visibility.
+
+    All methods must be called from the GUI thread.
+    """
+
+    def __init__(self, parent=None, tick_ms: int = 50, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize scheduler.
+
+        Args:
+            parent: QObject owning the master QTimer (MainController)
+            tick_ms: Master tick period (task intervals are rounded up to it)
+            clock: Monotonic time source in seconds (tests)
+        """
+        self._parent = parent
+        self.tick_ms = int(tick_ms)
+        self._clock = clock
+        self._timer: Optional[QTimer] = None
+
+        self._pages: Dict[int, List[RefreshTask]] = {}
+        self._page_names: Dict[int, str] = {}
+        self._background: Dict[str, List[RefreshTask]] = {}
+        self.current_page: Optional[int] = None
+        self._in_tick = False
+
+        self._stats = {
+            'ticks': 0,
+            'runs': 0,
+            'collapsed': 0,
+            'errors': 0,
+        }
+
+    # -- registration -----------------------------------------------------------
+
+    def add_page(self, index: int, tasks: Iterable[RefreshTask], name: Optional[str] = None):
+        """
+        Register a page's tasks.
+
+        Args:
+            index: Page index in the stacked widget (PageIndex)
+            tasks: RefreshTask objects; background ones run on every page
+            name: Page name for statistics (default: str(index))
+        """
+        name = name or str(index)
+        self._page_names[index] = name
+        for task in tasks:
+            if task.background:
+                self._background.setdefault(name, []).append(task)
+            else:
+                self._pages.setdefault(index, []).append(task)
+
+    def add_background(self, owner: str, tasks: Iterable[RefreshTask]):
+        """
+        Register tasks that run regardless of the visible page.
+
+        Args:
+            owner: Name for statistics (e.g. 'main')
+            tasks: RefreshTask objects
+        """
+        self._background.setdefault(owner, []).extend(tasks)
+
+    # -- visibility ---------------------------------------------------------------
+
+    def set_current_page(self, index: int):
+        """
+        Switch the visible page; its tasks run right away.
+
+        Called from a running task (alarm auto-navigation), the new page's
+        tasks run later in that same tick instead of a nested one.
+
+        Args:
+            index: Page index now shown in the stacked widget
+        """
+        self.current_page = index
+        now = self._clock()
+        for task in self._pages.get(index, []):
+            task.next_due = now
+        if not self._in_tick:
+            self.tick()
+
+    # -- master tick ----------------------------------------------------------------
+
+    def start(self):
+        """Start the master QTimer."""
+        if self._timer is None:
+            self._timer = QTimer(self._parent)
+            self._timer.timeout.connect(self.tick)
+        self._timer.start(self.tick_ms)
+        logger.info(f"GUI refresh scheduler started ({self.tick_ms} ms tick, {self._task_count()} tasks)")
+
+    def stop(self):
+        """Stop the master QTimer (GUI thread, before the window closes)."""
+        if self._timer is not None:
+            self._timer.stop()
+
+    def tick(self):
+        """Run every due task of the visible page and the background tasks."""
+        self._stats['ticks'] += 1
+        self._in_tick = True
+        try:
+            now = self._clock()
+            for tasks in self._background.values():
+                self._run_due(tasks, now)
+            self._run_due(self._pages.get(self.current_page, ()), now)
+        finally:
+            self._in_tick = False
+
+    def _run_due(self, tasks: Iterable[RefreshTask], now: float):
+        """Run due tasks once and schedule their next run."""
+        for task in tasks:
+            if now < task.next_due:
+                continue
+            start = self._clock()
+            try:
+                task.callback()
+            except Exception as e:
+                self._stats['errors'] += 1
+                logger.error(f"Refresh task '{task.name}' failed: {e}")
+            elapsed = self._clock() - start
+            task.runs += 1
+            task.total_s += elapsed
+            task.max_s = max(task.max_s, elapsed)
+            self._stats['runs'] += 1
+
+            # Stay on the task's period; missed periods collapse into this run
+            interval = task.interval_ms / 1000.0
+            task.next_due = (task.next_due or now) + interval
+            if task.next_due <= now:
+                self._stats['collapsed'] += int((now - task.next_due) / interval) + 1
+                task.next_due = now + interval
+
+    # -- statistics -------------------------------------------------------------------
+
+    def _task_count(self) -> int:
+        return sum(len(t) for t in self._pages.values()) + sum(len(t) for t in self._background.values())
+
+    def get_stats(self) -> dict:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with tick/run counters, the visible page and per-task
+            runs, average and max callback time in ms
+        """
+        tasks = {}
+        for index, page_tasks in self._pages.items():
+            for task in page_tasks:
+                tasks[f"{self._page_names.get(index, index)}.{task.name}"] = task
+        for owner, owner_tasks in self._background.items():
+            for task in owner_tasks:
+                tasks[f"{owner}.{task.name}"] = task
+        return {
+            **self._stats,
+            'tick_ms': self.tick_ms,
+            'current_page': self._page_names.get(self.current_page, self.current_page),
+            'tasks': {
+                key: {
+                    'interval_ms': task.interval_ms,
+                    'background': task.background,
+                    'runs': task.runs,
+                    'avg_ms': round(task.total_s / task.runs * 1000, 3) if task.runs else None,
+                    'max_ms': round(task.max_s * 1000, 3),
+                }
+                for key, task in tasks.items()
+            },
+        }
@@ -5,5 +5,6 @@ Custom widgets for the Smart Saw HMI.
 """
 
 from .touch_button import TouchButton
+from .polyline_plot import PolylinePlotWidget
 
-__all__ = ['TouchButton']
+__all__ = ['TouchButton', 'PolylinePlotWidget']
@@ -0,0 +1,447 @@
+"""
+Shared real-time line plot widget.
+
+Used by the sensor page cutting graph and the control panel band deviation
+graph. Compared to drawing every segment with drawLine from Python lists:
+
+- Points live in a NumPy ring buffer (PointBuffer), or in arrays owned by
+  the caller (set_source); no per-paint list rebuilding.
+- The series is decimated to the plot width in pixels before drawing:
+  LTTB (largest triangle three buckets) keeps the visual shape when there
+  are a few points per pixel, min/max bucketing keeps the envelope (and
+  every spike) when there are many.
+- The line is drawn with a single drawLines() call over the segment
+  pairs. (An antialiased 2 px drawPolyline() strokes the whole path with
+  joins and measured ~2.5x slower on the raster engine.)
+- The static grid is rendered once into a QPixmap, invalidated on resize.
+- refresh() (own timer, or the owner's GuiRefreshScheduler task) only
+  calls update() when points were added since the last paint.
+
+Subclasses customise the value range (_y_range), label updates
+(_on_range), the series drawing (_draw_series) and the empty state
+(_draw_empty).
+"""
+
+import logging
+import threading
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+try:
+    from PySide6.QtWidgets import QWidget
+    from PySide6.QtCore import Qt, QTimer, QPointF
+    from PySide6.QtGui import QPainter, QPen, QColor, QBrush, QPixmap, QPolygonF
+except ImportError:
+    logging.warning("PySide6 not installed")
+    QWidget = object
+    Qt = object
+    QTimer = object
+    QPointF = object
+    QPainter = object
+    QPen = object
+    QColor = object
+    QBrush = object
+    QPixmap = object
+    QPolygonF = object
+
+logger = logging.getLogger(__name__)
+
+DECIMATION_METHODS = ('auto', 'lttb', 'minmax')
+
+# 'auto' switches from LTTB to min/max above this many points per pixel
+AUTO_MINMAX_RATIO = 4
+
+
+class PointBuffer:
+    """
+    Fixed-capacity (x, y) ring buffer backed by NumPy arrays.
+
+    Every value is written twice (at i and i + capacity), so the contents
+    are always one contiguous slice and arrays() never copies.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize buffer.
+
+        Args:
+            capacity: Maximum points kept (oldest dropped first)
+        """
+        self.capacity = max(1, int(capacity))
+        self._x = np.zeros(2 * self.capacity)
+        self._y = np.zeros(2 * self.capacity)
+        self._start = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, x: float, y: float):
+        """Add a point, dropping the oldest when full."""
+        cap = self.capacity
+        if self._len < cap:
+            i = (self._start + self._len) % cap
+            self._len += 1
+        else:
+            i = self._start
+            self._start = (self._start + 1) % cap
+        self._x[i] = self._x[i + cap] = x
+        self._y[i] = self._y[i + cap] = y
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Oldest-first x and y views (valid until the next append)."""
+        end = self._start + self._len
+        return self._x[self._start:end], self._y[self._start:end]
+
+    def drop_before(self, x_min: float) -> int:
+        """
+        Drop leading points with x < x_min (x must be non-decreasing).
+
+        Returns:
+            Number of points dropped
+        """
+        x, _ = self.arrays()
+        count = int(np.searchsorted(x, x_min, side='left'))
+        if count:
+            self._start = (self._start + count) % self.capacity
+            self._len -= count
+        return count
+
+    def clear(self):
+        """Remove all points."""
+        self._start = 0
+        self._len = 0
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        x: X values (increasing)
+        y: Y values
+        n_out: Number of points to keep (first and last always kept)
+
+    Returns:
+        (x, y) of the selected points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Bucket bounds and next-bucket averages do not depend on the selection
+    every = (n - 2) / (n_out - 2)
+    edges = (np.arange(n_out - 1) * every).astype(np.intp) + 1
+    edges[-1] = n - 1
+    bounds = np.append(edges, n)
+    csx = np.concatenate(([0.0], np.cumsum(x)))
+    csy = np.concatenate(([0.0], np.cumsum(y)))
+    spans = bounds[2:] - bounds[1:-1]
+    avg_x = ((csx[bounds[2:]] - csx[bounds[1:-1]]) / spans).tolist()
+    avg_y = ((csy[bounds[2:]] - csy[bounds[1:-1]]) / spans).tolist()
+
+    xs = x.tolist()
+    ys = y.tolist()
+    starts = edges.tolist()
+    selected = [0]
+    a = 0
+    for i in range(n_out - 2):
+        # Point of this bucket with the largest triangle area (third vertex:
+        # average of the next bucket)
+        ax, ay = xs[a], ys[a]
+        cx, cy = avg_x[i], avg_y[i]
+        best_area = -1.0
+        best = starts[i]
+        for j in range(starts[i], starts[i + 1]):
+            area = abs((ax - cx) * (ys[j] - ay) - (ax - xs[j]) * (cy - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+
+    index = np.array(selected)
+    return x[index], y[index]
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Min/max bucketing: the min and max of each bucket, in time order.
+
+    Args:
+        x: X values (increasing)
+        y: Y values
+        n_buckets: Number of buckets (about one per pixel column)
+
+    Returns:
+        (x, y) with up to 2 * n_buckets points
+    """
+    n = len(x)
+    if n <= 2 * n_buckets or n_buckets < 1:
+        return x, y
+
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.intp)
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+
+    # Bucket-local argmin/argmax via a padded (n_buckets, max_size) view
+    width = int(sizes.max())
+    offsets = np.arange(width)
+    index = np.minimum(starts[:, None] + offsets, n - 1)
+    valid = offsets < sizes[:, None]
+    values = y[index]
+    i_min = index[np.arange(n_buckets), np.where(valid, values, np.inf).argmin(axis=1)]
+    i_max = index[np.arange(n_buckets), np.where(valid, values, -np.inf).argmax(axis=1)]
+
+    pairs = np.sort(np.stack([i_min, i_max], axis=1), axis=1).ravel()
+    return x[pairs], y[pairs]
+
+
+def decimate(x: np.ndarray, y: np.ndarray, n_out: int, method: str = 'auto') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series to about n_out points for drawing.
+
+    Args:
+        x: X values (increasing)
+        y: Y values
+        n_out: Target points (plot width in pixels)
+        method: 'lttb', 'minmax' or 'auto' (LTTB up to AUTO_MINMAX_RATIO
+                points per pixel, min/max above)
+
+    Returns:
+        (x, y) to draw (the input itself when already small enough)
+    """
+    n = len(x)
+    if n <= n_out:
+        return x, y
+    if method == 'lttb' or (method == 'auto' and n <= AUTO_MINMAX_RATIO * n_out):
+        return lttb(x, y, n_out)
+    return minmax_decimate(x, y, max(1, n_out // 2))
+
+
+class PolylinePlotWidget(QWidget):
+    """
+    Real-time line plot: index-spaced points (newest on the right), cached
+    grid, decimated single-polyline drawing.
+
+    Thread Safety:
+    - add_point()/clear_points() may be called from any thread (data lock)
+    - Painting happens on the GUI thread
+    """
+
+    def __init__(
+        self,
+        parent=None,
+        capacity: int = 1000,
+        padding: int = 20,
+        v_lines: int = 20,
+        h_lines: int = 10,
+        refresh_ms: Optional[int] = 100
+    ):
+        """
+        Initialize plot widget.
+
+        Args:
+            parent: Parent widget
+            capacity: Maximum points kept
+            padding: Plot area inset in pixels
+            v_lines: Vertical grid divisions
+            h_lines: Horizontal grid divisions
+            refresh_ms: Repaint timer interval (repaints only on new data);
+                        None = no own timer, the owner calls refresh()
+        """
+        super().__init__(parent)
+
+        self.points = PointBuffer(capacity)
+        self.max_points = capacity
+
+        # Appearance (subclasses adjust before the first paint)
+        self.padding = padding
+        self.v_lines = v_lines
+        self.h_lines = h_lines
+        self.grid_color = QColor(255, 255, 255, 50)
+        self.axis_pen: Optional[QPen] = None  # Left/bottom axis lines (None = none)
+        self.line_pen = QPen(QColor(0xF4, 0xF6, 0xFC), 2)
+        self.marker_color = QColor(255, 0, 0)
+        self.marker_radius = 6
+        self.decimation = 'auto'
+        self.pixels_per_point = 2  # Decimation target: one vertex per 2 px (line width)
+
+        # Thread-safe data access lock
+        self._data_lock = threading.Lock()
+
+        # External (x, y) arrays provider replacing self.points (set_source)
+        self._source: Optional[Callable[[], Tuple[np.ndarray, np.ndarray]]] = None
+
+        self._grid_cache: Optional[QPixmap] = None
+        self._dirty = True
+
+        # Timer for updates
+        self.update_timer: Optional[QTimer] = None
+        if refresh_ms is not None:
+            self.update_timer = QTimer(self)
+            self.update_timer.timeout.connect(self.refresh)
+            self.update_timer.start(refresh_ms)
+
+        self.setStyleSheet("""
+            QWidget {
+                background-color: transparent;
+                border: none;
+            }
+        """)
+
+    # -- data ---------------------------------------------------------------
+
+    def add_point(self, x: float, y: float):
+        """Add a point (thread-safe)."""
+        with self._data_lock:
+            self.points.append(x, y)
+            self._dirty = True
+
+    def clear_points(self):
+        """Remove all points (thread-safe)."""
+        with self._data_lock:
+            self.points.clear()
+            self._dirty = True
+
+    def set_source(self, source: Optional[Callable[[], Tuple[np.ndarray, np.ndarray]]]):
+        """
+        Plot arrays owned elsewhere instead of the internal point buffer.
+
+        Args:
+            source: Callable returning the current oldest-first (x, y)
+                    arrays, called under the data lock on each paint; None
+                    returns to the internal buffer
+        """
+        with self._data_lock:
+            self._source = source
+            self._dirty = True
+
+    def mark_dirty(self):
+        """Repaint on the next timer tick (source data changed)."""
+        self._dirty = True
+
+    def refresh(self):
+        """Repaint only when points changed since the last paint."""
+        if self._dirty:
+            self.update()
+
+    # -- geometry / static layer ----------------------------------------------
+
+    def plot_rect(self):
+        """Plot area (widget rect minus padding)."""
+        return self.rect().adjusted(self.padding, self.padding, -self.padding, -self.padding)
+
+    def invalidate_grid(self):
+        """Drop the cached grid (after changing grid appearance)."""
+        self._grid_cache = None
+        self.update()
+
+    def resizeEvent(self, event):
+        """Handle widget resize."""
+        super().resizeEvent(event)
+        self.invalidate_grid()
+
+    def _grid_pixmap(self) -> QPixmap:
+        """Cached static layer, rendered at the current size."""
+        if self._grid_cache is None or self._grid_cache.size() != self.size() * self.devicePixelRatioF():
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            try:
+                self._draw_static(painter, self.plot_rect())
+            finally:
+                painter.end()
+            self._grid_cache = pixmap
+        return self._grid_cache
+
+    def _draw_static(self, painter: QPainter, rect):
+        """Grid lines and axis lines (cached)."""
+        painter.setPen(QPen(self.grid_color, 1))
+        for i in range(self.v_lines + 1):
+            x = rect.left() + (rect.width() * i) // self.v_lines
+            painter.drawLine(x, rect.top(), x, rect.bottom())
+        for i in range(self.h_lines + 1):
+            y = rect.top() + (rect.height() * i) // self.h_lines
+            painter.drawLine(rect.left(), y, rect.right(), y)
+
+        if self.axis_pen is not None:
+            painter.setPen(self.axis_pen)
+            painter.drawLine(rect.left(), rect.top(), rect.left(), rect.bottom())
+            painter.drawLine(rect.left(), rect.bottom(), rect.right(), rect.bottom())
+
+    # -- painting -------------------------------------------------------------
+
+    def paintEvent(self, event):
+        """Draw cached grid, then the decimated series."""
+        try:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self._grid_pixmap())
+            rect = self.plot_rect()
+
+            with self._data_lock:
+                self._dirty = False
+                x, y = self._source() if self._source is not None else self.points.arrays()
+                n = len(y)
+                if n >= 2:
+                    x_min, x_max = float(x.min()), float(x.max())
+                    y_min, y_max = self._y_range(float(y.min()), float(y.max()))
+                    # Index-spaced: newest point on the right edge
+                    n_out = max(2, rect.width() // self.pixels_per_point)
+                    xs, ys = decimate(np.arange(n, dtype=float), y, n_out, self.decimation)
+                    px = rect.left() + xs * (rect.width() / (n - 1))
+                    py = rect.bottom() - (ys - y_min) * (rect.height() / (y_max - y_min))
+
+            painter.setRenderHint(QPainter.Antialiasing)
+            if n < 2:
+                self._draw_empty(painter, rect)
+                return
+
+            self._on_range(x_min, x_max, y_min, y_max)
+            self._draw_series(painter, rect, px, py, y_min, y_max)
+
+        except Exception as e:
+            logger.error(f"Error drawing plot: {e}")
+
+    @staticmethod
+    def _polygon(px: np.ndarray, py: np.ndarray) -> QPolygonF:
+        """Points as a QPolygonF."""
+        polygon = QPolygonF()
+        for a, b in zip(px.tolist(), py.tolist()):
+            polygon.append(QPointF(a, b))
+        return polygon
+
+    @classmethod
+    def _segments(cls, px: np.ndarray, py: np.ndarray) -> QPolygonF:
+        """Consecutive point pairs (p0 p1 p1 p2 ...) for a single drawLines call."""
+        return cls._polygon(np.repeat(px, 2)[1:-1], np.repeat(py, 2)[1:-1])
+
+    def _y_range(self, y_min: float, y_max: float) -> Tuple[float, float]:
+        """Value range mapped to the plot height (expanded when flat)."""
+        if y_max - y_min < 0.1:
+            mid = (y_min + y_max) / 2
+            return mid - 0.05, mid + 0.05
+        return y_min, y_max
+
+    def _on_range(self, x_min: float, x_max: float, y_min: float, y_max: float):
+        """Hook: called with the data/value ranges on each paint (labels)."""
+
+    def _draw_empty(self, painter: QPainter, rect):
+        """Hook: draw the state with fewer than 2 points."""
+
+    def _draw_series(self, painter: QPainter, rect, px: np.ndarray, py: np.ndarray, y_min: float, y_max: float):
+        """Draw the line and the last-point marker (px/py: pixel coordinates)."""
+        painter.setPen(self.line_pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.drawLines(self._segments(px, py))
+        self._draw_marker(painter, QPointF(px[-1], py[-1]))
+
+    def _draw_marker(self, painter: QPainter, point: QPointF):
+        """Red dot on the newest point."""
+        painter.setBrush(QBrush(self.marker_color))
+        painter.setPen(QPen(self.marker_color, 1))
+        painter.drawEllipse(point, self.marker_radius, self.marker_radius)
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 def setup_signal_handlers(app: ApplicationLifecycle, loop: asyncio.AbstractEventLoop):
     """
-    Setup signal handlers for graceful shutdown.
+    Setup signal handlers for graceful shutdown and latency dumps.
 
     Args:
         app: ApplicationLifecycle instance
@@ -29,10 +29,18 @@ def setup_signal_handlers(app: ApplicationLifecycle, loop: asyncio.AbstractEvent
         # Request shutdown
         app.request_shutdown()
 
+    def dump_handler(signum, frame):
+        """Dump pipeline latency histograms (on demand)."""
+        loop.call_soon_threadsafe(app.dump_latency)
+
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    # SIGUSR1: latency dump (not available on Windows)
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, dump_handler)
+
 
 async def main():
     """
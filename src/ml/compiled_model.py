@@ -0,0 +1,334 @@
+"""
+Compiled inference for bagging ensembles.
+
+sklearn's BaggingRegressor.predict validates the input, dispatches through
+joblib and calls predict() on every base estimator: milliseconds for one
+4-feature row. compile_model() flattens the ensemble once into contiguous
+NumPy arrays:
+
+- Trees (DecisionTreeRegressor / ExtraTreeRegressor): one node table for
+  all trees (feature, threshold, left, right, value) plus a root per tree.
+  Leaf nodes point to themselves.
+- Linear base estimators: one (estimators x features) weight matrix and
+  an intercept vector.
+
+Each estimator's feature subset (estimators_features_) is folded into the
+node/weight feature indices, so the compiled model takes the full input
+row in `feature_names` order.
+
+predict_one() walks every tree on plain Python lists built from the arrays
+(list indexing is much cheaper than NumPy scalar indexing for a single
+row). It mirrors sklearn exactly: inputs are rounded to float32 like
+sklearn's tree code does, the split test is `x <= threshold`, and leaf
+values are summed in estimator order per joblib chunk before dividing by
+the number of estimators. Tree ensembles therefore give bit-identical
+results. Linear ensembles agree to within rounding, because the dot
+product order may differ from BLAS.
+
+The compiled arrays are saved as .npz next to the model file. The cache
+is keyed on the model's size and mtime (see MLModelLoader.load_compiled).
+"""
+
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump when the array layout changes (invalidates cached files)
+COMPILED_FORMAT_VERSION = 1
+
+KIND_TREES = 'trees'
+KIND_LINEAR = 'linear'
+
+
+class ModelCompileError(ValueError):
+    """Model type or layout not supported by the compiler."""
+
+
+class CompiledEnsemble:
+    """
+    Flattened bagging ensemble with single-row prediction.
+
+    Build with compile_model() or CompiledEnsemble.load().
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        arrays: dict,
+        feature_names: Optional[Sequence[str]],
+        n_features: int,
+        chunk_starts: Sequence[int]
+    ):
+        """
+        Initialize compiled ensemble.
+
+        Args:
+            kind: 'trees' or 'linear'
+            arrays: Node arrays (trees) or weights/intercepts (linear)
+            feature_names: Input feature order, or None if the model had none
+            n_features: Input row length
+            chunk_starts: Estimator index boundaries of sklearn's joblib
+                          chunks ([0, ..., n_estimators]); sums follow them
+        """
+        if kind not in (KIND_TREES, KIND_LINEAR):
+            raise ModelCompileError(f"Unknown compiled model kind: {kind}")
+
+        self.kind = kind
+        self.arrays = arrays
+        self.feature_names = tuple(feature_names) if feature_names is not None else None
+        self.n_features = int(n_features)
+        self.chunk_starts = [int(s) for s in chunk_starts]
+        self.n_estimators = self.chunk_starts[-1]
+
+        # Reusable float32 input buffer (sklearn trees evaluate in float32)
+        self._x32 = np.zeros(self.n_features, dtype=np.float32)
+
+        if kind == KIND_TREES:
+            self._feature: List[int] = arrays['feature'].tolist()
+            self._threshold: List[float] = arrays['threshold'].tolist()
+            self._left: List[int] = arrays['left'].tolist()
+            self._right: List[int] = arrays['right'].tolist()
+            self._value: List[float] = arrays['value'].tolist()
+            self._chunks = [
+                arrays['roots'][start:end].tolist()
+                for start, end in zip(self.chunk_starts[:-1], self.chunk_starts[1:])
+            ]
+        else:
+            self._weights = arrays['weights']
+            self._intercepts = arrays['intercepts']
+            self._x64 = np.zeros(self.n_features, dtype=np.float64)
+            self._out = np.zeros(self.n_estimators, dtype=np.float64)
+
+    @property
+    def node_count(self) -> int:
+        """Total nodes over all trees (0 for linear ensembles)."""
+        return len(self.arrays['feature']) if self.kind == KIND_TREES else 0
+
+    def predict_one(self, row: Sequence[float]) -> float:
+        """
+        Predict a single row.
+
+        Args:
+            row: n_features values in feature_names order
+
+        Returns:
+            Ensemble prediction (same as model.predict([row])[0])
+        """
+        if self.kind == KIND_LINEAR:
+            self._x64[:] = row
+            np.dot(self._weights, self._x64, out=self._out)
+            self._out += self._intercepts
+            return float(np.sum(self._out)) / self.n_estimators
+
+        self._x32[:] = row
+        x = self._x32.tolist()
+        feature = self._feature
+        threshold = self._threshold
+        left = self._left
+        right = self._right
+        value = self._value
+
+        total = 0
+        for roots in self._chunks:
+            chunk_total = 0
+            for node in roots:
+                child = left[node]
+                while child != node:
+                    if x[feature[node]] <= threshold[node]:
+                        node = child
+                    else:
+                        node = right[node]
+                    child = left[node]
+                chunk_total += value[node]
+            total += chunk_total
+        return total / self.n_estimators
+
+    def predict(self, rows) -> np.ndarray:
+        """
+        Predict several rows (convenience for tests and offline use).
+
+        Args:
+            rows: (n_samples, n_features) array-like
+
+        Returns:
+            Predictions as float64 array
+        """
+        rows = np.asarray(rows, dtype=np.float64)
+        return np.array([self.predict_one(row) for row in rows], dtype=np.float64)
+
+    def save(self, path: Path, source_size: int = 0, source_mtime_ns: int = 0):
+        """
+        Save compiled arrays to an .npz file.
+
+        Args:
+            path: Destination file
+            source_size: Size of the model file compiled from
+            source_mtime_ns: mtime (ns) of the model file compiled from
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f,
+                format_version=np.int64(COMPILED_FORMAT_VERSION),
+                kind=np.str_(self.kind),
+                feature_names=np.array(self.feature_names or (), dtype=np.str_),
+                has_feature_names=np.bool_(self.feature_names is not None),
+                n_features=np.int64(self.n_features),
+                chunk_starts=np.array(self.chunk_starts, dtype=np.int64),
+                source_size=np.int64(source_size),
+                source_mtime_ns=np.int64(source_mtime_ns),
+                **self.arrays
+            )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        source_size: Optional[int] = None,
+        source_mtime_ns: Optional[int] = None
+    ) -> Optional['CompiledEnsemble']:
+        """
+        Load a compiled model saved by save().
+
+        Args:
+            path: .npz file
+            source_size: Expected model file size (None = don't check)
+            source_mtime_ns: Expected model file mtime (None = don't check)
+
+        Returns:
+            CompiledEnsemble, or None if the file is stale or has another
+            format version
+        """
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['format_version']) != COMPILED_FORMAT_VERSION:
+                return None
+            if source_size is not None and int(data['source_size']) != source_size:
+                return None
+            if source_mtime_ns is not None and int(data['source_mtime_ns']) != source_mtime_ns:
+                return None
+
+            kind = str(data['kind'])
+            names = ('feature', 'threshold', 'left', 'right', 'value', 'roots') \
+                if kind == KIND_TREES else ('weights', 'intercepts')
+            arrays = {name: data[name] for name in names}
+            feature_names = data['feature_names'].tolist() if bool(data['has_feature_names']) else None
+
+            return cls(
+                kind,
+                arrays,
+                feature_names,
+                int(data['n_features']),
+                data['chunk_starts'].tolist()
+            )
+
+
+def _chunk_starts(n_estimators: int, n_jobs) -> List[int]:
+    """Estimator chunk boundaries used by sklearn's parallel predict."""
+    try:
+        from sklearn.ensemble._base import _partition_estimators
+        return list(_partition_estimators(n_estimators, n_jobs)[2])
+    except Exception:
+        return [0, n_estimators]
+
+
+def _input_columns(model, feature_order: Optional[Sequence[str]]) -> np.ndarray:
+    """Model column index -> position in the compiled input row."""
+    n_features = int(model.n_features_in_)
+    model_names = getattr(model, 'feature_names_in_', None)
+    if feature_order is None or model_names is None:
+        return np.arange(n_features)
+
+    order = list(feature_order)
+    missing = [name for name in model_names if name not in order]
+    if missing:
+        raise ModelCompileError(f"Model features missing from feature order: {missing}")
+    return np.array([order.index(name) for name in model_names])
+
+
+def compile_model(model, feature_order: Optional[Sequence[str]] = None) -> CompiledEnsemble:
+    """
+    Flatten a fitted bagging ensemble into a CompiledEnsemble.
+
+    Args:
+        model: Fitted BaggingRegressor-like model (estimators_,
+               estimators_features_) with tree or linear base estimators
+        feature_order: Input column names for the compiled model. Used to
+                       reorder columns when the model was fitted with
+                       feature names; defaults to the model's own order
+
+    Returns:
+        CompiledEnsemble
+
+    Raises:
+        ModelCompileError: Unsupported model or base estimator
+    """
+    estimators = getattr(model, 'estimators_', None)
+    estimators_features = getattr(model, 'estimators_features_', None)
+    if not estimators or estimators_features is None:
+        raise ModelCompileError(f"Not a fitted bagging ensemble: {type(model).__name__}")
+
+    model_names = getattr(model, 'feature_names_in_', None)
+    if model_names is None:
+        feature_names = None
+    elif feature_order is not None:
+        feature_names = tuple(feature_order)
+    else:
+        feature_names = tuple(model_names)
+
+    columns = _input_columns(model, feature_order)
+    n_features = len(feature_names) if feature_names is not None else int(model.n_features_in_)
+    chunk_starts = _chunk_starts(len(estimators), getattr(model, 'n_jobs', None))
+
+    if all(hasattr(est, 'tree_') for est in estimators):
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        for est, est_features in zip(estimators, estimators_features):
+            tree = est.tree_
+            if tree.n_outputs != 1 or tree.value.shape[2] != 1:
+                raise ModelCompileError("Only single-output regression trees are supported")
+
+            node_ids = np.arange(tree.node_count, dtype=np.int64) + offset
+            is_leaf = tree.children_left < 0
+            est_columns = columns[np.asarray(est_features)]
+
+            features.append(np.where(is_leaf, 0, est_columns[np.maximum(tree.feature, 0)]))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset))
+            rights.append(np.where(is_leaf, node_ids, tree.children_right + offset))
+            values.append(tree.value[:, 0, 0])
+            roots.append(offset)
+            offset += tree.node_count
+
+        arrays = {
+            'feature': np.concatenate(features).astype(np.int64),
+            'threshold': np.concatenate(thresholds).astype(np.float64),
+            'left': np.concatenate(lefts).astype(np.int64),
+            'right': np.concatenate(rights).astype(np.int64),
+            'value': np.concatenate(values).astype(np.float64),
+            'roots': np.array(roots, dtype=np.int64),
+        }
+        return CompiledEnsemble(KIND_TREES, arrays, feature_names, n_features, chunk_starts)
+
+    if all(hasattr(est, 'coef_') and hasattr(est, 'intercept_') for est in estimators):
+        weights = np.zeros((len(estimators), n_features), dtype=np.float64)
+        intercepts = np.zeros(len(estimators), dtype=np.float64)
+        for i, (est, est_features) in enumerate(zip(estimators, estimators_features)):
+            coef = np.ravel(est.coef_)
+            if coef.size != len(est_features):
+                raise ModelCompileError("Only single-output linear estimators are supported")
+            # bootstrap_features repeats columns: their coefficients add up
+            np.add.at(weights[i], columns[np.asarray(est_features)], coef)
+            intercepts[i] = float(np.ravel(est.intercept_)[0])
+
+        arrays = {'weights': weights, 'intercepts': intercepts}
+        return CompiledEnsemble(KIND_LINEAR, arrays, feature_names, n_features, chunk_starts)
+
+    raise ModelCompileError(
+        f"Unsupported base estimator: {type(estimators[0]).__name__}"
+    )
@@ -5,9 +5,11 @@ ML model loading and caching (thread-safe).
 import threading
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 import joblib
 
+from .compiled_model import CompiledEnsemble, ModelCompileError, compile_model
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,8 +25,15 @@ class MLModelLoader:
         """
         self.model_path = model_path
         self._model = None
+        self._compiled: Optional[CompiledEnsemble] = None
+        self._compile_failed = False
         self._lock = threading.RLock()
 
+    @property
+    def compiled_path(self) -> Path:
+        """Cache file for the compiled model (next to the .pkl)."""
+        return self.model_path.with_suffix('.compiled.npz')
+
     def load(self):
         """
         Load and cache ML model.
@@ -53,6 +62,75 @@ class MLModelLoader:
 
             return self._model
 
+    def load_compiled(self, feature_order: Optional[Sequence[str]] = None) -> Optional[CompiledEnsemble]:
+        """
+        Load the compiled form of the model, compiling and caching it if needed.
+
+        The cache (compiled_path) is reused while the model file's size and
+        mtime match; otherwise the joblib model is loaded and recompiled.
+
+        Args:
+            feature_order: Input column order for the compiled model
+
+        Returns:
+            CompiledEnsemble, or None if the model type is not supported
+            (callers fall back to model.predict)
+
+        Raises:
+            FileNotFoundError: If model file doesn't exist
+        """
+        with self._lock:
+            if self._compiled is not None or self._compile_failed:
+                return self._compiled
+
+            if not self.model_path.exists():
+                raise FileNotFoundError(
+                    f"ML model not found: {self.model_path}\n"
+                    f"Please copy model file to: {self.model_path}"
+                )
+
+            stat = self.model_path.stat()
+            compiled = None
+            if self.compiled_path.exists():
+                try:
+                    compiled = CompiledEnsemble.load(
+                        self.compiled_path,
+                        source_size=stat.st_size,
+                        source_mtime_ns=stat.st_mtime_ns
+                    )
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable compiled model {self.compiled_path}: {e}")
+
+            if compiled is None:
+                try:
+                    compiled = compile_model(self.load(), feature_order)
+                except ModelCompileError as e:
+                    logger.warning(f"ML model not compiled, using model.predict: {e}")
+                    self._compile_failed = True
+                    return None
+
+                try:
+                    compiled.save(self.compiled_path, stat.st_size, stat.st_mtime_ns)
+                    logger.info(f"Compiled ML model cached: {self.compiled_path}")
+                except OSError as e:
+                    logger.warning(f"Could not cache compiled model: {e}")
+
+            if feature_order is not None and compiled.feature_names is not None \
+                    and compiled.feature_names != tuple(feature_order):
+                logger.warning(
+                    f"Compiled model feature order {compiled.feature_names} "
+                    f"!= {tuple(feature_order)}, using model.predict"
+                )
+                self._compile_failed = True
+                return None
+
+            self._compiled = compiled
+            logger.info(
+                f"Compiled ML model ready: {compiled.kind}, "
+                f"{compiled.n_estimators} estimators, {compiled.node_count} nodes"
+            )
+            return self._compiled
+
     def is_loaded(self) -> bool:
         """Check if model is loaded."""
         with self._lock:
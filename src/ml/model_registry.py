@@ -0,0 +1,453 @@
+"""
+ML model registry: background preload, hot reload and shadow scoring.
+
+The registry owns the MLModelLoader of the primary (controlling) model and
+of any shadow models. A single background thread:
+
+- preloads and warms every model at startup (load/compile plus one
+  prediction), so the first cut doesn't pay the load cost
+- polls the model files and, when one changes, prepares a fresh loader
+  next to the active one and swaps it in with a single reference
+  assignment; the control loop keeps predicting with the old model until
+  the new one is warm, and a failed load keeps the old model
+- scores shadow models on the primary's feature rows in batches and logs
+  the results to ml.db (ml_shadow_predictions)
+
+On the control path, submit_shadow() only appends one small tuple to a
+bounded deque, so shadow models add a fixed cost per cycle regardless of
+how many there are or how slow they predict.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .model_loader import MLModelLoader
+
+logger = logging.getLogger(__name__)
+
+SHADOW_TABLE = 'ml_shadow_predictions'
+SHADOW_COLUMNS = (
+    'timestamp', 'model_name', 'model_version', 'primary_version',
+    'akim_input', 'sapma_input', 'kesme_hizi_input', 'inme_hizi_input',
+    'primary_output', 'shadow_output', 'kesim_id'
+)
+
+
+@dataclass
+class ModelSlot:
+    """A loaded model file and the version it was loaded from."""
+    name: str
+    path: Path
+    loader: MLModelLoader
+    version: str
+    signature: Tuple[int, int]  # (size, mtime_ns) of the file when loaded
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of a file, or None if it doesn't exist."""
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def model_version(path: Path, signature: Tuple[int, int]) -> str:
+    """Readable version tag: file name plus modification time."""
+    mtime = datetime.fromtimestamp(signature[1] / 1e9)
+    return f"{Path(path).name}@{mtime.strftime('%Y%m%d%H%M%S')}"
+
+
+def predict_rows(
+    loader: MLModelLoader,
+    rows: np.ndarray,
+    feature_order: Sequence[str],
+    compiled: bool = True
+) -> np.ndarray:
+    """
+    Predict a (n, features) block with a loader's model.
+
+    Uses the compiled ensemble when enabled and supported, otherwise one
+    vectorized model.predict() for the whole block.
+
+    Args:
+        loader: Model loader
+        rows: Feature rows in feature_order
+        feature_order: Feature column names
+        compiled: Try the compiled ensemble first
+
+    Returns:
+        Predictions as float64 array
+    """
+    compiled_model = loader.load_compiled(feature_order) if compiled else None
+    if compiled_model is not None:
+        return compiled_model.predict(rows)
+
+    model = loader.load()
+    if getattr(model, 'feature_names_in_', None) is not None:
+        import pandas as pd
+        rows = pd.DataFrame(rows, columns=list(feature_order))
+    return np.asarray(model.predict(rows), dtype=np.float64)
+
+
+class ModelRegistry:
+    """
+    Primary and shadow models with background loading.
+
+    The active primary is read without locking (attribute reads are
+    atomic); swaps happen only in the registry thread or in reload_primary().
+    """
+
+    def __init__(
+        self,
+        primary_path: Path,
+        feature_order: Sequence[str],
+        shadow_models: Optional[Sequence[dict]] = None,
+        db_service=None,
+        compiled: bool = True,
+        watch_interval: float = 5.0,
+        shadow_batch_size: int = 50,
+        shadow_flush_interval: float = 5.0,
+        shadow_queue_size: int = 2000
+    ):
+        """
+        Initialize registry (no files are read until start()).
+
+        Args:
+            primary_path: Model file of the controlling model
+            feature_order: Model input column names
+            shadow_models: [{'name': ..., 'path': ...}] scored on the same rows
+            db_service: SQLiteService for ml.db (shadow results)
+            compiled: Use compiled ensembles when supported
+            watch_interval: Seconds between model file checks (0 = no hot reload)
+            shadow_batch_size: Rows per shadow scoring batch
+            shadow_flush_interval: Max seconds a row waits for its batch
+            shadow_queue_size: Pending shadow rows kept (oldest dropped)
+        """
+        self.feature_order = tuple(feature_order)
+        self.compiled = compiled
+        self.db = db_service
+        self.watch_interval = float(watch_interval)
+        self.shadow_batch_size = max(1, int(shadow_batch_size))
+        self.shadow_flush_interval = float(shadow_flush_interval)
+
+        self._primary = self._unloaded_slot('primary', Path(primary_path))
+        self._shadows: List[ModelSlot] = [
+            self._unloaded_slot(spec.get('name') or Path(spec['path']).stem, Path(spec['path']))
+            for spec in (shadow_models or [])
+        ]
+        # Signatures whose load failed: not retried until the file changes again
+        self._failed: Dict[str, Tuple[int, int]] = {}
+
+        self._pending: Deque[tuple] = deque(maxlen=max(1, int(shadow_queue_size)))
+        self._cond = threading.Condition()
+        self._swap_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._ready = threading.Event()
+        self._started = False
+
+        self._stats = {
+            'reloads': 0,
+            'reload_errors': 0,
+            'shadow_submitted': 0,
+            'shadow_dropped': 0,
+            'shadow_batches': 0,
+            'shadow_rows_scored': 0,
+            'shadow_errors': 0,
+            'last_shadow_batch_ms': 0.0
+        }
+
+    @staticmethod
+    def _unloaded_slot(name: str, path: Path) -> ModelSlot:
+        """Slot for a file that hasn't been loaded (loads lazily on use)."""
+        signature = file_signature(path) or (0, 0)
+        return ModelSlot(name, path, MLModelLoader(path), model_version(path, signature), signature)
+
+    # Active models
+
+    @property
+    def primary_loader(self) -> MLModelLoader:
+        """Loader of the active primary model."""
+        return self._primary.loader
+
+    @property
+    def primary_version(self) -> str:
+        """Version tag of the active primary model."""
+        return self._primary.version
+
+    @property
+    def shadow_names(self) -> List[str]:
+        """Names of the shadow models."""
+        return [slot.name for slot in self._shadows]
+
+    def is_loading(self) -> bool:
+        """True between start() and the end of the initial preload."""
+        return self._started and not self._ready.is_set()
+
+    # Lifecycle
+
+    def start(self):
+        """Start the registry thread (preload, file watch, shadow scoring)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        with self._cond:
+            self._stopping = False
+        self._started = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name="MLModelRegistry",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"ML model registry started: primary={self._primary.path}, "
+            f"shadows={self.shadow_names}, watch_interval={self.watch_interval}s"
+        )
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop the registry thread after scoring pending shadow rows.
+
+        Args:
+            timeout: Maximum time to wait for the thread
+        """
+        if self._thread is None:
+            return
+
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning("ML model registry did not stop within timeout")
+        self._thread = None
+        logger.info("ML model registry stopped")
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the initial preload.
+
+        Args:
+            timeout: Maximum seconds to wait (None = forever)
+
+        Returns:
+            True if preload finished
+        """
+        return self._ready.wait(timeout)
+
+    # Loading and swapping
+
+    def _prepare(self, name: str, path: Path) -> ModelSlot:
+        """
+        Load, compile and warm a model file into a new slot.
+
+        Raises:
+            Exception: If the model can't be loaded or predicted with
+        """
+        signature = file_signature(path)
+        if signature is None:
+            raise FileNotFoundError(f"ML model not found: {path}")
+
+        loader = MLModelLoader(path)
+        # Warm-up prediction: loads/compiles and pays first-call costs here
+        predict_rows(loader, np.zeros((1, len(self.feature_order))), self.feature_order, self.compiled)
+        return ModelSlot(name, path, loader, model_version(path, signature), signature)
+
+    def reload_primary(self, path: Optional[Path] = None) -> bool:
+        """
+        Load a primary model and swap it in once warm.
+
+        Blocking (load + warm-up); called from the registry thread, or from
+        a worker thread to promote another model file.
+
+        Args:
+            path: New model file (default: reload the current file)
+
+        Returns:
+            True if swapped, False if loading failed (old model kept)
+        """
+        path = Path(path) if path is not None else self._primary.path
+        try:
+            slot = self._prepare('primary', path)
+        except Exception as e:
+            self._stats['reload_errors'] += 1
+            self._failed['primary'] = file_signature(path)
+            logger.error(f"ML model reload failed, keeping {self._primary.version}: {e}")
+            return False
+
+        with self._swap_lock:
+            previous = self._primary
+            self._primary = slot
+            self._failed.pop('primary', None)
+        if self._ready.is_set():
+            self._stats['reloads'] += 1
+        logger.info(f"ML model swapped: {previous.version} -> {slot.version}")
+        return True
+
+    def _reload_shadow(self, index: int) -> bool:
+        """Reload one shadow model; keeps the old one on failure."""
+        current = self._shadows[index]
+        try:
+            slot = self._prepare(current.name, current.path)
+        except Exception as e:
+            self._stats['reload_errors'] += 1
+            self._failed[current.name] = file_signature(current.path)
+            logger.error(f"Shadow model {current.name} load failed: {e}")
+            return False
+
+        self._shadows[index] = slot
+        self._failed.pop(current.name, None)
+        logger.info(f"Shadow model {current.name} loaded: {slot.version}")
+        return True
+
+    def _preload(self):
+        """Initial load and warm-up of all models."""
+        start = time.perf_counter()
+        self.reload_primary()
+        for i in range(len(self._shadows)):
+            self._reload_shadow(i)
+        logger.info(f"ML models preloaded in {time.perf_counter() - start:.2f}s")
+
+    def _changed(self, slot: ModelSlot) -> bool:
+        """True if the slot's file changed and the new version hasn't failed before."""
+        signature = file_signature(slot.path)
+        if signature is None or signature == slot.signature:
+            return False
+        return self._failed.get(slot.name) != signature
+
+    def check_for_updates(self):
+        """Reload models whose files changed since they were loaded."""
+        if self._changed(self._primary):
+            self.reload_primary()
+        for i, slot in enumerate(self._shadows):
+            if self._changed(slot):
+                self._reload_shadow(i)
+
+    # Shadow scoring
+
+    def submit_shadow(self, row: Sequence[float], primary_output: float, kesim_id: Optional[int] = None):
+        """
+        Queue one feature row for shadow scoring (never blocks on models).
+
+        Args:
+            row: Model input row in feature_order (copied)
+            primary_output: Raw primary model output for the same row
+            kesim_id: Cut session ID for traceability
+        """
+        if not self._shadows:
+            return
+
+        entry = (
+            datetime.now().isoformat(), self._primary.version,
+            tuple(float(v) for v in row), float(primary_output), kesim_id
+        )
+        with self._cond:
+            if len(self._pending) == self._pending.maxlen:
+                self._stats['shadow_dropped'] += 1
+            self._pending.append(entry)
+            self._stats['shadow_submitted'] += 1
+            if len(self._pending) >= self.shadow_batch_size:
+                self._cond.notify()
+
+    def score_pending(self) -> int:
+        """
+        Score all pending rows with every shadow model and log them.
+
+        Returns:
+            Number of rows scored
+        """
+        with self._cond:
+            batch = list(self._pending)
+            self._pending.clear()
+        if not batch:
+            return 0
+
+        start = time.perf_counter()
+        features = np.array([entry[2] for entry in batch], dtype=np.float64)
+        rows = []
+        for slot in list(self._shadows):
+            try:
+                outputs = predict_rows(slot.loader, features, self.feature_order, self.compiled)
+            except Exception as e:
+                self._stats['shadow_errors'] += 1
+                logger.error(f"Shadow model {slot.name} scoring failed: {e}")
+                continue
+
+            for (timestamp, primary_version, values, primary_output, kesim_id), output in zip(batch, outputs):
+                rows.append((
+                    timestamp, slot.name, slot.version, primary_version,
+                    *values, primary_output, float(output), kesim_id
+                ))
+
+        if rows and self.db is not None:
+            self.db.append_rows(SHADOW_TABLE, rows, SHADOW_COLUMNS)
+
+        self._stats['shadow_batches'] += 1
+        self._stats['shadow_rows_scored'] += len(batch)
+        self._stats['last_shadow_batch_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        return len(batch)
+
+    # Registry thread
+
+    def _run(self):
+        """Preload, then alternate between file checks and shadow batches."""
+        try:
+            self._preload()
+        except Exception as e:
+            logger.error(f"ML model preload error: {e}", exc_info=True)
+        finally:
+            self._ready.set()
+
+        next_check = time.monotonic() + self.watch_interval
+        next_flush = time.monotonic() + self.shadow_flush_interval
+        while True:
+            with self._cond:
+                if not self._stopping and len(self._pending) < self.shadow_batch_size:
+                    deadlines = [next_flush]
+                    if self.watch_interval > 0:
+                        deadlines.append(next_check)
+                    self._cond.wait(max(0.0, min(deadlines) - time.monotonic()))
+                stopping = self._stopping
+
+            now = time.monotonic()
+            try:
+                if stopping or len(self._pending) >= self.shadow_batch_size or now >= next_flush:
+                    self.score_pending()
+                    next_flush = now + self.shadow_flush_interval
+                if not stopping and self.watch_interval > 0 and now >= next_check:
+                    self.check_for_updates()
+                    next_check = now + self.watch_interval
+            except Exception as e:
+                logger.error(f"ML model registry error: {e}", exc_info=True)
+
+            if stopping:
+                return
+
+    def get_stats(self) -> Dict:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with active versions, reload and shadow counters
+        """
+        with self._cond:
+            pending = len(self._pending)
+        return {
+            **self._stats,
+            'ready': self._ready.is_set(),
+            'primary_version': self._primary.version,
+            'shadow_versions': {slot.name: slot.version for slot in self._shadows},
+            'shadow_pending': pending
+        }
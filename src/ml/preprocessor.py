@@ -5,17 +5,93 @@ This module handles:
 - Sensor data buffering (noise reduction via averaging)
 - Torque-to-current conversion using polynomial model
 - Feature preparation for ML model input
+
+Buffers are preallocated NumPy rings with running sums, so averaging is
+O(1) per sample and the model input is written into one reusable (1, 4)
+array in training feature order. A pandas DataFrame is only built for
+models fitted with feature names (get_model_input()).
 """
 
 import logging
 import numpy as np
 import pandas as pd
-from collections import deque
-from typing import Optional, Dict, Tuple
+from typing import Iterator, Optional, Dict, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Feature order used in training (model input column order)
+FEATURE_NAMES = ('akim_input', 'sapma_input', 'kesme_hizi', 'inme_hizi')
+
+
+class RingMean:
+    """
+    Fixed-size float ring with a running sum.
+
+    Drop-in for the deque(maxlen=n) buffers used for averaging: supports
+    append/clear/len/iteration and returns the mean in O(1). The running
+    sum is recomputed from the ring once per `capacity` evictions so
+    rounding error does not accumulate.
+    """
+
+    __slots__ = ('capacity', '_ring', '_head', '_count', '_sum', '_evictions')
+
+    def __init__(self, capacity: int):
+        """
+        Initialize ring.
+
+        Args:
+            capacity: Maximum number of samples kept
+        """
+        if capacity < 1:
+            raise ValueError("RingMean capacity must be >= 1")
+
+        self.capacity = int(capacity)
+        self._ring = np.zeros(self.capacity, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[float]:
+        """Samples in insertion order (oldest first)."""
+        start = self._head - self._count
+        for i in range(start, self._head):
+            yield float(self._ring[i % self.capacity])
+
+    def append(self, value: float):
+        """Add a sample, evicting the oldest one when full."""
+        value = float(value)
+        head = self._head
+        if self._count == self.capacity:
+            self._sum += value - float(self._ring[head])
+            self._evictions += 1
+        else:
+            self._sum += value
+            self._count += 1
+        self._ring[head] = value
+        self._head = (head + 1) % self.capacity
+
+        if self._evictions >= self.capacity:
+            self._sum = float(self._ring.sum())
+            self._evictions = 0
+
+    def mean(self) -> float:
+        """Mean of the samples held (0.0 if empty)."""
+        if self._count == 0:
+            return 0.0
+        return self._sum / self._count
+
+    def clear(self):
+        """Remove all samples."""
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._evictions = 0
+
 
 class MLPreprocessor:
     """
@@ -42,14 +118,17 @@ class MLPreprocessor:
 
         # Standard feature buffers (10 samples)
         buffer_size = config.get('buffer_size', 10)
-        self.akim_buffer = deque(maxlen=buffer_size)
-        self.sapma_buffer = deque(maxlen=buffer_size)
-        self.kesme_hizi_buffer = deque(maxlen=buffer_size)
-        self.inme_hizi_buffer = deque(maxlen=buffer_size)
+        self.akim_buffer = RingMean(buffer_size)
+        self.sapma_buffer = RingMean(buffer_size)
+        self.kesme_hizi_buffer = RingMean(buffer_size)
+        self.inme_hizi_buffer = RingMean(buffer_size)
 
         # Extended torque buffer (50 samples for smoother conversion)
         torque_buffer_size = config.get('torque_buffer_size', 50)
-        self.torque_buffer = deque(maxlen=torque_buffer_size)
+        self.torque_buffer = RingMean(torque_buffer_size)
+
+        # Reusable model input row in FEATURE_NAMES order
+        self._features = np.zeros((1, len(FEATURE_NAMES)), dtype=np.float64)
 
         # Polynomial coefficients for torque → current conversion
         # f(x) = A2*x^2 + A1*x + A0
@@ -116,14 +195,8 @@ class MLPreprocessor:
             # Add torque to extended buffer
             self.torque_buffer.append(raw_data.serit_motor_tork_percentage)
 
-            # Calculate average torque from buffer
-            if len(self.torque_buffer) > 0:
-                avg_torque = np.mean(list(self.torque_buffer))
-            else:
-                avg_torque = raw_data.serit_motor_tork_percentage
-
             # Convert average torque to current
-            estimated_current = self.torque_to_current(avg_torque)
+            estimated_current = self.torque_to_current(self.torque_buffer.mean())
 
             # Add to feature buffers
             self.akim_buffer.append(estimated_current)
@@ -141,9 +214,45 @@ class MLPreprocessor:
             logger.error(f"Error adding data point: {e}", exc_info=True)
             return False
 
+    def get_model_input_array(self) -> Optional[np.ndarray]:
+        """
+        Get averaged feature values as a reusable model input array.
+
+        Columns follow FEATURE_NAMES:
+        ['akim_input', 'sapma_input', 'kesme_hizi', 'inme_hizi']
+
+        Returns:
+            (1, 4) float64 array, or None if buffers are empty.
+            The same array is overwritten on the next call; copy it if
+            it must outlive the current cycle.
+        """
+        if not self.is_ready():
+            logger.warning("Buffers empty, cannot generate model input")
+            return None
+
+        features = self._features[0]
+        features[0] = self.akim_buffer.mean()
+        features[1] = self.sapma_buffer.mean()
+        features[2] = self.kesme_hizi_buffer.mean()
+        features[3] = self.inme_hizi_buffer.mean()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Model input prepared: "
+                f"akim={features[0]:.2f}, "
+                f"sapma={features[1]:.3f}, "
+                f"kesme={features[2]:.1f}, "
+                f"inme={features[3]:.1f}"
+            )
+
+        return self._features
+
     def get_model_input(self) -> Optional[pd.DataFrame]:
         """
-        Get averaged feature values as model input.
+        Get averaged feature values as a one-row DataFrame.
+
+        Only needed for models fitted with feature names; otherwise use
+        get_model_input_array().
 
         CRITICAL: Feature order MUST match training data:
         ['akim_input', 'sapma_input', 'kesme_hizi', 'inme_hizi']
@@ -157,42 +266,13 @@ class MLPreprocessor:
             >>> df.columns.tolist()
             ['akim_input', 'sapma_input', 'kesme_hizi', 'inme_hizi']
         """
-        # Check if buffers have sufficient data
-        min_samples = min(
-            len(self.akim_buffer),
-            len(self.sapma_buffer),
-            len(self.kesme_hizi_buffer),
-            len(self.inme_hizi_buffer)
-        )
-
-        if min_samples == 0:
-            logger.warning("Buffers empty, cannot generate model input")
+        features = self.get_model_input_array()
+        if features is None:
             return None
 
         try:
-            # Calculate averages from each buffer
-            akim_avg = np.mean(list(self.akim_buffer))
-            sapma_avg = np.mean(list(self.sapma_buffer))
-            kesme_avg = np.mean(list(self.kesme_hizi_buffer))
-            inme_avg = np.mean(list(self.inme_hizi_buffer))
-
             # Create DataFrame with EXACT feature order from training
-            input_df = pd.DataFrame({
-                'akim_input': [akim_avg],
-                'sapma_input': [sapma_avg],
-                'kesme_hizi': [kesme_avg],
-                'inme_hizi': [inme_avg]
-            })
-
-            logger.debug(
-                f"Model input prepared: "
-                f"akim={akim_avg:.2f}, "
-                f"sapma={sapma_avg:.3f}, "
-                f"kesme={kesme_avg:.1f}, "
-                f"inme={inme_avg:.1f}"
-            )
-
-            return input_df
+            return pd.DataFrame(features.copy(), columns=list(FEATURE_NAMES))
 
         except Exception as e:
             logger.error(f"Error generating model input: {e}", exc_info=True)
@@ -211,10 +291,18 @@ class MLPreprocessor:
         if len(self.kesme_hizi_buffer) == 0 or len(self.inme_hizi_buffer) == 0:
             return (0.0, 0.0)
 
-        avg_kesme = np.mean(list(self.kesme_hizi_buffer))
-        avg_inme = np.mean(list(self.inme_hizi_buffer))
+        return (self.kesme_hizi_buffer.mean(), self.inme_hizi_buffer.mean())
 
-        return (avg_kesme, avg_inme)
+    def get_average_torque(self) -> Optional[float]:
+        """
+        Get average torque percentage from the torque buffer.
+
+        Returns:
+            Average torque, or None if the buffer is empty
+        """
+        if len(self.torque_buffer) == 0:
+            return None
+        return self.torque_buffer.mean()
 
     def reset_buffers(self):
         """
@@ -19,6 +19,8 @@ import threading
 import time
 from typing import TYPE_CHECKING
 
+from src.services.processing.scheduler import DeadlineScheduler
+
 if TYPE_CHECKING:
     from src.services.camera.camera_service import CameraService
     from src.services.camera.results_store import CameraResultsStore
@@ -66,6 +68,10 @@ class VisionService(threading.Thread):
         self._camera_service = camera_service
 
         self._stop_event = threading.Event()
+        # Polls on a fixed grid: a slow poll does not push later polls back
+        self._scheduler = DeadlineScheduler(
+            self._polling_interval, start_immediately=True, name="vision-service"
+        )
         self._prev_testere_durumu: int = 0
         self._is_recording: bool = False
         self._recording_start_time: float = 0.0
@@ -84,9 +90,8 @@ class VisionService(threading.Thread):
             self._recording_duration,
         )
 
-        while not self._stop_event.is_set():
+        while self._scheduler.wait_blocking(self._stop_event):
             self._poll_once()
-            self._stop_event.wait(self._polling_interval)
 
         logger.info("VisionService stopped")
 
@@ -3,26 +3,53 @@ Machine control module for positioning and vise operations.
 
 This module controls specific registers and bits on the machine via Modbus.
 Uses SYNCHRONOUS Modbus calls (like old project) for reliable Qt integration.
+
+Inside the application the connection is shared: the lifecycle hands
+MachineControl a SyncModbusClient (use_shared_client) of the pipeline's
+ModbusTransactionManager, so GUI commands, the status poll and the
+pipeline go through one socket with stop commands first. Standalone
+(tools, tests) it opens its own ModbusTcpClient.
+
+Status reads can be served from a cache: a background status poller reads
+all control/status registers in a few coalesced requests into a timestamped
+cache, so GUI getters never wait on the PLC. Writes invalidate the written
+registers and wake the poller.
+
+Example (config.yaml):
+
+    modbus:
+      status_poll:
+        interval: 0.25     # Seconds between polls
+        max_age: 1.0       # Cached values older than this read as None
+        max_gap: 100       # Merge registers separated by <= 100 unused ones
 """
 
+import contextlib
 import logging
 import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import yaml
 from pymodbus.client import ModbusTcpClient
 
+from ..modbus.read_plan import DEFAULT_MAX_GAP, ReadBlock, ReadPlan
+from ..modbus.transaction_manager import Priority, SyncModbusClient
+
 logger = logging.getLogger(__name__)
 
 # Connection settings
 CONNECT_TIMEOUT = 1.0  # Connection timeout in seconds
 CONNECT_COOLDOWN = 1.0  # Minimum seconds between connection attempts
 
+# Status poller defaults
+STATUS_POLL_INTERVAL = 0.25  # Seconds between status polls
+STATUS_MAX_AGE = 1.0         # Seconds before a cached status value is stale
+
 
 def _load_modbus_config() -> dict:
-    """Load modbus host/port from config/config.yaml."""
+    """Load modbus host/port and the status poll section from config/config.yaml."""
     config_path = Path(__file__).parent.parent.parent.parent / 'config' / 'config.yaml'
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
@@ -31,10 +58,11 @@ def _load_modbus_config() -> dict:
         return {
             'host': modbus.get('host', '127.0.0.1'),
             'port': modbus.get('port', 502),
+            'status_poll': modbus.get('status_poll') or {},
         }
     except Exception as e:
         logger.warning(f"Could not load modbus config: {e}, using defaults")
-        return {'host': '127.0.0.1', 'port': 502}
+        return {'host': '127.0.0.1', 'port': 502, 'status_poll': {}}
 
 
 class MachineControl:
@@ -48,10 +76,17 @@ class MachineControl:
     - Saw positioning (up/down)
     - Cutting start/stop
     - Coolant control
+
+    Thread Safety:
+    - Every client transaction holds an I/O lock (GUI thread and the status
+      poller share the synchronous client)
+    - Status getters read the cache under a separate lock and never block
+      on Modbus while the poller runs
     """
 
     _instance: Optional['MachineControl'] = None
     _lock = threading.Lock()
+    _shared_client: Optional[SyncModbusClient] = None
 
     # Register addresses
     CONTROL_REGISTER = 20
@@ -84,6 +119,18 @@ class MachineControl:
     SAW_DOWN_BIT = 10            # 20.10: Saw down
     COOLANT_BIT = 1              # 2000.1: Coolant
 
+    # Registers read by the status poller (getters are served from its cache)
+    STATUS_REGISTERS = {
+        'auto_mode': AUTO_MODE_REGISTER,
+        'control': CONTROL_REGISTER,
+        'konveyor': KONVEYOR_REGISTER,
+        'coolant': COOLANT_REGISTER,
+        'target_adet': TARGET_ADET_REGISTER,
+        'kesilmis_adet': KESILMIS_ADET_REGISTER,
+        'target_uzunluk': TARGET_UZUNLUK_REGISTER,
+        'target_x': TARGET_X_REGISTER,
+    }
+
     def __new__(cls, host: str = None, port: int = None):
         """Thread-safe singleton pattern."""
         with cls._lock:
@@ -108,7 +155,7 @@ class MachineControl:
             cfg = _load_modbus_config()
             self.host = host or cfg['host']
             self.port = port or cfg['port']
-            self.client = ModbusTcpClient(
+            self.client = MachineControl._shared_client or ModbusTcpClient(
                 host=self.host,
                 port=self.port,
                 timeout=CONNECT_TIMEOUT
@@ -118,6 +165,36 @@ class MachineControl:
             # Connection cooldown tracking
             self._last_connect_attempt: float = 0
 
+            # One client transaction at a time (GUI thread + status poller);
+            # the shared client is thread-safe and needs no lock (see _io)
+            self._io_lock = threading.RLock()
+
+            # Status cache: register -> (value, monotonic read time)
+            poll_cfg = cfg.get('status_poll', {})
+            self._status_interval = float(poll_cfg.get('interval', STATUS_POLL_INTERVAL))
+            self._status_max_age = float(poll_cfg.get('max_age', STATUS_MAX_AGE))
+            self._status_plan = ReadPlan(
+                [ReadBlock(name, address) for name, address in self.STATUS_REGISTERS.items()],
+                max_gap=poll_cfg.get('max_gap', DEFAULT_MAX_GAP),
+            )
+            self._status_addresses = frozenset(self.STATUS_REGISTERS.values())
+            self._status_cache: Dict[int, Tuple[int, float]] = {}
+            self._status_seq = 0                           # Invalidation counter
+            self._invalidated_seq: Dict[int, int] = {}     # register -> seq of last write
+            self._status_lock = threading.Lock()
+            self._status_wake = threading.Event()
+            self._status_thread: Optional[threading.Thread] = None
+            self._status_running = False
+            self._status_stats = {
+                'polls': 0,
+                'poll_failures': 0,
+                'cache_reads': 0,
+                'stale_reads': 0,
+                'invalidations': 0,
+                'last_poll_ms': None,
+                'max_poll_ms': 0.0,
+            }
+
             # Try to connect (with cooldown tracking)
             try:
                 self._last_connect_attempt = time.monotonic()
@@ -132,6 +209,38 @@ class MachineControl:
 
             self._initialized = True
 
+    @classmethod
+    def use_shared_client(cls, client: Optional[SyncModbusClient]):
+        """
+        Route all Modbus traffic through a shared transaction manager connection.
+
+        Call before the GUI creates MachineControl (an existing instance
+        switches clients too).
+
+        Args:
+            client: SyncModbusClient from ModbusTransactionManager.sync_client()
+                    (None: own ModbusTcpClient for new instances)
+        """
+        cls._shared_client = client
+        instance = cls._instance
+        if client is not None and instance is not None and instance._initialized:
+            with instance._io_lock:
+                instance.client.close()
+                instance.client = client
+        logger.info(f"MachineControl using {'shared transaction manager' if client else 'own'} connection")
+
+    def _io(self):
+        """Lock for one client transaction (own ModbusTcpClient only)."""
+        if isinstance(self.client, SyncModbusClient):
+            return contextlib.nullcontext()
+        return self._io_lock
+
+    def _priority(self, priority: Priority):
+        """Transaction priority context (shared client only)."""
+        if isinstance(self.client, SyncModbusClient):
+            return self.client.priority(priority)
+        return contextlib.nullcontext()
+
     @property
     def is_connected(self) -> bool:
         """Check if Modbus is connected."""
@@ -170,10 +279,11 @@ class MachineControl:
     def _read_register(self, register: int) -> Optional[int]:
         """Read a single register (synchronous)."""
         try:
-            if not self._ensure_connected():
-                return None
+            with self._io():
+                if not self._ensure_connected():
+                    return None
 
-            result = self.client.read_holding_registers(address=register, count=1)
+                result = self.client.read_holding_registers(address=register, count=1)
             if result.isError():
                 logger.error(f"Register read error ({register}): {result}")
                 return None
@@ -186,14 +296,16 @@ class MachineControl:
     def _write_register(self, register: int, value: int) -> bool:
         """Write a single register (synchronous)."""
         try:
-            if not self._ensure_connected():
-                logger.warning(f"WRITE SKIP reg={register} val={value} — not connected")
-                return False
+            with self._io():
+                if not self._ensure_connected():
+                    logger.warning(f"WRITE SKIP reg={register} val={value} — not connected")
+                    return False
 
-            result = self.client.write_register(address=register, value=value)
-            if result.isError():
-                logger.error(f"WRITE FAIL reg={register} val={value} — {result}")
-                return False
+                result = self.client.write_register(address=register, value=value)
+                if result.isError():
+                    logger.error(f"WRITE FAIL reg={register} val={value} — {result}")
+                    return False
+                self._invalidate_status(register)
 
             logger.info(f"WRITE OK reg={register} val={value}")
             return True
@@ -204,19 +316,201 @@ class MachineControl:
     def _write_coil(self, coil_address: int, value: bool) -> bool:
         """Write a single coil (discrete output)."""
         try:
-            if not self._ensure_connected():
-                logger.warning(f"COIL SKIP coil={coil_address} val={value} — not connected")
-                return False
-            result = self.client.write_coil(address=coil_address, value=value)
-            if result.isError():
-                logger.error(f"COIL FAIL coil={coil_address} val={value} — {result}")
-                return False
+            with self._io():
+                if not self._ensure_connected():
+                    logger.warning(f"COIL SKIP coil={coil_address} val={value} — not connected")
+                    return False
+                result = self.client.write_coil(address=coil_address, value=value)
+                if result.isError():
+                    logger.error(f"COIL FAIL coil={coil_address} val={value} — {result}")
+                    return False
+                # Coil n is bit n % 16 of register n // 16
+                self._invalidate_status(coil_address // 16)
             logger.info(f"COIL OK coil={coil_address} val={value}")
             return True
         except Exception as e:
             logger.error(f"COIL ERR coil={coil_address} val={value} — {e}")
             return False
 
+    # ========================================================================
+    # Status Cache
+    # ========================================================================
+
+    @property
+    def status_polling(self) -> bool:
+        """True while the background status poller runs."""
+        return self._status_running
+
+    def start_status_polling(self, interval: Optional[float] = None):
+        """
+        Start the background status poller (daemon thread).
+
+        Status getters (is_*, read_* of STATUS_REGISTERS) are served from the
+        cache from now on; before the first poll they return None.
+
+        Args:
+            interval: Seconds between polls (default: config status_poll.interval)
+        """
+        if self._status_running:
+            return
+        if interval is not None:
+            self._status_interval = float(interval)
+        self._status_running = True
+        self._status_wake.clear()
+        self._status_thread = threading.Thread(
+            target=self._status_poll_loop,
+            name="MachineStatusPoller",
+            daemon=True
+        )
+        self._status_thread.start()
+        logger.info(
+            f"Status poller started ({self._status_interval * 1000:.0f} ms, "
+            f"{', '.join(f'{r.address}x{r.count}' for r in self._status_plan.requests)})"
+        )
+
+    def stop_status_polling(self, timeout: float = 2.0):
+        """
+        Stop the status poller; getters fall back to direct reads.
+
+        Args:
+            timeout: Maximum time to wait for an in-flight poll
+        """
+        if not self._status_running:
+            return
+        self._status_running = False
+        self._status_wake.set()
+        if self._status_thread and self._status_thread.is_alive():
+            self._status_thread.join(timeout=timeout)
+        self._status_thread = None
+        logger.info("Status poller stopped")
+
+    def _status_poll_loop(self):
+        """Poller thread: poll, then sleep until the next period or a write."""
+        while self._status_running:
+            self.poll_status()
+            self._status_wake.wait(self._status_interval)
+            self._status_wake.clear()
+
+    def poll_status(self) -> bool:
+        """
+        Read all status registers into the cache (one request per coalesced range).
+
+        Returns:
+            True if every request succeeded
+        """
+        start = time.perf_counter()
+        ok = True
+        with self._priority(Priority.TELEMETRY):
+            try:
+                with self._io():
+                    if not self._ensure_connected():
+                        return self._finish_poll(start, False)
+                for request in self._status_plan.requests:
+                    # Registers written while this request is on the wire keep
+                    # their invalidation (the value read may predate the write)
+                    with self._status_lock:
+                        seq = self._status_seq
+                    with self._io():
+                        result = self.client.read_holding_registers(address=request.address, count=request.count)
+                    if result.isError() or len(result.registers) < request.count:
+                        logger.debug(f"Status read error ({request.address}x{request.count}): {result}")
+                        ok = False
+                        continue
+                    now = time.monotonic()
+                    with self._status_lock:
+                        for block in request.blocks:
+                            if self._invalidated_seq.get(block.address, -1) >= seq:
+                                continue
+                            value = result.registers[block.address - request.address]
+                            self._status_cache[block.address] = (value, now)
+            except Exception as e:
+                logger.debug(f"Status poll exception: {e}")
+                ok = False
+        return self._finish_poll(start, ok)
+
+    def _finish_poll(self, start: float, ok: bool) -> bool:
+        """Record poll statistics."""
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._status_stats['polls'] += 1
+        self._status_stats['last_poll_ms'] = elapsed_ms
+        self._status_stats['max_poll_ms'] = max(self._status_stats['max_poll_ms'], elapsed_ms)
+        if not ok:
+            self._status_stats['poll_failures'] += 1
+        return ok
+
+    def _invalidate_status(self, *registers: int):
+        """Drop cached values of written registers and poll again soon."""
+        with self._status_lock:
+            for register in registers:
+                self._invalidated_seq[register] = self._status_seq
+                if self._status_cache.pop(register, None) is not None:
+                    self._status_stats['invalidations'] += 1
+            self._status_seq += 1
+        if self._status_running:
+            self._status_wake.set()
+
+    def _read_status_register(self, register: int) -> Optional[int]:
+        """
+        Read a status register: from the cache while polling, else from the PLC.
+
+        Returns:
+            Register value, or None if not read yet, invalidated by a write
+            or older than status_poll.max_age (see status_age)
+        """
+        if not self._status_running or register not in self._status_addresses:
+            return self._read_register(register)
+
+        with self._status_lock:
+            entry = self._status_cache.get(register)
+        self._status_stats['cache_reads'] += 1
+        if entry is None or time.monotonic() - entry[1] > self._status_max_age:
+            self._status_stats['stale_reads'] += 1
+            return None
+        return entry[0]
+
+    def status_age(self, register: Optional[int] = None) -> Optional[float]:
+        """
+        Age of cached status in seconds (staleness indicator).
+
+        Args:
+            register: Register address (None: oldest of all status registers)
+
+        Returns:
+            Seconds since the value was read, None if not cached
+        """
+        now = time.monotonic()
+        with self._status_lock:
+            if register is not None:
+                entry = self._status_cache.get(register)
+                return now - entry[1] if entry else None
+            times = [self._status_cache[r][1] for r in self._status_addresses if r in self._status_cache]
+            if len(times) < len(self._status_addresses):
+                return None
+            return now - min(times)
+
+    def is_status_stale(self) -> bool:
+        """True if any cached status value is missing or older than max_age."""
+        age = self.status_age()
+        return age is None or age > self._status_max_age
+
+    def get_status_stats(self) -> dict:
+        """
+        Get status poller statistics.
+
+        Returns:
+            Dictionary with poll counters/timings (ms), cache read counters,
+            the coalesced request ranges and the oldest cached value age
+        """
+        age = self.status_age()
+        return {
+            **self._status_stats,
+            'polling': self._status_running,
+            'interval_s': self._status_interval,
+            'max_age_s': self._status_max_age,
+            'request_ranges': [(r.address, r.count) for r in self._status_plan.requests],
+            'age_s': round(age, 3) if age is not None else None,
+        }
+
     def _set_bit(self, register: int, bit_position: int, value: bool) -> bool:
         """Set a specific bit in a register."""
         try:
@@ -245,9 +539,9 @@ class MachineControl:
             return False
 
     def _get_bit(self, register: int, bit_position: int) -> Optional[bool]:
-        """Get a specific bit value from a register."""
+        """Get a specific bit value from a register (status cache while polling)."""
         try:
-            current_value = self._read_register(register)
+            current_value = self._read_status_register(register)
             if current_value is None:
                 return None
 
@@ -355,7 +649,8 @@ class MachineControl:
 
     def stop_material_forward(self) -> bool:
         """Stop material forward movement."""
-        return self._set_bit(self.CONTROL_REGISTER, self.MATERIAL_FORWARD_BIT, False)
+        with self._priority(Priority.SAFETY):
+            return self._set_bit(self.CONTROL_REGISTER, self.MATERIAL_FORWARD_BIT, False)
 
     def move_material_backward(self) -> bool:
         """Move material backward."""
@@ -363,7 +658,8 @@ class MachineControl:
 
     def stop_material_backward(self) -> bool:
         """Stop material backward movement."""
-        return self._set_bit(self.CONTROL_REGISTER, self.MATERIAL_BACKWARD_BIT, False)
+        with self._priority(Priority.SAFETY):
+            return self._set_bit(self.CONTROL_REGISTER, self.MATERIAL_BACKWARD_BIT, False)
 
     def is_material_moving_forward(self) -> Optional[bool]:
         """Check if material is moving forward."""
@@ -383,7 +679,8 @@ class MachineControl:
 
     def stop_saw_up(self) -> bool:
         """Stop saw upward movement."""
-        return self._set_bit(self.CONTROL_REGISTER, self.SAW_UP_BIT, False)
+        with self._priority(Priority.SAFETY):
+            return self._set_bit(self.CONTROL_REGISTER, self.SAW_UP_BIT, False)
 
     def move_saw_down(self) -> bool:
         """Move saw down."""
@@ -391,7 +688,8 @@ class MachineControl:
 
     def stop_saw_down(self) -> bool:
         """Stop saw downward movement."""
-        return self._set_bit(self.CONTROL_REGISTER, self.SAW_DOWN_BIT, False)
+        with self._priority(Priority.SAFETY):
+            return self._set_bit(self.CONTROL_REGISTER, self.SAW_DOWN_BIT, False)
 
     def is_saw_moving_up(self) -> Optional[bool]:
         """Check if saw is moving up."""
@@ -411,7 +709,8 @@ class MachineControl:
 
     def stop_cutting(self) -> bool:
         """Stop cutting operation."""
-        return self._set_bit(self.CONTROL_REGISTER, self.CUTTING_STOP_BIT, True)
+        with self._priority(Priority.SAFETY):
+            return self._set_bit(self.CONTROL_REGISTER, self.CUTTING_STOP_BIT, True)
 
     def is_cutting_active(self) -> Optional[bool]:
         """Check if cutting is active."""
@@ -540,7 +839,7 @@ class MachineControl:
 
     def read_auto_cutting_mode(self) -> Optional[bool]:
         """Read auto cutting mode from register 2. Returns True if 1, False if 0, None on error."""
-        val = self._read_register(self.AUTO_MODE_REGISTER)
+        val = self._read_status_register(self.AUTO_MODE_REGISTER)
         if val is None:
             return None
         return val == 1
@@ -548,14 +847,16 @@ class MachineControl:
     def _write_double_word(self, register: int, value: int) -> bool:
         """Write a 32-bit value as two consecutive registers (FC16)."""
         try:
-            if not self._ensure_connected():
-                return False
-            low_word = value & 0xFFFF
-            high_word = (value >> 16) & 0xFFFF
-            result = self.client.write_registers(address=register, values=[low_word, high_word])
-            if result.isError():
-                logger.error(f"Double word write error ({register}): {result}")
-                return False
+            with self._io():
+                if not self._ensure_connected():
+                    return False
+                low_word = value & 0xFFFF
+                high_word = (value >> 16) & 0xFFFF
+                result = self.client.write_registers(address=register, values=[low_word, high_word])
+                if result.isError():
+                    logger.error(f"Double word write error ({register}): {result}")
+                    return False
+                self._invalidate_status(register, register + 1)
             return True
         except Exception as e:
             logger.error(f"Double word write exception ({register}): {e}")
@@ -574,7 +875,7 @@ class MachineControl:
 
     def read_target_x(self) -> Optional[int]:
         """Read X (paketteki adet) from register 2070."""
-        return self._read_register(self.TARGET_X_REGISTER)
+        return self._read_status_register(self.TARGET_X_REGISTER)
 
     def write_target_adet(self, p: int) -> bool:
         """Write P (hedef adet) to register 2050."""
@@ -601,18 +902,18 @@ class MachineControl:
 
     def read_target_adet(self) -> Optional[int]:
         """Read target adet from register 2050."""
-        return self._read_register(self.TARGET_ADET_REGISTER)
+        return self._read_status_register(self.TARGET_ADET_REGISTER)
 
     def read_target_uzunluk(self) -> Optional[float]:
         """Read target uzunluk from register 2064 as single word (value /10)."""
-        raw = self._read_register(self.TARGET_UZUNLUK_REGISTER)
+        raw = self._read_status_register(self.TARGET_UZUNLUK_REGISTER)
         if raw is not None:
             return raw / 10.0
         return None
 
     def read_kesilmis_adet(self) -> Optional[int]:
         """Read current cut count from register 2056."""
-        return self._read_register(self.KESILMIS_ADET_REGISTER)
+        return self._read_status_register(self.KESILMIS_ADET_REGISTER)
 
     def start_auto_cutting(self) -> bool:
         """Start auto cutting by setting bit 20.13."""
@@ -624,7 +925,8 @@ class MachineControl:
 
     def cancel_auto_cutting(self) -> bool:
         """Cancel auto cutting by setting stop bit 20.4."""
-        return self._set_bit(self.CONTROL_REGISTER, self.CUTTING_STOP_BIT, True)
+        with self._priority(Priority.SAFETY):
+            return self._set_bit(self.CONTROL_REGISTER, self.CUTTING_STOP_BIT, True)
 
     # ========================================================================
     # Status Methods
@@ -633,7 +935,7 @@ class MachineControl:
     def get_control_register_status(self) -> Optional[dict]:
         """Get all bit statuses from control register."""
         try:
-            current_value = self._read_register(self.CONTROL_REGISTER)
+            current_value = self._read_status_register(self.CONTROL_REGISTER)
             if current_value is None:
                 return None
 
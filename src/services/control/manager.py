@@ -31,15 +31,17 @@ class ControlManager:
         self,
         config: dict,
         modbus_service,
-        ml_db_service
+        ml_db_service,
+        write_scheduler=None
     ):
         """
         Initialize control manager.
 
         Args:
             config: System configuration dictionary
-            modbus_service: AsyncModbusService instance
+            modbus_service: AsyncModbusService or ModbusTransactionManager
             ml_db_service: SQLiteService for ml.db
+            write_scheduler: ModbusWriteScheduler shared with the pipeline (optional)
         """
         self.config = config
 
@@ -57,7 +59,8 @@ class ControlManager:
         self.modbus_writer = ModbusWriter(
             modbus_service,
             config['modbus']['registers'],
-            config['control']['speed_limits']
+            config['control']['speed_limits'],
+            scheduler=write_scheduler
         )
 
         # Controllers
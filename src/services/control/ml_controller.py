@@ -7,6 +7,7 @@ This is the most complex component in the system, implementing:
 - Torque Guard (spike detection and emergency response)
 - Speed change accumulation (threshold-based writing)
 - Database logging (ML predictions)
+- Model registry (background preload, hot reload, shadow models)
 """
 
 import asyncio
@@ -14,15 +15,19 @@ import logging
 import numpy as np
 import sqlite3
 import threading
+import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, Tuple
 
 from ...ml.model_loader import MLModelLoader
-from ...ml.preprocessor import MLPreprocessor
+from ...ml.model_registry import ModelRegistry
+from ...ml.preprocessor import FEATURE_NAMES, MLPreprocessor
 from ...domain.models import ControlCommand, ProcessedData
 from ...domain.validators import validate_speed
+from .torque_history import HeightTorqueHistory
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +54,7 @@ class MLController:
 
         Args:
             config: Full system configuration dictionary
-            modbus_service: AsyncModbusService instance
+            modbus_service: AsyncModbusService or ModbusTransactionManager
             db_service: SQLiteService instance for ml.db
             modbus_writer: ModbusWriter instance for writing speeds (optional)
         """
@@ -58,9 +63,23 @@ class MLController:
         self.db = db_service
         self.writer = modbus_writer
 
+        # Flattened NumPy/list evaluation of the ensemble instead of model.predict
+        self.compiled_inference = config['ml'].get('compiled_inference', True)
+
         # ML components
-        model_path = Path(config['ml']['model_path'])
-        self.model_loader = MLModelLoader(model_path)
+        # Registry: background preload, hot reload and shadow models (see start())
+        registry_config = config['ml'].get('registry', {})
+        self.model_registry = ModelRegistry(
+            Path(config['ml']['model_path']),
+            FEATURE_NAMES,
+            shadow_models=registry_config.get('shadow_models') or [],
+            db_service=db_service,
+            compiled=self.compiled_inference,
+            watch_interval=registry_config.get('watch_interval', 5.0),
+            shadow_batch_size=registry_config.get('shadow_batch_size', 50),
+            shadow_flush_interval=registry_config.get('shadow_flush_interval', 5.0),
+            shadow_queue_size=registry_config.get('shadow_queue_size', 2000)
+        )
         self.preprocessor = MLPreprocessor(config['ml'])
 
         # Torque Guard configuration
@@ -71,8 +90,11 @@ class MLController:
         self.tg_torque_threshold = tg_config['torque_increase_threshold']
         self.tg_reduction_factor = tg_config['speed_reduction_factor']
 
-        # Torque Guard state
-        self.height_torque_buffer: List[Tuple[float, float]] = []
+        # Torque Guard state (height-sorted, bounded to twice the lookback above the head)
+        self.height_torque_buffer = HeightTorqueHistory(
+            max_distance_mm=2 * self.tg_height_threshold,
+            max_samples=tg_config.get('history_max_samples', 3000)
+        )
         self.ml_activation_time: Optional[float] = None
         self.torque_guard_triggered = False
         self.torque_guard_monitoring_started = False  # Track first activation
@@ -117,12 +139,31 @@ class MLController:
         # Lock for thread safety
         self._lock = threading.RLock()
 
+        # Inference executor: steps 4-9 of calculate_speeds off the event loop
+        inference_config = config['ml'].get('inference', {})
+        self.inference_executor_enabled = inference_config.get('executor', True)
+        self.inference_deadline = inference_config.get('deadline_ms', 50) / 1000.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending_inference: Optional[asyncio.Future] = None
+        self._late_command: Optional[ControlCommand] = None
+        # Samples that arrived while a job overran: fed to the buffers by the next job
+        self._skipped_samples = deque(maxlen=inference_config.get('max_skipped_samples', 100))
+        # ML command not applied yet and the accumulated changes it consumed
+        self._uncommitted: Optional[Tuple[ControlCommand, float, float]] = None
+        self._inference_latency = deque(maxlen=inference_config.get('latency_window', 500))
+
         # Statistics
         self._stats = {
             'predictions': 0,
             'torque_guard_activations': 0,
             'speed_commands_sent': 0,
-            'errors': 0
+            'errors': 0,
+            'inference_deadline_misses': 0,
+            'inference_busy_skips': 0,
+            'inference_skipped_samples_fed': 0,
+            'inference_late_commands_dropped': 0,
+            'ml_commands_superseded': 0,
+            'model_not_ready_skips': 0
         }
 
         logger.info(
@@ -136,6 +177,15 @@ class MLController:
             f"speed_restore={self.speed_restore_enabled}"
         )
 
+    @property
+    def model_loader(self) -> MLModelLoader:
+        """Loader of the active model (replaced by the registry on reload)."""
+        return self.model_registry.primary_loader
+
+    def start(self):
+        """Start background model preload, hot reload and shadow scoring."""
+        self.model_registry.start()
+
     async def calculate_speeds(
         self,
         processed_data: 'ProcessedData'
@@ -147,12 +197,18 @@ class MLController:
         1. Check if cutting (testere_durumu == 3)
         2. Check update interval (rate limiting)
         3. Record ML activation time (first cutting iteration)
-        4. Add data to preprocessor buffers
-        5. Check Torque Guard (priority over normal ML)
-        6. Normal ML prediction
-        7. Calculate new speeds
-        8. Accumulate changes
-        9. Return command if thresholds exceeded
+        4-9. _compute_command(): buffers, Torque Guard, prediction, speed
+             math, accumulation and thresholds
+
+        Steps 4-9 run in the inference executor when enabled, so the event
+        loop never blocks on them. If no result arrives within the deadline
+        the fallback is to hold the last command (return None; the PLC keeps
+        the speeds written last). The job still completes; a late Torque
+        Guard command is returned on the next call (ahead of that call's ML
+        command), late ML commands are dropped. A dropped ML command leaves
+        its accumulated speed changes in the buffers for the next command.
+        While a job overruns, new samples skip only the model step: the next
+        job adds them to the preprocessor and Torque Guard history first.
 
         Args:
             processed_data: ProcessedData with sensor readings
@@ -160,43 +216,175 @@ class MLController:
         Returns:
             ControlCommand if speeds should be updated, None otherwise
         """
+        try:
+            raw_data = processed_data.raw_data
+
+            # 1. Check cutting state
+            if raw_data.testere_durumu != 3:  # Not cutting
+                if self.is_cutting:
+                    await self._reset_cutting_state()
+                return None
+
+            # Mark as cutting
+            if not self.is_cutting:
+                self.is_cutting = True
+                logger.info("Cutting started - ML controller activated")
+                # Save original speeds before ML starts adjusting
+                if self.speed_restore_enabled:
+                    self._save_original_speeds(
+                        raw_data.serit_kesme_hizi,
+                        raw_data.serit_inme_hizi
+                    )
+
+            # 2. Check update interval (rate limiting)
+            if not self._should_update():
+                return None
+
+            # 3. Record ML activation time (first iteration)
+            now = asyncio.get_running_loop().time()
+            if self.ml_activation_time is None:
+                self.ml_activation_time = now
+                logger.info(
+                    f"ML control activated. "
+                    f"Torque Guard will activate after {self.tg_activation_delay:.1f}s"
+                )
+
+            if not self.inference_executor_enabled:
+                return self._commit_command(self._compute_command(processed_data, now))
+
+            return await self._run_inference(processed_data, now)
+
+        except Exception as e:
+            logger.error(f"Error in ML control loop: {e}", exc_info=True)
+            self._stats['errors'] += 1
+            return None
+
+    async def _run_inference(
+        self,
+        processed_data: 'ProcessedData',
+        now: float
+    ) -> Optional[ControlCommand]:
+        """
+        Run _compute_command() in the inference executor with a deadline.
+
+        Args:
+            processed_data: ProcessedData with sensor readings
+            now: Event loop time of this cycle
+
+        Returns:
+            ControlCommand (a late Torque Guard command first), or None (hold
+            last command) on a missed deadline
+        """
+        late_command = self._take_late_command()
+
+        if self._pending_inference is not None and not self._pending_inference.done():
+            # Previous job overran: don't queue behind it. Only the model step
+            # is skipped; the next job adds this sample to the buffers first
+            self._skipped_samples.append((processed_data, now))
+            self._stats['inference_busy_skips'] += 1
+            return late_command
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MLInference")
+
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, self._compute_command, processed_data, now
+        )
+        self._pending_inference = future
+
+        done, _ = await asyncio.wait({future}, timeout=self.inference_deadline)
+        if not done:
+            self._stats['inference_deadline_misses'] += 1
+            future.add_done_callback(self._on_late_inference)
+            logger.warning(
+                f"ML inference missed {self.inference_deadline * 1000:.0f} ms deadline "
+                f"- holding last command"
+            )
+            return late_command
+
+        self._pending_inference = None
+        command = future.result()
+        if late_command is not None:
+            # Protection first: this cycle's ML step was computed on pre-reduction speeds
+            if command is not None and command.source == "torque_guard":
+                self._late_command = command     # Next cycle
+            elif command is not None:
+                self._discard_command(command, 'ml_commands_superseded')
+            return late_command
+        return self._commit_command(command)
+
+    def _on_late_inference(self, future):
+        """Keep a late Torque Guard command for the next cycle; drop late ML commands."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        command = future.result()
+        if command is None:
+            return
+        if command.source == "torque_guard":
+            self._late_command = command
+        else:
+            self._discard_command(command, 'inference_late_commands_dropped')
+
+    def _commit_command(self, command: Optional[ControlCommand]) -> Optional[ControlCommand]:
+        """Consume the accumulated speed changes of an ML command being applied."""
+        if command is None:
+            return None
         with self._lock:
-            try:
-                raw_data = processed_data.raw_data
+            if self._uncommitted is not None and self._uncommitted[0] is command:
+                _, kesme_consumed, inme_consumed = self._uncommitted
+                self.kesme_hizi_degisim_buffer -= kesme_consumed
+                self.inme_hizi_degisim_buffer -= inme_consumed
+                self._uncommitted = None
+            if command.source == "ml":
+                self._stats['speed_commands_sent'] += 1
+        return command
+
+    def _discard_command(self, command: ControlCommand, stat: str):
+        """Drop an ML command; its accumulated speed changes stay in the buffers."""
+        with self._lock:
+            if self._uncommitted is not None and self._uncommitted[0] is command:
+                self._uncommitted = None
+            self._stats[stat] += 1
+        logger.warning(f"ML speed command dropped ({stat})")
+
+    def _take_late_command(self) -> Optional[ControlCommand]:
+        """Pop a Torque Guard command produced after its deadline."""
+        command, self._late_command = self._late_command, None
+        if command is not None:
+            logger.warning("Applying late Torque Guard command")
+        return command
+
+    def _compute_command(
+        self,
+        processed_data: 'ProcessedData',
+        now: float
+    ) -> Optional[ControlCommand]:
+        """
+        Steps 4-9 of calculate_speeds (runs in the inference executor).
 
-                # 1. Check cutting state
-                if raw_data.testere_durumu != 3:  # Not cutting
-                    if self.is_cutting:
-                        await self._reset_cutting_state()
-                    return None
+        Args:
+            processed_data: ProcessedData with sensor readings
+            now: Event loop time of this cycle (for Torque Guard delay)
 
-                # Mark as cutting
-                if not self.is_cutting:
-                    self.is_cutting = True
-                    logger.info("Cutting started - ML controller activated")
-                    # Save original speeds before ML starts adjusting
-                    if self.speed_restore_enabled:
-                        self._save_original_speeds(
-                            raw_data.serit_kesme_hizi,
-                            raw_data.serit_inme_hizi
-                        )
-
-                # 2. Check update interval (rate limiting)
-                if not self._should_update():
-                    return None
+        Returns:
+            ControlCommand if speeds should be updated, None otherwise
+        """
+        start = time.perf_counter()
 
-                # 3. Record ML activation time (first iteration)
-                if self.ml_activation_time is None:
-                    self.ml_activation_time = asyncio.get_event_loop().time()
-                    logger.info(
-                        f"ML control activated. "
-                        f"Torque Guard will activate after {self.tg_activation_delay:.1f}s"
-                    )
+        # First call loads/compiles the model: keep that outside the controller lock
+        self._warm_model()
 
-                # 4. Add data to preprocessor buffers
+        with self._lock:
+            try:
+                raw_data = processed_data.raw_data
+
+                # 4. Add data to preprocessor buffers, in time order with the
+                # samples skipped while a job overran (this one may be that job)
+                skipped_guard_command = self._feed_skipped_samples(until=now)
                 if not self.preprocessor.add_data_point(raw_data):
                     logger.error("Failed to add data to preprocessor")
                     return None
+                skipped_guard_command = skipped_guard_command or self._feed_skipped_samples()
 
                 # Wait for buffers to fill
                 if not self.preprocessor.is_ready():
@@ -205,18 +393,29 @@ class MLController:
 
                 # 5. Check Torque Guard (highest priority)
                 if self.torque_guard_enabled:
-                    torque_guard_command = self._check_and_apply_torque_guard(raw_data)
+                    torque_guard_command = (
+                        skipped_guard_command or self._check_and_apply_torque_guard(raw_data, now)
+                    )
                     if torque_guard_command:
                         return torque_guard_command
 
-                # 6. Normal ML prediction
+                # 6. Normal ML prediction (hold speeds until the preload is done)
+                if self.model_registry.is_loading():
+                    self._stats['model_not_ready_skips'] += 1
+                    return None
+
                 prediction_result = self._predict_coefficient(raw_data)
                 if prediction_result is None:
                     logger.error("ML prediction failed")
                     self._stats['errors'] += 1
                     return None
 
-                coefficient, input_df = prediction_result
+                coefficient, features, model_output = prediction_result
+
+                # Shadow models score the same row later, in a batch
+                self.model_registry.submit_shadow(
+                    features[0], model_output, processed_data.cutting_session_id
+                )
 
                 # 7. Calculate new speeds using CURRENT sensor values (matches old project exactly)
                 # Old project uses: processed_data.get('serit_kesme_hizi') directly
@@ -232,7 +431,7 @@ class MLController:
 
                 # Log ML prediction with complete data (after speed calculation)
                 self._log_ml_prediction(
-                    input_df,
+                    features,
                     coefficient,
                     raw_data.serit_motor_tork_percentage,
                     raw_data.kafa_yuksekligi_mm,
@@ -256,9 +455,13 @@ class MLController:
                 )
 
                 # 9. Check thresholds and write speeds (matching old project logic)
-                # Each speed is checked independently, buffer accumulation is used
+                # Each speed is checked independently, buffer accumulation is used.
+                # Buffers are reset by _commit_command() once the command is
+                # applied, so a dropped command (late, superseded) loses nothing.
                 inme_target = None
                 kesme_target = None
+                inme_consumed = 0.0
+                kesme_consumed = 0.0
 
                 # Check inme threshold (independent)
                 if not self.inme_threshold_enabled or abs(self.inme_hizi_degisim_buffer) >= self.inme_threshold:
@@ -270,7 +473,7 @@ class MLController:
                         self.limits['inme_hizi']['max'],
                         'inme_hizi'
                     )
-                    self.inme_hizi_degisim_buffer = 0.0  # Reset only this buffer
+                    inme_consumed = self.inme_hizi_degisim_buffer  # Reset only this buffer
 
                 # Check kesme threshold (independent)
                 if not self.kesme_threshold_enabled or abs(self.kesme_hizi_degisim_buffer) >= self.kesme_threshold:
@@ -282,7 +485,7 @@ class MLController:
                         self.limits['kesme_hizi']['max'],
                         'kesme_hizi'
                     )
-                    self.kesme_hizi_degisim_buffer = 0.0  # Reset only this buffer
+                    kesme_consumed = self.kesme_hizi_degisim_buffer  # Reset only this buffer
 
                 # Return command if either speed needs writing
                 # IMPORTANT: Only include speeds that exceeded threshold (None = don't write)
@@ -294,8 +497,7 @@ class MLController:
                         kesme_hizi_target=kesme_target,  # None if threshold not exceeded
                         inme_hizi_target=inme_target     # None if threshold not exceeded
                     )
-
-                    self._stats['speed_commands_sent'] += 1
+                    self._uncommitted = (command, kesme_consumed, inme_consumed)
 
                     # Log only the speeds being written
                     log_parts = []
@@ -308,13 +510,48 @@ class MLController:
                     return command
 
                 return None
-
             except Exception as e:
                 logger.error(f"Error in ML control loop: {e}", exc_info=True)
                 self._stats['errors'] += 1
                 return None
 
-    def _predict_coefficient(self, raw_data) -> Optional[Tuple[float, 'pd.DataFrame']]:
+            finally:
+                self._inference_latency.append(time.perf_counter() - start)
+
+
+    def _feed_skipped_samples(self, until: float = float('inf')) -> Optional[ControlCommand]:
+        """
+        Add samples skipped while a job overran to the preprocessor and Torque Guard history.
+
+        Args:
+            until: Only feed samples from cycles up to this event loop time
+
+        Returns:
+            Torque Guard command if one of them triggered it, None otherwise
+        """
+        guard_command = None
+        while self._skipped_samples and self._skipped_samples[0][1] <= until:
+            processed_data, now = self._skipped_samples.popleft()
+            raw_data = processed_data.raw_data
+            if not self.preprocessor.add_data_point(raw_data):
+                continue
+            self._stats['inference_skipped_samples_fed'] += 1
+            if self.torque_guard_enabled and guard_command is None and self.preprocessor.is_ready():
+                guard_command = self._check_and_apply_torque_guard(raw_data, now)
+        return guard_command
+
+    def _warm_model(self):
+        """Load (and compile) the model if not done yet; errors surface in prediction."""
+        if self.model_registry.is_loading():
+            return
+        try:
+            if self.compiled_inference and self.model_loader.load_compiled(FEATURE_NAMES) is not None:
+                return
+            self.model_loader.load()
+        except Exception:
+            pass
+
+    def _predict_coefficient(self, raw_data) -> Optional[Tuple[float, np.ndarray, float]]:
         """
         ML model inference.
 
@@ -327,29 +564,45 @@ class MLController:
 
         Note: Database logging is deferred to calculate_speeds() after
         speed calculation, so this method returns both the coefficient
-        and input_df for use in logging.
+        and the feature row for use in logging.
 
         Args:
             raw_data: RawSensorData with current sensor readings
 
         Returns:
-            Tuple of (coefficient, input_df) or None on error
+            Tuple of (coefficient, features, model_output) or None on error
             Coefficient is in [-1.0, 1.0] range (after katsayi applied)
+            features is the preprocessor's reusable (1, 4) input array
+            model_output is the raw model prediction (for shadow comparison)
         """
         try:
-            # Get model input
-            input_df = self.preprocessor.get_model_input()
-            if input_df is None:
+            # Get model input (reusable array in training feature order)
+            features = self.preprocessor.get_model_input_array()
+            if features is None:
                 return None
 
-            # Load model
-            model = self.model_loader.load()
+            # One loader for the whole prediction (the registry may swap it)
+            loader = self.model_loader
 
-            # Predict
-            coefficient = model.predict(input_df)[0]
+            # Predict with the compiled ensemble when available
+            compiled = (
+                loader.load_compiled(FEATURE_NAMES)
+                if self.compiled_inference else None
+            )
+            if compiled is not None:
+                model_output = compiled.predict_one(features[0])
+            else:
+                model = loader.load()
+
+                # Models fitted on a DataFrame validate column names
+                if getattr(model, 'feature_names_in_', None) is not None:
+                    model_output = model.predict(self.preprocessor.get_model_input())[0]
+                else:
+                    model_output = model.predict(features)[0]
+            model_output = float(model_output)
 
             # Clamp to valid range
-            coefficient = max(-1.0, min(coefficient, 1.0))
+            coefficient = max(-1.0, min(model_output, 1.0))
 
             # Apply global multiplier
             coefficient *= self.katsayi
@@ -358,7 +611,7 @@ class MLController:
 
             logger.debug(f"ML coefficient: {coefficient:.4f}")
 
-            return (coefficient, input_df)
+            return (coefficient, features, model_output)
 
         except Exception as e:
             logger.error(f"ML prediction error: {e}", exc_info=True)
@@ -435,7 +688,8 @@ class MLController:
 
     def _check_and_apply_torque_guard(
         self,
-        raw_data
+        raw_data,
+        now: float
     ) -> Optional[ControlCommand]:
         """
         Torque Guard: Detect and respond to rapid torque increases.
@@ -450,6 +704,7 @@ class MLController:
 
         Args:
             raw_data: RawSensorData with current readings
+            now: Event loop time of this cycle
 
         Returns:
             ControlCommand for emergency reduction, or None if not triggered
@@ -462,7 +717,7 @@ class MLController:
         if self.ml_activation_time is None:
             return None
 
-        elapsed = asyncio.get_event_loop().time() - self.ml_activation_time
+        elapsed = now - self.ml_activation_time
         if elapsed < self.tg_activation_delay:
             # Still waiting for Torque Guard activation delay
             return None
@@ -476,16 +731,11 @@ class MLController:
             )
 
         # Record current (height, torque) pair
-        avg_torque = (
-            np.mean(list(self.preprocessor.torque_buffer))
-            if len(self.preprocessor.torque_buffer) > 0
-            else raw_data.serit_motor_tork_percentage
-        )
+        avg_torque = self.preprocessor.get_average_torque()
+        if avg_torque is None:
+            avg_torque = raw_data.serit_motor_tork_percentage
 
-        self.height_torque_buffer.append((
-            raw_data.kafa_yuksekligi_mm,
-            avg_torque
-        ))
+        self.height_torque_buffer.append(raw_data.kafa_yuksekligi_mm, avg_torque)
 
         # Skip initial descent phase
         if len(self.height_torque_buffer) < 10:  # Need some history
@@ -532,7 +782,8 @@ class MLController:
         """
         Interpolate torque value at specific height from history.
 
-        Uses linear interpolation between nearest height samples.
+        Uses linear interpolation between nearest height samples
+        (binary search on the height-sorted history).
 
         Args:
             target_height: Height (mm) to find torque at
@@ -540,38 +791,7 @@ class MLController:
         Returns:
             Interpolated torque percentage, or None if not enough data
         """
-        if len(self.height_torque_buffer) < 2:
-            return None
-
-        # Sort by height (ascending)
-        sorted_buffer = sorted(self.height_torque_buffer, key=lambda x: x[0])
-
-        # Find bounding samples
-        lower = None
-        upper = None
-
-        for height, torque in sorted_buffer:
-            if height <= target_height:
-                lower = (height, torque)
-            elif height > target_height:
-                upper = (height, torque)
-                break
-
-        # Check if we have bounds
-        if lower is None or upper is None:
-            # Use closest available
-            closest = min(sorted_buffer, key=lambda x: abs(x[0] - target_height))
-            return closest[1]
-
-        # Linear interpolation
-        h1, t1 = lower
-        h2, t2 = upper
-
-        if h2 == h1:
-            return t1
-
-        interpolated_torque = t1 + (t2 - t1) * (target_height - h1) / (h2 - h1)
-        return interpolated_torque
+        return self.height_torque_buffer.interpolate(target_height)
 
     def _apply_torque_guard_reduction(self, raw_data) -> ControlCommand:
         """
@@ -612,6 +832,7 @@ class MLController:
         self.height_torque_buffer.clear()
         self.kesme_hizi_degisim_buffer = 0.0
         self.inme_hizi_degisim_buffer = 0.0
+        self._uncommitted = None
 
         logger.warning(
             f"TORQUE GUARD REDUCTION: "
@@ -682,22 +903,31 @@ class MLController:
 
         Restores original speeds if speed_restore is enabled.
         """
+        # Let an overrunning inference job finish before clearing its state
+        if self._pending_inference is not None:
+            await asyncio.wait({self._pending_inference})
+            self._pending_inference = None
+        self._late_command = None
+        self._uncommitted = None
+        self._skipped_samples.clear()
+
         # Restore original speeds before resetting state
         if self.speed_restore_enabled:
             await self._restore_original_speeds()
 
-        self.is_cutting = False
-        self.ml_activation_time = None
-        self.torque_guard_triggered = False
-        self.torque_guard_monitoring_started = False
-        self.height_torque_buffer.clear()
-        self.kesme_hizi_degisim_buffer = 0.0
-        self.inme_hizi_degisim_buffer = 0.0
-        self.preprocessor.reset_buffers()
-
-        # Clear saved speeds
-        self._saved_kesme_hizi = None
-        self._saved_inme_hizi = None
+        with self._lock:
+            self.is_cutting = False
+            self.ml_activation_time = None
+            self.torque_guard_triggered = False
+            self.torque_guard_monitoring_started = False
+            self.height_torque_buffer.clear()
+            self.kesme_hizi_degisim_buffer = 0.0
+            self.inme_hizi_degisim_buffer = 0.0
+            self.preprocessor.reset_buffers()
+
+            # Clear saved speeds
+            self._saved_kesme_hizi = None
+            self._saved_inme_hizi = None
 
         logger.info("Cutting stopped - ML state reset")
 
@@ -746,7 +976,7 @@ class MLController:
 
     def _log_ml_prediction(
         self,
-        input_df,
+        features: np.ndarray,
         coefficient: float,
         serit_motor_tork: float,
         kafa_yuksekligi: float,
@@ -762,7 +992,7 @@ class MLController:
         Log ML prediction to database for analysis.
 
         Args:
-            input_df: Input DataFrame with features
+            features: (1, 4) model input in FEATURE_NAMES order
             coefficient: Predicted coefficient (already has katsayi applied)
             serit_motor_tork: Band motor torque percentage at prediction time
             kafa_yuksekligi: Head height in mm at prediction time
@@ -797,10 +1027,10 @@ class MLController:
 
             params = (
                 datetime.now().isoformat(),
-                float(input_df['akim_input'].iloc[0]),
-                float(input_df['sapma_input'].iloc[0]),
-                float(input_df['kesme_hizi'].iloc[0]),
-                float(input_df['inme_hizi'].iloc[0]),
+                float(features[0, 0]),
+                float(features[0, 1]),
+                float(features[0, 2]),
+                float(features[0, 3]),
                 float(serit_motor_tork),
                 float(kafa_yuksekligi),
                 float(yeni_kesme_hizi),
@@ -832,5 +1062,40 @@ class MLController:
                 'torque_guard_active': self.torque_guard_triggered,
                 'preprocessor_status': self.preprocessor.get_buffer_status(),
                 'accumulated_kesme': self.kesme_hizi_degisim_buffer,
-                'accumulated_inme': self.inme_hizi_degisim_buffer
+                'accumulated_inme': self.inme_hizi_degisim_buffer,
+                'inference_latency': self.get_inference_latency(),
+                'model_registry': self.model_registry.get_stats()
             }
+
+    def get_inference_latency(self) -> Dict:
+        """
+        Get inference latency percentiles over the last `latency_window` jobs.
+
+        Returns:
+            Dictionary with sample count and p50/p95/p99/max in milliseconds
+        """
+        samples = list(self._inference_latency)
+        if not samples:
+            return {'samples': 0, 'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None}
+
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99]) * 1000
+        return {
+            'samples': len(samples),
+            'p50_ms': round(float(p50), 3),
+            'p95_ms': round(float(p95), 3),
+            'p99_ms': round(float(p99), 3),
+            'max_ms': round(max(samples) * 1000, 3)
+        }
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the inference executor and the model registry.
+
+        Args:
+            wait: Wait for a running inference job to finish
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+            logger.info("ML inference executor stopped")
+        self.model_registry.stop()
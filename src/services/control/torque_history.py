@@ -0,0 +1,155 @@
+"""
+Height-indexed torque history for Torque Guard lookback.
+
+Keeps (height, torque) samples sorted by height so the torque "lookback_mm
+above the current head position" is found with a binary search instead of
+re-sorting the whole cut's history every cycle.
+
+The head only descends during a cut, so samples far above the current
+position can never be the nearest neighbours of a future lookback target.
+Samples more than `max_distance_mm` above the newest sample are evicted,
+and the oldest sample is evicted beyond `max_samples` (head standing
+still), so memory is bounded regardless of cut length.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+
+class HeightTorqueHistory:
+    """
+    Bounded (height, torque) history with O(log n) interpolation.
+
+    Equal heights keep insertion order, so queries give the same result as
+    a stable sort by height of the retained samples.
+
+    Not thread-safe: MLController holds its lock around all calls.
+    """
+
+    def __init__(self, max_distance_mm: float, max_samples: int = 3000):
+        """
+        Initialize history.
+
+        Args:
+            max_distance_mm: Samples higher than newest height + this are evicted
+            max_samples: Upper bound on retained samples (oldest evicted first)
+        """
+        if max_samples < 2:
+            raise ValueError("HeightTorqueHistory max_samples must be >= 2")
+
+        self.max_distance_mm = float(max_distance_mm)
+        self.max_samples = int(max_samples)
+
+        # Parallel lists sorted by (height, seq)
+        self._heights: List[float] = []
+        self._seqs: List[int] = []
+        self._torques: List[float] = []
+
+        # Insertion order for oldest-first eviction: (height, seq)
+        self._order: Deque[Tuple[float, int]] = deque()
+        self._seq = 0
+        self._evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._heights)
+
+    @property
+    def evicted(self) -> int:
+        """Samples evicted since the last clear()."""
+        return self._evicted
+
+    def append(self, height: float, torque: float):
+        """
+        Add a sample and evict samples out of range.
+
+        Args:
+            height: Head height (mm)
+            torque: Torque percentage at that height
+        """
+        height = float(height)
+        self._seq += 1
+
+        index = bisect_right(self._heights, height)
+        self._heights.insert(index, height)
+        self._seqs.insert(index, self._seq)
+        self._torques.insert(index, float(torque))
+        self._order.append((height, self._seq))
+
+        # Drop samples too far above the head (sorted list tail)
+        limit = bisect_right(self._heights, height + self.max_distance_mm)
+        if limit < len(self._heights):
+            dropped = len(self._heights) - limit
+            del self._heights[limit:]
+            del self._seqs[limit:]
+            del self._torques[limit:]
+            self._evicted += dropped
+
+        while len(self._heights) > self.max_samples:
+            self._remove(*self._order.popleft())
+
+        # Order entries of samples dropped by distance are skipped lazily;
+        # compact occasionally so the deque stays bounded too
+        if len(self._order) > 2 * self.max_samples:
+            self._order = deque(entry for entry in self._order if self._find(*entry) is not None)
+
+    def _find(self, height: float, seq: int) -> Optional[int]:
+        """Index of sample (height, seq), or None if no longer retained."""
+        lo = bisect_left(self._heights, height)
+        hi = bisect_right(self._heights, height, lo)
+        for i in range(lo, hi):
+            if self._seqs[i] == seq:
+                return i
+        return None
+
+    def _remove(self, height: float, seq: int):
+        """Remove one retained sample."""
+        index = self._find(height, seq)
+        if index is None:
+            return
+        del self._heights[index]
+        del self._seqs[index]
+        del self._torques[index]
+        self._evicted += 1
+
+    def clear(self):
+        """Remove all samples."""
+        self._heights.clear()
+        self._seqs.clear()
+        self._torques.clear()
+        self._order.clear()
+        self._evicted = 0
+
+    def interpolate(self, target_height: float) -> Optional[float]:
+        """
+        Torque at a height, linearly interpolated between the nearest samples.
+
+        If the target is outside the retained height range, the torque of
+        the closest sample is returned.
+
+        Args:
+            target_height: Height (mm) to find torque at
+
+        Returns:
+            Torque percentage, or None if fewer than 2 samples
+        """
+        count = len(self._heights)
+        if count < 2:
+            return None
+
+        upper = bisect_right(self._heights, target_height)
+        if upper == 0:
+            # All samples above target: lowest height (first inserted on ties)
+            return self._torques[0]
+        if upper == count:
+            # All samples at or below target: highest height (first inserted on ties)
+            return self._torques[bisect_left(self._heights, self._heights[-1])]
+
+        lower = upper - 1
+        h1, t1 = self._heights[lower], self._torques[lower]
+        h2, t2 = self._heights[upper], self._torques[upper]
+
+        if h2 == h1:
+            return t1
+
+        return t1 + (t2 - t1) * (target_height - h1) / (h2 - h1)
@@ -0,0 +1,658 @@
+"""
+Offline what-if engine for MLController settings.
+
+Re-simulates the controller's speed decisions over recorded cuts for a
+grid of parameter sets at once:
+
+- katsayi (global coefficient multiplier)
+- kesme/inme write thresholds (accumulators; threshold <= 0 = write every step)
+- Torque Guard: enabled, activation delay, lookback height, torque increase
+  threshold, speed reduction factor
+
+Inputs per kesim_id come from total.db (sensor_data, or the partitioned
+sensor_data_all view) and ml.db (ml_predictions):
+
+- ML steps follow the controller's rate limit (min_speed_update_interval)
+  on the sensor timestamps; the first step activates ML and Torque Guard's
+  delay counts from it
+- each step uses the recorded model output nearest to it (ml_output /
+  katsayi, i.e. the clamped model output before katsayi); steps without a
+  recorded prediction make no ML change
+- torque and head height are the recorded values. Speeds are simulated:
+  they start from the cut's first recorded speeds and follow each
+  setting's own commands (the PLC is assumed to reach written targets
+  before the next step)
+
+The model output sequence is replayed, not re-predicted: the model inputs
+include the speeds, which differ between settings, so results are a
+first-order estimate of what each setting would have written.
+
+Speed math, accumulation and thresholds are evaluated with NumPy over all
+settings per step. Torque Guard triggers at most once per cut and only
+depends on recorded torque/height, so its torque increase series is
+computed once per distinct (delay, lookback) with the controller's own
+HeightTorqueHistory, and the trigger step of every threshold is read off
+that series. run_grid() spreads cuts over a process pool; each
+worker reads its cuts from SQLite itself.
+"""
+
+import itertools
+import logging
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .torque_history import HeightTorqueHistory
+
+logger = logging.getLogger(__name__)
+
+# Grid parameter names (config key in comments)
+GRID_PARAMETERS = (
+    'katsayi',         # ml.katsayi
+    'kesme_threshold',  # ml.write_thresholds.kesme_hizi.threshold (<= 0: disabled)
+    'inme_threshold',   # ml.write_thresholds.inme_hizi.threshold (<= 0: disabled)
+    'tg_enabled',       # ml.torque_guard.enabled (0/1)
+    'tg_delay',         # ml.torque_guard.activation_delay_seconds
+    'tg_lookback',      # ml.torque_guard.height_threshold_mm
+    'tg_threshold',     # ml.torque_guard.torque_increase_threshold
+    'tg_reduction',     # ml.torque_guard.speed_reduction_factor
+)
+
+SUMMARY_FIELDS = (
+    'commands', 'kesme_writes', 'inme_writes', 'tg_triggers',
+    'ml_steps', 'mean_kesme_hizi', 'mean_inme_hizi'
+)
+
+
+@dataclass
+class SimulationSettings:
+    """Controller settings shared by every grid point."""
+    kesme_limits: tuple = (40.0, 90.0)
+    inme_limits: tuple = (10.0, 60.0)
+    min_update_interval: float = 0.2
+    torque_buffer_size: int = 3
+    history_max_samples: int = 3000
+    match_tolerance: float = 0.1  # Max seconds between a step and its recorded prediction
+
+    @classmethod
+    def from_config(cls, config: dict) -> 'SimulationSettings':
+        """Build from the full system configuration."""
+        ml_config = config['ml']
+        limits = config['control']['speed_limits']
+        return cls(
+            kesme_limits=(limits['kesme_hizi']['min'], limits['kesme_hizi']['max']),
+            inme_limits=(limits['inme_hizi']['min'], limits['inme_hizi']['max']),
+            min_update_interval=ml_config.get('min_speed_update_interval', 0.1),
+            torque_buffer_size=ml_config.get('torque_buffer_size', 3),
+            history_max_samples=ml_config.get('torque_guard', {}).get('history_max_samples', 3000)
+        )
+
+
+@dataclass
+class RecordedCut:
+    """Recorded inputs of one cut (timestamps in epoch seconds)."""
+    kesim_id: int
+    timestamps: np.ndarray
+    torque: np.ndarray
+    height: np.ndarray
+    kesme_hizi: np.ndarray
+    inme_hizi: np.ndarray
+    ml_timestamps: np.ndarray
+    ml_outputs: np.ndarray  # Clamped model output before katsayi
+
+
+@dataclass
+class CutResult:
+    """Simulation result of one cut for every grid point."""
+    kesim_id: int
+    ml_steps: int
+    commands: np.ndarray       # (G,) speed commands (ML + Torque Guard)
+    kesme_writes: np.ndarray   # (G,) commands including a kesme target
+    inme_writes: np.ndarray    # (G,) commands including an inme target
+    tg_step: np.ndarray        # (G,) Torque Guard trigger step, -1 if none
+    kesme_sum: np.ndarray      # (G,) simulated kesme speed summed over steps
+    inme_sum: np.ndarray       # (G,) simulated inme speed summed over steps
+    step_times: Optional[np.ndarray] = None     # (T,) with keep_traces
+    kesme_targets: Optional[np.ndarray] = None  # (T, G) written targets, NaN = no write
+    inme_targets: Optional[np.ndarray] = None   # (T, G)
+
+
+@dataclass
+class WhatIfReport:
+    """Totals per grid point over all simulated cuts."""
+    grid: Dict[str, np.ndarray]
+    cuts: int = 0
+    skipped_cuts: List[int] = field(default_factory=list)
+    totals: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def rows(self) -> List[dict]:
+        """One dict per grid point: parameters followed by SUMMARY_FIELDS."""
+        size = grid_size(self.grid)
+        rows = []
+        for g in range(size):
+            row = {name: float(self.grid[name][g]) for name in GRID_PARAMETERS}
+            for name in SUMMARY_FIELDS:
+                value = self.totals[name][g]
+                row[name] = float(value) if name.startswith('mean_') else int(value)
+            rows.append(row)
+        return rows
+
+
+# Grid construction
+
+def base_parameters(ml_config: dict) -> Dict[str, float]:
+    """
+    Grid parameters as currently configured.
+
+    Args:
+        ml_config: 'ml' section of the configuration
+
+    Returns:
+        Dictionary keyed by GRID_PARAMETERS
+    """
+    thresholds = ml_config.get('write_thresholds', {})
+
+    def threshold(name, default):
+        value = thresholds.get(name, {})
+        if not isinstance(value, dict):
+            return float(value)
+        return float(value.get('threshold', default)) if value.get('enabled', True) else 0.0
+
+    tg = ml_config.get('torque_guard', {})
+    return {
+        'katsayi': float(ml_config.get('katsayi', 1.0)),
+        'kesme_threshold': threshold('kesme_hizi', 0.9),
+        'inme_threshold': threshold('inme_hizi', 1.0),
+        'tg_enabled': float(bool(tg.get('enabled', True))),
+        'tg_delay': float(tg.get('activation_delay_seconds', 5.0)),
+        'tg_lookback': float(tg.get('height_threshold_mm', 2.5)),
+        'tg_threshold': float(tg.get('torque_increase_threshold', 40.0)),
+        'tg_reduction': float(tg.get('speed_reduction_factor', 25.0)),
+    }
+
+
+def build_grid(base: Dict[str, float], axes: Dict[str, Sequence[float]]) -> Dict[str, np.ndarray]:
+    """
+    Cartesian product of parameter axes over the base settings.
+
+    Args:
+        base: Value of every GRID_PARAMETERS entry (see base_parameters)
+        axes: Parameter name -> values to try
+
+    Returns:
+        Parameter name -> (G,) float array
+
+    Raises:
+        ValueError: Unknown parameter name or empty axis
+    """
+    unknown = set(axes) - set(GRID_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown what-if parameters: {sorted(unknown)}")
+    if any(len(values) == 0 for values in axes.values()):
+        raise ValueError("What-if parameter axes must not be empty")
+
+    names = list(axes)
+    combos = list(itertools.product(*(axes[name] for name in names))) or [()]
+    grid = {name: np.full(len(combos), float(base[name])) for name in GRID_PARAMETERS}
+    for i, name in enumerate(names):
+        grid[name] = np.array([combo[i] for combo in combos], dtype=np.float64)
+    return grid
+
+
+def grid_size(grid: Dict[str, np.ndarray]) -> int:
+    """Number of grid points."""
+    return len(grid['katsayi'])
+
+
+# Simulation
+
+def ml_step_indices(timestamps: np.ndarray, min_interval: float) -> np.ndarray:
+    """
+    Sensor sample indices where the rate-limited controller runs.
+
+    Same rule as MLController._should_update(): the first sample, then every
+    sample at least min_interval after the previous step.
+    """
+    steps = []
+    last = None
+    for i, t in enumerate(timestamps.tolist()):
+        if last is None or t - last >= min_interval:
+            steps.append(i)
+            last = t
+    return np.array(steps, dtype=np.int64)
+
+
+def step_outputs(cut: RecordedCut, step_times: np.ndarray, tolerance: float) -> np.ndarray:
+    """Recorded model output nearest to each step (NaN if none within tolerance)."""
+    outputs = np.full(len(step_times), np.nan)
+    if len(cut.ml_timestamps) == 0:
+        return outputs
+
+    right = np.clip(np.searchsorted(cut.ml_timestamps, step_times), 0, len(cut.ml_timestamps) - 1)
+    left = np.clip(right - 1, 0, len(cut.ml_timestamps) - 1)
+    nearest = np.where(
+        np.abs(cut.ml_timestamps[left] - step_times) <= np.abs(cut.ml_timestamps[right] - step_times),
+        left, right
+    )
+    matched = np.abs(cut.ml_timestamps[nearest] - step_times) <= tolerance
+    outputs[matched] = cut.ml_outputs[nearest[matched]]
+    return outputs
+
+
+def trailing_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Mean of the last `window` values at each position (fewer at the start)."""
+    values = np.asarray(values, dtype=np.float64)
+    means = np.empty(len(values))
+    head = min(window - 1, len(values))
+    means[:head] = np.cumsum(values[:head]) / np.arange(1, head + 1)
+    if len(values) >= window:
+        means[head:] = np.lib.stride_tricks.sliding_window_view(values, window).mean(axis=1)
+    return means
+
+
+def torque_increase_series(
+    elapsed: np.ndarray,
+    height: np.ndarray,
+    avg_torque: np.ndarray,
+    delay: float,
+    lookback: float,
+    max_samples: int = 3000
+) -> np.ndarray:
+    """
+    Torque Guard's torque increase (%) at each step, as in MLController.
+
+    Until it triggers, Torque Guard's history is the same for every
+    threshold, so one series serves all thresholds: the trigger step is the
+    first step whose increase exceeds the threshold.
+
+    Args:
+        elapsed: Seconds since ML activation per step
+        height: Head height per step
+        avg_torque: Torque buffer average per step
+        delay: activation_delay_seconds
+        lookback: height_threshold_mm
+        max_samples: history_max_samples
+
+    Returns:
+        Increase per step; NaN where Torque Guard doesn't check
+    """
+    increase = np.full(len(elapsed), np.nan)
+    history = HeightTorqueHistory(2 * lookback, max_samples)
+    for t in np.flatnonzero(elapsed >= delay).tolist():
+        torque = float(avg_torque[t])
+        history.append(height[t], torque)
+        if len(history) < 10:
+            continue
+        previous = history.interpolate(float(height[t]) + lookback)
+        if previous is None:
+            continue
+        increase[t] = (torque - previous) / previous * 100 if previous > 0 else 0
+    return increase
+
+
+def first_exceeding(series: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """First index where series > threshold, per threshold (-1 if never)."""
+    exceeded = np.nan_to_num(series, nan=-np.inf)[None, :] > np.asarray(thresholds)[:, None]
+    return np.where(exceeded.any(axis=1), exceeded.argmax(axis=1), -1)
+
+
+def _clamp(values: np.ndarray, low: float, high: float) -> np.ndarray:
+    """validate_speed() clamping: max(low, min(value, high))."""
+    return np.maximum(np.minimum(values, high), low)
+
+
+def simulate_cut(
+    cut: RecordedCut,
+    grid: Dict[str, np.ndarray],
+    settings: SimulationSettings,
+    keep_traces: bool = False
+) -> CutResult:
+    """
+    Simulate one cut for every grid point.
+
+    Args:
+        cut: Recorded cut
+        grid: Parameter arrays (see build_grid)
+        settings: Shared controller settings
+        keep_traces: Also return (steps x settings) written targets
+
+    Returns:
+        CutResult
+    """
+    size = grid_size(grid)
+    steps = ml_step_indices(cut.timestamps, settings.min_update_interval)
+    count = len(steps)
+    step_times = cut.timestamps[steps]
+    outputs = np.clip(step_outputs(cut, step_times, settings.match_tolerance), -1.0, 1.0)
+    height = cut.height[steps]
+    avg_torque = trailing_mean(cut.torque[steps], settings.torque_buffer_size)
+    elapsed = step_times - step_times[0] if count else step_times
+
+    # Torque Guard trigger step: one history replay per distinct (delay, lookback)
+    tg_step = np.full(size, -1, dtype=np.int64)
+    enabled = grid['tg_enabled'] > 0
+    keys = np.column_stack([grid['tg_delay'], grid['tg_lookback']])
+    for delay, lookback in np.unique(keys[enabled], axis=0).tolist():
+        members = enabled & (grid['tg_delay'] == delay) & (grid['tg_lookback'] == lookback)
+        series = torque_increase_series(
+            elapsed, height, avg_torque, delay, lookback, settings.history_max_samples
+        )
+        tg_step[members] = first_exceeding(series, grid['tg_threshold'][members])
+    trigger_steps = {int(t): tg_step == t for t in np.unique(tg_step[tg_step >= 0])}
+
+    kmin, kmax = settings.kesme_limits
+    imin, imax = settings.inme_limits
+    katsayi = grid['katsayi']
+    kesme_threshold = grid['kesme_threshold']
+    inme_threshold = grid['inme_threshold']
+    reduction = 1 - grid['tg_reduction'] / 100
+
+    first = steps[0] if count else 0
+    kesme = np.full(size, float(cut.kesme_hizi[first]) if count else 0.0)
+    inme = np.full(size, float(cut.inme_hizi[first]) if count else 0.0)
+    kesme_buffer = np.zeros(size)
+    inme_buffer = np.zeros(size)
+
+    commands = np.zeros(size, dtype=np.int64)
+    kesme_writes = np.zeros(size, dtype=np.int64)
+    inme_writes = np.zeros(size, dtype=np.int64)
+    kesme_sum = np.zeros(size)
+    inme_sum = np.zeros(size)
+    if keep_traces:
+        kesme_targets = np.full((count, size), np.nan, dtype=np.float32)
+        inme_targets = np.full((count, size), np.nan, dtype=np.float32)
+
+    for t in range(count):
+        # Torque Guard command replaces the ML step
+        triggered = trigger_steps.get(t)
+        if triggered is not None:
+            kesme = np.where(triggered, _clamp(kesme * reduction, kmin, kmax), kesme)
+            inme = np.where(triggered, _clamp(inme * reduction, imin, imax), inme)
+            kesme_buffer[triggered] = 0.0
+            inme_buffer[triggered] = 0.0
+            commands += triggered
+            kesme_writes += triggered
+            inme_writes += triggered
+            if keep_traces:
+                kesme_targets[t, triggered] = kesme[triggered]
+                inme_targets[t, triggered] = inme[triggered]
+
+        if not np.isnan(outputs[t]):
+            coefficient = outputs[t] * katsayi
+
+            # MLController._calculate_new_speeds
+            new_inme = _clamp(inme + coefficient, imin, imax)
+            inme_change = new_inme - inme
+            decreasing = inme_change < 0
+            inme_range = np.where(decreasing, inme - imin, imax - inme)
+            inme_pct = np.divide(
+                np.abs(inme_change), inme_range,
+                out=np.zeros(size), where=inme_range > 0
+            ) * 100
+            kesme_change = np.where(
+                decreasing,
+                -((kesme - kmin) * inme_pct / 100),
+                (kmax - kesme) * inme_pct / 100
+            )
+
+            active = ~triggered if triggered is not None else None
+            if active is not None:
+                inme_change = np.where(active, inme_change, 0.0)
+                kesme_change = np.where(active, kesme_change, 0.0)
+            inme_buffer += inme_change
+            kesme_buffer += kesme_change
+
+            # Independent thresholds; write current + accumulated change
+            write_inme = (inme_threshold <= 0) | (np.abs(inme_buffer) >= inme_threshold)
+            write_kesme = (kesme_threshold <= 0) | (np.abs(kesme_buffer) >= kesme_threshold)
+            if active is not None:
+                write_inme &= active
+                write_kesme &= active
+
+            inme = np.where(write_inme, _clamp(inme + inme_buffer, imin, imax), inme)
+            kesme = np.where(write_kesme, _clamp(kesme + kesme_buffer, kmin, kmax), kesme)
+            inme_buffer[write_inme] = 0.0
+            kesme_buffer[write_kesme] = 0.0
+
+            commands += write_inme | write_kesme
+            inme_writes += write_inme
+            kesme_writes += write_kesme
+            if keep_traces:
+                inme_targets[t, write_inme] = inme[write_inme]
+                kesme_targets[t, write_kesme] = kesme[write_kesme]
+
+        kesme_sum += kesme
+        inme_sum += inme
+
+    result = CutResult(
+        kesim_id=cut.kesim_id,
+        ml_steps=count,
+        commands=commands,
+        kesme_writes=kesme_writes,
+        inme_writes=inme_writes,
+        tg_step=tg_step,
+        kesme_sum=kesme_sum,
+        inme_sum=inme_sum
+    )
+    if keep_traces:
+        result.step_times = step_times
+        result.kesme_targets = kesme_targets
+        result.inme_targets = inme_targets
+    return result
+
+
+# Recorded data
+
+def _connect(path: Path) -> sqlite3.Connection:
+    """Read-only connection (the live system may be writing)."""
+    return sqlite3.connect(f"file:{Path(path)}?mode=ro", uri=True)
+
+
+def _epoch_seconds(timestamps: Iterable[str]) -> np.ndarray:
+    """ISO timestamps (naive local) to epoch seconds."""
+    return np.array([datetime.fromisoformat(ts).timestamp() for ts in timestamps], dtype=np.float64)
+
+
+def list_cuts(
+    total_db: Path,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> List[int]:
+    """
+    kesim_ids of recorded cuts started in [since, until).
+
+    Args:
+        total_db: total.db path
+        since: Earliest start time
+        until: Latest start time (exclusive)
+
+    Returns:
+        kesim_ids ordered by start time
+    """
+    sql = "SELECT kesim_id FROM cutting_sessions WHERE 1=1"
+    params = []
+    if since is not None:
+        sql += " AND start_time >= ?"
+        params.append(since.isoformat())
+    if until is not None:
+        sql += " AND start_time < ?"
+        params.append(until.isoformat())
+    sql += " ORDER BY start_time"
+
+    conn = _connect(total_db)
+    try:
+        return [kesim_id for (kesim_id,) in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def load_cut(total_db: Path, ml_db: Path, kesim_id: int) -> Optional[RecordedCut]:
+    """
+    Read one cut's sensor samples and ML predictions.
+
+    Uses the partitioned sensor_data_all view when total.db has one.
+
+    Args:
+        total_db: total.db path
+        ml_db: ml.db path
+        kesim_id: Cut session ID
+
+    Returns:
+        RecordedCut, or None if the cut has no cutting samples
+    """
+    columns = "serit_motor_tork_percentage, kafa_yuksekligi_mm, serit_kesme_hizi, serit_inme_hizi"
+    conn = _connect(total_db)
+    try:
+        partitioned = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='view' AND name='sensor_data_all'"
+        ).fetchone() is not None
+        if partitioned:
+            rows = conn.execute(
+                f"SELECT timestamp_ms, {columns} FROM sensor_data_all "
+                f"WHERE kesim_id = ? AND testere_durumu = 3 ORDER BY timestamp_ms",
+                (kesim_id,)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                f"SELECT timestamp, {columns} FROM sensor_data "
+                f"WHERE kesim_id = ? AND testere_durumu = 3 ORDER BY timestamp",
+                (kesim_id,)
+            ).fetchall()
+    finally:
+        conn.close()
+
+    if not rows:
+        return None
+
+    if partitioned:
+        timestamps = np.array([row[0] for row in rows], dtype=np.float64) / 1000.0
+    else:
+        timestamps = _epoch_seconds(row[0] for row in rows)
+    values = np.array([row[1:] for row in rows], dtype=np.float64)
+    values = np.nan_to_num(values)
+
+    conn = _connect(ml_db)
+    try:
+        predictions = conn.execute(
+            "SELECT timestamp, ml_output, katsayi FROM ml_predictions "
+            "WHERE kesim_id = ? ORDER BY timestamp",
+            (kesim_id,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+    predictions = [
+        (ts, output / katsayi) for ts, output, katsayi in predictions
+        if output is not None and katsayi
+    ]
+
+    return RecordedCut(
+        kesim_id=kesim_id,
+        timestamps=timestamps,
+        torque=values[:, 0],
+        height=values[:, 1],
+        kesme_hizi=values[:, 2],
+        inme_hizi=values[:, 3],
+        ml_timestamps=_epoch_seconds(ts for ts, _ in predictions),
+        ml_outputs=np.array([output for _, output in predictions], dtype=np.float64)
+    )
+
+
+# Grid runs
+
+def _simulate_recorded(args) -> Optional[CutResult]:
+    """Worker: load and simulate one cut (optionally saving traces)."""
+    total_db, ml_db, kesim_id, grid, settings, traces_dir = args
+    cut = load_cut(total_db, ml_db, kesim_id)
+    if cut is None:
+        return None
+
+    result = simulate_cut(cut, grid, settings, keep_traces=traces_dir is not None)
+    if traces_dir is not None:
+        np.savez_compressed(
+            Path(traces_dir) / f"kesim_{kesim_id}.npz",
+            step_times=result.step_times,
+            kesme_targets=result.kesme_targets,
+            inme_targets=result.inme_targets,
+            tg_step=result.tg_step,
+            **{f"grid_{name}": values for name, values in grid.items()}
+        )
+        # Traces stay on disk; only totals go back to the parent
+        result.step_times = result.kesme_targets = result.inme_targets = None
+    return result
+
+
+def run_grid(
+    total_db: Path,
+    ml_db: Path,
+    kesim_ids: Sequence[int],
+    grid: Dict[str, np.ndarray],
+    settings: SimulationSettings,
+    processes: Optional[int] = None,
+    traces_dir: Optional[Path] = None
+) -> WhatIfReport:
+    """
+    Simulate every grid point over recorded cuts.
+
+    Args:
+        total_db: total.db path
+        ml_db: ml.db path
+        kesim_ids: Cuts to simulate
+        grid: Parameter arrays (see build_grid)
+        settings: Shared controller settings
+        processes: Worker processes (None = CPU count, 1 = in-process)
+        traces_dir: Write per-cut command traces (kesim_<id>.npz) here
+
+    Returns:
+        WhatIfReport with totals per grid point
+    """
+    if traces_dir is not None:
+        Path(traces_dir).mkdir(parents=True, exist_ok=True)
+
+    size = grid_size(grid)
+    report = WhatIfReport(grid=grid)
+    totals = {name: np.zeros(size, dtype=np.int64) for name in ('commands', 'kesme_writes', 'inme_writes', 'tg_triggers')}
+    kesme_sum = np.zeros(size)
+    inme_sum = np.zeros(size)
+    steps = 0
+
+    jobs = [(total_db, ml_db, kesim_id, grid, settings, traces_dir) for kesim_id in kesim_ids]
+    if processes == 1:
+        results = map(_simulate_recorded, jobs)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=processes)
+        results = executor.map(_simulate_recorded, jobs, chunksize=max(1, len(jobs) // 64))
+
+    try:
+        for kesim_id, result in zip(kesim_ids, results):
+            if result is None:
+                report.skipped_cuts.append(kesim_id)
+                continue
+            report.cuts += 1
+            steps += result.ml_steps
+            totals['commands'] += result.commands
+            totals['kesme_writes'] += result.kesme_writes
+            totals['inme_writes'] += result.inme_writes
+            totals['tg_triggers'] += result.tg_step >= 0
+            kesme_sum += result.kesme_sum
+            inme_sum += result.inme_sum
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    totals['ml_steps'] = np.full(size, steps, dtype=np.int64)
+    totals['mean_kesme_hizi'] = kesme_sum / steps if steps else np.zeros(size)
+    totals['mean_inme_hizi'] = inme_sum / steps if steps else np.zeros(size)
+    report.totals = totals
+
+    logger.info(
+        f"What-if: {size} settings x {report.cuts} cuts ({steps} ML steps), "
+        f"{len(report.skipped_cuts)} cuts without data"
+    )
+    return report
@@ -0,0 +1,396 @@
+"""
+Daily-partitioned sensor_data storage for total.db.
+
+Layout (database.sqlite.total_storage: partitioned):
+- sensor_data_pYYYYMMDD: one table per day, same columns as sensor_data
+  except the ISO `timestamp TEXT` becomes `timestamp_ms INTEGER` (epoch ms)
+- sensor_data_all: UNION ALL view over every partition
+
+Range queries go straight to the partitions overlapping the range (integer
+comparisons on a per-day index). Retention drops whole partition tables
+instead of deleting rows.
+
+migrate_sensor_data() converts an existing legacy sensor_data table in one
+transaction; the legacy rows are kept in sensor_data_legacy.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .schemas import SCHEMA_TOTAL_DB, SENSOR_DATA_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PREFIX = 'sensor_data_p'
+PARTITION_VIEW = 'sensor_data_all'
+LEGACY_TABLE = 'sensor_data_legacy'
+
+_PARTITION_RE = re.compile(r'^sensor_data_p(\d{8})$')
+
+# Insert column order for partition tables
+PARTITION_COLUMNS = ('timestamp_ms',) + tuple(SENSOR_DATA_COLUMNS[1:])
+
+# Rows read per chunk during migration (bounds memory, not the transaction)
+MIGRATION_CHUNK_ROWS = 50_000
+
+
+def _sensor_data_column_types() -> List[Tuple[str, str]]:
+    """Column (name, type) pairs of sensor_data, parsed from SCHEMA_TOTAL_DB."""
+    body = SCHEMA_TOTAL_DB.split('CREATE TABLE IF NOT EXISTS sensor_data (', 1)[1].split(');', 1)[0]
+    columns = re.findall(r'^\s+(\w+) (INTEGER|REAL|TEXT)\b', body, re.M)
+    return [(name, col_type) for name, col_type in columns if name not in ('id', 'timestamp')]
+
+
+def partition_name(day: date) -> str:
+    """Partition table name for a calendar day."""
+    return f"{PARTITION_PREFIX}{day.strftime('%Y%m%d')}"
+
+
+def partition_day(name: str) -> Optional[date]:
+    """Calendar day of a partition table name, or None if not a partition."""
+    match = _PARTITION_RE.match(name)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), '%Y%m%d').date()
+
+
+def to_epoch_ms(timestamp: datetime) -> int:
+    """Convert a (naive local or aware) datetime to epoch milliseconds."""
+    return int(timestamp.timestamp() * 1000)
+
+
+def partition_ddl(name: str) -> List[str]:
+    """
+    CREATE statements for one partition table and its indexes.
+
+    Args:
+        name: Partition table name
+
+    Returns:
+        List of single SQL statements
+    """
+    columns = ",\n    ".join(f"{col} {col_type}" for col, col_type in _sensor_data_column_types())
+    return [
+        f"CREATE TABLE IF NOT EXISTS {name} (\n"
+        f"    id INTEGER PRIMARY KEY,\n"
+        f"    timestamp_ms INTEGER NOT NULL,\n"
+        f"    {columns}\n"
+        f")",
+        f"CREATE INDEX IF NOT EXISTS idx_{name}_ts ON {name}(timestamp_ms)",
+        f"CREATE INDEX IF NOT EXISTS idx_{name}_kesim ON {name}(kesim_id)",
+    ]
+
+
+def view_ddl(partitions: Sequence[str]) -> List[str]:
+    """
+    Statements that (re)create the sensor_data_all view.
+
+    Args:
+        partitions: Partition table names
+
+    Returns:
+        List of single SQL statements
+    """
+    statements = [f"DROP VIEW IF EXISTS {PARTITION_VIEW}"]
+    if partitions:
+        union = "\nUNION ALL\n".join(f"SELECT * FROM {name}" for name in sorted(partitions))
+        statements.append(f"CREATE VIEW {PARTITION_VIEW} AS\n{union}")
+    return statements
+
+
+def list_partitions(db_service) -> List[str]:
+    """
+    List existing partition tables.
+
+    Args:
+        db_service: SQLiteService (or anything with read(sql, params))
+
+    Returns:
+        Sorted partition table names
+    """
+    rows = db_service.read(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE ?",
+        (f"{PARTITION_PREFIX}%",)
+    )
+    return sorted(name for (name,) in rows if _PARTITION_RE.match(name))
+
+
+def range_sql(
+    partitions: Sequence[str],
+    start_ms: int,
+    end_ms: int,
+    columns: str = '*'
+) -> Tuple[Optional[str], Tuple[int, ...]]:
+    """
+    Build a UNION ALL query over the partitions overlapping [start_ms, end_ms).
+
+    Args:
+        partitions: Existing partition table names
+        start_ms: Inclusive lower bound (epoch ms)
+        end_ms: Exclusive upper bound (epoch ms)
+        columns: Column list for each SELECT
+
+    Returns:
+        Tuple of (sql, params); sql is None if no partition overlaps
+    """
+    # Pad by one day on each side: partitions follow local calendar days
+    first_day = datetime.fromtimestamp(start_ms / 1000).date() - timedelta(days=1)
+    last_day = datetime.fromtimestamp(max(start_ms, end_ms - 1) / 1000).date() + timedelta(days=1)
+
+    selected = [
+        name for name in partitions
+        if (day := partition_day(name)) is not None and first_day <= day <= last_day
+    ]
+    if not selected:
+        return None, ()
+
+    parts = [
+        f"SELECT {columns} FROM {name} WHERE timestamp_ms >= ? AND timestamp_ms < ?"
+        for name in selected
+    ]
+    sql = "\nUNION ALL\n".join(parts) + "\nORDER BY timestamp_ms"
+    params: Tuple[int, ...] = (start_ms, end_ms) * len(selected)
+    return sql, params
+
+
+def query_range(
+    db_service,
+    start: datetime,
+    end: datetime,
+    columns: str = '*'
+) -> List[Tuple[Any, ...]]:
+    """
+    Read sensor rows in [start, end) from the partitions that cover it.
+
+    Args:
+        db_service: SQLiteService for total.db
+        start: Range start
+        end: Range end (exclusive)
+        columns: Column list (must include timestamp_ms when using '*' ordering)
+
+    Returns:
+        Rows ordered by timestamp_ms
+    """
+    sql, params = range_sql(list_partitions(db_service), to_epoch_ms(start), to_epoch_ms(end), columns)
+    if sql is None:
+        return []
+    return db_service.read(sql, params)
+
+
+class SensorDataPartitions:
+    """
+    Routes sensor_data rows to daily partition tables.
+
+    New partitions are created through the service's write queue, so the
+    DDL is applied by the writer thread before the first insert into it.
+    """
+
+    def __init__(self, db_service, retention_days: int = 0):
+        """
+        Initialize partition router.
+
+        Args:
+            db_service: SQLiteService for total.db
+            retention_days: Drop partitions older than this many days when a
+                            new day starts (0 = keep everything)
+        """
+        self.db = db_service
+        self.retention_days = max(0, int(retention_days))
+        self._lock = threading.Lock()
+        self._partitions = set(list_partitions(db_service))
+        self._current_day: Optional[date] = None
+        self._current_name: Optional[str] = None
+
+        logger.info(f"SensorDataPartitions initialized: {len(self._partitions)} partitions")
+
+    def append(self, timestamp: datetime, values: Sequence[Any]) -> bool:
+        """
+        Queue one sensor row into the partition for its day.
+
+        Args:
+            timestamp: Sample time
+            values: Row values in SENSOR_DATA_COLUMNS order, without timestamp
+
+        Returns:
+            True if queued successfully
+        """
+        day = timestamp.date()
+        if day != self._current_day and self.retention_days:
+            self.drop_partitions_before(day - timedelta(days=self.retention_days))
+
+        name = self._ensure_partition(day)
+        row = (to_epoch_ms(timestamp), *values)
+        return self.db.append_rows(name, [row], PARTITION_COLUMNS)
+
+    def _ensure_partition(self, day: date) -> str:
+        """Return the partition name for a day, creating it if needed."""
+        with self._lock:
+            if day == self._current_day:
+                return self._current_name
+
+            name = partition_name(day)
+            if name not in self._partitions:
+                for statement in partition_ddl(name):
+                    self.db.write_async(statement)
+                self._partitions.add(name)
+                for statement in view_ddl(sorted(self._partitions)):
+                    self.db.write_async(statement)
+                logger.info(f"Created sensor_data partition: {name}")
+
+            self._current_day = day
+            self._current_name = name
+            return name
+
+    def drop_partitions_before(self, day: date) -> List[str]:
+        """
+        Drop whole partitions older than a day (retention without row deletes).
+
+        Args:
+            day: First day to keep
+
+        Returns:
+            Names of dropped partitions
+        """
+        with self._lock:
+            dropped = sorted(
+                name for name in self._partitions
+                if (pday := partition_day(name)) is not None and pday < day
+            )
+            if not dropped:
+                return []
+
+            self._partitions.difference_update(dropped)
+            for statement in view_ddl(sorted(self._partitions)):
+                self.db.write_async(statement)
+            for name in dropped:
+                self.db.write_async(f"DROP TABLE IF EXISTS {name}")
+
+            if self._current_name in dropped:
+                self._current_day = None
+                self._current_name = None
+
+            logger.info(f"Dropped sensor_data partitions: {', '.join(dropped)}")
+            return dropped
+
+    def get_stats(self) -> dict:
+        """Get partition statistics."""
+        with self._lock:
+            return {
+                'partitions': len(self._partitions),
+                'current_partition': self._current_name,
+                'retention_days': self.retention_days,
+            }
+
+
+def migrate_sensor_data(db_path: Path) -> int:
+    """
+    One-time migration of legacy sensor_data rows into daily partitions.
+
+    Converts ISO timestamps to epoch ms, copies rows day by day, rebuilds
+    the view and moves the legacy rows to sensor_data_legacy (renamed, or
+    appended if an earlier migration left one). Copy and move run in one
+    transaction, so an interrupted migration leaves nothing behind and the
+    next start runs it again from scratch. Safe to call repeatedly: does
+    nothing once sensor_data is empty or gone.
+
+    Args:
+        db_path: Path to total.db
+
+    Returns:
+        Number of migrated rows
+    """
+    if not Path(db_path).exists():
+        return 0
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sensor_data'"
+        ).fetchone()
+        if not exists:
+            return 0
+
+        total = conn.execute("SELECT COUNT(*) FROM sensor_data").fetchone()[0]
+        if total == 0:
+            return 0
+
+        logger.info(f"Migrating {total} sensor_data rows to daily partitions...")
+
+        legacy_columns = ", ".join(SENSOR_DATA_COLUMNS)
+        insert_columns = ", ".join(PARTITION_COLUMNS)
+        placeholders = ", ".join("?" for _ in PARTITION_COLUMNS)
+
+        partitions = set(
+            name for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE ?",
+                (f"{PARTITION_PREFIX}%",)
+            ) if _PARTITION_RE.match(name)
+        )
+
+        # One transaction: partitions, copies and the legacy move commit together
+        conn.execute("BEGIN")
+
+        migrated = 0
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                f"SELECT id, {legacy_columns} FROM sensor_data WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, MIGRATION_CHUNK_ROWS)
+            ).fetchall()
+            if not rows:
+                break
+
+            by_partition = {}
+            for row in rows:
+                timestamp = datetime.fromisoformat(row[1])
+                name = partition_name(timestamp.date())
+                by_partition.setdefault(name, []).append((to_epoch_ms(timestamp), *row[2:]))
+
+            for name, partition_rows in by_partition.items():
+                if name not in partitions:
+                    for statement in partition_ddl(name):
+                        conn.execute(statement)
+                    partitions.add(name)
+                conn.executemany(
+                    f"INSERT INTO {name} ({insert_columns}) VALUES ({placeholders})",
+                    partition_rows
+                )
+
+            migrated += len(rows)
+            last_id = rows[-1][0]
+            logger.info(f"  migrated {migrated}/{total} rows")
+
+        for statement in view_ddl(sorted(partitions)):
+            conn.execute(statement)
+
+        # Keep the original rows, out of the write path (never drop an earlier backup)
+        legacy_exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (LEGACY_TABLE,)
+        ).fetchone()
+        if legacy_exists:
+            conn.execute(
+                f"INSERT INTO {LEGACY_TABLE} ({legacy_columns}) SELECT {legacy_columns} FROM sensor_data"
+            )
+            conn.execute("DROP TABLE sensor_data")
+        else:
+            conn.execute(f"ALTER TABLE sensor_data RENAME TO {LEGACY_TABLE}")
+        conn.commit()
+
+        logger.info(
+            f"sensor_data migration complete: {migrated} rows, "
+            f"{len(partitions)} partitions (legacy table kept as {LEGACY_TABLE})"
+        )
+        return migrated
+
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+    finally:
+        conn.close()
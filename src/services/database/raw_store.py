@@ -0,0 +1,231 @@
+"""
+Compact raw register storage for raw.db.
+
+Instead of one 45-column row per 10 Hz sample, samples are packed into
+chunks: one `raw_register_chunks` row holds N samples as
+
+- timestamps: array('q') of epoch milliseconds
+- registers:  array('H') of N x 44 register values (row-major)
+
+both optionally zlib-compressed. Chunks close when full, when the saw
+state (register 1030) changes so a chunk never spans a cut boundary, or
+on flush().
+
+Blobs are always stored little-endian.
+"""
+
+import logging
+import sys
+import threading
+import zlib
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Registers per sample (1000-1043)
+RAW_REGISTER_COUNT = 44
+
+# Index of testere_durumu (register 1030) inside a sample
+TESTERE_DURUMU_INDEX = 30
+
+# Insert column order for raw_register_chunks
+RAW_CHUNK_COLUMNS = (
+    'start_ms',
+    'end_ms',
+    'sample_count',
+    'register_count',
+    'testere_durumu',
+    'compressed',
+    'timestamps',
+    'registers',
+)
+
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def _pack(values: array, compress: bool) -> bytes:
+    """Serialize an array little-endian, optionally zlib-compressed."""
+    if _BIG_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    data = values.tobytes()
+    return zlib.compress(data, 1) if compress else data
+
+
+def _unpack(typecode: str, blob: bytes, compressed: bool) -> array:
+    """Inverse of _pack()."""
+    values = array(typecode)
+    values.frombytes(zlib.decompress(blob) if compressed else blob)
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def decode_chunk(
+    timestamps_blob: bytes,
+    registers_blob: bytes,
+    register_count: int = RAW_REGISTER_COUNT,
+    compressed: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decode one chunk into NumPy arrays.
+
+    Args:
+        timestamps_blob: Packed epoch-ms timestamps
+        registers_blob: Packed register values
+        register_count: Registers per sample
+        compressed: Whether blobs are zlib-compressed
+
+    Returns:
+        Tuple of (timestamps int64 [N], registers uint16 [N, register_count])
+    """
+    timestamps = np.frombuffer(_unpack('q', timestamps_blob, compressed), dtype=np.int64)
+    registers = np.frombuffer(_unpack('H', registers_blob, compressed), dtype=np.uint16)
+    return timestamps, registers.reshape(-1, register_count)
+
+
+def read_raw_chunks(
+    db_service,
+    start_ms: Optional[int] = None,
+    end_ms: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read compact raw samples in a time range as NumPy arrays.
+
+    Args:
+        db_service: SQLiteService (or anything with read(sql, params)) for raw.db
+        start_ms: Inclusive lower bound (epoch ms), None for unbounded
+        end_ms: Exclusive upper bound (epoch ms), None for unbounded
+
+    Returns:
+        Tuple of (timestamps int64 [N], registers uint16 [N, 44]) sorted by time
+    """
+    lower = start_ms if start_ms is not None else -(2 ** 63)
+    upper = end_ms if end_ms is not None else 2 ** 63 - 1
+
+    rows = db_service.read(
+        """
+        SELECT timestamps, registers, register_count, compressed
+        FROM raw_register_chunks
+        WHERE end_ms >= ? AND start_ms < ?
+        ORDER BY start_ms
+        """,
+        (lower, upper)
+    )
+
+    return _concat_chunks(rows, lower, upper)
+
+
+def _concat_chunks(rows: Iterable[tuple], lower: int, upper: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Decode chunk rows, concatenate and trim to [lower, upper)."""
+    ts_parts: List[np.ndarray] = []
+    reg_parts: List[np.ndarray] = []
+    register_count = RAW_REGISTER_COUNT
+
+    for timestamps_blob, registers_blob, register_count, compressed in rows:
+        ts, regs = decode_chunk(timestamps_blob, registers_blob, register_count, bool(compressed))
+        ts_parts.append(ts)
+        reg_parts.append(regs)
+
+    if not ts_parts:
+        return np.empty(0, dtype=np.int64), np.empty((0, register_count), dtype=np.uint16)
+
+    timestamps = np.concatenate(ts_parts)
+    registers = np.concatenate(reg_parts)
+    mask = (timestamps >= lower) & (timestamps < upper)
+    return timestamps[mask], registers[mask]
+
+
+class CompactRawWriter:
+    """
+    Buffers raw samples and appends them to raw.db as packed chunks.
+
+    Thread Safety:
+    - append()/flush() are guarded by a lock (pipeline + shutdown path)
+    """
+
+    def __init__(self, db_service, chunk_samples: int = 10, compress: bool = True):
+        """
+        Initialize compact writer.
+
+        Args:
+            db_service: SQLiteService for raw.db
+            chunk_samples: Samples per chunk row (10 = one row per second at 10 Hz)
+            compress: zlib-compress blobs
+        """
+        self.db = db_service
+        self.chunk_samples = max(1, int(chunk_samples))
+        self.compress = compress
+
+        self._lock = threading.Lock()
+        self._timestamps = array('q')
+        self._registers = array('H')
+        self._testere_durumu: Optional[int] = None
+
+        self._chunks_written = 0
+        self._samples_written = 0
+
+    def append(self, timestamp_ms: int, registers: Sequence[int]):
+        """
+        Add one sample; writes a chunk when it fills or the saw state changes.
+
+        Args:
+            timestamp_ms: Sample time (epoch milliseconds)
+            registers: 44 raw register values
+        """
+        with self._lock:
+            state = registers[TESTERE_DURUMU_INDEX]
+            if self._timestamps and state != self._testere_durumu:
+                self._flush_locked()
+
+            self._testere_durumu = state
+            self._timestamps.append(int(timestamp_ms))
+            self._registers.extend(registers[:RAW_REGISTER_COUNT])
+
+            if len(self._timestamps) >= self.chunk_samples:
+                self._flush_locked()
+
+    def flush(self):
+        """Write any buffered samples as a (possibly partial) chunk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Pack buffered samples into one chunk row (lock held)."""
+        count = len(self._timestamps)
+        if count == 0:
+            return
+
+        row = (
+            self._timestamps[0],
+            self._timestamps[-1],
+            count,
+            RAW_REGISTER_COUNT,
+            self._testere_durumu,
+            int(self.compress),
+            _pack(self._timestamps, self.compress),
+            _pack(self._registers, self.compress),
+        )
+
+        if self.db.append_rows('raw_register_chunks', [row], RAW_CHUNK_COLUMNS):
+            self._chunks_written += 1
+            self._samples_written += count
+        else:
+            logger.warning(f"Compact raw chunk dropped ({count} samples)")
+
+        self._timestamps = array('q')
+        self._registers = array('H')
+
+    def get_stats(self) -> dict:
+        """Get writer statistics."""
+        with self._lock:
+            return {
+                'chunk_samples': self.chunk_samples,
+                'compress': self.compress,
+                'buffered_samples': len(self._timestamps),
+                'chunks_written': self._chunks_written,
+                'samples_written': self._samples_written,
+            }
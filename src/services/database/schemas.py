@@ -68,6 +68,22 @@ CREATE TABLE IF NOT EXISTS raw_registers (
 
 CREATE INDEX IF NOT EXISTS idx_raw_timestamp ON raw_registers(timestamp);
 CREATE INDEX IF NOT EXISTS idx_raw_testere_durumu ON raw_registers(reg_1030_testere_durumu);
+
+-- Compact raw storage (database.sqlite.raw_storage: compact)
+-- One row per chunk of samples; see services/database/raw_store.py
+CREATE TABLE IF NOT EXISTS raw_register_chunks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    start_ms INTEGER NOT NULL,      -- First sample time (epoch ms)
+    end_ms INTEGER NOT NULL,        -- Last sample time (epoch ms)
+    sample_count INTEGER NOT NULL,
+    register_count INTEGER NOT NULL,
+    testere_durumu INTEGER,         -- Saw state shared by all samples in chunk
+    compressed INTEGER NOT NULL,    -- 1 if blobs are zlib-compressed
+    timestamps BLOB NOT NULL,       -- array('q') epoch ms, little-endian
+    registers BLOB NOT NULL         -- array('H') sample_count x register_count, little-endian
+);
+
+CREATE INDEX IF NOT EXISTS idx_raw_chunks_start ON raw_register_chunks(start_ms);
 """
 
 # total.db - Processed sensor data + cutting sessions
@@ -225,6 +241,31 @@ CREATE TABLE IF NOT EXISTS ml_predictions (
 
 CREATE INDEX IF NOT EXISTS idx_ml_timestamp ON ml_predictions(timestamp);
 CREATE INDEX IF NOT EXISTS idx_ml_kesim_id ON ml_predictions(kesim_id);
+
+-- Shadow models scored on the same feature rows as the primary model
+CREATE TABLE IF NOT EXISTS ml_shadow_predictions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,       -- When the primary predicted this row
+
+    model_name TEXT NOT NULL,      -- Shadow model name (config)
+    model_version TEXT,            -- Shadow model file@mtime
+    primary_version TEXT,          -- Primary model file@mtime
+
+    -- Input features (same row as the primary)
+    akim_input REAL,
+    sapma_input REAL,
+    kesme_hizi_input REAL,
+    inme_hizi_input REAL,
+
+    -- Raw model outputs (before clamp and katsayi)
+    primary_output REAL,
+    shadow_output REAL,
+
+    kesim_id INTEGER               -- Cut session ID (NULL if not cutting)
+);
+
+CREATE INDEX IF NOT EXISTS idx_ml_shadow_timestamp ON ml_shadow_predictions(timestamp);
+CREATE INDEX IF NOT EXISTS idx_ml_shadow_model ON ml_shadow_predictions(model_name);
 """
 
 # anomaly.db - Anomaly detection tracking
@@ -301,6 +342,109 @@ CREATE INDEX IF NOT EXISTS idx_wear_timestamp ON wear_history(timestamp);
 CREATE INDEX IF NOT EXISTS idx_wear_kesim_id ON wear_history(kesim_id);
 """
 
+# Insert column order for raw_registers (used with SQLiteService.append_rows)
+RAW_REGISTER_COLUMNS = (
+    'timestamp',
+    'reg_1000_makine_id',
+    'reg_1001_serit_id',
+    'reg_1002_serit_dis_mm',
+    'reg_1003_serit_tip',
+    'reg_1004_serit_marka',
+    'reg_1005_serit_malz',
+    'reg_1006_malzeme_cinsi',
+    'reg_1007_malzeme_sertlik',
+    'reg_1008_kesit_yapisi',
+    'reg_1009_a_mm',
+    'reg_1010_b_mm',
+    'reg_1011_c_mm',
+    'reg_1012_d_mm',
+    'reg_1013_kafa_yuksekligi',
+    'reg_1014_kesilen_parca_adeti',
+    'reg_1015_serit_motor_akim',
+    'reg_1016_serit_motor_tork',
+    'reg_1017_inme_motor_akim',
+    'reg_1018_inme_motor_tork',
+    'reg_1019_mengene_basinc',
+    'reg_1020_serit_gerginligi',
+    'reg_1021_ivme_olcer_x',
+    'reg_1022_ivme_olcer_y',
+    'reg_1023_ivme_olcer_z',
+    'reg_1024_serit_sapmasi',
+    'reg_1025_ortam_sicakligi',
+    'reg_1026_ortam_nem',
+    'reg_1027_sogutma_sivi_sicakligi',
+    'reg_1028_hidrolik_yag_sicakligi',
+    'reg_1029_serit_sicakligi',
+    'reg_1030_testere_durumu',
+    'reg_1031_alarm_status',
+    'reg_1032_alarm_bilgisi',
+    'reg_1033_serit_kesme_hizi',
+    'reg_1034_serit_inme_hizi',
+    'reg_1035_ivme_olcer_x_hz',
+    'reg_1036_ivme_olcer_y_hz',
+    'reg_1037_ivme_olcer_z_hz',
+    'reg_1038_fark_hz_x',
+    'reg_1039_fark_hz_y',
+    'reg_1040_fark_hz_z',
+    'reg_1041_malzeme_genisligi',
+    'reg_1042_guc_1',
+    'reg_1043_guc_2',
+)
+
+# Insert column order for sensor_data (used with SQLiteService.append_rows)
+SENSOR_DATA_COLUMNS = (
+    'timestamp',
+    'kesim_id',
+    'serit_motor_akim_a',
+    'serit_motor_tork_percentage',
+    'inme_motor_akim_a',
+    'inme_motor_tork_percentage',
+    'serit_kesme_hizi',
+    'serit_inme_hizi',
+    'kesme_hizi_hedef',
+    'inme_hizi_hedef',
+    'kafa_yuksekligi_mm',
+    'serit_sapmasi',
+    'serit_gerginligi_bar',
+    'mengene_basinc_bar',
+    'ortam_sicakligi_c',
+    'ortam_nem_percentage',
+    'sogutma_sivi_sicakligi_c',
+    'hidrolik_yag_sicakligi_c',
+    'ivme_olcer_x',
+    'ivme_olcer_y',
+    'ivme_olcer_z',
+    'ivme_olcer_x_hz',
+    'ivme_olcer_y_hz',
+    'ivme_olcer_z_hz',
+    'max_titresim_hz',
+    'testere_durumu',
+    'alarm_status',
+    'alarm_bilgisi',
+    'makine_id',
+    'serit_id',
+    'malzeme_cinsi',
+    'malzeme_sertlik',
+    'kesit_yapisi',
+    'malzeme_a_mm',
+    'malzeme_b_mm',
+    'malzeme_c_mm',
+    'malzeme_d_mm',
+    'malzeme_genisligi',
+    'serit_tip',
+    'serit_marka',
+    'serit_malz',
+    'serit_dis_mm',
+    'kesilen_parca_adeti',
+    'guc_kwh',
+    'ml_output',
+    'kesme_hizi_degisim',
+    'inme_hizi_degisim',
+    'torque_guard_active',
+    'controller_type',
+    'anomalies',
+)
+
 # Schema mapping
 SCHEMAS = {
     'raw': SCHEMA_RAW_DB,
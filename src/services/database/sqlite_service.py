@@ -5,6 +5,9 @@ Architecture:
 - All writes go through a Queue to a dedicated writer thread
 - Reads use thread-local connections (query_only=ON)
 - Batch commits every 100 writes or 1 second
+- Consecutive items with identical SQL are flushed with executemany()
+  (one prepared statement per group, one transaction per batch)
+- append_rows() queues many rows of one table as a single queue item
 - WAL mode for concurrent read/write
 - Auto-detects schema mismatches and recreates database with backup
 """
@@ -16,7 +19,7 @@ import time
 from datetime import datetime
 from pathlib import Path
 from queue import Queue, Empty
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Sequence
 import logging
 
 logger = logging.getLogger(__name__)
@@ -29,23 +32,41 @@ SCHEMA_MISMATCH_PATTERNS = [
     "table .* has no column",
 ]
 
+# Prepared statements kept per connection (sqlite3 statement cache)
+STATEMENT_CACHE_SIZE = 256
+
+# Queue item: (sql, params_or_rows, is_many)
+WriteItem = Tuple[str, Any, bool]
+
 
 class SQLiteService:
     """Thread-safe SQLite database service."""
 
-    def __init__(self, db_path: Path, schema_sql: str):
+    def __init__(
+        self,
+        db_path: Path,
+        schema_sql: str,
+        queue_size: int = 10000,
+        batch_size: int = 100,
+        commit_interval: float = 1.0
+    ):
         """
         Initialize SQLite service.
 
         Args:
             db_path: Path to database file
             schema_sql: SQL schema creation script
+            queue_size: Maximum queued write items
+            batch_size: Queue items per commit
+            commit_interval: Maximum seconds between commits
         """
         self.db_path = db_path
         self.schema_sql = schema_sql
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
 
         # Thread-safe queue for write operations
-        self._write_queue: Queue = Queue(maxsize=10000)
+        self._write_queue: Queue = Queue(maxsize=queue_size)
 
         # Writer thread
         self._writer_thread: Optional[threading.Thread] = None
@@ -61,9 +82,13 @@ class SQLiteService:
             "writes_completed": 0,
             "writes_failed": 0,
             "reads_completed": 0,
-            "queue_full_count": 0
+            "queue_full_count": 0,
+            "batches_committed": 0
         }
 
+        # INSERT statements built by append_rows(), keyed by (table, columns)
+        self._insert_sql_cache: Dict[Tuple[str, Optional[Tuple[str, ...]]], str] = {}
+
         # Schema migration tracking
         self._schema_recreated = False
         self._recreate_lock = threading.Lock()
@@ -192,6 +217,13 @@ class SQLiteService:
                 logger.error(f"Failed to backup and recreate database: {e}", exc_info=True)
                 return False
 
+    def _open_write_connection(self) -> sqlite3.Connection:
+        """Open the writer-thread connection (WAL, statement cache)."""
+        conn = sqlite3.connect(str(self.db_path), cached_statements=STATEMENT_CACHE_SIZE)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _get_read_connection(self) -> sqlite3.Connection:
         """Get thread-local read connection."""
         if not hasattr(self._thread_local, 'conn'):
@@ -207,14 +239,12 @@ class SQLiteService:
     def _writer_loop(self):
         """Dedicated writer thread loop."""
         # Create dedicated connection for writes
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
+        conn = self._open_write_connection()
 
         batch = []
-        batch_size = 100
+        batch_size = self.batch_size
         last_commit = time.time()
-        commit_interval = 1.0  # 1 second
+        commit_interval = self.commit_interval
 
         while not self._stop_event.is_set():
             try:
@@ -252,29 +282,85 @@ class SQLiteService:
             except Exception as e:
                 logger.error(f"Writer loop error: {e}", exc_info=True)
 
-        # Final batch commit
+        # Drain items still queued at shutdown, then final batch commit
+        while True:
+            try:
+                item = self._write_queue.get_nowait()
+            except Empty:
+                break
+            if item is not None:
+                batch.append(item)
+
         if batch:
             self._execute_batch(conn, batch)
 
         conn.close()
 
-    def _execute_batch(self, conn: sqlite3.Connection, batch: List[Dict]) -> Optional[sqlite3.Connection]:
+    @staticmethod
+    def _group_batch(batch: List[WriteItem]) -> List[Tuple[str, List[Any]]]:
+        """
+        Group consecutive queue items with identical SQL text.
+
+        Only consecutive items are merged so statement order (e.g. an
+        INSERT followed by an UPDATE of the same row) is preserved.
+
+        Args:
+            batch: Queued write items
+
+        Returns:
+            List of (sql, param rows) groups
+        """
+        groups: List[Tuple[str, List[Any]]] = []
+        last_sql = None
+
+        for sql, params, many in batch:
+            if sql != last_sql:
+                groups.append((sql, []))
+                last_sql = sql
+
+            if many:
+                groups[-1][1].extend(params)
+            else:
+                groups[-1][1].append(params)
+
+        return groups
+
+    @staticmethod
+    def _row_count(batch: List[WriteItem]) -> int:
+        """Number of rows represented by a batch."""
+        return sum(len(params) if many else 1 for _, params, many in batch)
+
+    def _apply_batch(self, conn: sqlite3.Connection, batch: List[WriteItem]):
+        """
+        Execute a batch inside one transaction (executemany per SQL group).
+
+        Args:
+            conn: Writer connection
+            batch: Queued write items
+        """
+        for sql, rows in self._group_batch(batch):
+            if len(rows) == 1:
+                conn.execute(sql, rows[0])
+            else:
+                conn.executemany(sql, rows)
+
+        conn.commit()
+
+    def _execute_batch(self, conn: sqlite3.Connection, batch: List[WriteItem]) -> Optional[sqlite3.Connection]:
         """
         Execute batch write operations.
 
         Returns:
             New connection if database was recreated, None otherwise
         """
-        try:
-            for item in batch:
-                sql = item['sql']
-                params = item['params']
-                conn.execute(sql, params)
+        row_count = self._row_count(batch)
 
-            conn.commit()
+        try:
+            self._apply_batch(conn, batch)
 
             with self._stats_lock:
-                self._stats['writes_completed'] += len(batch)
+                self._stats['writes_completed'] += row_count
+                self._stats['batches_committed'] += 1
 
             return None
 
@@ -295,25 +381,22 @@ class SQLiteService:
                 # Backup old database and create new one
                 if self._backup_and_recreate_database():
                     # Create new connection for writer thread
-                    new_conn = sqlite3.connect(str(self.db_path))
-                    new_conn.execute("PRAGMA journal_mode=WAL")
-                    new_conn.execute("PRAGMA synchronous=NORMAL")
+                    new_conn = self._open_write_connection()
 
                     # Retry the batch with new connection
                     try:
-                        for item in batch:
-                            new_conn.execute(item['sql'], item['params'])
-                        new_conn.commit()
+                        self._apply_batch(new_conn, batch)
 
                         with self._stats_lock:
-                            self._stats['writes_completed'] += len(batch)
+                            self._stats['writes_completed'] += row_count
+                            self._stats['batches_committed'] += 1
 
                         return new_conn
                     except Exception as retry_error:
                         logger.error(f"Batch retry failed after recreate: {retry_error}")
                         new_conn.rollback()
                         with self._stats_lock:
-                            self._stats['writes_failed'] += len(batch)
+                            self._stats['writes_failed'] += row_count
                         return new_conn
 
             # Regular error handling
@@ -324,7 +407,7 @@ class SQLiteService:
                 pass
 
             with self._stats_lock:
-                self._stats['writes_failed'] += len(batch)
+                self._stats['writes_failed'] += row_count
 
             return None
 
@@ -342,10 +425,7 @@ class SQLiteService:
             True if queued successfully, False if queue is full
         """
         try:
-            self._write_queue.put_nowait({
-                'sql': sql,
-                'params': params
-            })
+            self._write_queue.put_nowait((sql, params, False))
 
             with self._stats_lock:
                 self._stats['writes_queued'] += 1
@@ -359,6 +439,78 @@ class SQLiteService:
             logger.warning(f"Write queue full for {self.db_path.name}")
             return False
 
+    def append_rows(
+        self,
+        table: str,
+        rows: Sequence[Sequence[Any]],
+        columns: Optional[Sequence[str]] = None
+    ) -> bool:
+        """
+        Queue a bulk INSERT of rows into a table (one queue item for all rows).
+
+        Rows are positional tuples in column order. The INSERT text is built
+        once per (table, columns) and reused, so the writer thread can flush
+        consecutive appends with a single executemany().
+
+        Args:
+            table: Table name
+            rows: Row tuples
+            columns: Column names matching the row tuples. Defaults to all
+                     table columns except the INTEGER PRIMARY KEY `id`.
+
+        Returns:
+            True if queued successfully, False if queue is full or table unknown
+        """
+        if not rows:
+            return True
+
+        sql = self._insert_sql(table, columns)
+        if sql is None:
+            return False
+
+        try:
+            self._write_queue.put_nowait((sql, list(rows), True))
+
+            with self._stats_lock:
+                self._stats['writes_queued'] += len(rows)
+
+            return True
+
+        except:
+            with self._stats_lock:
+                self._stats['queue_full_count'] += 1
+
+            logger.warning(f"Write queue full for {self.db_path.name}")
+            return False
+
+    def _insert_sql(self, table: str, columns: Optional[Sequence[str]]) -> Optional[str]:
+        """
+        Build (and cache) the INSERT statement for append_rows().
+
+        Args:
+            table: Table name
+            columns: Column names, or None for all non-id columns
+
+        Returns:
+            INSERT SQL text, or None if the table has no columns
+        """
+        key = (table, tuple(columns) if columns is not None else None)
+        sql = self._insert_sql_cache.get(key)
+        if sql is not None:
+            return sql
+
+        if columns is None:
+            info = self.read(f"PRAGMA table_info({table})")
+            columns = [row[1] for row in info if row[1] != 'id']
+            if not columns:
+                logger.error(f"append_rows: unknown table {table} in {self.db_path.name}")
+                return None
+
+        placeholders = ", ".join("?" for _ in columns)
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        self._insert_sql_cache[key] = sql
+        return sql
+
     def read(self, sql: str, params: Tuple = ()) -> List[Tuple]:
         """
         Thread-safe read operation.
@@ -19,6 +19,7 @@ except ImportError:
     logging.warning("httpx not installed - HTTP functionality disabled")
 
 from .thingsboard import ThingsBoardFormatter
+from ..processing.scheduler import DeadlineScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -396,9 +397,14 @@ class HTTPThingsBoardService:
         """Background task: Send batches periodically."""
         logger.info("HTTP batch sender loop started")
 
+        # Batches leave on a fixed grid even when a send takes a while
+        scheduler = DeadlineScheduler(
+            self.batch_interval, start_immediately=False, name='iot_batch_sender'
+        )
+
         while self._running:
             try:
-                await asyncio.sleep(self.batch_interval)
+                await scheduler.wait()
 
                 if self._connected and not self._batch_queue.empty():
                     await self._send_batch_internal()
@@ -22,6 +22,7 @@ except ImportError:
     logging.warning("aiomqtt not installed - MQTT functionality disabled")
 
 from .thingsboard import ThingsBoardFormatter
+from ..processing.scheduler import DeadlineScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -370,10 +371,15 @@ class MQTTService:
         """
         logger.info("Batch sender loop started")
 
+        # Batches leave on a fixed grid even when a send takes a while
+        scheduler = DeadlineScheduler(
+            self.batch_interval, start_immediately=False, name='iot_batch_sender'
+        )
+
         while self._running:
             try:
                 # Wait for batch interval
-                await asyncio.sleep(self.batch_interval)
+                await scheduler.wait()
 
                 # Send batch if connected and queue not empty
                 if self._connected and not self._batch_queue.empty():
@@ -40,6 +40,11 @@ class AsyncModbusService:
         self._write_count = 0
         self._error_count = 0
 
+    @property
+    def connected(self) -> bool:
+        """True while the Modbus connection is up."""
+        return self._connected
+
     def _should_attempt_connect(self) -> bool:
         """Check if enough time has passed since last connection attempt."""
         elapsed = time.monotonic() - self._last_connect_attempt
@@ -53,10 +58,17 @@ class AsyncModbusService:
     async def connect(self) -> bool:
         """Establish Modbus connection."""
         async with self._lock:
+            # Concurrent callers (ReadPlan requests, transaction workers) queue
+            # here; the first one connects, the rest reuse its connection
+            if self._connected:
+                return True
+
             # Record attempt time BEFORE connecting
             self._last_connect_attempt = time.monotonic()
 
             try:
+                if self._client is not None:
+                    self._client.close()     # Never leak the previous socket
                 self._client = AsyncModbusTcpClient(
                     host=self.host,
                     port=self.port,
@@ -227,6 +239,136 @@ class AsyncModbusService:
                 self._connected = False
                 return False
 
+    async def write_registers(
+        self,
+        address: int,
+        values: List[int],
+        unit: int = 1
+    ) -> bool:
+        """
+        Write multiple consecutive registers with FC16 (rate-limited).
+
+        Args:
+            address: Starting register address
+            values: Values to write (0-65535 each)
+            unit: Modbus slave unit ID
+
+        Returns:
+            True if successful, False otherwise
+        """
+        async with self._write_semaphore:
+            try:
+                if not self._connected:
+                    # Check cooldown before attempting reconnection
+                    if not self._should_attempt_connect():
+                        return False  # Skip operation during cooldown
+                    await self.connect()
+                    if not self._connected:
+                        return False  # Connection failed
+
+                # Wrap write operation with explicit timeout
+                write_timeout = self.config.get('timeout', 5.0)
+                result = await asyncio.wait_for(
+                    self._client.write_registers(
+                        address=address,
+                        values=list(values)
+                    ),
+                    timeout=write_timeout
+                )
+
+                if result.isError():
+                    logger.error(f"Modbus multi-write error at {address}: {result}")
+                    self._error_count += 1
+                    return False
+
+                self._write_count += 1
+                self._last_write_time = asyncio.get_event_loop().time()
+
+                return True
+
+            except asyncio.TimeoutError:
+                logger.debug(f"Modbus multi-write timeout at {address}")
+                self._error_count += 1
+                self._connected = False
+                return False
+            except ModbusException as e:
+                # Log without traceback to keep logs clean
+                logger.debug(f"Modbus multi-write exception: {e}")
+                self._error_count += 1
+                self._connected = False
+                return False
+            except Exception as e:
+                # Catch any other exceptions
+                logger.debug(f"Unexpected error in Modbus multi-write: {e}")
+                self._error_count += 1
+                self._connected = False
+                return False
+
+    async def write_coil(
+        self,
+        address: int,
+        value: bool,
+        unit: int = 1
+    ) -> bool:
+        """
+        Write single coil with FC05 (rate-limited).
+
+        Args:
+            address: Coil address (register * 16 + bit)
+            value: Coil state
+            unit: Modbus slave unit ID
+
+        Returns:
+            True if successful, False otherwise
+        """
+        async with self._write_semaphore:
+            try:
+                if not self._connected:
+                    # Check cooldown before attempting reconnection
+                    if not self._should_attempt_connect():
+                        return False  # Skip operation during cooldown
+                    await self.connect()
+                    if not self._connected:
+                        return False  # Connection failed
+
+                # Wrap write operation with explicit timeout
+                write_timeout = self.config.get('timeout', 5.0)
+                result = await asyncio.wait_for(
+                    self._client.write_coil(
+                        address=address,
+                        value=bool(value)
+                    ),
+                    timeout=write_timeout
+                )
+
+                if result.isError():
+                    logger.error(f"Modbus coil write error at {address}: {result}")
+                    self._error_count += 1
+                    return False
+
+                self._write_count += 1
+                self._last_write_time = asyncio.get_event_loop().time()
+
+                return True
+
+            except asyncio.TimeoutError:
+                logger.debug(f"Modbus coil write timeout at {address}")
+                self._error_count += 1
+                self._connected = False
+                return False
+            except ModbusException as e:
+                # Log without traceback to keep logs clean
+                logger.debug(f"Modbus coil write exception: {e}")
+                self._error_count += 1
+                self._connected = False
+                return False
+            except Exception as e:
+                # Catch any other exceptions
+                logger.debug(f"Unexpected error in Modbus coil write: {e}")
+                self._error_count += 1
+                self._connected = False
+                return False
+
     def get_health(self) -> Dict[str, Any]:
         """Get health status information."""
         now = asyncio.get_event_loop().time()
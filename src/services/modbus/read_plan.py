@@ -0,0 +1,237 @@
+"""
+Declarative Modbus read plan.
+
+Describes which register blocks must be read every cycle and coalesces
+nearby address ranges into the fewest possible read requests. Independent
+requests are issued concurrently over the same AsyncModbusService.
+
+Example (config.yaml):
+
+    modbus:
+      read_plan:
+        max_gap: 32          # Merge blocks separated by <= 32 unused registers
+        max_count: 125       # Modbus FC03 limit per request
+        blocks:
+          sensors: {address: 1000, count: 44}
+          kesme_hizi_hedef: {register: KESME_HIZI}
+          inme_hizi_hedef: {register: INME_HIZI}
+
+Blocks may reference a name from `modbus.registers` instead of a literal
+address, so target registers stay defined in a single place.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+# Modbus FC03 (read holding registers) allows at most 125 registers per request
+MAX_REGISTERS_PER_REQUEST = 125
+
+# Default plan - matches the registers ModbusReader has always read
+DEFAULT_READ_BLOCKS = {
+    'sensors': {'address': 1000, 'count': 44},
+    'kesme_hizi_hedef': {'address': 2066, 'count': 1},
+    'inme_hizi_hedef': {'address': 2041, 'count': 1},
+}
+DEFAULT_MAX_GAP = 32
+
+
+@dataclass(frozen=True)
+class ReadBlock:
+    """A named, contiguous register range the caller needs each cycle."""
+    name: str
+    address: int
+    count: int = 1
+
+    @property
+    def end(self) -> int:
+        """Address one past the last register of the block."""
+        return self.address + self.count
+
+
+@dataclass
+class ReadRequest:
+    """A single Modbus read request covering one or more blocks."""
+    address: int
+    count: int
+    blocks: List[ReadBlock] = field(default_factory=list)
+
+    @property
+    def end(self) -> int:
+        """Address one past the last register of the request."""
+        return self.address + self.count
+
+
+class ReadPlan:
+    """
+    Coalesced read plan executed once per processing cycle.
+
+    Features:
+    - Merges blocks whose gap is <= max_gap into one request
+    - Splits nothing across the FC03 125-register limit
+    - Issues independent requests concurrently (asyncio.gather)
+    - Per-plan latency metrics (last/avg/max, failures)
+    """
+
+    def __init__(
+        self,
+        blocks: List[ReadBlock],
+        max_gap: int = DEFAULT_MAX_GAP,
+        max_count: int = MAX_REGISTERS_PER_REQUEST
+    ):
+        """
+        Initialize read plan.
+
+        Args:
+            blocks: Register blocks to read
+            max_gap: Maximum number of unused registers allowed between
+                     two blocks for them to be merged into one request
+            max_count: Maximum registers per request
+        """
+        if not blocks:
+            raise ValueError("Read plan requires at least one block")
+
+        self.blocks = list(blocks)
+        self.max_gap = max(0, int(max_gap))
+        self.max_count = min(int(max_count), MAX_REGISTERS_PER_REQUEST)
+        self.requests = self._coalesce(self.blocks)
+
+        # Latency metrics (seconds)
+        self._executions = 0
+        self._failures = 0
+        self._last_latency: Optional[float] = None
+        self._max_latency = 0.0
+        self._total_latency = 0.0
+
+        logger.info(
+            f"ReadPlan built: {len(self.blocks)} blocks -> {len(self.requests)} requests "
+            f"({', '.join(f'{r.address}x{r.count}' for r in self.requests)})"
+        )
+
+    @classmethod
+    def from_config(cls, plan_config: Optional[dict], register_map: Optional[dict] = None) -> 'ReadPlan':
+        """
+        Build a read plan from the `modbus.read_plan` config section.
+
+        Args:
+            plan_config: read_plan section (None uses defaults)
+            register_map: `modbus.registers` map for `register:` references
+
+        Returns:
+            ReadPlan instance
+
+        Raises:
+            ValueError: If a block references an unknown register name
+        """
+        plan_config = plan_config or {}
+        register_map = register_map or {}
+        block_specs = plan_config.get('blocks') or DEFAULT_READ_BLOCKS
+
+        blocks = []
+        for name, spec in block_specs.items():
+            if 'register' in spec:
+                reg_name = spec['register']
+                if reg_name not in register_map:
+                    raise ValueError(f"Unknown register in read plan: {reg_name}")
+                address = int(register_map[reg_name])
+            else:
+                address = int(spec['address'])
+            blocks.append(ReadBlock(name=name, address=address, count=int(spec.get('count', 1))))
+
+        return cls(
+            blocks,
+            max_gap=plan_config.get('max_gap', DEFAULT_MAX_GAP),
+            max_count=plan_config.get('max_count', MAX_REGISTERS_PER_REQUEST)
+        )
+
+    def _coalesce(self, blocks: List[ReadBlock]) -> List[ReadRequest]:
+        """
+        Merge sorted blocks into the fewest requests.
+
+        Args:
+            blocks: Register blocks
+
+        Returns:
+            List of ReadRequest sorted by address
+        """
+        requests: List[ReadRequest] = []
+
+        for block in sorted(blocks, key=lambda b: (b.address, b.count)):
+            if block.count > self.max_count:
+                raise ValueError(
+                    f"Block {block.name} ({block.count} registers) exceeds "
+                    f"per-request limit of {self.max_count}"
+                )
+
+            current = requests[-1] if requests else None
+            if current is not None:
+                gap = block.address - current.end
+                merged_end = max(current.end, block.end)
+                if gap <= self.max_gap and merged_end - current.address <= self.max_count:
+                    current.count = merged_end - current.address
+                    current.blocks.append(block)
+                    continue
+
+            requests.append(ReadRequest(block.address, block.count, [block]))
+
+        return requests
+
+    async def execute(self, modbus) -> Dict[str, Optional[List[int]]]:
+        """
+        Execute all requests concurrently and slice results per block.
+
+        Args:
+            modbus: AsyncModbusService or ModbusTransactionManager
+
+        Returns:
+            Mapping of block name -> register values (None if its request failed)
+        """
+        start = time.perf_counter()
+
+        results = await asyncio.gather(
+            *(modbus.read_holding_registers(r.address, r.count) for r in self.requests),
+            return_exceptions=True
+        )
+
+        values: Dict[str, Optional[List[int]]] = {}
+        failed = False
+        for request, registers in zip(self.requests, results):
+            if isinstance(registers, BaseException) or not registers or len(registers) < request.count:
+                if isinstance(registers, BaseException):
+                    logger.debug(f"Read plan request {request.address} failed: {registers}")
+                failed = True
+                for block in request.blocks:
+                    values[block.name] = None
+                continue
+
+            for block in request.blocks:
+                offset = block.address - request.address
+                values[block.name] = list(registers[offset:offset + block.count])
+
+        latency = time.perf_counter() - start
+        self._executions += 1
+        self._last_latency = latency
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+        if failed:
+            self._failures += 1
+
+        return values
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get read plan statistics (latencies in milliseconds)."""
+        avg = self._total_latency / self._executions if self._executions else None
+        return {
+            'blocks': len(self.blocks),
+            'requests': len(self.requests),
+            'request_ranges': [(r.address, r.count) for r in self.requests],
+            'executions': self._executions,
+            'failures': self._failures,
+            'last_latency_ms': self._last_latency * 1000 if self._last_latency is not None else None,
+            'avg_latency_ms': avg * 1000 if avg is not None else None,
+            'max_latency_ms': self._max_latency * 1000,
+        }
@@ -55,10 +55,12 @@ Register order (from old project modbus/client.py):
 
 import logging
 import struct
+import time
 from datetime import datetime
 from typing import Optional
 from ...domain.models import RawSensorData
 from ...domain.validators import sanitize_signed_register
+from .read_plan import ReadPlan
 
 logger = logging.getLogger(__name__)
 
@@ -75,66 +77,160 @@ class ModbusReader:
     KESME_HIZI_TARGET_ADDRESS = 2066
     INME_HIZI_TARGET_ADDRESS = 2041
 
-    def __init__(self, modbus_client, register_map: dict):
+    def __init__(self, modbus_client, register_map: dict, read_plan_config: Optional[dict] = None):
         """
         Initialize reader.
 
         Args:
-            modbus_client: AsyncModbusService instance
-            register_map: Register address mapping from config (not used anymore, kept for compatibility)
+            modbus_client: AsyncModbusService or ModbusTransactionManager
+            register_map: Register address mapping from config (used for read plan references)
+            read_plan_config: `modbus.read_plan` config section (optional, defaults
+                              to 1000x44 + 2066 + 2041 coalesced)
         """
         self.modbus = modbus_client
         self.client = modbus_client  # Alias for GUI connection checking
         self.regs = register_map
 
+        # Coalesced read plan (sensor block + target speed registers)
+        self.read_plan = ReadPlan.from_config(read_plan_config, register_map)
+        sensors = next((b for b in self.read_plan.blocks if b.name == 'sensors'), None)
+        if sensors is None or sensors.address != self.START_ADDRESS or sensors.count < self.REGISTER_COUNT:
+            raise ValueError(
+                f"Read plan must contain a 'sensors' block at {self.START_ADDRESS} "
+                f"with at least {self.REGISTER_COUNT} registers"
+            )
+
+        # Split plans for high-rate acquisition: the sensor block alone (one
+        # FC03 request) at the acquisition rate, the target speed registers
+        # (only change when we write them) at the control rate
+        self.sensor_plan = ReadPlan([sensors], self.read_plan.max_gap, self.read_plan.max_count)
+        other_blocks = [b for b in self.read_plan.blocks if b is not sensors]
+        self.target_plan: Optional[ReadPlan] = (
+            ReadPlan(other_blocks, self.read_plan.max_gap, self.read_plan.max_count)
+            if other_blocks else None
+        )
+        self._target_values: dict = {}
+
         # Store last raw registers for database saving
         self._last_raw_registers: list = []
 
+        # Optional PipelineLatency: times the read and decode stages separately
+        self.latency = None
+
     async def read_all_sensors(self) -> Optional[RawSensorData]:
         """
         Read all sensor data from Modbus.
 
         Based on old project: reads 44 registers starting from address 1000.
-        Also reads target speed registers (2066, 2041) separately.
+        Target speed registers (2066, 2041) are read through the same
+        coalesced read plan (see read_plan.py).
 
         Returns:
             RawSensorData instance or None on error
         """
+        start_ns = time.perf_counter_ns()
         try:
-            # Read all 44 registers in a single batch (like old project)
-            registers = await self.modbus.read_holding_registers(
-                self.START_ADDRESS,
-                self.REGISTER_COUNT
-            )
+            # Execute coalesced read plan (sensor block + target speeds, concurrently)
+            values = await self.read_plan.execute(self.modbus)
+        except Exception as e:
+            logger.debug(f"Error reading sensors: {e}")
+            return None
+
+        read_ns = time.perf_counter_ns()
+        raw_data = self._decode(values)
+
+        if self.latency is not None:
+            end_ns = time.perf_counter_ns()
+            self.latency.record('modbus_read', read_ns - start_ns, read_ns)
+            self.latency.record('decode', end_ns - read_ns, end_ns)
+
+        return raw_data
+
+    async def read_sensor_block(self) -> Optional[RawSensorData]:
+        """
+        Read only the sensor block (high-rate acquisition path).
+
+        Target speeds are taken from the last refresh_targets() call.
+
+        Returns:
+            RawSensorData instance or None on error
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            values = await self.sensor_plan.execute(self.modbus)
+        except Exception as e:
+            logger.debug(f"Error reading sensor block: {e}")
+            return None
+
+        read_ns = time.perf_counter_ns()
+        raw_data = self._decode({**self._target_values, **values})
+
+        if self.latency is not None:
+            end_ns = time.perf_counter_ns()
+            self.latency.record('modbus_read', read_ns - start_ns, read_ns)
+            self.latency.record('decode', end_ns - read_ns, end_ns)
+
+        return raw_data
+
+    async def refresh_targets(self) -> bool:
+        """
+        Read the non-sensor blocks (target speeds) for read_sensor_block().
+
+        Returns:
+            True if every block was read
+        """
+        if self.target_plan is None:
+            return True
+        try:
+            values = await self.target_plan.execute(self.modbus)
+        except Exception as e:
+            logger.debug(f"Error reading target registers: {e}")
+            return False
+
+        ok = True
+        for name, registers in values.items():
+            if registers is None:
+                ok = False
+            else:
+                self._target_values[name] = registers
+        return ok
+
+    def _decode(self, values: dict) -> Optional[RawSensorData]:
+        """
+        Convert read plan results to RawSensorData.
+
+        Args:
+            values: Block name -> register list (from ReadPlan.execute)
+
+        Returns:
+            RawSensorData instance or None if the sensor block is missing
+        """
+        try:
+            registers = values.get('sensors')
 
             if not registers:
                 logger.warning("Failed to read Modbus registers")
                 return None
 
+            registers = registers[:self.REGISTER_COUNT]
+
             # Store raw registers for database saving
             self._last_raw_registers = list(registers)
 
-            # Read target speed registers separately (2066 and 2041)
+            # Target speed registers (2066 and 2041)
             # These are the speeds we write to PLC, shown as "hedef" (target) in GUI
             kesme_hizi_hedef = 0.0
             inme_hizi_hedef = 0.0
 
-            try:
-                # Read cutting speed target (2066) - no scaling needed per speed_reader.py
-                kesme_target_regs = await self.modbus.read_holding_registers(
-                    self.KESME_HIZI_TARGET_ADDRESS, 1
-                )
-                if kesme_target_regs:
-                    kesme_hizi_hedef = float(kesme_target_regs[0])
-
-                # Read descent speed target (2041) - scale by /100 per speed_reader.py
-                inme_target_regs = await self.modbus.read_holding_registers(
-                    self.INME_HIZI_TARGET_ADDRESS, 1
-                )
-                if inme_target_regs:
-                    inme_hizi_hedef = float(inme_target_regs[0]) / 100.0
-            except Exception as e:
-                logger.debug(f"Failed to read target speed registers: {e}")
+            # Cutting speed target (2066) - no scaling needed per speed_reader.py
+            kesme_target_regs = values.get('kesme_hizi_hedef')
+            if kesme_target_regs:
+                kesme_hizi_hedef = float(kesme_target_regs[0])
+
+            # Descent speed target (2041) - scale by /100 per speed_reader.py
+            inme_target_regs = values.get('inme_hizi_hedef')
+            if inme_target_regs:
+                inme_hizi_hedef = float(inme_target_regs[0]) / 100.0
 
             # Map register indices to values (0-indexed, register 1000 = index 0)
             # Apply scaling factors from old project's data/processor.py
@@ -290,7 +386,7 @@ class ModbusReader:
             )
 
         except Exception as e:
-            logger.debug(f"Error reading sensors: {e}")
+            logger.debug(f"Error decoding sensors: {e}")
             return None
 
     def _decode_inme_hizi(self, raw_value: int) -> float:
@@ -333,6 +429,20 @@ class ModbusReader:
             logger.debug(f"IEEE754 decode error: {e}")
             return 0.0
 
+    def get_stats(self) -> dict:
+        """
+        Get reader statistics.
+
+        Returns:
+            Dictionary with read plan latency metrics
+        """
+        stats = {'read_plan': self.read_plan.get_stats()}
+        if self.sensor_plan.get_stats()['executions']:
+            stats['sensor_plan'] = self.sensor_plan.get_stats()
+            if self.target_plan is not None:
+                stats['target_plan'] = self.target_plan.get_stats()
+        return stats
+
     def get_last_raw_registers(self) -> list:
         """
         Get the last raw register values (unprocessed).
@@ -0,0 +1,413 @@
+"""
+Modbus TCP PLC simulator that replays recorded raw.db samples.
+
+Serves holding registers 1000-2066 like the saw PLC:
+
+- 1000-1043: the recorded sample for the current replay time, read from
+  raw.db (compact `raw_register_chunks` or legacy `raw_registers`)
+- 2066 / 2041: speed targets written by ModbusWriter (kesme unscaled,
+  inme x100)
+
+Replay time advances with the wall clock times `speed` (1.0 = real time,
+10.0 = ten recorded seconds per second) and wraps around at the end of the
+recording. Registers are refreshed lazily on each read, so there is no
+timer to keep up at high replay speeds.
+
+Plant model: while the recorded saw state (1030) is cutting, a written
+target takes over the matching actual speed register (1033 kesme x10,
+1034 inme) with a first-order lag of `plant_tau` recorded seconds. When the
+recorded cut ends, overrides are dropped and the recording shows through
+again.
+
+Also records what the PLC side can observe for benchmarks: read intervals
+of the sensor block (cycle period/jitter) and read-to-write latency of
+speed commands.
+
+Example:
+    simulator = PLCSimulator(samples_ms, registers, speed=10.0)
+    port = await simulator.start(port=0)
+    ...
+    await simulator.stop()
+"""
+
+import asyncio
+import logging
+import math
+import sqlite3
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Optional, Tuple
+
+import numpy as np
+from pymodbus.server import ModbusTcpServer
+from pymodbus.simulator import DataType, SimData, SimDevice
+
+from ..database.raw_store import RAW_REGISTER_COUNT, TESTERE_DURUMU_INDEX, read_raw_chunks
+from ..database.schemas import RAW_REGISTER_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Register layout served by the simulator
+SENSOR_START_ADDRESS = 1000
+KESME_HIZI_ADDRESS = 1033
+INME_HIZI_ADDRESS = 1034
+INME_HIZI_TARGET_ADDRESS = 2041
+KESME_HIZI_TARGET_ADDRESS = 2066
+
+# testere_durumu value while cutting (TesereDurumu.KESIM_YAPILIYOR)
+CUTTING_STATE = 3
+
+# Read function codes (holding / input registers)
+_READ_FUNCTION_CODES = (3, 4, 23)
+
+
+class _SQLiteReader:
+    """Minimal read(sql, params) adapter for read_raw_chunks()."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def read(self, sql: str, params: tuple = ()) -> list:
+        return self._connection.execute(sql, params).fetchall()
+
+
+def load_raw_samples(
+    db_path: Path,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Load recorded register samples from raw.db.
+
+    Compact chunks are used when present, otherwise the legacy
+    raw_registers rows.
+
+    Args:
+        db_path: Path to raw.db
+        start: Inclusive lower bound, None for unbounded
+        end: Exclusive upper bound, None for unbounded
+
+    Returns:
+        Tuple of (timestamps int64 epoch ms [N], registers uint16 [N, 44])
+    """
+    start_ms = int(start.timestamp() * 1000) if start is not None else None
+    end_ms = int(end.timestamp() * 1000) if end is not None else None
+
+    connection = sqlite3.connect(f"file:{Path(db_path)}?mode=ro", uri=True)
+    try:
+        tables = {
+            row[0] for row in
+            connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        if 'raw_register_chunks' in tables:
+            timestamps, registers = read_raw_chunks(_SQLiteReader(connection), start_ms, end_ms)
+            if len(timestamps):
+                return timestamps, registers
+
+        if 'raw_registers' not in tables:
+            return np.empty(0, dtype=np.int64), np.empty((0, RAW_REGISTER_COUNT), dtype=np.uint16)
+
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("timestamp >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            conditions.append("timestamp < ?")
+            params.append(end.isoformat())
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = connection.execute(
+            f"SELECT {', '.join(RAW_REGISTER_COLUMNS)} FROM raw_registers {where} ORDER BY id",
+            params
+        ).fetchall()
+    finally:
+        connection.close()
+
+    timestamps = np.array(
+        [int(datetime.fromisoformat(row[0]).timestamp() * 1000) for row in rows],
+        dtype=np.int64
+    )
+    registers = np.array(
+        [[value or 0 for value in row[1:]] for row in rows], dtype=np.uint16
+    ).reshape(-1, RAW_REGISTER_COUNT)
+    order = np.argsort(timestamps, kind='stable')
+    return timestamps[order], registers[order]
+
+
+def _percentiles_ms(values) -> dict:
+    """p50/p99/max/std in milliseconds for a sequence of seconds."""
+    if not values:
+        return {'count': 0, 'p50_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0, 'std_ms': 0.0}
+    array_ms = np.asarray(values) * 1000.0
+    return {
+        'count': len(array_ms),
+        'p50_ms': float(np.percentile(array_ms, 50)),
+        'p99_ms': float(np.percentile(array_ms, 99)),
+        'max_ms': float(array_ms.max()),
+        'std_ms': float(array_ms.std()),
+    }
+
+
+class PLCSimulator:
+    """
+    Replaying Modbus TCP server with a first-order speed plant model.
+
+    Thread Safety:
+    - Runs on one asyncio event loop; register access is only done from the
+      server's action callback on that loop.
+    """
+
+    def __init__(
+        self,
+        timestamps_ms: np.ndarray,
+        registers: np.ndarray,
+        speed: float = 1.0,
+        plant_tau: float = 1.0,
+        device_id: int = 0,
+        history_size: int = 100000
+    ):
+        """
+        Initialize simulator.
+
+        Args:
+            timestamps_ms: Recorded sample times (epoch ms, ascending)
+            registers: Recorded registers [N, 44] (1000-1043)
+            speed: Replay speed (recorded seconds per wall second)
+            plant_tau: Speed response time constant (recorded seconds)
+            device_id: Modbus device id to answer (0 = any)
+            history_size: Max read intervals / write latencies kept
+        """
+        if len(timestamps_ms) == 0:
+            raise ValueError("No recorded samples to replay")
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+
+        self.timestamps_ms = np.asarray(timestamps_ms, dtype=np.int64)
+        self.registers = np.asarray(registers, dtype=np.uint16).reshape(-1, RAW_REGISTER_COUNT)
+        self.speed = float(speed)
+        self.plant_tau = float(plant_tau)
+        self.device_id = device_id
+
+        # Replay clock (span includes one nominal sample period so the last
+        # sample is served before wrapping)
+        self._t0_ms = int(self.timestamps_ms[0])
+        period_ms = int(np.median(np.diff(self.timestamps_ms))) if len(self.timestamps_ms) > 1 else 100
+        self._span_ms = max(int(self.timestamps_ms[-1]) - self._t0_ms + period_ms, 1)
+        self._wall_start: Optional[float] = None
+        self._last_sim_ms: Optional[float] = None
+
+        # Plant state (None = no override, recording shows through)
+        self._kesme_target: Optional[float] = None
+        self._inme_target: Optional[float] = None
+        self._kesme_actual: Optional[float] = None
+        self._inme_actual: Optional[float] = None
+        self._index = 0
+
+        # PLC-side observations
+        self._last_sensor_read: Optional[float] = None
+        self._read_intervals: Deque[float] = deque(maxlen=history_size)
+        self._write_latencies: Deque[float] = deque(maxlen=history_size)
+
+        self._server: Optional[ModbusTcpServer] = None
+        self._serve_task: Optional[asyncio.Task] = None
+
+        self._stats = {
+            'sensor_reads': 0,
+            'target_reads': 0,
+            'kesme_writes': 0,
+            'inme_writes': 0,
+            'loops': 0,
+        }
+
+        logger.info(
+            f"PLCSimulator initialized: {len(self.timestamps_ms)} samples "
+            f"({self._span_ms / 1000:.0f}s recorded), speed={self.speed:g}x"
+        )
+
+    @property
+    def port(self) -> Optional[int]:
+        """Bound TCP port (None before start)."""
+        if self._server is None or self._server.transport is None:
+            return None
+        return self._server.transport.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 5020) -> int:
+        """
+        Start serving.
+
+        Args:
+            host: Listen address
+            port: Listen port (0 = pick a free port)
+
+        Returns:
+            Bound port
+        """
+        device = SimDevice(
+            self.device_id,
+            simdata=[SimData(
+                SENSOR_START_ADDRESS,
+                count=KESME_HIZI_TARGET_ADDRESS - SENSOR_START_ADDRESS + 1,
+                values=0,
+                datatype=DataType.REGISTERS
+            )],
+            action=self._on_access
+        )
+        self._server = ModbusTcpServer(device, address=(host, port))
+        self._wall_start = time.monotonic()
+        self._serve_task = asyncio.create_task(self._server.serve_forever())
+
+        while self._server.transport is None:
+            if self._serve_task.done():
+                self._serve_task.result()  # Re-raise bind errors
+            await asyncio.sleep(0.01)
+
+        logger.info(f"PLC simulator listening on {host}:{self.port}")
+        return self.port
+
+    async def stop(self):
+        """Stop serving."""
+        if self._server is not None:
+            await self._server.shutdown()
+        if self._serve_task is not None:
+            self._serve_task.cancel()
+            try:
+                await self._serve_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._server = None
+        self._serve_task = None
+        logger.info("PLC simulator stopped")
+
+    def sim_time_ms(self, now: Optional[float] = None) -> float:
+        """Recorded time (epoch ms) currently being replayed."""
+        if self._wall_start is None:
+            self._wall_start = time.monotonic()
+        now = time.monotonic() if now is None else now
+        elapsed_ms = (now - self._wall_start) * 1000.0 * self.speed
+        return self._t0_ms + elapsed_ms % self._span_ms
+
+    def current_registers(self, now: Optional[float] = None) -> list:
+        """
+        Advance replay and plant model to `now` and return registers 1000-1043.
+
+        Args:
+            now: time.monotonic() value (default: now)
+
+        Returns:
+            44 register values as served
+        """
+        sim_ms = self.sim_time_ms(now)
+        if self._last_sim_ms is not None and sim_ms < self._last_sim_ms:
+            self._stats['loops'] += 1
+            self._reset_plant()
+            dt = 0.0
+        else:
+            dt = (sim_ms - self._last_sim_ms) / 1000.0 if self._last_sim_ms is not None else 0.0
+        self._last_sim_ms = sim_ms
+
+        self._index = max(int(np.searchsorted(self.timestamps_ms, sim_ms, side='right')) - 1, 0)
+        sample = self.registers[self._index].tolist()
+
+        if sample[TESTERE_DURUMU_INDEX] != CUTTING_STATE:
+            self._reset_plant()
+            return sample
+
+        alpha = 1.0 - math.exp(-dt / self.plant_tau) if self.plant_tau > 0 else 1.0
+        if self._kesme_target is not None:
+            if self._kesme_actual is None:
+                self._kesme_actual = sample[KESME_HIZI_ADDRESS - SENSOR_START_ADDRESS] / 10.0
+            self._kesme_actual += (self._kesme_target - self._kesme_actual) * alpha
+            sample[KESME_HIZI_ADDRESS - SENSOR_START_ADDRESS] = int(round(self._kesme_actual * 10)) & 0xFFFF
+        if self._inme_target is not None:
+            if self._inme_actual is None:
+                self._inme_actual = self._decode_inme(sample[INME_HIZI_ADDRESS - SENSOR_START_ADDRESS])
+            self._inme_actual += (self._inme_target - self._inme_actual) * alpha
+            sample[INME_HIZI_ADDRESS - SENSOR_START_ADDRESS] = int(round(self._inme_actual)) & 0xFFFF
+        return sample
+
+    def _reset_plant(self):
+        """Drop speed overrides (cut ended or replay wrapped)."""
+        self._kesme_target = None
+        self._inme_target = None
+        self._kesme_actual = None
+        self._inme_actual = None
+
+    @staticmethod
+    def _decode_inme(raw_value: int) -> float:
+        """Same sign convention as ModbusReader (values > 500 are negative)."""
+        return float(raw_value - 65536) if raw_value > 500 else float(raw_value)
+
+    async def _on_access(
+        self,
+        function_code: int,
+        start_address: int,
+        address: int,
+        count: int,
+        current_registers: list,
+        set_values
+    ):
+        """pymodbus action hook: refresh on sensor reads, capture target writes."""
+        now = time.monotonic()
+        end = address + count
+
+        if set_values is not None:
+            for offset, value in enumerate(set_values):
+                self._on_write(address + offset, int(value), now)
+            return None
+
+        if function_code not in _READ_FUNCTION_CODES:
+            return None
+
+        if address < SENSOR_START_ADDRESS + RAW_REGISTER_COUNT and end > SENSOR_START_ADDRESS:
+            offset = SENSOR_START_ADDRESS - start_address
+            current_registers[offset:offset + RAW_REGISTER_COUNT] = self.current_registers(now)
+            self._stats['sensor_reads'] += 1
+            if self._last_sensor_read is not None:
+                self._read_intervals.append(now - self._last_sensor_read)
+            self._last_sensor_read = now
+
+        if address <= KESME_HIZI_TARGET_ADDRESS and end > INME_HIZI_TARGET_ADDRESS:
+            self._stats['target_reads'] += 1
+        return None
+
+    def _on_write(self, address: int, value: int, now: float):
+        """Record a speed target write."""
+        if address == KESME_HIZI_TARGET_ADDRESS:
+            self._kesme_target = float(value)
+            self._stats['kesme_writes'] += 1
+        elif address == INME_HIZI_TARGET_ADDRESS:
+            self._inme_target = value / 100.0
+            self._stats['inme_writes'] += 1
+        else:
+            return
+
+        if self._last_sensor_read is not None:
+            self._write_latencies.append(now - self._last_sensor_read)
+
+    def reset_measurements(self):
+        """Clear read intervals and write latencies (e.g. after warm-up)."""
+        self._read_intervals.clear()
+        self._write_latencies.clear()
+
+    def get_stats(self) -> dict:
+        """
+        Get simulator statistics.
+
+        Returns:
+            Counters, replay position, sensor read interval stats (cycle
+            period and jitter as seen by the PLC) and read-to-write latency
+            of speed commands
+        """
+        return {
+            **self._stats,
+            'speed': self.speed,
+            'sample_index': self._index,
+            'sim_time': (
+                datetime.fromtimestamp(self._last_sim_ms / 1000.0).isoformat()
+                if self._last_sim_ms is not None else None
+            ),
+            'plant_active': self._kesme_target is not None or self._inme_target is not None,
+            'read_interval': _percentiles_ms(self._read_intervals),
+            'write_latency': _percentiles_ms(self._write_latencies),
+        }
@@ -0,0 +1,497 @@
+"""
+Prioritized Modbus transaction manager.
+
+The data pipeline (AsyncModbusService) and the GUI's MachineControl used to
+open their own TCP connection to the same PLC and contend blindly, each with
+its own reconnect cooldown. ModbusTransactionManager owns the pipeline's
+AsyncModbusService connection and runs every transaction through one
+priority queue:
+
+    SAFETY     stop commands (cutting, auto cutting, jog stops)
+    OPERATOR   operator writes and their read-modify-write reads (GUI)
+    CONTROL    speed writes from the control loop (write scheduler)
+    TELEMETRY  sensor/target reads and the GUI status poll
+
+Features:
+- At most max_in_flight transactions on the wire; a free slot always takes
+  the most urgent queued transaction (FIFO within a class)
+- Identical queued reads are coalesced into one request (a read already on
+  the wire is never joined, so a caller never gets a value older than its
+  request)
+- A caller that stops waiting (timeout, cancellation) withdraws its
+  transaction while it is still queued; a write reported as failed is never
+  sent later (it could otherwise land after a newer SAFETY stop)
+- Async facade with the AsyncModbusService interface (ModbusReader,
+  ReadPlan, ModbusWriter, ModbusWriteScheduler use it unchanged)
+- Thread-safe sync facade (SyncModbusClient) with the pymodbus
+  ModbusTcpClient call shape for MachineControl
+- Per-class queue wait and total latency histograms
+
+Example (config.yaml):
+
+    modbus:
+      transactions:
+        max_in_flight: 2
+        coalesce_reads: true
+        sync_timeout: 3.0
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..processing.latency import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Transaction priority classes (lower value runs first)."""
+    SAFETY = 0
+    OPERATOR = 1
+    CONTROL = 2
+    TELEMETRY = 3
+
+
+@dataclass(order=True)
+class _Transaction:
+    """A queued Modbus transaction and the futures waiting for its result."""
+    priority: int
+    seq: int
+    kind: str = field(compare=False)
+    args: Tuple = field(compare=False)
+    waiters: List[asyncio.Future] = field(compare=False, default_factory=list)
+    submitted_ns: int = field(compare=False, default=0)
+    started: bool = field(compare=False, default=False)
+
+
+class ModbusTransactionManager:
+    """
+    Single-connection, prioritized transaction queue in front of AsyncModbusService.
+
+    Thread Safety:
+    - Async methods must be awaited on the event loop that ran start()
+    - Other threads use sync_client() (run_coroutine_threadsafe)
+    """
+
+    def __init__(self, modbus_service, config: Optional[dict] = None):
+        """
+        Initialize transaction manager.
+
+        Args:
+            modbus_service: AsyncModbusService owning the PLC connection
+            config: `modbus.transactions` config section (optional)
+        """
+        config = config or {}
+        self.service = modbus_service
+        self.max_in_flight = max(1, int(config.get('max_in_flight', 2)))
+        self.coalesce_reads = config.get('coalesce_reads', True)
+        self.sync_timeout = float(config.get('sync_timeout', 3.0))
+        # Longest a started transaction can take on the wire (service timeout)
+        self.wire_timeout = float(getattr(modbus_service, 'config', {}).get('timeout', 5.0))
+
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._queued_reads: Dict[Tuple[int, int], _Transaction] = {}
+        self._seq = itertools.count()
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._running = False
+        self._in_flight = 0
+
+        # Statistics (event loop only)
+        self._stats = {
+            'transactions': 0,
+            'max_queue_depth': 0,
+            'max_in_flight': 0,
+            'skipped': 0,
+        }
+        self._class_stats = {
+            p: {'submitted': 0, 'coalesced': 0, 'completed': 0, 'failed': 0, 'withdrawn': 0}
+            for p in Priority
+        }
+        self._latency = {
+            p: {'wait': LatencyHistogram(), 'total': LatencyHistogram()}
+            for p in Priority
+        }
+
+    @property
+    def connected(self) -> bool:
+        """True while the shared connection is up."""
+        return self.service.connected
+
+    async def start(self):
+        """Start the dispatcher workers (on the event loop that owns the connection)."""
+        if self._running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._queue = asyncio.PriorityQueue()
+        self._running = True
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_in_flight)]
+        logger.info(
+            f"Modbus transaction manager started: max_in_flight={self.max_in_flight}, "
+            f"coalesce_reads={self.coalesce_reads}"
+        )
+
+    async def stop(self):
+        """Stop the workers; queued transactions fail (None/False)."""
+        if not self._running:
+            return
+
+        self._running = False
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        while not self._queue.empty():
+            self._resolve(self._queue.get_nowait(), None)
+        self._queued_reads.clear()
+        logger.info("Modbus transaction manager stopped")
+
+    # ------------------------------------------------------------------
+    # Async facade (AsyncModbusService interface)
+    # ------------------------------------------------------------------
+
+    async def connect(self) -> bool:
+        """Connect the shared client (no-op while connected, honours the cooldown)."""
+        if self.service.connected:
+            return True
+        if not self.service._should_attempt_connect():
+            return False
+        return await self.service.connect()
+
+    async def disconnect(self):
+        """Close the shared connection."""
+        await self.service.disconnect()
+
+    async def read_holding_registers(
+        self,
+        address: int,
+        count: int,
+        unit: int = 1,
+        priority: Priority = Priority.TELEMETRY,
+        timeout: Optional[float] = None
+    ) -> Optional[List[int]]:
+        """
+        Read holding registers.
+
+        Args:
+            address: Starting register address
+            count: Number of registers to read
+            unit: Modbus slave unit ID (unused, single PLC)
+            priority: Transaction class
+            timeout: Seconds to wait; a transaction still queued then is
+                     withdrawn and fails (None: wait for the result)
+
+        Returns:
+            List of register values or None on error
+        """
+        return await self._submit('read', (address, count), priority, timeout)
+
+    async def write_register(
+        self,
+        address: int,
+        value: int,
+        unit: int = 1,
+        priority: Priority = Priority.CONTROL,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """Write a single register (FC06). Returns True if successful."""
+        return bool(await self._submit('write', (address, value), priority, timeout))
+
+    async def write_registers(
+        self,
+        address: int,
+        values: List[int],
+        unit: int = 1,
+        priority: Priority = Priority.CONTROL,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """Write consecutive registers (FC16). Returns True if successful."""
+        return bool(await self._submit('write_multi', (address, list(values)), priority, timeout))
+
+    async def write_coil(
+        self,
+        address: int,
+        value: bool,
+        priority: Priority = Priority.OPERATOR,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """Write a single coil (FC05). Returns True if successful."""
+        return bool(await self._submit('coil', (address, bool(value)), priority, timeout))
+
+    def get_health(self) -> Dict[str, Any]:
+        """Connection health (AsyncModbusService) plus transaction statistics."""
+        return {**self.service.get_health(), 'transactions': self.get_stats()}
+
+    # ------------------------------------------------------------------
+    # Sync facade
+    # ------------------------------------------------------------------
+
+    def sync_client(self, timeout: Optional[float] = None) -> 'SyncModbusClient':
+        """
+        Blocking client sharing this manager's connection (call after start()).
+
+        Args:
+            timeout: Seconds to wait per transaction (default: sync_timeout)
+        """
+        return SyncModbusClient(self, timeout if timeout is not None else self.sync_timeout)
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    async def _submit(self, kind: str, args: Tuple, priority: Priority, timeout: Optional[float] = None):
+        """Queue a transaction and wait for its result (see read_holding_registers for timeout)."""
+        priority = Priority(priority)
+        if not self._running:
+            # Before start()/after stop(): run directly on the connection
+            return await self._execute(kind, args)
+
+        stats = self._class_stats[priority]
+        stats['submitted'] += 1
+        future = self._loop.create_future()
+
+        key = args if kind == 'read' else None
+        queued = self._queued_reads.get(key) if key is not None and self.coalesce_reads else None
+        if queued is not None and queued.priority <= priority:
+            transaction = queued
+            transaction.waiters.append(future)
+            stats['coalesced'] += 1
+        else:
+            transaction = _Transaction(
+                priority=int(priority),
+                seq=next(self._seq),
+                kind=kind,
+                args=args,
+                waiters=[future],
+                submitted_ns=time.perf_counter_ns(),
+            )
+            if key is not None:
+                self._queued_reads[key] = transaction
+            self._queue.put_nowait(transaction)
+            self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], self._queue.qsize())
+
+        try:
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                if not transaction.started:
+                    self._withdraw(future, priority)
+                    logger.warning(f"Modbus {kind} {args[0]} withdrawn after {timeout:.1f}s in queue")
+                    return None
+                # Already on the wire: report what the PLC answered
+                return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not transaction.started:
+                self._withdraw(future, priority)
+            raise
+
+    def _withdraw(self, future: asyncio.Future, priority: Priority):
+        """Drop a waiter; a transaction without waiters is skipped by the workers."""
+        if not future.done():
+            future.cancel()
+            self._class_stats[priority]['withdrawn'] += 1
+
+    async def _worker(self):
+        """One in-flight slot: take the most urgent transaction, execute, resolve."""
+        while True:
+            transaction = await self._queue.get()
+            if transaction.kind == 'read' and self._queued_reads.get(transaction.args) is transaction:
+                del self._queued_reads[transaction.args]
+            if all(waiter.done() for waiter in transaction.waiters):
+                # Every caller gave up (and was told it failed): never send it
+                self._stats['skipped'] += 1
+                continue
+            transaction.started = True
+
+            start_ns = time.perf_counter_ns()
+            self._in_flight += 1
+            self._stats['max_in_flight'] = max(self._stats['max_in_flight'], self._in_flight)
+            try:
+                result = await self._execute(transaction.kind, transaction.args)
+            except asyncio.CancelledError:
+                self._resolve(transaction, None)
+                raise
+            finally:
+                self._in_flight -= 1
+
+            end_ns = time.perf_counter_ns()
+            priority = Priority(transaction.priority)
+            latency = self._latency[priority]
+            latency['wait'].record(start_ns - transaction.submitted_ns, end_ns)
+            latency['total'].record(end_ns - transaction.submitted_ns, end_ns)
+            self._stats['transactions'] += 1
+            outcome = 'failed' if result is None or result is False else 'completed'
+            self._class_stats[priority][outcome] += sum(not w.done() for w in transaction.waiters)
+            self._resolve(transaction, result)
+
+    async def _execute(self, kind: str, args: Tuple):
+        """Run one transaction on the shared connection."""
+        try:
+            if kind == 'read':
+                return await self.service.read_holding_registers(*args)
+            if kind == 'write':
+                return await self.service.write_register(*args)
+            if kind == 'write_multi':
+                return await self.service.write_registers(*args)
+            if kind == 'coil':
+                return await self.service.write_coil(*args)
+            raise ValueError(f"Unknown transaction kind: {kind}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Modbus {kind} transaction error {args[0]}: {e}")
+            return None
+
+    @staticmethod
+    def _resolve(transaction: _Transaction, result):
+        """Hand the result to every waiter still interested."""
+        for future in transaction.waiters:
+            if not future.done():
+                future.set_result(result)
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get transaction statistics.
+
+        Returns:
+            Dictionary with totals, queue depth/in-flight maxima and, per
+            priority class, counters plus queue wait and total latency
+            percentiles (ms) over the last minute
+        """
+        return {
+            **self._stats,
+            'running': self._running,
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'in_flight': self._in_flight,
+            'in_flight_limit': self.max_in_flight,
+            'classes': {
+                p.name.lower(): {
+                    **self._class_stats[p],
+                    'wait': self._latency[p]['wait'].snapshot(),
+                    'total': self._latency[p]['total'].snapshot(),
+                }
+                for p in Priority
+            },
+        }
+
+
+class SyncResponse:
+    """Minimal pymodbus-style response (isError(), registers)."""
+
+    def __init__(self, registers: Optional[List[int]] = None, error: Optional[str] = None):
+        self.registers = registers or []
+        self.error = error
+
+    def isError(self) -> bool:
+        return self.error is not None
+
+    def __repr__(self) -> str:
+        return f"SyncResponse(error={self.error!r})" if self.error else f"SyncResponse({self.registers})"
+
+
+class SyncModbusClient:
+    """
+    Blocking, thread-safe facade over ModbusTransactionManager.
+
+    Mirrors the subset of pymodbus ModbusTcpClient that MachineControl uses,
+    so it can replace MachineControl's own TCP connection. Transactions run
+    at the calling thread's current priority (priority() context, default
+    OPERATOR). Must not be called from the event loop thread.
+    """
+
+    def __init__(self, manager: ModbusTransactionManager, timeout: float = 3.0):
+        """
+        Initialize facade.
+
+        Args:
+            manager: Started ModbusTransactionManager
+            timeout: Seconds a transaction may wait in the queue; it is then
+                     withdrawn and fails (one on the wire is waited for)
+        """
+        self.manager = manager
+        self.timeout = timeout
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def priority(self, priority: Priority):
+        """Run this thread's transactions in the block at the given priority."""
+        previous = getattr(self._local, 'priority', Priority.OPERATOR)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def _call(self, coro_fn, *args, default=None):
+        """Run a manager coroutine on its loop and wait for the result."""
+        manager = self.manager
+        if manager._loop is None or threading.get_ident() == manager._loop_thread:
+            raise RuntimeError("SyncModbusClient needs a started manager and a non-loop thread")
+        priority = getattr(self._local, 'priority', Priority.OPERATOR)
+        coro = coro_fn(*args, priority=priority, timeout=self.timeout)
+        try:
+            future = asyncio.run_coroutine_threadsafe(coro, manager._loop)
+        except RuntimeError as e:   # Loop closed (shutdown)
+            coro.close()
+            logger.debug(f"Sync Modbus call skipped: {e}")
+            return default
+        try:
+            # The loop withdraws a transaction still queued after self.timeout;
+            # one already on the wire is waited for (bounded by the wire timeout)
+            result = future.result(self.timeout + manager.wire_timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.warning(f"Sync Modbus transaction timed out after {self.timeout:.1f}s")
+            return default
+        return default if result is None else result
+
+    # pymodbus ModbusTcpClient call shape -------------------------------
+
+    def connect(self) -> bool:
+        manager = self.manager
+        if manager._loop is None:
+            return False
+        try:
+            return asyncio.run_coroutine_threadsafe(manager.connect(), manager._loop).result(self.timeout)
+        except (RuntimeError, concurrent.futures.TimeoutError):
+            return False
+
+    def is_socket_open(self) -> bool:
+        return self.manager.connected
+
+    def close(self):
+        """No-op: the shared connection is owned by the manager."""
+
+    def read_holding_registers(self, address: int, count: int = 1, **kwargs) -> SyncResponse:
+        registers = self._call(self.manager.read_holding_registers, address, count, 1)
+        if registers is None:
+            return SyncResponse(error=f"read {address}x{count} failed")
+        return SyncResponse(registers)
+
+    def write_register(self, address: int, value: int, **kwargs) -> SyncResponse:
+        ok = self._call(self.manager.write_register, address, value, 1, default=False)
+        return SyncResponse() if ok else SyncResponse(error=f"write {address} failed")
+
+    def write_registers(self, address: int, values: List[int], **kwargs) -> SyncResponse:
+        ok = self._call(self.manager.write_registers, address, values, 1, default=False)
+        return SyncResponse() if ok else SyncResponse(error=f"write {address}x{len(values)} failed")
+
+    def write_coil(self, address: int, value: bool, **kwargs) -> SyncResponse:
+        ok = self._call(self.manager.write_coil, address, value, default=False)
+        return SyncResponse() if ok else SyncResponse(error=f"coil {address} failed")
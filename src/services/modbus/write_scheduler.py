@@ -0,0 +1,266 @@
+"""
+Async PLC write scheduler.
+
+Owns all pipeline-originated register writes so callers never await a
+Modbus round trip (or an inter-write delay) inside their own cycle.
+
+Behavior:
+- Latest value wins: a newer command for a register replaces any pending one
+- Submission order: registers are written in the order they were first
+  queued (a combined speed command writes 2066 before 2041, as the old
+  project did)
+- Results: an optional on_done(success) callback per submit reports the
+  PLC write result (a superseded value reports the write that replaced it)
+- Pacing: consecutive write transactions are spaced by min_write_interval
+  (the PLC needs ~110 ms between speed writes, see old project)
+- FC16: pending writes to consecutive registers are merged into a single
+  write_registers() transaction when multi_register_writes is enabled
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ModbusWriteScheduler:
+    """Dedicated asyncio task that drains latest-value-wins register writes."""
+
+    def __init__(self, modbus_client, config: Optional[dict] = None):
+        """
+        Initialize write scheduler.
+
+        Args:
+            modbus_client: AsyncModbusService or ModbusTransactionManager
+            config: `modbus.write_scheduler` config section (optional)
+        """
+        config = config or {}
+        self.modbus = modbus_client
+        self.min_write_interval = config.get('min_write_interval', 0.11)
+        self.multi_register_writes = config.get('multi_register_writes', True)
+
+        # Pending writes in submission order: address -> (value, submit_time, callbacks)
+        self._pending: Dict[int, Tuple[int, float, List[Callable[[bool], None]]]] = {}
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._last_write_end: float = 0.0
+
+        # Statistics
+        self._stats = {
+            'submitted': 0,
+            'superseded': 0,      # Pending values replaced before being written
+            'transactions': 0,
+            'multi_register_transactions': 0,
+            'registers_written': 0,
+            'failures': 0,
+        }
+        self._last_latency: Optional[float] = None
+        self._max_latency = 0.0
+        self._total_latency = 0.0
+        self._max_queue_delay = 0.0
+
+    async def start(self):
+        """Start the scheduler task."""
+        if self._running:
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Modbus write scheduler started: "
+            f"interval={self.min_write_interval * 1000:.0f}ms, "
+            f"fc16={'enabled' if self.multi_register_writes else 'disabled'}"
+        )
+
+    async def stop(self, timeout: float = 2.0):
+        """
+        Stop the scheduler, flushing pending writes first.
+
+        Args:
+            timeout: Maximum time to wait for pending writes
+        """
+        if not self._running:
+            return
+
+        try:
+            await asyncio.wait_for(self.flush(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Write scheduler stop: {len(self._pending)} pending writes dropped")
+            for _, _, callbacks in self._pending.values():
+                self._notify(callbacks, False)
+            self._pending.clear()
+
+        self._running = False
+        self._wakeup.set()
+
+        if self._task:
+            try:
+                await asyncio.wait_for(self._task, timeout=timeout)
+            except asyncio.TimeoutError:
+                self._task.cancel()
+
+        logger.info("Modbus write scheduler stopped")
+
+    def submit(self, address: int, value: int, on_done: Optional[Callable[[bool], None]] = None):
+        """
+        Queue a register write (non-blocking, latest value wins).
+
+        Args:
+            address: Register address
+            value: Register value (0-65535)
+            on_done: Called with True/False once the value (or a newer one
+                     for the same register) was written or failed
+        """
+        callbacks = []
+        if address in self._pending:
+            self._stats['superseded'] += 1
+            # Keeps its place in the submission order
+            callbacks = self._pending[address][2]
+        if on_done is not None:
+            callbacks.append(on_done)
+
+        self._pending[address] = (int(value) & 0xFFFF, time.perf_counter(), callbacks)
+        self._stats['submitted'] += 1
+        self._idle.clear()
+        self._wakeup.set()
+
+    def submit_many(self, writes: Dict[int, int]):
+        """
+        Queue several register writes at once.
+
+        Args:
+            writes: Mapping of register address -> value
+        """
+        for address, value in writes.items():
+            self.submit(address, value)
+
+    async def flush(self):
+        """Wait until all pending writes have been sent."""
+        await self._idle.wait()
+
+    async def _run(self):
+        """Scheduler loop: wait for work, pace, send, repeat."""
+        while self._running:
+            try:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+
+                while self._pending and self._running:
+                    # Pace transactions (no sleep in the caller's cycle)
+                    wait = self._last_write_end + self.min_write_interval - time.perf_counter()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+
+                    address, values, submit_times, callbacks = self._take_next_run()
+                    try:
+                        success = await self._send(address, values, submit_times)
+                    except Exception:
+                        self._notify(callbacks, False)
+                        raise
+                    self._notify(callbacks, success)
+
+                if not self._pending:
+                    self._idle.set()
+
+            except asyncio.CancelledError:
+                break
+
+            except Exception as e:
+                logger.error(f"Write scheduler error: {e}", exc_info=True)
+                await asyncio.sleep(self.min_write_interval)
+
+        self._idle.set()
+
+    def _take_next_run(self) -> Tuple[int, List[int], List[float], List[Callable[[bool], None]]]:
+        """
+        Pop the next transaction from the pending map.
+
+        Takes the oldest pending register; with FC16 enabled, pending
+        registers directly above it are taken together.
+
+        Returns:
+            Tuple of (start address, values, submit times, result callbacks)
+        """
+        address = next(iter(self._pending))
+        value, submitted, callbacks = self._pending.pop(address)
+        values = [value]
+        submit_times = [submitted]
+        callbacks = list(callbacks)
+
+        if self.multi_register_writes:
+            next_address = address + 1
+            while next_address in self._pending and len(values) < 123:  # FC16 limit
+                value, submitted, more_callbacks = self._pending.pop(next_address)
+                values.append(value)
+                submit_times.append(submitted)
+                callbacks.extend(more_callbacks)
+                next_address += 1
+
+        return address, values, submit_times, callbacks
+
+    @staticmethod
+    def _notify(callbacks: List[Callable[[bool], None]], success: bool):
+        """Report a write result to the submitters."""
+        for callback in callbacks:
+            try:
+                callback(success)
+            except Exception as e:
+                logger.error(f"Write result callback failed: {e}", exc_info=True)
+
+    async def _send(self, address: int, values: List[int], submit_times: List[float]) -> bool:
+        """
+        Send one write transaction and record metrics.
+
+        Args:
+            address: Start register address
+            values: Register values
+            submit_times: perf_counter() timestamps when each value was submitted
+
+        Returns:
+            True if the PLC accepted the write
+        """
+        start = time.perf_counter()
+
+        if len(values) > 1:
+            success = await self.modbus.write_registers(address, values)
+            self._stats['multi_register_transactions'] += 1
+        else:
+            success = await self.modbus.write_register(address, values[0])
+
+        end = time.perf_counter()
+        self._last_write_end = end
+
+        latency = end - start
+        self._stats['transactions'] += 1
+        self._last_latency = latency
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+        self._max_queue_delay = max(self._max_queue_delay, start - min(submit_times))
+
+        if success:
+            self._stats['registers_written'] += len(values)
+            logger.debug(f"Scheduled write ok: {address} <- {values} ({latency * 1000:.1f}ms)")
+        else:
+            self._stats['failures'] += 1
+            logger.error(f"Scheduled write failed: {address} <- {values}")
+        return bool(success)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics (latencies in milliseconds)."""
+        transactions = self._stats['transactions']
+        avg = self._total_latency / transactions if transactions else None
+        return {
+            **self._stats,
+            'is_running': self._running,
+            'queue_depth': len(self._pending),
+            'last_write_latency_ms': self._last_latency * 1000 if self._last_latency is not None else None,
+            'avg_write_latency_ms': avg * 1000 if avg is not None else None,
+            'max_write_latency_ms': self._max_latency * 1000,
+            'max_queue_delay_ms': self._max_queue_delay * 1000,
+        }
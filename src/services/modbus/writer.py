@@ -8,12 +8,19 @@ Writing format (from old project utils/helpers.py):
 IMPORTANT: Each speed is written INDEPENDENTLY (matching old project).
 If a speed is None, it is NOT written. This prevents oscillation caused by
 writing stale values when only one speed's threshold was exceeded.
+
+When a ModbusWriteScheduler is attached, write_speeds() only queues the
+values (latest value wins) and returns immediately; the scheduler task
+owns pacing and the actual PLC transactions, in the same order (cutting
+speed first). The PLC result arrives later through on_written and the
+writer's get_stats().
 """
 
 import asyncio
 import logging
-from typing import Optional
+from typing import Callable, Optional
 from ...domain.validators import validate_speed
+from .write_scheduler import ModbusWriteScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -25,23 +32,38 @@ class ModbusWriter:
     KESME_HIZI_TARGET_ADDRESS = 2066
     INME_HIZI_TARGET_ADDRESS = 2041
 
-    def __init__(self, modbus_client, register_map: dict, speed_limits: dict):
+    def __init__(
+        self,
+        modbus_client,
+        register_map: dict,
+        speed_limits: dict,
+        scheduler: Optional[ModbusWriteScheduler] = None
+    ):
         """
         Initialize writer.
 
         Args:
-            modbus_client: AsyncModbusService instance
+            modbus_client: AsyncModbusService or ModbusTransactionManager
             register_map: Register address mapping (not used, kept for compatibility)
             speed_limits: Speed limit configuration
+            scheduler: ModbusWriteScheduler for non-blocking writes (optional)
         """
         self.modbus = modbus_client
         self.regs = register_map
         self.limits = speed_limits
+        self.scheduler = scheduler
+
+        # PLC results of speed commands (both paths)
+        self._stats = {
+            'commands_written': 0,
+            'commands_failed': 0,
+        }
 
     async def write_speeds(
         self,
         kesme_hizi: Optional[float],
-        inme_hizi: Optional[float]
+        inme_hizi: Optional[float],
+        on_written: Optional[Callable[[bool], None]] = None
     ) -> bool:
         """
         Write cutting and/or descent speeds to Modbus.
@@ -56,10 +78,26 @@ class ModbusWriter:
         Args:
             kesme_hizi: Cutting speed (mm/min), or None to skip
             inme_hizi: Descent speed (mm/min), or None to skip
+            on_written: Called once with True if every attempted write reached
+                        the PLC (with a scheduler: after the queued writes ran)
 
         Returns:
-            True if all attempted writes successful
+            True if all attempted writes successful (or queued, with scheduler)
         """
+        if self.scheduler is not None:
+            return self._queue_speeds(kesme_hizi, inme_hizi, on_written)
+
+        success = await self._write_speeds_direct(kesme_hizi, inme_hizi)
+        self._record_result(success, on_written)
+        return success
+
+    async def _write_speeds_direct(
+        self,
+        kesme_hizi: Optional[float],
+        inme_hizi: Optional[float]
+    ) -> bool:
+        """Write speeds inline (no scheduler); see write_speeds()."""
+
         try:
             success = True
 
@@ -110,3 +148,84 @@ class ModbusWriter:
         except Exception as e:
             logger.error(f"Error writing speeds: {e}", exc_info=True)
             return False
+
+    def _queue_speeds(
+        self,
+        kesme_hizi: Optional[float],
+        inme_hizi: Optional[float],
+        on_written: Optional[Callable[[bool], None]] = None
+    ) -> bool:
+        """
+        Validate speeds and hand them to the write scheduler (non-blocking).
+
+        Args:
+            kesme_hizi: Cutting speed (mm/min), or None to skip
+            inme_hizi: Descent speed (mm/min), or None to skip
+            on_written: Called once with the combined PLC result
+
+        Returns:
+            True if queued successfully
+        """
+        try:
+            writes = []     # Submission order = PLC write order (cutting speed first)
+            if kesme_hizi is not None:
+                kesme_hizi = validate_speed(
+                    kesme_hizi,
+                    self.limits['kesme_hizi']['min'],
+                    self.limits['kesme_hizi']['max'],
+                    'kesme_hizi'
+                )
+                writes.append((self.KESME_HIZI_TARGET_ADDRESS, int(kesme_hizi)))
+
+            if inme_hizi is not None:
+                inme_hizi = validate_speed(
+                    inme_hizi,
+                    self.limits['inme_hizi']['min'],
+                    self.limits['inme_hizi']['max'],
+                    'inme_hizi'
+                )
+                writes.append((self.INME_HIZI_TARGET_ADDRESS, int(inme_hizi * 100)))
+
+        except Exception as e:
+            logger.error(f"Error queueing speeds: {e}", exc_info=True)
+            self._record_result(False, on_written)
+            return False
+
+        on_done = self._join_results(len(writes), on_written)
+        for address, value in writes:
+            self.scheduler.submit(address, value, on_done)
+        return True
+
+    def _join_results(self, count: int, on_written: Optional[Callable[[bool], None]]) -> Callable[[bool], None]:
+        """Per-register scheduler callback reporting once all `count` writes are done."""
+        remaining = [count]
+        failed = [False]
+
+        def on_done(success: bool):
+            failed[0] = failed[0] or not success
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                self._record_result(not failed[0], on_written)
+
+        if count == 0:
+            self._record_result(True, on_written)
+        return on_done
+
+    def _record_result(self, success: bool, on_written: Optional[Callable[[bool], None]]):
+        """Count a speed command's PLC result and report it to the caller."""
+        self._stats['commands_written' if success else 'commands_failed'] += 1
+        if on_written is not None:
+            on_written(success)
+
+    def get_stats(self) -> dict:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with speed command results and write scheduler stats
+            (queue depth, write latency)
+        """
+        return {
+            **self._stats,
+            'scheduler': self.scheduler.get_stats() if self.scheduler is not None else None,
+        }
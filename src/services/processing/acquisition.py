@@ -0,0 +1,293 @@
+"""
+High-rate acquisition decoupled from the control rate.
+
+By default DataProcessingPipeline reads, decides and persists in one loop at
+processing.rate_hz (10 Hz), so torque/current/vibration spikes shorter than
+one cycle are never seen. With processing.acquisition.enabled, an
+AcquisitionLoop task polls the sensor block at its own rate (25-50 Hz) into
+a ring buffer, and each control cycle consumes the samples acquired since
+the previous one:
+
+- Reads: only the 44-register sensor block, as a single FC03 request per
+  tick (ModbusReader.read_sensor_block). The target speed registers only
+  change when we write them, so the control cycle refreshes them once per
+  cycle (ModbusReader.refresh_targets).
+- Anomaly detection runs on every acquired sample.
+- Control, GUI, IoT and total.db get one sample per control cycle, built
+  by the configured window mode:
+    latest - the newest sample (decimation)
+    peak   - the newest sample with peak_fields replaced by their
+             largest-magnitude value in the window (aggregation), so short
+             spikes reach Torque Guard and the persisted row
+- raw.db stores the control sample ('decimate') or every acquired sample
+  ('all').
+
+The achieved acquisition rate is reported in get_stats() next to the
+scheduler lateness.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from itertools import islice
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from .scheduler import DeadlineScheduler
+
+logger = logging.getLogger(__name__)
+
+WINDOW_MODES = ('latest', 'peak')
+RAW_PERSIST_MODES = ('decimate', 'all')
+
+# Fields where sub-cycle spikes matter (RawSensorData attribute names)
+DEFAULT_PEAK_FIELDS = (
+    'serit_motor_akim_a',
+    'serit_motor_tork_percentage',
+    'inme_motor_akim_a',
+    'inme_motor_tork_percentage',
+    'serit_sapmasi',
+    'ivme_olcer_x',
+    'ivme_olcer_y',
+    'ivme_olcer_z',
+    'ivme_olcer_x_hz',
+    'ivme_olcer_y_hz',
+    'ivme_olcer_z_hz',
+    'max_titresim_hz',
+)
+
+
+@dataclass
+class AcquiredSample:
+    """One high-rate sample: decoded values plus the raw sensor registers."""
+    seq: int
+    raw_data: object          # RawSensorData
+    raw_registers: list
+    monotonic: float
+
+
+class SampleRingBuffer:
+    """
+    Bounded buffer of acquired samples with sequence numbers.
+
+    Single writer (acquisition task), single reader (control loop), both on
+    the event loop. Samples overwritten before being read are counted as
+    dropped.
+    """
+
+    def __init__(self, size: int = 3000):
+        """
+        Initialize buffer.
+
+        Args:
+            size: Maximum samples kept
+        """
+        self._samples: Deque[AcquiredSample] = deque(maxlen=max(1, int(size)))
+        self._seq = 0
+        self.dropped = 0
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the newest sample (0 when empty)."""
+        return self._seq
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def append(self, raw_data, raw_registers: list, monotonic: float) -> AcquiredSample:
+        """Add a sample and return it."""
+        self._seq += 1
+        sample = AcquiredSample(self._seq, raw_data, raw_registers, monotonic)
+        self._samples.append(sample)
+        return sample
+
+    def read_since(self, seq: int) -> List[AcquiredSample]:
+        """
+        Samples newer than `seq`, oldest first.
+
+        Args:
+            seq: Last sequence number the caller has seen
+
+        Returns:
+            List of samples (may be empty)
+        """
+        new = self._seq - seq
+        if new <= 0:
+            return []
+        available = min(new, len(self._samples))
+        if new > available:
+            self.dropped += new - available
+        window = list(islice(reversed(self._samples), available))
+        window.reverse()
+        return window
+
+    def latest(self) -> Optional[AcquiredSample]:
+        """Newest sample or None."""
+        return self._samples[-1] if self._samples else None
+
+
+def aggregate_window(samples: Sequence[AcquiredSample], mode: str = 'peak',
+                     peak_fields: Sequence[str] = DEFAULT_PEAK_FIELDS):
+    """
+    Build the control-rate sample from a window of acquired samples.
+
+    Args:
+        samples: Window, oldest first (non-empty)
+        mode: 'latest' or 'peak' (see module docstring)
+        peak_fields: RawSensorData fields aggregated in 'peak' mode
+
+    Returns:
+        RawSensorData (the newest sample itself when nothing is aggregated)
+    """
+    latest = samples[-1].raw_data
+    if mode != 'peak' or len(samples) == 1:
+        return latest
+    peaks = {
+        name: max((getattr(s.raw_data, name) for s in samples), key=abs)
+        for name in peak_fields
+    }
+    return replace(latest, **peaks)
+
+
+class AcquisitionLoop:
+    """
+    Dedicated task polling the sensor block at the acquisition rate.
+
+    Uses the same ModbusReader (and AsyncModbusService) as the pipeline; the
+    control loop no longer reads the sensor block itself.
+    """
+
+    def __init__(self, modbus_reader, config: Optional[dict] = None):
+        """
+        Initialize acquisition loop.
+
+        Args:
+            modbus_reader: ModbusReader instance
+            config: processing.acquisition section (rate_hz, buffer_size,
+                    window, peak_fields, raw_persist, overrun_policy)
+
+        Raises:
+            ValueError: On an unknown window or raw_persist mode
+        """
+        config = config or {}
+        self.modbus_reader = modbus_reader
+        self.rate_hz = float(config.get('rate_hz', 50))
+        self.window_mode = config.get('window', 'peak')
+        self.raw_persist = config.get('raw_persist', 'decimate')
+        self.peak_fields: Tuple[str, ...] = tuple(config.get('peak_fields') or DEFAULT_PEAK_FIELDS)
+        if self.window_mode not in WINDOW_MODES:
+            raise ValueError(f"Unknown acquisition window mode '{self.window_mode}' (expected one of {WINDOW_MODES})")
+        if self.raw_persist not in RAW_PERSIST_MODES:
+            raise ValueError(f"Unknown raw_persist mode '{self.raw_persist}' (expected one of {RAW_PERSIST_MODES})")
+
+        self.buffer = SampleRingBuffer(config.get('buffer_size', 3000))
+        self.scheduler = DeadlineScheduler(
+            1.0 / self.rate_hz,
+            policy=config.get('overrun_policy', 'skip'),
+            name='acquisition'
+        )
+
+        # Achieved rate: acquisition times over the last rate_window seconds
+        self._rate_window = float(config.get('rate_window_seconds', 5.0))
+        self._times: Deque[float] = deque()
+
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+
+        self._stats = {
+            'samples': 0,
+            'read_errors': 0,
+        }
+
+        logger.info(
+            f"AcquisitionLoop initialized: rate={self.rate_hz:.0f}Hz, "
+            f"window={self.window_mode}, raw_persist={self.raw_persist}"
+        )
+
+    async def start(self):
+        """Start the acquisition task."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._acquisition_loop())
+
+    async def stop(self, timeout: float = 2.0):
+        """
+        Stop the acquisition task.
+
+        Args:
+            timeout: Maximum time to wait for the current read
+        """
+        if not self._running:
+            return
+        self._running = False
+        if self._task:
+            try:
+                await asyncio.wait_for(self._task, timeout=timeout)
+            except asyncio.TimeoutError:
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+
+    async def _acquisition_loop(self):
+        """Poll the sensor block on the acquisition deadline grid."""
+        logger.info(f"Acquisition loop started ({self.rate_hz:.0f} Hz)")
+        # Seed the target speeds decoded into every sample (then refreshed per control cycle)
+        await self.modbus_reader.refresh_targets()
+        self.scheduler.reset()
+
+        while self._running:
+            try:
+                await self.scheduler.wait()
+                if not self._running:
+                    break
+
+                raw_data = await self.modbus_reader.read_sensor_block()
+                if raw_data is None:
+                    self._stats['read_errors'] += 1
+                    continue
+
+                now = time.monotonic()
+                self.buffer.append(raw_data, self.modbus_reader.get_last_raw_registers(), now)
+                self._stats['samples'] += 1
+                self._times.append(now)
+                while self._times and now - self._times[0] > self._rate_window:
+                    self._times.popleft()
+
+            except asyncio.CancelledError:
+                break
+
+            except Exception as e:
+                logger.error(f"Error in acquisition loop: {e}", exc_info=True)
+                self._stats['read_errors'] += 1
+
+        logger.info("Acquisition loop ended")
+
+    def achieved_rate_hz(self) -> Optional[float]:
+        """Samples per second over the recent rate window (None before 2 samples)."""
+        if len(self._times) < 2:
+            return None
+        span = self._times[-1] - self._times[0]
+        return (len(self._times) - 1) / span if span > 0 else None
+
+    def get_stats(self) -> dict:
+        """
+        Get acquisition statistics.
+
+        Returns:
+            Dictionary with target/achieved rate, sample and error counters,
+            ring buffer fill/drops and scheduler lateness
+        """
+        return {
+            **self._stats,
+            'target_rate_hz': self.rate_hz,
+            'achieved_rate_hz': self.achieved_rate_hz(),
+            'buffered': len(self.buffer),
+            'dropped': self.buffer.dropped,
+            'window': self.window_mode,
+            'raw_persist': self.raw_persist,
+            'scheduler': self.scheduler.get_stats(),
+        }
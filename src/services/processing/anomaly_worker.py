@@ -0,0 +1,280 @@
+"""
+Anomaly detection worker - runs the anomaly stage off the asyncio event loop.
+
+The processing loop hands each sample to AnomalyWorker.submit(), which never
+blocks: samples go into a bounded single-producer/single-consumer queue and
+a dedicated thread runs AnomalyManager + AnomalyTracker on them. Results are
+published as a snapshot that the loop reads with latest_results(), so
+ProcessedData.anomalies reflects the most recent completed sample (usually
+the previous cycle) and the control path never waits on detection.
+
+Modes:
+- every_sample: every sample is evaluated in order; when the queue is full
+  the new sample is dropped (counted in 'dropped')
+- latest_only: only the newest pending sample is kept; an unprocessed
+  sample replaced by a newer one is counted in 'superseded'
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Sequence
+
+from ...anomaly.manager import SENSOR_COLUMNS, SENSOR_DATA_KEYS
+
+logger = logging.getLogger(__name__)
+
+# Anomaly result key (e.g. 'SeritAkim') -> index in SENSOR_DATA_KEYS
+SENSOR_RESULT_INDEX = {key: i for i, (key, _, _) in enumerate(SENSOR_COLUMNS)}
+
+MODE_EVERY_SAMPLE = 'every_sample'
+MODE_LATEST_ONLY = 'latest_only'
+WORKER_MODES = (MODE_EVERY_SAMPLE, MODE_LATEST_ONLY)
+
+
+@dataclass
+class AnomalySample:
+    """One sample for the anomaly stage (values in SENSOR_DATA_KEYS order)."""
+    values: Sequence[float]
+    is_cutting: bool
+    kesim_id: Optional[int] = None
+    kafa_yuksekligi: Optional[float] = None
+    makine_id: Optional[int] = None
+    serit_id: Optional[int] = None
+    malzeme_cinsi: Optional[str] = None
+    seq: int = 0
+    submitted_at: float = field(default=0.0, repr=False)
+
+
+def run_anomaly_detection(anomaly_manager, anomaly_tracker, sample: AnomalySample) -> Dict[str, bool]:
+    """
+    Run detection for one sample and record detected anomalies.
+
+    Used inline by the pipeline when the worker is disabled and by the
+    worker thread otherwise.
+
+    Args:
+        anomaly_manager: AnomalyManager instance
+        anomaly_tracker: AnomalyTracker instance
+        sample: Sample to evaluate
+
+    Returns:
+        Anomaly results keyed by result key (e.g. 'SeritAkim')
+    """
+    if anomaly_manager.batch_mode:
+        results = anomaly_manager.process_values(sample.values, sample.is_cutting)
+    else:
+        data = dict(zip(SENSOR_DATA_KEYS, sample.values))
+        results = anomaly_manager.process_data(data, sample.is_cutting)
+
+    # Record anomalies to tracker (for persistence and GUI display)
+    for sensor_name, is_anomaly in results.items():
+        if is_anomaly:
+            index = SENSOR_RESULT_INDEX.get(sensor_name)
+            anomaly_tracker.record_anomaly(
+                sensor_name=sensor_name,
+                sensor_value=sample.values[index] if index is not None else 0.0,
+                detection_method=anomaly_manager.get_method_for_sensor(sensor_name),
+                kesim_id=sample.kesim_id,
+                kafa_yuksekligi=sample.kafa_yuksekligi,
+                makine_id=sample.makine_id,
+                serit_id=sample.serit_id,
+                malzeme_cinsi=sample.malzeme_cinsi
+            )
+
+    return results
+
+
+class AnomalyWorker:
+    """
+    Dedicated thread for anomaly detection fed by a bounded queue.
+
+    The pipeline coroutine is the only producer and the worker thread the
+    only consumer. submit() and latest_results() take a short lock and
+    never wait on detection.
+    """
+
+    def __init__(
+        self,
+        anomaly_manager,
+        anomaly_tracker,
+        mode: str = MODE_EVERY_SAMPLE,
+        queue_size: int = 50
+    ):
+        """
+        Initialize anomaly worker.
+
+        Args:
+            anomaly_manager: AnomalyManager instance
+            anomaly_tracker: AnomalyTracker instance
+            mode: 'every_sample' or 'latest_only'
+            queue_size: Maximum pending samples in every_sample mode
+        """
+        if mode not in WORKER_MODES:
+            raise ValueError(f"Unknown anomaly worker mode: {mode} (expected one of {WORKER_MODES})")
+        if queue_size < 1:
+            raise ValueError("Anomaly worker queue_size must be >= 1")
+
+        self.anomaly_manager = anomaly_manager
+        self.anomaly_tracker = anomaly_tracker
+        self.mode = mode
+        self.queue_size = 1 if mode == MODE_LATEST_ONLY else int(queue_size)
+
+        self._queue: Deque[AnomalySample] = deque()
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Published results (replaced, never mutated)
+        self._results: Dict[str, bool] = {}
+        self._results_seq = 0
+
+        # Statistics (guarded by _cond)
+        self._submitted_seq = 0
+        self._stats = {
+            'submitted': 0,
+            'processed': 0,
+            'dropped': 0,
+            'superseded': 0,
+            'errors': 0,
+            'max_queue_depth': 0
+        }
+        self._delay_total = 0.0
+        self._delay_last = 0.0
+        self._delay_max = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """True while the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the worker thread."""
+        if self.is_running:
+            return
+
+        with self._cond:
+            self._stopping = False
+        self._thread = threading.Thread(
+            target=self._worker_loop,
+            name="AnomalyWorker",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Anomaly worker started: mode={self.mode}, queue_size={self.queue_size}")
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Stop the worker thread after it drains pending samples.
+
+        Args:
+            timeout: Maximum time to wait for the thread
+        """
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning("Anomaly worker did not stop within timeout")
+
+        logger.info(f"Anomaly worker stopped: {self.get_stats()}")
+
+    def submit(self, sample: AnomalySample) -> bool:
+        """
+        Queue a sample for detection (non-blocking).
+
+        Args:
+            sample: Sample to evaluate; seq and submitted_at are assigned here
+
+        Returns:
+            False if the sample was dropped because the queue is full
+        """
+        with self._cond:
+            self._submitted_seq += 1
+            sample.seq = self._submitted_seq
+            sample.submitted_at = time.perf_counter()
+            self._stats['submitted'] += 1
+
+            if self.mode == MODE_LATEST_ONLY:
+                if self._queue:
+                    self._queue.clear()
+                    self._stats['superseded'] += 1
+            elif len(self._queue) >= self.queue_size:
+                self._stats['dropped'] += 1
+                return False
+
+            self._queue.append(sample)
+            depth = len(self._queue)
+            if depth > self._stats['max_queue_depth']:
+                self._stats['max_queue_depth'] = depth
+            self._cond.notify()
+            return True
+
+    def latest_results(self) -> Dict[str, bool]:
+        """
+        Results of the most recently processed sample.
+
+        Returns:
+            Anomaly results (empty until the first sample is processed).
+            The dict is replaced on each update; callers must not modify it.
+        """
+        return self._results
+
+    @property
+    def results_seq(self) -> int:
+        """Sequence number of the sample behind latest_results() (0 = none)."""
+        return self._results_seq
+
+    def _worker_loop(self):
+        """Consume samples until stopped and the queue is drained."""
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                sample = self._queue.popleft()
+
+            try:
+                results = run_anomaly_detection(self.anomaly_manager, self.anomaly_tracker, sample)
+            except Exception as e:
+                logger.error(f"Anomaly detection error: {e}", exc_info=True)
+                with self._cond:
+                    self._stats['errors'] += 1
+                continue
+
+            delay = time.perf_counter() - sample.submitted_at
+            with self._cond:
+                self._results = results
+                self._results_seq = sample.seq
+                self._stats['processed'] += 1
+                self._delay_total += delay
+                self._delay_last = delay
+                if delay > self._delay_max:
+                    self._delay_max = delay
+
+    def get_stats(self) -> dict:
+        """
+        Get worker statistics.
+
+        Returns:
+            Dictionary with counters, queue depth and submit-to-result delay.
+            lag_samples is how many submitted samples the published results
+            are behind (dropped/superseded samples included).
+        """
+        with self._cond:
+            processed = self._stats['processed']
+            return {
+                **self._stats,
+                'mode': self.mode,
+                'is_running': self.is_running,
+                'queue_depth': len(self._queue),
+                'lag_samples': self._submitted_seq - self._results_seq,
+                'last_delay_ms': round(self._delay_last * 1000, 3),
+                'avg_delay_ms': round(self._delay_total / processed * 1000, 3) if processed else 0.0,
+                'max_delay_ms': round(self._delay_max * 1000, 3)
+            }
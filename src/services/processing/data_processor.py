@@ -5,6 +5,7 @@ Main data processing pipeline - orchestrates entire data flow.
 import asyncio
 import logging
 import json
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -12,6 +13,14 @@ from ...domain.models import ProcessedData
 from .cutting_tracker import CuttingTracker
 from .anomaly_tracker import AnomalyTracker
 from ...anomaly.manager import AnomalyManager
+from .anomaly_worker import AnomalySample, AnomalyWorker, run_anomaly_detection
+from ..database.schemas import RAW_REGISTER_COLUMNS, SENSOR_DATA_COLUMNS
+from ..database.raw_store import CompactRawWriter
+from ..database.partitions import SensorDataPartitions
+from .latency import PipelineLatency
+from .scheduler import DeadlineScheduler
+from .acquisition import AcquisitionLoop, aggregate_window
+from .snapshot import LatestSnapshot, SnapshotPublisher
 
 logger = logging.getLogger(__name__)
 
@@ -77,31 +86,97 @@ class DataProcessingPipeline:
         anomaly_config = config.get('anomaly_detection', {})
         self.anomaly_manager = AnomalyManager(
             buffer_size=anomaly_config.get('window', 100),
-            min_samples=anomaly_config.get('min_samples', 10)
+            min_samples=anomaly_config.get('min_samples', 10),
+            batch_mode=anomaly_config.get('batch_mode', False),
+            sensor_methods={
+                name: sensor['method']
+                for name, sensor in (anomaly_config.get('sensors') or {}).items()
+                if sensor and sensor.get('method')
+            }
         )
 
+        # Optional worker thread so detection never runs on the event loop
+        worker_config = anomaly_config.get('worker') or {}
+        self.anomaly_worker: Optional[AnomalyWorker] = None
+        if worker_config.get('enabled', False):
+            self.anomaly_worker = AnomalyWorker(
+                self.anomaly_manager,
+                self.anomaly_tracker,
+                mode=worker_config.get('mode', 'every_sample'),
+                queue_size=worker_config.get('queue_size', 50)
+            )
+
+        # Raw storage mode: 'columns' (one row per sample) or 'compact' (packed chunks)
+        sqlite_config = config.get('database', {}).get('sqlite', {})
+        self.raw_storage = sqlite_config.get('raw_storage', 'columns')
+        self.compact_raw_writer: Optional[CompactRawWriter] = None
+        if self.raw_storage == 'compact' and db_services.get('raw') is not None:
+            self.compact_raw_writer = CompactRawWriter(
+                db_services['raw'],
+                chunk_samples=sqlite_config.get('compact_chunk_samples', 10),
+                compress=sqlite_config.get('compact_compression', True)
+            )
+
+        # total.db sensor_data mode: 'legacy' (single table) or 'partitioned' (daily tables)
+        self.total_storage = sqlite_config.get('total_storage', 'legacy')
+        self.sensor_partitions: Optional[SensorDataPartitions] = None
+        if self.total_storage == 'partitioned' and db_services.get('total') is not None:
+            self.sensor_partitions = SensorDataPartitions(
+                db_services['total'],
+                retention_days=sqlite_config.get('total_retention_days', 0)
+            )
+
         # Processing loop control
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
         # Target processing rate
-        self.target_interval = 1.0 / config.get('processing', {}).get('rate_hz', 10)
+        processing_config = config.get('processing', {})
+        self.target_interval = 1.0 / processing_config.get('rate_hz', 10)
+
+        # Absolute-deadline cycle timing (no drift, lateness/jitter stats)
+        self.scheduler = DeadlineScheduler(
+            self.target_interval,
+            policy=processing_config.get('overrun_policy', 'skip'),
+            max_catch_up=processing_config.get('max_catch_up', 10),
+            name='pipeline'
+        )
+
+        # Per-stage latency histograms (read/decode are timed inside the reader)
+        latency_config = processing_config.get('latency', {})
+        self.latency = PipelineLatency(
+            window_seconds=latency_config.get('window_seconds', 60.0),
+            slots=latency_config.get('slots', 6)
+        )
+        self.latency_dump_path = latency_config.get('dump_path', 'logs/pipeline_latency.json')
+        self.modbus_reader.latency = self.latency
+
+        # Optional high-rate acquisition (sensor block polled faster than rate_hz)
+        acquisition_config = processing_config.get('acquisition') or {}
+        self.acquisition: Optional[AcquisitionLoop] = None
+        if acquisition_config.get('enabled', False):
+            self.acquisition = AcquisitionLoop(modbus_reader, acquisition_config)
+        self._acquired_seq = 0
 
         # Statistics
         self._stats = {
             'cycles': 0,
             'errors': 0,
-            'speed_commands_sent': 0,
+            'speed_commands_sent': 0,     # Confirmed by the PLC
+            'speed_commands_failed': 0,
             'db_writes': 0,
-            'mqtt_queued': 0
+            'mqtt_queued': 0,
+            'last_cycle_ms': 0.0,
+            'max_cycle_ms': 0.0,
+            'overruns': 0
         }
 
-        # Latest data for GUI
-        self._last_processed_data = None
-
         # Store last processed data for GUI access
         self._last_processed_data: Optional[ProcessedData] = None
 
+        # Versioned flattened snapshot for GUI pollers (built once per cycle)
+        self._snapshots = SnapshotPublisher(config.get('modbus', {}).get('host', ''))
+
         logger.info(
             f"DataProcessingPipeline initialized: "
             f"target_rate={1.0/self.target_interval:.1f}Hz"
@@ -116,6 +191,10 @@ class DataProcessingPipeline:
             return
 
         self._running = True
+        if self.anomaly_worker is not None:
+            self.anomaly_worker.start()
+        if self.acquisition is not None:
+            await self.acquisition.start()
         self._task = asyncio.create_task(self._processing_loop())
 
         logger.info("Data processing pipeline started")
@@ -140,6 +219,17 @@ class DataProcessingPipeline:
                 logger.warning("Pipeline stop timeout - cancelling task")
                 self._task.cancel()
 
+        if self.acquisition is not None:
+            await self.acquisition.stop()
+
+        # Drain queued anomaly samples without blocking the event loop
+        if self.anomaly_worker is not None:
+            await asyncio.to_thread(self.anomaly_worker.stop)
+
+        # Write partially filled compact raw chunk
+        if self.compact_raw_writer is not None:
+            self.compact_raw_writer.flush()
+
         logger.info("Data processing pipeline stopped")
 
     async def _processing_loop(self):
@@ -150,12 +240,29 @@ class DataProcessingPipeline:
         """
         logger.info("Processing loop started")
 
-        while self._running:
-            cycle_start = asyncio.get_event_loop().time()
+        latency = self.latency
+        perf_ns = time.perf_counter_ns
+
+        self.scheduler.reset()
 
+        while self._running:
             try:
-                # 1. Read from Modbus
-                raw_data = await self.modbus_reader.read_all_sensors()
+                # Sleep until this cycle's deadline (fixed grid, see scheduler.py)
+                await self.scheduler.wait()
+                if not self._running:
+                    break
+                cycle_start_ns = perf_ns()
+
+                # 1. Read from Modbus (or take the window from the acquisition buffer)
+                window = None
+                if self.acquisition is not None:
+                    window = await self._read_acquired_window()
+                    raw_data = (
+                        aggregate_window(window, self.acquisition.window_mode, self.acquisition.peak_fields)
+                        if window else None
+                    )
+                else:
+                    raw_data = await self.modbus_reader.read_all_sensors()
                 if raw_data is None:
                     # Modbus read failed (PLC disconnected or error)
                     self._stats['errors'] += 1
@@ -167,14 +274,15 @@ class DataProcessingPipeline:
                             "Waiting for PLC connection..."
                         )
 
-                    await asyncio.sleep(self.target_interval)
                     continue
 
                 # 2. Process raw data
-                processed_data = self._process_raw_data(raw_data)
+                stage_ns = perf_ns()
+                processed_data = self._process_raw_data(raw_data, window)
 
                 # Store for GUI access
                 self._last_processed_data = processed_data
+                self._snapshots.publish(processed_data)
 
                 # Write camera-relevant fields to CameraResultsStore (per D-02, D-05)
                 if self.camera_results_store is not None:
@@ -189,26 +297,36 @@ class DataProcessingPipeline:
                     except Exception as e:
                         logger.warning(f"CameraResultsStore update failed: {e}")
 
+                now_ns = perf_ns()
+                latency.record('anomaly', now_ns - stage_ns, now_ns)
+                stage_ns = now_ns
+
                 # 3. Control logic (ML or Manual)
                 command = await self.control_manager.process_data(processed_data)
 
-                # 4. Write speeds to Modbus
+                now_ns = perf_ns()
+                latency.record('control', now_ns - stage_ns, now_ns)
+                stage_ns = now_ns
+
+                # 4. Write speeds to Modbus (queued to the write scheduler when enabled;
+                # the PLC result is reported to _on_speeds_written once known)
                 if command:
-                    success = await self.modbus_writer.write_speeds(
+                    await self.modbus_writer.write_speeds(
                         command.kesme_hizi_target,
-                        command.inme_hizi_target
+                        command.inme_hizi_target,
+                        on_written=lambda success, command=command: self._on_speeds_written(command, success)
                     )
 
-                    if success:
-                        self._stats['speed_commands_sent'] += 1
-                        kesme_str = f"{command.kesme_hizi_target:.1f}" if command.kesme_hizi_target is not None else "None"
-                        inme_str = f"{command.inme_hizi_target:.1f}" if command.inme_hizi_target is not None else "None"
-                        logger.debug(f"Speeds written: kesme={kesme_str}, inme={inme_str}")
-                    else:
-                        logger.error("Failed to write speeds to Modbus")
+                    now_ns = perf_ns()
+                    latency.record('write', now_ns - stage_ns, now_ns)
+                    stage_ns = now_ns
 
                 # 5. Save to databases
-                self._save_to_databases(raw_data, processed_data, command)
+                self._save_to_databases(raw_data, processed_data, command, window)
+
+                now_ns = perf_ns()
+                latency.record('db_enqueue', now_ns - stage_ns, now_ns)
+                stage_ns = now_ns
 
                 # 6. Queue for IoT (MQTT or HTTP)
                 if self.iot_service:
@@ -229,19 +347,23 @@ class DataProcessingPipeline:
                     await self.iot_service.queue_telemetry(processed_data, vision_data=vision_data)
                     self._stats['mqtt_queued'] += 1
 
+                    now_ns = perf_ns()
+                    latency.record('iot_enqueue', now_ns - stage_ns, now_ns)
+
                 # Update statistics
                 self._stats['cycles'] += 1
+                now_ns = perf_ns()
+                latency.record('cycle', now_ns - cycle_start_ns, now_ns)
 
-                # Rate limiting
-                cycle_duration = asyncio.get_event_loop().time() - cycle_start
-                sleep_time = max(0, self.target_interval - cycle_duration)
+                cycle_ms = (now_ns - cycle_start_ns) / 1e6
+                self._stats['last_cycle_ms'] = cycle_ms
+                self._stats['max_cycle_ms'] = max(self._stats['max_cycle_ms'], cycle_ms)
 
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                else:
+                if cycle_ms > self.target_interval * 1000:
+                    self._stats['overruns'] += 1
                     logger.warning(
                         f"Processing cycle exceeded target interval: "
-                        f"{cycle_duration*1000:.1f}ms > {self.target_interval*1000:.1f}ms"
+                        f"{cycle_ms:.1f}ms > {self.target_interval*1000:.1f}ms"
                     )
 
             except asyncio.CancelledError:
@@ -251,16 +373,32 @@ class DataProcessingPipeline:
             except Exception as e:
                 logger.error(f"Error in processing loop: {e}", exc_info=True)
                 self._stats['errors'] += 1
-                await asyncio.sleep(self.target_interval)
 
         logger.info("Processing loop ended")
 
-    def _process_raw_data(self, raw_data) -> ProcessedData:
+    async def _read_acquired_window(self) -> list:
+        """
+        Samples acquired since the previous control cycle (high-rate mode).
+
+        Also refreshes the target speed registers decoded into new samples.
+
+        Returns:
+            List of AcquiredSample, oldest first (empty if nothing new)
+        """
+        await self.modbus_reader.refresh_targets()
+        window = self.acquisition.buffer.read_since(self._acquired_seq)
+        if window:
+            self._acquired_seq = window[-1].seq
+        return window
+
+    def _process_raw_data(self, raw_data, window: Optional[list] = None) -> ProcessedData:
         """
         Process raw sensor data into ProcessedData.
 
         Args:
             raw_data: RawSensorData from Modbus
+            window: High-rate mode: acquired samples behind raw_data; anomaly
+                    detection runs on each of them
 
         Returns:
             ProcessedData with anomalies and session info
@@ -278,49 +416,13 @@ class DataProcessingPipeline:
         is_cutting = (raw_data.testere_durumu == 3)
 
         # Detect anomalies using advanced manager
-        # Convert raw_data to dict for manager
-        raw_data_dict = {
-            'serit_sapmasi': raw_data.serit_sapmasi,
-            'serit_motor_akim_a': raw_data.serit_motor_akim_a,
-            'serit_motor_tork_percentage': raw_data.serit_motor_tork_percentage,
-            'serit_kesme_hizi': raw_data.serit_kesme_hizi,
-            'serit_inme_hizi': raw_data.serit_inme_hizi,
-            'ivme_olcer_x_hz': raw_data.ivme_olcer_x_hz,
-            'ivme_olcer_y_hz': raw_data.ivme_olcer_y_hz,
-            'ivme_olcer_z_hz': raw_data.ivme_olcer_z_hz,
-            'serit_gerginligi_bar': raw_data.serit_gerginligi_bar,
-        }
-        anomaly_results = self.anomaly_manager.process_data(raw_data_dict, is_cutting)
-
-        # Mapping from GUI keys to data keys (for sensor value lookup)
-        gui_to_data_key = {
-            'SeritSapmasi': 'serit_sapmasi',
-            'SeritAkim': 'serit_motor_akim_a',
-            'SeritTork': 'serit_motor_tork_percentage',
-            'KesmeHizi': 'serit_kesme_hizi',
-            'IlerlemeHizi': 'serit_inme_hizi',
-            'TitresimX': 'ivme_olcer_x_hz',
-            'TitresimY': 'ivme_olcer_y_hz',
-            'TitresimZ': 'ivme_olcer_z_hz',
-            'SeritGerginligi': 'serit_gerginligi_bar',
-        }
-
-        # Record anomalies to tracker (for persistence and GUI display)
-        for sensor_name, is_anomaly in anomaly_results.items():
-            if is_anomaly:
-                # Get correct data key for sensor value lookup
-                data_key = gui_to_data_key.get(sensor_name)
-                sensor_value = raw_data_dict.get(data_key, 0.0) if data_key else 0.0
-                self.anomaly_tracker.record_anomaly(
-                    sensor_name=sensor_name,
-                    sensor_value=sensor_value,
-                    detection_method=self.anomaly_manager.get_method_for_sensor(sensor_name),
-                    kesim_id=kesim_id,
-                    kafa_yuksekligi=raw_data.kafa_yuksekligi_mm,
-                    makine_id=raw_data.makine_id if raw_data.makine_id else None,
-                    serit_id=raw_data.serit_id if raw_data.serit_id else None,
-                    malzeme_cinsi=raw_data.malzeme_cinsi if raw_data.malzeme_cinsi else None
-                )
+        if window:
+            anomaly_results = {}
+            for acquired in window:
+                for key, is_anomaly in self._detect_anomalies(acquired.raw_data, kesim_id).items():
+                    anomaly_results[key] = anomaly_results.get(key, False) or is_anomaly
+        else:
+            anomaly_results = self._detect_anomalies(raw_data, kesim_id)
 
         # Convert anomaly results to list format for ProcessedData
         anomalies = [
@@ -346,7 +448,65 @@ class DataProcessingPipeline:
         # logger.info(f"ProcessedData: {processed_data}")
         return processed_data
 
-    def _save_to_databases(self, raw_data, processed_data, command):
+    def _detect_anomalies(self, raw_data, kesim_id) -> dict:
+        """
+        Run anomaly detection for one sample (inline or via the worker).
+
+        Args:
+            raw_data: RawSensorData
+            kesim_id: Current cutting session id
+
+        Returns:
+            Anomaly result key -> is_anomaly
+        """
+        is_cutting = (raw_data.testere_durumu == 3)
+
+        # Values in SENSOR_DATA_KEYS order
+        sample = AnomalySample(
+            values=(
+                raw_data.serit_sapmasi,
+                raw_data.serit_motor_akim_a,
+                raw_data.serit_motor_tork_percentage,
+                raw_data.serit_kesme_hizi,
+                raw_data.serit_inme_hizi,
+                raw_data.ivme_olcer_x_hz,
+                raw_data.ivme_olcer_y_hz,
+                raw_data.ivme_olcer_z_hz,
+                raw_data.serit_gerginligi_bar,
+            ),
+            is_cutting=is_cutting,
+            kesim_id=kesim_id,
+            kafa_yuksekligi=raw_data.kafa_yuksekligi_mm,
+            makine_id=raw_data.makine_id if raw_data.makine_id else None,
+            serit_id=raw_data.serit_id if raw_data.serit_id else None,
+            malzeme_cinsi=raw_data.malzeme_cinsi if raw_data.malzeme_cinsi else None
+        )
+        if self.anomaly_worker is not None:
+            # Non-blocking: results are from the latest sample the worker finished
+            self.anomaly_worker.submit(sample)
+            anomaly_results = self.anomaly_worker.latest_results()
+        else:
+            anomaly_results = run_anomaly_detection(self.anomaly_manager, self.anomaly_tracker, sample)
+        return anomaly_results
+
+    def _on_speeds_written(self, command, success: bool):
+        """
+        Record the PLC result of a speed command.
+
+        Args:
+            command: ControlCommand whose speeds were written
+            success: True if every attempted write reached the PLC
+        """
+        if success:
+            self._stats['speed_commands_sent'] += 1
+            kesme_str = f"{command.kesme_hizi_target:.1f}" if command.kesme_hizi_target is not None else "None"
+            inme_str = f"{command.inme_hizi_target:.1f}" if command.inme_hizi_target is not None else "None"
+            logger.debug(f"Speeds written: kesme={kesme_str}, inme={inme_str}")
+        else:
+            self._stats['speed_commands_failed'] += 1
+            logger.error("Failed to write speeds to Modbus")
+
+    def _save_to_databases(self, raw_data, processed_data, command, window: Optional[list] = None):
         """
         Save data to SQLite databases (non-blocking).
 
@@ -354,11 +514,19 @@ class DataProcessingPipeline:
             raw_data: RawSensorData
             processed_data: ProcessedData
             command: ControlCommand (or None)
+            window: High-rate mode: acquired samples of this cycle
         """
         try:
             # Save to raw.db
             if 'raw' in self.db_services:
-                self._save_raw_data(raw_data)
+                if not window:
+                    self._save_raw_data(raw_data)
+                elif self.acquisition.raw_persist == 'all':
+                    for acquired in window:
+                        self._save_raw_data(acquired.raw_data, acquired.raw_registers)
+                else:
+                    # Raw registers of the newest sample (aggregates are not raw)
+                    self._save_raw_data(window[-1].raw_data, window[-1].raw_registers)
 
             # Save to total.db
             if 'total' in self.db_services:
@@ -369,119 +537,31 @@ class DataProcessingPipeline:
         except Exception as e:
             logger.error(f"Error saving to databases: {e}", exc_info=True)
 
-    def _save_raw_data(self, raw_data):
+    def _save_raw_data(self, raw_data, raw_registers: Optional[list] = None):
         """
         Save raw Modbus register values to raw.db (unprocessed).
 
         Args:
             raw_data: RawSensorData (we use modbus_reader to get raw registers)
+            raw_registers: Registers of this sample (default: last read)
         """
         # Get raw registers from modbus reader
-        raw_registers = self.modbus_reader.get_last_raw_registers()
+        if raw_registers is None:
+            raw_registers = self.modbus_reader.get_last_raw_registers()
 
         if not raw_registers or len(raw_registers) < 44:
             logger.warning("No raw registers available for database save")
             return
 
-        sql = """
-            INSERT INTO raw_registers (
-                timestamp,
-                reg_1000_makine_id,
-                reg_1001_serit_id,
-                reg_1002_serit_dis_mm,
-                reg_1003_serit_tip,
-                reg_1004_serit_marka,
-                reg_1005_serit_malz,
-                reg_1006_malzeme_cinsi,
-                reg_1007_malzeme_sertlik,
-                reg_1008_kesit_yapisi,
-                reg_1009_a_mm,
-                reg_1010_b_mm,
-                reg_1011_c_mm,
-                reg_1012_d_mm,
-                reg_1013_kafa_yuksekligi,
-                reg_1014_kesilen_parca_adeti,
-                reg_1015_serit_motor_akim,
-                reg_1016_serit_motor_tork,
-                reg_1017_inme_motor_akim,
-                reg_1018_inme_motor_tork,
-                reg_1019_mengene_basinc,
-                reg_1020_serit_gerginligi,
-                reg_1021_ivme_olcer_x,
-                reg_1022_ivme_olcer_y,
-                reg_1023_ivme_olcer_z,
-                reg_1024_serit_sapmasi,
-                reg_1025_ortam_sicakligi,
-                reg_1026_ortam_nem,
-                reg_1027_sogutma_sivi_sicakligi,
-                reg_1028_hidrolik_yag_sicakligi,
-                reg_1029_serit_sicakligi,
-                reg_1030_testere_durumu,
-                reg_1031_alarm_status,
-                reg_1032_alarm_bilgisi,
-                reg_1033_serit_kesme_hizi,
-                reg_1034_serit_inme_hizi,
-                reg_1035_ivme_olcer_x_hz,
-                reg_1036_ivme_olcer_y_hz,
-                reg_1037_ivme_olcer_z_hz,
-                reg_1038_fark_hz_x,
-                reg_1039_fark_hz_y,
-                reg_1040_fark_hz_z,
-                reg_1041_malzeme_genisligi,
-                reg_1042_guc_1,
-                reg_1043_guc_2
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
+        if self.compact_raw_writer is not None:
+            timestamp_ms = int(raw_data.timestamp.timestamp() * 1000)
+            self.compact_raw_writer.append(timestamp_ms, raw_registers)
+            return
 
-        params = (
-            raw_data.timestamp.isoformat(),
-            raw_registers[0],   # 1000 - makine_id
-            raw_registers[1],   # 1001 - serit_id
-            raw_registers[2],   # 1002 - serit_dis_mm
-            raw_registers[3],   # 1003 - serit_tip
-            raw_registers[4],   # 1004 - serit_marka
-            raw_registers[5],   # 1005 - serit_malz
-            raw_registers[6],   # 1006 - malzeme_cinsi
-            raw_registers[7],   # 1007 - malzeme_sertlik
-            raw_registers[8],   # 1008 - kesit_yapisi
-            raw_registers[9],   # 1009 - a_mm
-            raw_registers[10],  # 1010 - b_mm
-            raw_registers[11],  # 1011 - c_mm
-            raw_registers[12],  # 1012 - d_mm
-            raw_registers[13],  # 1013 - kafa_yuksekligi
-            raw_registers[14],  # 1014 - kesilen_parca_adeti
-            raw_registers[15],  # 1015 - serit_motor_akim
-            raw_registers[16],  # 1016 - serit_motor_tork
-            raw_registers[17],  # 1017 - inme_motor_akim
-            raw_registers[18],  # 1018 - inme_motor_tork
-            raw_registers[19],  # 1019 - mengene_basinc
-            raw_registers[20],  # 1020 - serit_gerginligi
-            raw_registers[21],  # 1021 - ivme_olcer_x
-            raw_registers[22],  # 1022 - ivme_olcer_y
-            raw_registers[23],  # 1023 - ivme_olcer_z
-            raw_registers[24],  # 1024 - serit_sapmasi
-            raw_registers[25],  # 1025 - ortam_sicakligi
-            raw_registers[26],  # 1026 - ortam_nem
-            raw_registers[27],  # 1027 - sogutma_sivi_sicakligi
-            raw_registers[28],  # 1028 - hidrolik_yag_sicakligi
-            raw_registers[29],  # 1029 - serit_sicakligi
-            raw_registers[30],  # 1030 - testere_durumu
-            raw_registers[31],  # 1031 - alarm_status
-            raw_registers[32],  # 1032 - alarm_bilgisi
-            raw_registers[33],  # 1033 - serit_kesme_hizi
-            raw_registers[34],  # 1034 - serit_inme_hizi
-            raw_registers[35],  # 1035 - ivme_olcer_x_hz
-            raw_registers[36],  # 1036 - ivme_olcer_y_hz
-            raw_registers[37],  # 1037 - ivme_olcer_z_hz
-            raw_registers[38],  # 1038 - fark_hz_x
-            raw_registers[39],  # 1039 - fark_hz_y
-            raw_registers[40],  # 1040 - fark_hz_z
-            raw_registers[41],  # 1041 - malzeme_genisligi
-            raw_registers[42],  # 1042 - guc_1
-            raw_registers[43],  # 1043 - guc_2
-        )
+        # Row layout: timestamp, then registers 1000-1043 in order (see RAW_REGISTER_COLUMNS)
+        row = (raw_data.timestamp.isoformat(), *raw_registers[:44])
 
-        self.db_services['raw'].write_async(sql, params)
+        self.db_services['raw'].append_rows('raw_registers', [row], RAW_REGISTER_COLUMNS)
 
     def _save_processed_data(self, processed_data, command):
         """
@@ -493,62 +573,8 @@ class DataProcessingPipeline:
         """
         raw = processed_data.raw_data
 
-        sql = """
-            INSERT INTO sensor_data (
-                timestamp,
-                kesim_id,
-                serit_motor_akim_a,
-                serit_motor_tork_percentage,
-                inme_motor_akim_a,
-                inme_motor_tork_percentage,
-                serit_kesme_hizi,
-                serit_inme_hizi,
-                kesme_hizi_hedef,
-                inme_hizi_hedef,
-                kafa_yuksekligi_mm,
-                serit_sapmasi,
-                serit_gerginligi_bar,
-                mengene_basinc_bar,
-                ortam_sicakligi_c,
-                ortam_nem_percentage,
-                sogutma_sivi_sicakligi_c,
-                hidrolik_yag_sicakligi_c,
-                ivme_olcer_x,
-                ivme_olcer_y,
-                ivme_olcer_z,
-                ivme_olcer_x_hz,
-                ivme_olcer_y_hz,
-                ivme_olcer_z_hz,
-                max_titresim_hz,
-                testere_durumu,
-                alarm_status,
-                alarm_bilgisi,
-                makine_id,
-                serit_id,
-                malzeme_cinsi,
-                malzeme_sertlik,
-                kesit_yapisi,
-                malzeme_a_mm,
-                malzeme_b_mm,
-                malzeme_c_mm,
-                malzeme_d_mm,
-                malzeme_genisligi,
-                serit_tip,
-                serit_marka,
-                serit_malz,
-                serit_dis_mm,
-                kesilen_parca_adeti,
-                guc_kwh,
-                ml_output,
-                kesme_hizi_degisim,
-                inme_hizi_degisim,
-                torque_guard_active,
-                controller_type,
-                anomalies
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        params = (
+        # Row layout matches SENSOR_DATA_COLUMNS
+        row = (
             processed_data.timestamp.isoformat(),
             processed_data.cutting_session_id,  # kesim_id (int or None)
             raw.serit_motor_akim_a,
@@ -601,7 +627,11 @@ class DataProcessingPipeline:
             json.dumps(processed_data.anomalies) if processed_data.anomalies else None
         )
 
-        self.db_services['total'].write_async(sql, params)
+        if self.sensor_partitions is not None:
+            self.sensor_partitions.append(processed_data.timestamp, row[1:])
+            return
+
+        self.db_services['total'].append_rows('sensor_data', [row], SENSOR_DATA_COLUMNS)
 
     def get_stats(self) -> dict:
         """
@@ -613,11 +643,52 @@ class DataProcessingPipeline:
         return {
             **self._stats,
             'is_running': self._running,
+            'modbus_reader': self.modbus_reader.get_stats(),
+            'modbus_writer': self.modbus_writer.get_stats(),
+            'raw_storage': (
+                self.compact_raw_writer.get_stats()
+                if self.compact_raw_writer is not None else self.raw_storage
+            ),
+            'total_storage': (
+                self.sensor_partitions.get_stats()
+                if self.sensor_partitions is not None else self.total_storage
+            ),
+            'latency': self.latency.snapshot(),
+            'scheduler': self.scheduler.get_stats(),
+            'acquisition': (
+                self.acquisition.get_stats() if self.acquisition is not None else None
+            ),
             'cutting_tracker': self.cutting_tracker.get_stats(),
             'anomaly_manager': self.anomaly_manager.get_stats(),
+            'anomaly_worker': (
+                self.anomaly_worker.get_stats() if self.anomaly_worker is not None else None
+            ),
             'control_manager': self.control_manager.get_status()
         }
 
+    def dump_latency(self, path: Optional[str] = None) -> str:
+        """
+        Write the per-stage latency histograms as JSON (on demand).
+
+        Args:
+            path: Output file (default: processing.latency.dump_path)
+
+        Returns:
+            Path written
+        """
+        return str(self.latency.dump(path or self.latency_dump_path))
+
+    def get_latest_snapshot(self) -> LatestSnapshot:
+        """
+        Get the latest flattened sample for GUI display (O(1)).
+
+        Returns:
+            LatestSnapshot; compare .version with the last rendered one to
+            skip unchanged refreshes. .data has the get_latest_data() keys
+            (defaults with modbus_connected=False before the first sample).
+        """
+        return self._snapshots.latest()
+
     def get_latest_data(self) -> dict:
         """
         Get latest processed data for GUI display.
@@ -628,140 +699,7 @@ class DataProcessingPipeline:
 
         Note:
             Unlike to_dict() which returns nested structure, this method
-            flattens raw_data fields for direct GUI access.
+            flattens raw_data fields for direct GUI access. Copy of
+            get_latest_snapshot().data; pollers should prefer the snapshot.
         """
-        modbus_ip = self.config.get('modbus', {}).get('host', '')
-
-        # If we have recent processed data, connection is working
-        # Check data freshness (within last 2 seconds)
-        if self._last_processed_data is not None:
-            data_age = (datetime.now() - self._last_processed_data.timestamp).total_seconds()
-            # If data is fresh (less than 2 seconds old), connection is active
-            modbus_connected = data_age < 2.0
-        else:
-            modbus_connected = False
-
-        # If we have processed data, flatten it for GUI
-        if self._last_processed_data is not None:
-            pd = self._last_processed_data
-            raw = pd.raw_data
-
-            # Flatten raw_data fields directly into result dict
-            data = {
-                # Connection status
-                'modbus_connected': modbus_connected,
-                'modbus_ip': modbus_ip,
-
-                # Timestamp
-                'timestamp': pd.timestamp.isoformat(),
-
-                # Motor measurements (from raw_data)
-                'serit_motor_akim_a': raw.serit_motor_akim_a,
-                'serit_motor_tork_percentage': raw.serit_motor_tork_percentage,
-                'inme_motor_akim_a': raw.inme_motor_akim_a,
-                'inme_motor_tork_percentage': raw.inme_motor_tork_percentage,
-
-                # Speed values (actual - from registers 1033/1034)
-                'serit_kesme_hizi': raw.serit_kesme_hizi,
-                'serit_inme_hizi': raw.serit_inme_hizi,
-
-                # Target speed values (from registers 2066/2041 - what we write to PLC)
-                'kesme_hizi_hedef': raw.kesme_hizi_hedef,
-                'inme_hizi_hedef': raw.inme_hizi_hedef,
-
-                # Mechanical measurements
-                'kafa_yuksekligi_mm': raw.kafa_yuksekligi_mm,
-                'serit_sapmasi': raw.serit_sapmasi,
-                'serit_gerginligi_bar': raw.serit_gerginligi_bar,
-                'mengene_basinc_bar': raw.mengene_basinc_bar,
-
-                # Environmental measurements
-                'ortam_sicakligi_c': raw.ortam_sicakligi_c,
-                'ortam_nem_percentage': raw.ortam_nem_percentage,
-                'sogutma_sivi_sicakligi_c': raw.sogutma_sivi_sicakligi_c,
-                'hidrolik_yag_sicakligi_c': raw.hidrolik_yag_sicakligi_c,
-
-                # Vibration measurements
-                'ivme_olcer_x': raw.ivme_olcer_x,
-                'ivme_olcer_y': raw.ivme_olcer_y,
-                'ivme_olcer_z': raw.ivme_olcer_z,
-                'ivme_olcer_x_hz': raw.ivme_olcer_x_hz,
-                'ivme_olcer_y_hz': raw.ivme_olcer_y_hz,
-                'ivme_olcer_z_hz': raw.ivme_olcer_z_hz,
-                'max_titresim_hz': raw.max_titresim_hz,
-
-                # State information
-                'testere_durumu': raw.testere_durumu,
-                'alarm_status': raw.alarm_status,
-                'alarm_bilgisi': raw.alarm_bilgisi,
-
-                # Identification
-                'makine_id': raw.makine_id,
-                'serit_id': raw.serit_id,
-
-                # Material information
-                'malzeme_cinsi': raw.malzeme_cinsi,
-                'malzeme_sertlik': raw.malzeme_sertlik,
-                'kesit_yapisi': raw.kesit_yapisi,
-                'malzeme_a_mm': raw.malzeme_a_mm,
-                'malzeme_b_mm': raw.malzeme_b_mm,
-                'malzeme_c_mm': raw.malzeme_c_mm,
-                'malzeme_d_mm': raw.malzeme_d_mm,
-                'malzeme_genisligi': raw.malzeme_genisligi,
-
-                # Band information
-                'serit_tip': raw.serit_tip,
-                'serit_marka': raw.serit_marka,
-                'serit_malz': raw.serit_malz,
-                'serit_dis_mm': raw.serit_dis_mm,
-
-                # Statistics
-                'kesilen_parca_adeti': raw.kesilen_parca_adeti,
-
-                # Power measurement
-                'guc_kwh': raw.guc_kwh,
-
-                # ML control outputs (from ProcessedData)
-                'ml_output': pd.ml_output,
-                'kesme_hizi_degisim': pd.kesme_hizi_degisim,
-                'inme_hizi_degisim': pd.inme_hizi_degisim,
-                'torque_guard_active': pd.torque_guard_active,
-
-                # Anomaly detection
-                'anomalies': pd.anomalies,
-
-                # Cutting session tracking
-                'is_cutting': pd.is_cutting,
-                'cutting_session_id': pd.cutting_session_id,
-                'controller_type': pd.controller_type,
-            }
-            return data
-
-        # No data available - return defaults with connection status
-        return {
-            'modbus_connected': modbus_connected,
-            'modbus_ip': modbus_ip,
-            'testere_durumu': -1,  # Special value for "waiting for connection"
-            'kafa_yuksekligi_mm': 0,
-            'serit_motor_akim_a': 0,
-            'inme_motor_akim_a': 0,
-            'serit_motor_tork_percentage': 0,
-            'inme_motor_tork_percentage': 0,
-            'serit_sapmasi': 0,
-            'serit_kesme_hizi': 0,
-            'serit_inme_hizi': 0,
-            'kesme_hizi_hedef': 0,
-            'inme_hizi_hedef': 0,
-            'serit_gerginligi_bar': 0,
-            'mengene_basinc_bar': 0,
-            'ortam_sicakligi_c': 0,
-            'ortam_nem_percentage': 0,
-            'ivme_olcer_x': 0,
-            'ivme_olcer_y': 0,
-            'ivme_olcer_z': 0,
-            'ivme_olcer_x_hz': 0,
-            'ivme_olcer_y_hz': 0,
-            'ivme_olcer_z_hz': 0,
-            'max_titresim_hz': 0,
-            'guc_kwh': 0,
-        }
+        return dict(self._snapshots.latest().data)
@@ -0,0 +1,223 @@
+"""
+Per-stage latency histograms for the processing pipeline.
+
+Each stage of DataProcessingPipeline._processing_loop (and the read/decode
+split inside ModbusReader) is timed with time.perf_counter_ns() and
+recorded into a fixed-bucket histogram:
+
+- Buckets are geometric (x1.2 from 1 us to ~10 s), so percentiles are
+  reported as the bucket upper bound: at most 20% above the true value,
+  never below it (capped at the window maximum).
+- A rolling window is split into slots (default 60 s in 6 x 10 s). A slot
+  is replaced by a fresh bucket list when its time comes round again, so
+  snapshots always cover the last window_seconds (+ one partial slot).
+
+Lock-free: record() is only called from the event loop (single writer).
+Readers in other threads (GUI, dump) merge slot lists without a lock; a
+slot is swapped for a new list rather than cleared in place, so a reader
+sees either the old or the new slot, at worst missing the counts of the
+record() running concurrently.
+
+Timing one stage (perf_counter_ns() + record()) costs well under 1 us, a
+few us per cycle: a fraction of a percent of the active cycle time.
+src/tasks/pipeline_benchmark.py measures it (latency_overhead_pct).
+"""
+
+import json
+import logging
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Stages timed per cycle ('cycle' is the whole active cycle, without sleep)
+PIPELINE_STAGES = (
+    'modbus_read',
+    'decode',
+    'anomaly',
+    'control',
+    'write',
+    'db_enqueue',
+    'iot_enqueue',
+    'cycle',
+)
+
+PERCENTILES = (50, 95, 99)
+
+
+def _bucket_bounds(min_ns: int = 1_000, max_ns: int = 10_000_000_000, growth: float = 1.2) -> List[int]:
+    """Geometric bucket upper bounds in nanoseconds."""
+    bounds = [min_ns]
+    while bounds[-1] < max_ns:
+        bounds.append(max(int(bounds[-1] * growth), bounds[-1] + 1))
+    return bounds
+
+
+BUCKET_BOUNDS_NS = _bucket_bounds()
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram over a rolling time window.
+
+    Each slot is a list of bucket counts with the slot maximum appended as
+    the last element, so record() touches a single list.
+
+    Thread Safety:
+    - record(): single writer (event loop)
+    - snapshot(): any thread, no lock (see module docstring)
+    """
+
+    def __init__(self, window_seconds: float = 60.0, slots: int = 6, bounds: Iterable[int] = BUCKET_BOUNDS_NS):
+        """
+        Initialize histogram.
+
+        Args:
+            window_seconds: Rolling window length
+            slots: Sub-windows the window rotates through
+            bounds: Bucket upper bounds in ns (values above the last go to an overflow bucket)
+        """
+        self.bounds = list(bounds)
+        self.slots = max(1, int(slots))
+        self.window_seconds = float(window_seconds)
+        self._slot_ns = max(1, int(self.window_seconds * 1e9 / self.slots))
+
+        # Per slot: counts for len(bounds) + 1 buckets, then the slot max
+        self._size = len(self.bounds) + 2
+        self._slot_lists: List[List[int]] = [[0] * self._size for _ in range(self.slots)]
+        self._epochs: List[int] = [-1] * self.slots
+
+        # Slot being written
+        self._epoch = -1
+        self._current = self._slot_lists[0]
+
+    def record(self, value_ns: int, now_ns: Optional[int] = None):
+        """
+        Add one duration.
+
+        Args:
+            value_ns: Duration in nanoseconds
+            now_ns: perf_counter_ns() at the end of the stage (default: now)
+        """
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        epoch = now_ns // self._slot_ns
+        if epoch != self._epoch:
+            self._rotate(epoch)
+
+        current = self._current
+        current[bisect_left(self.bounds, value_ns)] += 1
+        if value_ns > current[-1]:
+            current[-1] = value_ns
+
+    def _rotate(self, epoch: int):
+        """Switch to the slot for `epoch`, replacing it if it holds an older epoch."""
+        slot = epoch % self.slots
+        if self._epochs[slot] != epoch:
+            self._slot_lists[slot] = [0] * self._size
+            self._epochs[slot] = epoch
+        self._current = self._slot_lists[slot]
+        self._epoch = epoch
+
+    def snapshot(self, now_ns: Optional[int] = None) -> dict:
+        """
+        Percentiles over the rolling window.
+
+        Args:
+            now_ns: perf_counter_ns() reference (default: now)
+
+        Returns:
+            Dict with count, p50_ms, p95_ms, p99_ms and max_ms (None when empty)
+        """
+        if now_ns is None:
+            now_ns = time.perf_counter_ns()
+        oldest = now_ns // self._slot_ns - self.slots + 1
+
+        merged = [0] * (self._size - 1)
+        window_max = 0
+        for slot in range(self.slots):
+            if self._epochs[slot] < oldest:
+                continue
+            counts = self._slot_lists[slot]
+            for i in range(len(merged)):
+                merged[i] += counts[i]
+            window_max = max(window_max, counts[-1])
+
+        count = sum(merged)
+        result = {'count': count}
+        for q in PERCENTILES:
+            result[f'p{q}_ms'] = self._percentile(merged, count, q, window_max) / 1e6 if count else None
+        result['max_ms'] = window_max / 1e6 if count else None
+        return result
+
+    def _percentile(self, counts: List[int], total: int, q: float, window_max: int) -> int:
+        """Bucket upper bound holding the q-th percentile, capped at the window max."""
+        rank = total * q / 100.0
+        cumulative = 0
+        for i, count in enumerate(counts):
+            cumulative += count
+            if cumulative >= rank and count:
+                upper = self.bounds[i] if i < len(self.bounds) else window_max
+                return min(upper, window_max)
+        return window_max
+
+
+class PipelineLatency:
+    """Histograms for the pipeline stages plus summary and dump helpers."""
+
+    def __init__(self, window_seconds: float = 60.0, slots: int = 6, stages: Iterable[str] = PIPELINE_STAGES):
+        """
+        Initialize stage histograms.
+
+        Args:
+            window_seconds: Rolling window length
+            slots: Sub-windows per window
+            stages: Stage names
+        """
+        self.window_seconds = window_seconds
+        self.histograms: Dict[str, LatencyHistogram] = {
+            stage: LatencyHistogram(window_seconds, slots) for stage in stages
+        }
+
+    def record(self, stage: str, value_ns: int, now_ns: Optional[int] = None):
+        """Record one stage duration (ns)."""
+        self.histograms[stage].record(value_ns, now_ns)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Per-stage window percentiles (see LatencyHistogram.snapshot)."""
+        now_ns = time.perf_counter_ns()
+        return {stage: hist.snapshot(now_ns) for stage, hist in self.histograms.items()}
+
+    def format_summary(self, stages: Optional[Iterable[str]] = None) -> str:
+        """One-line p50/p99/max summary for the health log."""
+        snapshot = self.snapshot()
+        parts = []
+        for stage in stages or self.histograms:
+            s = snapshot[stage]
+            if s['count']:
+                parts.append(f"{stage}={s['p50_ms']:.2f}/{s['p99_ms']:.2f}/{s['max_ms']:.2f}")
+        return ", ".join(parts) if parts else "no samples"
+
+    def dump(self, path: Path) -> Path:
+        """
+        Write the current snapshot as JSON.
+
+        Args:
+            path: Output file (parent directories are created)
+
+        Returns:
+            path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'window_seconds': self.window_seconds,
+            'stages': self.snapshot(),
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+        logger.info(f"Pipeline latency histograms written to {path}")
+        return path
@@ -0,0 +1,195 @@
+"""
+Drift-free periodic scheduling on absolute deadlines.
+
+Sleeping `period - work_time` after each cycle accumulates error: every
+wake-up is a little late and the next cycle is timed from that late start,
+so a 10 Hz loop slowly falls behind the wall clock and sample spacing
+wanders. DeadlineScheduler keeps a fixed grid instead
+(next_deadline += period) and measures how late each tick starts.
+
+Overrun policies (when work runs past one or more deadlines):
+- 'skip' (default): start the late tick immediately and drop the ticks
+  whose deadlines have fully passed, so the loop stays on its grid.
+- 'catch_up': run missed ticks back to back until on time again (at most
+  max_catch_up ticks, then skip the rest). For loops where every tick
+  matters, e.g. fixed-count batching.
+
+Lateness (wake-up time - deadline) goes into a LatencyHistogram, which
+gives the jitter percentiles.
+
+Usage (asyncio):
+    scheduler = DeadlineScheduler(0.1, name='pipeline')
+    while running:
+        await scheduler.wait()
+        ...
+
+Usage (thread with a stop event):
+    while scheduler.wait_blocking(stop_event):
+        ...
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from .latency import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+OVERRUN_POLICIES = ('skip', 'catch_up')
+
+
+class DeadlineScheduler:
+    """
+    Periodic scheduler with absolute deadlines, overrun policy and jitter stats.
+
+    Thread Safety:
+    - One loop (task or thread) drives wait()/wait_blocking()
+    - get_stats() may be called from any thread
+    """
+
+    def __init__(
+        self,
+        period: float,
+        policy: str = 'skip',
+        max_catch_up: int = 10,
+        start_immediately: bool = True,
+        name: str = 'periodic',
+        clock: Callable[[], float] = time.monotonic,
+        window_seconds: float = 60.0
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            period: Tick period in seconds
+            policy: Overrun policy ('skip' or 'catch_up')
+            max_catch_up: catch_up only: max consecutive late ticks run back to back
+            start_immediately: First tick at the first wait() (else one period later)
+            name: Name for logs
+            clock: Monotonic clock in seconds (must match the event loop clock)
+            window_seconds: Rolling window of the lateness histogram
+        """
+        if period <= 0:
+            raise ValueError("period must be positive")
+        if policy not in OVERRUN_POLICIES:
+            raise ValueError(f"Unknown overrun policy '{policy}' (expected one of {OVERRUN_POLICIES})")
+
+        self.period = float(period)
+        self.policy = policy
+        self.max_catch_up = max(0, int(max_catch_up))
+        self.start_immediately = start_immediately
+        self.name = name
+        self._clock = clock
+
+        self._next_deadline: Optional[float] = None
+        self._catch_up_run = 0
+
+        self.lateness = LatencyHistogram(window_seconds=window_seconds)
+
+        self._stats = {
+            'ticks': 0,
+            'overruns': 0,
+            'skipped_ticks': 0,
+            'caught_up_ticks': 0,
+            'last_lateness_ms': 0.0,
+            'max_lateness_ms': 0.0,
+        }
+
+    def reset(self):
+        """Re-anchor the grid at the next wait() (e.g. after a pause)."""
+        self._next_deadline = None
+        self._catch_up_run = 0
+
+    def next_delay(self) -> float:
+        """
+        Advance to the next deadline and return seconds to sleep (0 = run now).
+
+        Applies the overrun policy when the deadline has already passed.
+        """
+        now = self._clock()
+        if self._next_deadline is None:
+            self._next_deadline = now if self.start_immediately else now + self.period
+            return max(0.0, self._next_deadline - now)
+
+        deadline = self._next_deadline + self.period
+        if now <= deadline:
+            self._catch_up_run = 0
+            self._next_deadline = deadline
+            return deadline - now
+
+        # Previous tick ran past this deadline
+        self._stats['overruns'] += 1
+        missed = int((now - deadline) // self.period)
+
+        if self.policy == 'catch_up' and self._catch_up_run < self.max_catch_up:
+            self._catch_up_run += 1
+            self._stats['caught_up_ticks'] += 1
+            self._next_deadline = deadline
+            return 0.0
+
+        # skip: drop the fully missed ticks, run the late one now
+        self._catch_up_run = 0
+        if missed:
+            self._stats['skipped_ticks'] += missed
+            logger.debug(f"{self.name}: skipped {missed} tick(s)")
+        self._next_deadline = deadline + missed * self.period
+        return 0.0
+
+    def _record_wake(self):
+        """Record lateness of the tick that starts now."""
+        lateness = max(0.0, self._clock() - self._next_deadline)
+        lateness_ms = lateness * 1000.0
+        self.lateness.record(int(lateness * 1e9))
+        self._stats['ticks'] += 1
+        self._stats['last_lateness_ms'] = lateness_ms
+        if lateness_ms > self._stats['max_lateness_ms']:
+            self._stats['max_lateness_ms'] = lateness_ms
+
+    async def wait(self):
+        """Sleep until the next deadline (asyncio)."""
+        delay = self.next_delay()
+        # sleep(0) still yields so a late loop cannot starve other tasks
+        await asyncio.sleep(delay)
+        self._record_wake()
+
+    def wait_blocking(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """
+        Block until the next deadline (threads).
+
+        Args:
+            stop_event: Returns early when set
+
+        Returns:
+            False if stop_event was set (the loop should exit), else True
+        """
+        delay = self.next_delay()
+        if stop_event is not None:
+            if stop_event.wait(delay):
+                return False
+        elif delay > 0:
+            time.sleep(delay)
+        self._record_wake()
+        return True
+
+    @property
+    def next_deadline(self) -> Optional[float]:
+        """Clock time of the current tick's deadline (None before the first wait)."""
+        return self._next_deadline
+
+    def get_stats(self) -> dict:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with tick/overrun counters, last/max lateness and
+            lateness (jitter) percentiles over the rolling window
+        """
+        return {
+            **self._stats,
+            'period_ms': self.period * 1000.0,
+            'policy': self.policy,
+            'lateness': self.lateness.snapshot(),
+        }
@@ -0,0 +1,238 @@
+"""
+Versioned latest-sample snapshot for the GUI.
+
+The pipeline flattens each cycle's ProcessedData once into an immutable
+LatestSnapshot with a monotonically increasing version. GUI controllers
+poll DataProcessingPipeline.get_latest_snapshot() on their own timers:
+fetching is O(1), and a controller that remembers the last version it
+rendered skips its UI refresh when nothing new has arrived.
+
+Connection status is part of the data: when no new cycle is published for
+STALE_AFTER_SECONDS, the next fetch replaces the snapshot with a copy
+marked modbus_connected=False (new version), so controllers also refresh
+exactly once on disconnect.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# Data older than this is shown as disconnected
+STALE_AFTER_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class LatestSnapshot:
+    """
+    Immutable flattened view of the latest processed sample.
+
+    Attributes:
+        version: Increases with every publish (0 = no data yet)
+        data: Read-only mapping with the get_latest_data() keys
+        published_at: time.monotonic() of the publish
+    """
+    version: int
+    data: Mapping[str, Any] = field(repr=False)
+    published_at: float = 0.0
+
+
+def flatten_processed_data(pd, modbus_ip: str) -> dict:
+    """
+    Flatten ProcessedData (and its raw_data) into the GUI key set.
+
+    Args:
+        pd: ProcessedData
+        modbus_ip: Configured PLC address
+
+    Returns:
+        Dictionary with sensor data and connection status
+    """
+    raw = pd.raw_data
+    return {
+        # Connection status
+        'modbus_connected': True,
+        'modbus_ip': modbus_ip,
+
+        # Timestamp
+        'timestamp': pd.timestamp.isoformat(),
+
+        # Motor measurements (from raw_data)
+        'serit_motor_akim_a': raw.serit_motor_akim_a,
+        'serit_motor_tork_percentage': raw.serit_motor_tork_percentage,
+        'inme_motor_akim_a': raw.inme_motor_akim_a,
+        'inme_motor_tork_percentage': raw.inme_motor_tork_percentage,
+
+        # Speed values (actual - from registers 1033/1034)
+        'serit_kesme_hizi': raw.serit_kesme_hizi,
+        'serit_inme_hizi': raw.serit_inme_hizi,
+
+        # Target speed values (from registers 2066/2041 - what we write to PLC)
+        'kesme_hizi_hedef': raw.kesme_hizi_hedef,
+        'inme_hizi_hedef': raw.inme_hizi_hedef,
+
+        # Mechanical measurements
+        'kafa_yuksekligi_mm': raw.kafa_yuksekligi_mm,
+        'serit_sapmasi': raw.serit_sapmasi,
+        'serit_gerginligi_bar': raw.serit_gerginligi_bar,
+        'mengene_basinc_bar': raw.mengene_basinc_bar,
+
+        # Environmental measurements
+        'ortam_sicakligi_c': raw.ortam_sicakligi_c,
+        'ortam_nem_percentage': raw.ortam_nem_percentage,
+        'sogutma_sivi_sicakligi_c': raw.sogutma_sivi_sicakligi_c,
+        'hidrolik_yag_sicakligi_c': raw.hidrolik_yag_sicakligi_c,
+
+        # Vibration measurements
+        'ivme_olcer_x': raw.ivme_olcer_x,
+        'ivme_olcer_y': raw.ivme_olcer_y,
+        'ivme_olcer_z': raw.ivme_olcer_z,
+        'ivme_olcer_x_hz': raw.ivme_olcer_x_hz,
+        'ivme_olcer_y_hz': raw.ivme_olcer_y_hz,
+        'ivme_olcer_z_hz': raw.ivme_olcer_z_hz,
+        'max_titresim_hz': raw.max_titresim_hz,
+
+        # State information
+        'testere_durumu': raw.testere_durumu,
+        'alarm_status': raw.alarm_status,
+        'alarm_bilgisi': raw.alarm_bilgisi,
+
+        # Identification
+        'makine_id': raw.makine_id,
+        'serit_id': raw.serit_id,
+
+        # Material information
+        'malzeme_cinsi': raw.malzeme_cinsi,
+        'malzeme_sertlik': raw.malzeme_sertlik,
+        'kesit_yapisi': raw.kesit_yapisi,
+        'malzeme_a_mm': raw.malzeme_a_mm,
+        'malzeme_b_mm': raw.malzeme_b_mm,
+        'malzeme_c_mm': raw.malzeme_c_mm,
+        'malzeme_d_mm': raw.malzeme_d_mm,
+        'malzeme_genisligi': raw.malzeme_genisligi,
+
+        # Band information
+        'serit_tip': raw.serit_tip,
+        'serit_marka': raw.serit_marka,
+        'serit_malz': raw.serit_malz,
+        'serit_dis_mm': raw.serit_dis_mm,
+
+        # Statistics
+        'kesilen_parca_adeti': raw.kesilen_parca_adeti,
+
+        # Power measurement
+        'guc_kwh': raw.guc_kwh,
+
+        # ML control outputs (from ProcessedData)
+        'ml_output': pd.ml_output,
+        'kesme_hizi_degisim': pd.kesme_hizi_degisim,
+        'inme_hizi_degisim': pd.inme_hizi_degisim,
+        'torque_guard_active': pd.torque_guard_active,
+
+        # Anomaly detection
+        'anomalies': pd.anomalies,
+
+        # Cutting session tracking
+        'is_cutting': pd.is_cutting,
+        'cutting_session_id': pd.cutting_session_id,
+        'controller_type': pd.controller_type,
+    }
+
+
+def default_data(modbus_ip: str) -> dict:
+    """
+    GUI data before the first sample (waiting for connection).
+
+    Args:
+        modbus_ip: Configured PLC address
+
+    Returns:
+        Dictionary with zeroed values and modbus_connected=False
+    """
+    return {
+        'modbus_connected': False,
+        'modbus_ip': modbus_ip,
+        'testere_durumu': -1,  # Special value for "waiting for connection"
+        'kafa_yuksekligi_mm': 0,
+        'serit_motor_akim_a': 0,
+        'inme_motor_akim_a': 0,
+        'serit_motor_tork_percentage': 0,
+        'inme_motor_tork_percentage': 0,
+        'serit_sapmasi': 0,
+        'serit_kesme_hizi': 0,
+        'serit_inme_hizi': 0,
+        'kesme_hizi_hedef': 0,
+        'inme_hizi_hedef': 0,
+        'serit_gerginligi_bar': 0,
+        'mengene_basinc_bar': 0,
+        'ortam_sicakligi_c': 0,
+        'ortam_nem_percentage': 0,
+        'ivme_olcer_x': 0,
+        'ivme_olcer_y': 0,
+        'ivme_olcer_z': 0,
+        'ivme_olcer_x_hz': 0,
+        'ivme_olcer_y_hz': 0,
+        'ivme_olcer_z_hz': 0,
+        'max_titresim_hz': 0,
+        'guc_kwh': 0,
+    }
+
+
+class SnapshotPublisher:
+    """
+    Holds the current LatestSnapshot.
+
+    Thread Safety:
+    - publish(): pipeline (event loop thread)
+    - latest(): any thread (GUI); the stale -> disconnected swap and
+      publish() share a lock so versions never repeat
+    """
+
+    def __init__(self, modbus_ip: str = '', stale_after: float = STALE_AFTER_SECONDS,
+                 clock=time.monotonic):
+        """
+        Initialize publisher with the "no data yet" snapshot (version 0).
+
+        Args:
+            modbus_ip: Configured PLC address (shown by the GUI)
+            stale_after: Seconds without publish before data counts as disconnected
+            clock: Monotonic clock in seconds
+        """
+        self.modbus_ip = modbus_ip
+        self.stale_after = stale_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._snapshot = LatestSnapshot(0, MappingProxyType(default_data(modbus_ip)), clock())
+
+    def publish(self, processed_data) -> LatestSnapshot:
+        """
+        Publish a new snapshot built from ProcessedData.
+
+        Args:
+            processed_data: ProcessedData of the cycle
+
+        Returns:
+            The published snapshot
+        """
+        data = MappingProxyType(flatten_processed_data(processed_data, self.modbus_ip))
+        with self._lock:
+            self._snapshot = LatestSnapshot(self._snapshot.version + 1, data, self._clock())
+            return self._snapshot
+
+    def latest(self) -> LatestSnapshot:
+        """
+        Current snapshot (replaced by a disconnected copy once stale).
+
+        Returns:
+            LatestSnapshot
+        """
+        snapshot = self._snapshot
+        if snapshot.data['modbus_connected'] and self._clock() - snapshot.published_at >= self.stale_after:
+            with self._lock:
+                if self._snapshot is snapshot:
+                    data = MappingProxyType({**snapshot.data, 'modbus_connected': False})
+                    self._snapshot = LatestSnapshot(snapshot.version + 1, data, snapshot.published_at)
+                snapshot = self._snapshot
+        return snapshot
+
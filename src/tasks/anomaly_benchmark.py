@@ -0,0 +1,167 @@
+"""
+Anomaly detector microbenchmark - per-cycle cost vs. buffer size.
+
+Compares the legacy detector cycle (deque of dicts -> list -> np.mean/
+np.std/np.percentile over the whole window) against the streaming
+RollingWindow statistics now used by BaseAnomalyDetector, for the
+Z-score and IQR methods. With --manager, also compares a full 9-sensor
+AnomalyManager cycle in per-detector vs batch mode.
+
+Usage:
+    python -m src.tasks.anomaly_benchmark --sizes 100 1000 10000
+    python -m src.tasks.anomaly_benchmark --manager
+"""
+
+import argparse
+import logging
+import time
+from collections import deque
+from typing import Dict, List
+
+import numpy as np
+
+from src.anomaly.base import BaseAnomalyDetector, DetectionMethod
+from src.anomaly.manager import AnomalyManager, SENSOR_DATA_KEYS
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+
+def _legacy_cycle(buffer: deque, value: float, method: DetectionMethod) -> bool:
+    """One detector cycle as implemented before the rolling window."""
+    buffer.append({'value': value, 'is_cutting': True, 'timestamp': None})
+    values = [item['value'] for item in buffer]
+    values_array = np.array(values)
+
+    if method == DetectionMethod.Z_SCORE:
+        std = np.std(values_array)
+        if std == 0:
+            return False
+        return abs((values[-1] - np.mean(values_array)) / std) > 3.0
+
+    q1 = np.percentile(values_array, 25)
+    q3 = np.percentile(values_array, 75)
+    iqr = q3 - q1
+    return values[-1] < q1 - 1.5 * iqr or values[-1] > q3 + 1.5 * iqr
+
+
+def _time_per_cycle(cycle, samples: np.ndarray) -> float:
+    """Run cycle(value) over samples and return mean microseconds per call."""
+    start = time.perf_counter()
+    for value in samples:
+        cycle(value)
+    return (time.perf_counter() - start) / len(samples) * 1e6
+
+
+def run_benchmark(sizes: List[int], cycles: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure legacy vs rolling per-cycle cost for each buffer size.
+
+    Args:
+        sizes: Buffer sizes to test
+        cycles: Measured cycles per configuration (after the window fills)
+
+    Returns:
+        Results keyed by "<method>/<size>" with legacy_us, rolling_us, speedup
+    """
+    rng = np.random.default_rng(42)
+    results = {}
+
+    for method in (DetectionMethod.Z_SCORE, DetectionMethod.IQR):
+        for size in sizes:
+            warmup = rng.normal(50.0, 5.0, size)
+            samples = [float(v) for v in rng.normal(50.0, 5.0, cycles)]
+
+            legacy_buffer = deque((
+                {'value': float(v), 'is_cutting': True, 'timestamp': None} for v in warmup
+            ), maxlen=size)
+            legacy_us = _time_per_cycle(
+                lambda v: _legacy_cycle(legacy_buffer, v, method), samples
+            )
+
+            detector = BaseAnomalyDetector('bench', 'bench', method, buffer_size=size, min_samples=10)
+            for v in warmup:
+                detector.add_data_point(v)
+
+            def rolling_cycle(v):
+                detector.add_data_point(v)
+                return detector.detect()
+
+            rolling_us = _time_per_cycle(rolling_cycle, samples)
+
+            key = f"{method.value}/{size}"
+            results[key] = {
+                'legacy_us': legacy_us,
+                'rolling_us': rolling_us,
+                'speedup': legacy_us / rolling_us,
+            }
+            logger.info(
+                f"{key:<14} legacy={legacy_us:8.1f}us rolling={rolling_us:6.1f}us "
+                f"x{legacy_us / rolling_us:.1f} "
+                f"(9 detectors @10Hz: {9 * 10 * legacy_us / 1000:.1f} -> "
+                f"{9 * 10 * rolling_us / 1000:.2f} ms/s)"
+            )
+
+    return results
+
+
+def run_manager_benchmark(sizes: List[int], cycles: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure a full AnomalyManager cycle in per-detector vs batch mode.
+
+    Args:
+        sizes: Buffer sizes to test
+        cycles: Measured cycles per configuration (after the window fills)
+
+    Returns:
+        Results keyed by "manager/<size>" with per_detector_us, batch_us
+    """
+    rng = np.random.default_rng(42)
+    results = {}
+
+    for size in sizes:
+        rows = rng.normal(50.0, 5.0, (size + cycles, len(SENSOR_DATA_KEYS))).tolist()
+
+        per_detector = AnomalyManager(buffer_size=size, min_samples=10)
+        batch = AnomalyManager(buffer_size=size, min_samples=10, batch_mode=True)
+        for row in rows[:size]:
+            per_detector.process_data(dict(zip(SENSOR_DATA_KEYS, row)))
+            batch.process_values(row)
+
+        per_detector_us = _time_per_cycle(
+            lambda row: per_detector.process_data(dict(zip(SENSOR_DATA_KEYS, row))), rows[size:]
+        )
+        batch_us = _time_per_cycle(batch.process_values, rows[size:])
+
+        key = f"manager/{size}"
+        results[key] = {'per_detector_us': per_detector_us, 'batch_us': batch_us}
+        logger.info(f"{key:<14} per-detector={per_detector_us:7.1f}us batch={batch_us:7.1f}us")
+
+    return results
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Anomaly detector microbenchmark")
+    parser.add_argument("--sizes", type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Buffer sizes (default: 100 1000 10000)")
+    parser.add_argument("--cycles", type=int, default=2000,
+                        help="Measured cycles per configuration")
+    parser.add_argument("--manager", action="store_true",
+                        help="Compare AnomalyManager per-detector vs batch mode")
+    args = parser.parse_args()
+
+    if args.manager:
+        run_manager_benchmark(args.sizes, args.cycles)
+    else:
+        run_benchmark(args.sizes, args.cycles)
+
+
+if __name__ == "__main__":
+    main()
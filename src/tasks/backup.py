@@ -123,8 +123,31 @@ def _merge_database(source_db: Path, archive_db: Path, db_name: str):
             # Get table names
             tables = _get_table_names(db_name)
 
+            # Daily sensor_data partitions (total_storage: partitioned)
+            if db_name == 'total':
+                tables += _list_source_partitions(conn)
+
             # Merge each table
             for table in tables:
+                if not _table_exists(conn, 'source', table):
+                    logger.info(f"  {table}: not in source, skipping")
+                    continue
+
+                # Tables added by newer schemas (e.g. raw_register_chunks)
+                if not _table_exists(conn, 'main', table):
+                    create_sql = conn.execute(
+                        "SELECT sql FROM source.sqlite_master WHERE type='table' AND name=?",
+                        (table,)
+                    ).fetchone()[0]
+                    conn.execute(create_sql)
+                    for (index_sql,) in conn.execute(
+                        "SELECT sql FROM source.sqlite_master "
+                        "WHERE type='index' AND tbl_name=? AND sql IS NOT NULL",
+                        (table,)
+                    ).fetchall():
+                        conn.execute(index_sql.replace("CREATE INDEX ", "CREATE INDEX IF NOT EXISTS ", 1))
+                    logger.info(f"  {table}: created in archive")
+
                 # Get row count before merge
                 cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
                 count_before = cursor.fetchone()[0]
@@ -142,6 +165,9 @@ def _merge_database(source_db: Path, archive_db: Path, db_name: str):
                 rows_added = count_after - count_before
                 logger.info(f"  {table}: +{rows_added} rows (total: {count_after})")
 
+            if db_name == 'total':
+                _rebuild_partition_view(conn)
+
             # Commit
             conn.commit()
 
@@ -156,6 +182,63 @@ def _merge_database(source_db: Path, archive_db: Path, db_name: str):
         raise
 
 
+def _table_exists(conn: sqlite3.Connection, schema: str, table: str) -> bool:
+    """
+    Check whether a table exists in an attached schema.
+
+    Args:
+        conn: Archive connection
+        schema: Schema name ('main' or attached alias)
+        table: Table name
+
+    Returns:
+        True if the table exists
+    """
+    cursor = conn.execute(
+        f"SELECT 1 FROM {schema}.sqlite_master WHERE type='table' AND name=?",
+        (table,)
+    )
+    return cursor.fetchone() is not None
+
+
+def _list_source_partitions(conn: sqlite3.Connection) -> List[str]:
+    """
+    List daily sensor_data partition tables in the attached source.
+
+    Args:
+        conn: Archive connection with source attached
+
+    Returns:
+        Sorted partition table names (sensor_data_pYYYYMMDD)
+    """
+    cursor = conn.execute(
+        "SELECT name FROM source.sqlite_master WHERE type='table' AND name GLOB ?",
+        ('sensor_data_p[0-9][0-9][0-9][0-9][0-9][0-9][0-9][0-9]',)
+    )
+    return sorted(row[0] for row in cursor.fetchall())
+
+
+def _rebuild_partition_view(conn: sqlite3.Connection):
+    """
+    Recreate the sensor_data_all view over the archive's partitions.
+
+    Args:
+        conn: Archive connection
+    """
+    partitions = sorted(
+        row[0] for row in conn.execute(
+            "SELECT name FROM main.sqlite_master WHERE type='table' AND name GLOB ?",
+            ('sensor_data_p[0-9][0-9][0-9][0-9][0-9][0-9][0-9][0-9]',)
+        ).fetchall()
+    )
+    if not partitions:
+        return
+
+    conn.execute("DROP VIEW IF EXISTS main.sensor_data_all")
+    union = " UNION ALL ".join(f"SELECT * FROM {name}" for name in partitions)
+    conn.execute(f"CREATE VIEW main.sensor_data_all AS {union}")
+
+
 def _get_table_names(db_name: str) -> List[str]:
     """
     Get table names for database type.
@@ -167,8 +250,8 @@ def _get_table_names(db_name: str) -> List[str]:
         List of table names
     """
     tables = {
-        'raw': ['sensor_data'],
-        'total': ['processed_data', 'cutting_sessions'],
+        'raw': ['raw_registers', 'raw_register_chunks'],
+        'total': ['sensor_data', 'cutting_sessions'],
         'log': ['system_logs'],
         'ml': ['ml_predictions']
     }
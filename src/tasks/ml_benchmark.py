@@ -0,0 +1,237 @@
+"""
+ML controller benchmark - end-to-end MLController.calculate_speeds latency.
+
+Drives MLController with a synthetic cutting stream (testere_durumu == 3,
+no rate limiting) and reports per-call latency. The production model is
+kept in Git LFS, so a stand-in BaggingRegressor is trained on synthetic
+data with the trained feature order, once with feature names (fit on a
+DataFrame, like the production model) and once without (fit on an array).
+Both go through sklearn's model.predict; a third run uses the compiled
+ensemble (ml.compiled_inference), and a fourth adds two shadow models to
+the compiled run to show the per-cycle cost of shadow scoring.
+
+Usage:
+    python -m src.tasks.ml_benchmark
+    python -m src.tasks.ml_benchmark --cycles 5000 --estimators 50
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+
+import joblib
+import numpy as np
+import pandas as pd
+import yaml
+
+from src.domain.models import ProcessedData, RawSensorData
+from src.ml.compiled_model import compile_model
+from src.ml.preprocessor import FEATURE_NAMES
+from src.services.control.ml_controller import MLController
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+# Per-command INFO logs would dominate the output
+logging.getLogger('src.services.control.ml_controller').setLevel(logging.WARNING)
+
+CONFIG_PATH = Path("config/config.yaml")
+
+
+class _NullDatabase:
+    """Stand-in for ml.db SQLiteService (discards writes)."""
+
+    def write_async(self, sql, params=None) -> bool:
+        return True
+
+    def append_rows(self, table, rows, columns=None) -> bool:
+        return True
+
+
+def train_stand_in_model(estimators: int, feature_names: bool, seed: int = 0):
+    """
+    Train a BaggingRegressor with the production feature layout.
+
+    Args:
+        estimators: Number of bagged trees
+        feature_names: Fit on a DataFrame (model records feature_names_in_)
+        seed: Random seed
+
+    Returns:
+        Fitted BaggingRegressor
+    """
+    from sklearn.ensemble import BaggingRegressor
+
+    rng = np.random.default_rng(seed)
+    n = 5000
+    features = np.column_stack([
+        rng.normal(20.0, 4.0, n),     # akim_input
+        rng.normal(0.0, 0.4, n),      # sapma_input
+        rng.normal(80.0, 10.0, n),    # kesme_hizi
+        rng.normal(40.0, 8.0, n),     # inme_hizi
+    ])
+    target = np.clip(
+        -0.08 * (features[:, 0] - 20.0) - 0.5 * np.abs(features[:, 1]) + rng.normal(0.0, 0.1, n),
+        -1.0, 1.0
+    )
+
+    model = BaggingRegressor(n_estimators=estimators, random_state=seed)
+    if feature_names:
+        model.fit(pd.DataFrame(features, columns=list(FEATURE_NAMES)), target)
+    else:
+        model.fit(features, target)
+    return model
+
+
+def _make_stream(cycles: int, seed: int = 1):
+    """Synthetic cutting samples as ProcessedData."""
+    rng = np.random.default_rng(seed)
+    stream = []
+    for i in range(cycles):
+        raw = RawSensorData(
+            timestamp=datetime.now(),
+            serit_motor_tork_percentage=float(rng.normal(35.0, 3.0)),
+            serit_kesme_hizi=float(rng.normal(80.0, 2.0)),
+            serit_inme_hizi=float(rng.normal(40.0, 2.0)),
+            serit_sapmasi=float(rng.normal(0.0, 0.2)),
+            kafa_yuksekligi_mm=300.0 - i * 0.05,
+            testere_durumu=3,
+        )
+        stream.append(ProcessedData(timestamp=raw.timestamp, raw_data=raw, is_cutting=True))
+    return stream
+
+
+def run_benchmark(cycles: int, estimators: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure calculate_speeds latency for named and unnamed stand-in models.
+
+    Args:
+        cycles: Measured calls per model
+        estimators: Trees in the stand-in model
+
+    Returns:
+        Results keyed by model variant with mean_us, p50_us, p99_us
+    """
+    with open(CONFIG_PATH, encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config['ml']['min_speed_update_interval'] = 0.0
+
+    variants = (
+        ('feature_names', True, False, 0),
+        ('array', False, False, 0),
+        ('compiled', True, True, 0),
+        ('compiled+2shadow', True, True, 2),
+    )
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for variant, feature_names, compiled, shadows in variants:
+            model_path = Path(tmp) / f"model_{variant}.pkl"
+            joblib.dump(train_stand_in_model(estimators, feature_names), model_path)
+            config['ml']['model_path'] = str(model_path)
+            config['ml']['compiled_inference'] = compiled
+
+            shadow_models = []
+            for i in range(shadows):
+                shadow_path = Path(tmp) / f"shadow_{variant}_{i}.pkl"
+                joblib.dump(train_stand_in_model(estimators, feature_names, seed=i + 1), shadow_path)
+                shadow_models.append({'name': f"shadow{i}", 'path': str(shadow_path)})
+            config['ml']['registry'] = {'shadow_models': shadow_models, 'watch_interval': 0}
+
+            controller = MLController(config, modbus_service=None, db_service=_NullDatabase())
+            stream = _make_stream(cycles + 50)
+
+            # Background preload; wait so the timed loop doesn't skip cycles
+            controller.start()
+            controller.model_registry.wait_ready()
+
+            async def drive():
+                timings = []
+                for i, processed in enumerate(stream):
+                    start = time.perf_counter()
+                    await controller.calculate_speeds(processed)
+                    if i >= 50:  # Skip model load and buffer warmup
+                        timings.append(time.perf_counter() - start)
+                    # A job that missed its deadline would finish well before the
+                    # next 10 Hz cycle; don't time back-to-back busy skips
+                    pending = controller._pending_inference
+                    if pending is not None:
+                        await asyncio.wait({pending})
+                return np.array(timings) * 1e6
+
+            timings = asyncio.run(drive())
+            controller.shutdown()
+            stats = controller.get_stats()
+            results[variant] = {
+                'mean_us': float(timings.mean()),
+                'p50_us': float(np.percentile(timings, 50)),
+                'p99_us': float(np.percentile(timings, 99)),
+            }
+            logger.info(
+                f"{variant:<14} mean={timings.mean():7.1f}us "
+                f"p50={results[variant]['p50_us']:7.1f}us "
+                f"p99={results[variant]['p99_us']:7.1f}us "
+                f"(predictions={stats['predictions']}, "
+                f"deadline_misses={stats['inference_deadline_misses']}, "
+                f"shadow_rows={stats['model_registry']['shadow_rows_scored']})"
+            )
+
+    return results
+
+
+def run_predict_benchmark(estimators: int, rows: int = 500) -> Dict[str, float]:
+    """
+    Measure single-row model.predict vs compiled predict_one.
+
+    Args:
+        estimators: Trees in the stand-in model
+        rows: Rows predicted one at a time
+
+    Returns:
+        Dictionary with sklearn_us, compiled_us
+    """
+    model = train_stand_in_model(estimators, feature_names=True)
+    compiled = compile_model(model, FEATURE_NAMES)
+    inputs = np.random.default_rng(2).normal([20.0, 0.0, 80.0, 40.0], [4.0, 0.4, 10.0, 8.0], (rows, 4))
+
+    start = time.perf_counter()
+    for row in inputs[:50]:
+        model.predict(pd.DataFrame(row[None, :], columns=list(FEATURE_NAMES)))
+    sklearn_us = (time.perf_counter() - start) / 50 * 1e6
+
+    start = time.perf_counter()
+    for row in inputs:
+        compiled.predict_one(row)
+    compiled_us = (time.perf_counter() - start) / rows * 1e6
+
+    logger.info(
+        f"single-row predict ({estimators} trees, {compiled.node_count} nodes): "
+        f"sklearn={sklearn_us:.1f}us compiled={compiled_us:.1f}us"
+    )
+    return {'sklearn_us': sklearn_us, 'compiled_us': compiled_us}
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="MLController.calculate_speeds benchmark")
+    parser.add_argument("--cycles", type=int, default=2000,
+                        help="Measured calculate_speeds calls per model")
+    parser.add_argument("--estimators", type=int, default=10,
+                        help="Trees in the stand-in BaggingRegressor")
+    args = parser.parse_args()
+
+    run_predict_benchmark(args.estimators)
+    run_benchmark(args.cycles, args.estimators)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,446 @@
+"""
+End-to-end pipeline benchmark against the replaying PLC simulator.
+
+Starts src/services/modbus/simulator.PLCSimulator on localhost with samples
+from a recorded raw.db (or synthetic cuts), then runs the full
+ApplicationLifecycle against it (temporary databases, GUI and camera off)
+and reports:
+
+- Cycle period and jitter as seen by the PLC (sensor block read intervals;
+  the acquisition period with --acquisition-hz)
+- Achieved high-rate acquisition rate (--acquisition-hz)
+- Pipeline cycle time (last/max), overruns and scheduler lateness (jitter)
+- Sensor read to speed write latency (ML mode)
+- SQLite writes/s per database and peak write queue
+- IoT batch queue depth (telemetry goes to a local HTTP sink, never to
+  the configured ThingsBoard server)
+- Per-stage latency percentiles from the pipeline histograms, and the
+  cost of recording them as a share of the median cycle time
+
+Profiles:
+    realistic  1x replay, 10 Hz pipeline
+    stress     10x replay, 50 Hz pipeline
+
+Usage:
+    python -m src.tasks.pipeline_benchmark --raw-db data/raw.db --duration 60
+    python -m src.tasks.pipeline_benchmark --profile stress --mode ml
+    python -m src.tasks.pipeline_benchmark --acquisition-hz 50
+    python -m src.tasks.pipeline_benchmark --serve --speed 1.0 --port 5020
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Tuple
+
+import joblib
+import numpy as np
+import yaml
+
+from src.services.database.raw_store import RAW_REGISTER_COUNT
+from src.services.database.schemas import RAW_REGISTER_COLUMNS, SCHEMA_RAW_DB
+from src.services.modbus.simulator import CUTTING_STATE, PLCSimulator, load_raw_samples
+from src.services.processing.latency import PIPELINE_STAGES, PipelineLatency
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = Path("config/config.yaml")
+
+PROFILES = {
+    'realistic': {'speed': 1.0, 'rate_hz': 10.0},
+    'stress': {'speed': 10.0, 'rate_hz': 50.0},
+}
+
+
+def make_synthetic_raw_db(
+    path: Path,
+    duration_s: float = 600.0,
+    cut_s: float = 120.0,
+    idle_s: float = 30.0,
+    seed: int = 0
+) -> Path:
+    """
+    Write synthetic 10 Hz raw_registers rows (alternating idle and cuts).
+
+    Args:
+        path: raw.db to create
+        duration_s: Recording length in seconds
+        cut_s: Cut duration in seconds
+        idle_s: Idle time between cuts in seconds
+        seed: RNG seed
+
+    Returns:
+        path
+    """
+    rng = np.random.default_rng(seed)
+    samples = int(duration_s * 10)
+    start = datetime(2025, 5, 1, 8, 0, 0)
+
+    phase = (np.arange(samples) / 10.0) % (cut_s + idle_s)
+    cutting = phase >= idle_s
+    registers = np.zeros((samples, RAW_REGISTER_COUNT), dtype=np.int64)
+    registers[:, 0] = 1                                                   # makine_id
+    registers[:, 1] = 1                                                   # serit_id
+    registers[:, 13] = np.where(cutting, 3000 - (phase - idle_s) * 15, 3000)  # kafa_yuksekligi x10
+    registers[:, 15] = np.where(cutting, 200 + rng.normal(0, 15, samples), 0)  # serit_motor_akim x10
+    registers[:, 16] = np.where(
+        cutting, 300 + np.cumsum(rng.normal(0, 2, samples)).clip(-100, 300), 0
+    )                                                                     # serit_motor_tork x10
+    registers[:, 24] = (rng.normal(0, 20, samples).astype(np.int64)) & 0xFFFF  # serit_sapmasi x100
+    registers[:, 30] = np.where(cutting, CUTTING_STATE, 0)               # testere_durumu
+    registers[:, 33] = np.where(cutting, 800, 0)                          # serit_kesme_hizi x10
+    registers[:, 34] = np.where(cutting, 40, 0)                           # serit_inme_hizi
+
+    connection = sqlite3.connect(path)
+    try:
+        connection.executescript(SCHEMA_RAW_DB)
+        connection.executemany(
+            f"INSERT INTO raw_registers ({', '.join(RAW_REGISTER_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(RAW_REGISTER_COLUMNS))})",
+            [
+                ((start + timedelta(milliseconds=100 * i)).isoformat(), *registers[i].clip(0, 0xFFFF).tolist())
+                for i in range(samples)
+            ]
+        )
+        connection.commit()
+    finally:
+        connection.close()
+    return path
+
+
+def measure_latency_overhead(iterations: int = 200000) -> float:
+    """
+    Cost of timing one stage (perf_counter_ns() + PipelineLatency.record()).
+
+    Args:
+        iterations: Records to time
+
+    Returns:
+        Nanoseconds per recorded stage
+    """
+    latency = PipelineLatency()
+    perf_ns = time.perf_counter_ns
+    start = perf_ns()
+    for i in range(iterations):
+        now_ns = perf_ns()
+        latency.record('control', 50_000 + (i & 1023) * 1000, now_ns)
+    return (perf_ns() - start) / iterations
+
+
+async def _telemetry_sink(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Minimal HTTP/1.1 endpoint that accepts every request (IoT stand-in)."""
+    try:
+        while True:
+            header = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in header.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def build_config(
+    base: dict,
+    data_dir: Path,
+    modbus_port: int,
+    rate_hz: float,
+    mode: str,
+    model_path: Optional[Path],
+    iot_port: Optional[int],
+    acquisition_hz: Optional[float] = None
+) -> dict:
+    """
+    Derive the benchmark configuration from config.yaml.
+
+    Args:
+        base: Loaded config.yaml
+        data_dir: Directory for the temporary databases
+        modbus_port: Simulator port on 127.0.0.1
+        rate_hz: Pipeline rate
+        mode: Control mode ('manual' or 'ml')
+        model_path: Model for ML mode (None keeps config)
+        iot_port: Local telemetry sink port (None disables IoT)
+        acquisition_hz: High-rate acquisition rate (None: sensor block read per cycle)
+
+    Returns:
+        New configuration dictionary
+    """
+    config = copy.deepcopy(base)
+    config['modbus']['host'] = "127.0.0.1"
+    config['modbus']['port'] = modbus_port
+    config['processing'] = {**config.get('processing', {}), 'rate_hz': rate_hz}
+    config['processing']['acquisition'] = {
+        **config['processing'].get('acquisition', {}),
+        'enabled': acquisition_hz is not None,
+        'rate_hz': acquisition_hz or 50,
+    }
+    config['control']['default_mode'] = mode
+    config['database']['sqlite']['path'] = str(data_dir)
+    config['database'].setdefault('postgresql', {})['enabled'] = False
+    config.setdefault('gui', {})['enabled'] = False
+    config.setdefault('camera', {})['enabled'] = False
+    if model_path is not None:
+        config['ml']['model_path'] = str(model_path)
+
+    thingsboard = config.setdefault('iot', {}).setdefault('thingsboard', {})
+    thingsboard['enabled'] = iot_port is not None
+    thingsboard['protocol'] = 'http'
+    thingsboard.setdefault('http', {}).update({'host': "127.0.0.1", 'port': iot_port or 0})
+    return config
+
+
+async def run_benchmark(
+    base_config: dict,
+    samples: Tuple[np.ndarray, np.ndarray],
+    speed: float,
+    rate_hz: float,
+    duration: float,
+    warmup: float = 3.0,
+    mode: str = 'manual',
+    model_path: Optional[Path] = None,
+    iot: bool = True,
+    acquisition_hz: Optional[float] = None
+) -> dict:
+    """
+    Run ApplicationLifecycle against the simulator and collect measurements.
+
+    Args:
+        base_config: Loaded config.yaml
+        samples: (timestamps_ms, registers) to replay
+        speed: Replay speed
+        rate_hz: Pipeline rate
+        duration: Measured seconds (after warm-up)
+        warmup: Seconds before measurements start
+        mode: Control mode ('manual' or 'ml')
+        model_path: Model for ML mode (None keeps config)
+        iot: Send telemetry to a local HTTP sink
+        acquisition_hz: Enable high-rate acquisition at this rate
+
+    Returns:
+        Result dictionary (see module docstring)
+    """
+    from src.core.lifecycle import ApplicationLifecycle
+
+    simulator = PLCSimulator(*samples, speed=speed)
+    port = await simulator.start(port=0)
+
+    sink = await asyncio.start_server(_telemetry_sink, "127.0.0.1", 0) if iot else None
+    iot_port = sink.sockets[0].getsockname()[1] if sink else None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = build_config(
+            base_config, Path(tmp), port, rate_hz, mode, model_path, iot_port, acquisition_hz
+        )
+        config_path = Path(tmp) / "config.yaml"
+        with open(config_path, 'w', encoding='utf-8') as f:
+            yaml.safe_dump(config, f)
+
+        app = ApplicationLifecycle(config_path)
+        try:
+            await app.start()
+            await asyncio.sleep(warmup)
+
+            simulator.reset_measurements()
+            pipeline = app.data_pipeline
+            start_stats = copy.deepcopy(pipeline.get_stats())
+            start_db = {name: service.get_stats() for name, service in app.db_services.items()}
+            start = time.perf_counter()
+
+            iot_depths, db_queue_peak = [], 0
+            while time.perf_counter() - start < duration:
+                await asyncio.sleep(0.25)
+                if app.iot_service is not None:
+                    iot_depths.append(app.iot_service.get_stats().get('queue_size', 0))
+                db_queue_peak = max(
+                    [db_queue_peak] + [s.get_stats()['queue_size'] for s in app.db_services.values()]
+                )
+
+            elapsed = time.perf_counter() - start
+            end_stats = pipeline.get_stats()
+            end_db = {name: service.get_stats() for name, service in app.db_services.items()}
+        finally:
+            await app.stop()
+            await simulator.stop()
+            if sink is not None:
+                sink.close()
+                await sink.wait_closed()
+
+    plc = simulator.get_stats()
+    record_ns = measure_latency_overhead()
+    cycle_p50_ms = end_stats['latency']['cycle']['p50_ms']
+    return {
+        'speed': speed,
+        'rate_hz': rate_hz,
+        'mode': mode,
+        'seconds': elapsed,
+        'cycles_per_s': (end_stats['cycles'] - start_stats['cycles']) / elapsed,
+        'errors': end_stats['errors'] - start_stats['errors'],
+        'overruns': end_stats['overruns'] - start_stats['overruns'],
+        'max_cycle_ms': end_stats['max_cycle_ms'],
+        'cycle_period': plc['read_interval'],
+        'write_latency': plc['write_latency'],
+        'speed_writes': plc['kesme_writes'] + plc['inme_writes'],
+        'db_writes_per_s': {
+            name: (end_db[name]['writes_completed'] - start_db[name]['writes_completed']) / elapsed
+            for name in end_db
+        },
+        'db_queue_peak': db_queue_peak,
+        'iot_queue_max': max(iot_depths) if iot_depths else None,
+        'iot_queue_mean': float(np.mean(iot_depths)) if iot_depths else None,
+        'latency': end_stats['latency'],
+        'scheduler': end_stats['scheduler'],
+        'acquisition': end_stats['acquisition'],
+        'latency_record_ns': record_ns,
+        'latency_overhead_pct': (
+            100.0 * record_ns * len(PIPELINE_STAGES) / (cycle_p50_ms * 1e6) if cycle_p50_ms else None
+        ),
+    }
+
+
+async def serve(samples: Tuple[np.ndarray, np.ndarray], speed: float, host: str, port: int):
+    """Run the simulator alone until interrupted (point config.yaml modbus at it)."""
+    simulator = PLCSimulator(*samples, speed=speed)
+    await simulator.start(host, port)
+    try:
+        while True:
+            await asyncio.sleep(10.0)
+            stats = simulator.get_stats()
+            logger.info(
+                f"sim_time={stats['sim_time']} reads={stats['sensor_reads']} "
+                f"writes={stats['kesme_writes'] + stats['inme_writes']} "
+                f"period p50={stats['read_interval']['p50_ms']:.1f}ms "
+                f"std={stats['read_interval']['std_ms']:.1f}ms"
+            )
+    finally:
+        await simulator.stop()
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="End-to-end pipeline benchmark with a replaying PLC simulator")
+    parser.add_argument("--config", type=Path, default=CONFIG_PATH, help="Path to config.yaml")
+    parser.add_argument("--raw-db", type=Path, help="Recorded raw.db (default: synthetic cuts)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Replay samples from this time")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Replay samples before this time")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default='realistic')
+    parser.add_argument("--speed", type=float, help="Replay speed (overrides profile)")
+    parser.add_argument("--rate-hz", type=float, help="Pipeline rate (overrides profile)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    parser.add_argument("--mode", choices=['manual', 'ml'], default='manual', help="Control mode")
+    parser.add_argument("--stand-in-model", type=int, default=0, metavar="ESTIMATORS",
+                        help="ML mode: train a stand-in BaggingRegressor instead of config model_path")
+    parser.add_argument("--acquisition-hz", type=float,
+                        help="High-rate acquisition at this rate (default: off)")
+    parser.add_argument("--no-iot", action='store_true', help="Disable telemetry (default: local sink)")
+    parser.add_argument("--serve", action='store_true', help="Only run the simulator")
+    parser.add_argument("--host", default="127.0.0.1", help="--serve listen address")
+    parser.add_argument("--port", type=int, default=5020, help="--serve listen port")
+    args = parser.parse_args()
+
+    profile = PROFILES[args.profile]
+    speed = args.speed or profile['speed']
+    rate_hz = args.rate_hz or profile['rate_hz']
+
+    with open(args.config, encoding='utf-8') as f:
+        base_config = yaml.safe_load(f)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_db = args.raw_db or make_synthetic_raw_db(Path(tmp) / "raw.db")
+        samples = load_raw_samples(raw_db, args.since, args.until)
+        if not len(samples[0]):
+            logger.error(f"No samples in {raw_db}")
+            return 1
+        logger.info(f"Replaying {len(samples[0])} samples from {raw_db}")
+
+        if args.serve:
+            try:
+                asyncio.run(serve(samples, speed, args.host, args.port))
+            except KeyboardInterrupt:
+                pass
+            return 0
+
+        model_path = None
+        if args.stand_in_model:
+            from src.tasks.ml_benchmark import train_stand_in_model
+
+            model_path = Path(tmp) / "stand_in.pkl"
+            joblib.dump(train_stand_in_model(args.stand_in_model, feature_names=True), model_path)
+
+        result = asyncio.run(run_benchmark(
+            base_config, samples, speed, rate_hz, args.duration,
+            mode=args.mode, model_path=model_path, iot=not args.no_iot,
+            acquisition_hz=args.acquisition_hz
+        ))
+
+    period, latency = result['cycle_period'], result['write_latency']
+    logger.info(
+        f"{args.profile} ({speed:g}x, {rate_hz:g} Hz, {args.mode}): "
+        f"{result['cycles_per_s']:.1f} cycles/s, errors={result['errors']}, "
+        f"overruns={result['overruns']}, max cycle={result['max_cycle_ms']:.1f}ms"
+    )
+    logger.info(
+        f"Cycle period p50={period['p50_ms']:.1f}ms p99={period['p99_ms']:.1f}ms "
+        f"max={period['max_ms']:.1f}ms jitter(std)={period['std_ms']:.2f}ms"
+    )
+    if latency['count']:
+        logger.info(
+            f"Read->write latency p50={latency['p50_ms']:.1f}ms p99={latency['p99_ms']:.1f}ms "
+            f"({result['speed_writes']} writes)"
+        )
+    sched = result['scheduler']
+    if sched['lateness']['count']:
+        logger.info(
+            f"Scheduler ({sched['policy']}): lateness p50={sched['lateness']['p50_ms']:.2f}ms "
+            f"p99={sched['lateness']['p99_ms']:.2f}ms max={sched['lateness']['max_ms']:.2f}ms, "
+            f"overruns={sched['overruns']}, skipped={sched['skipped_ticks']}"
+        )
+    acquisition = result['acquisition']
+    if acquisition and acquisition['achieved_rate_hz'] is not None:
+        logger.info(
+            f"Acquisition: {acquisition['achieved_rate_hz']:.1f}/{acquisition['target_rate_hz']:.0f} Hz "
+            f"({acquisition['samples']} samples, read_errors={acquisition['read_errors']}, "
+            f"dropped={acquisition['dropped']}, skipped={acquisition['scheduler']['skipped_ticks']})"
+        )
+    db_rates = ", ".join(f"{name}={rate:.1f}" for name, rate in result['db_writes_per_s'].items())
+    logger.info(f"DB writes/s: {db_rates}; peak queue={result['db_queue_peak']}")
+    logger.info(
+        f"IoT queue: max={result['iot_queue_max']} mean={result['iot_queue_mean']}"
+        if result['iot_queue_max'] is not None else "IoT: not running"
+    )
+    for stage, s in result['latency'].items():
+        if s['count']:
+            logger.info(
+                f"  {stage:<12} p50={s['p50_ms']:.3f}ms p95={s['p95_ms']:.3f}ms "
+                f"p99={s['p99_ms']:.3f}ms max={s['max_ms']:.3f}ms (n={s['count']})"
+            )
+    if result['latency_overhead_pct'] is not None:
+        logger.info(
+            f"Latency recording: {result['latency_record_ns']:.0f}ns/stage, "
+            f"{result['latency_overhead_pct']:.3f}% of median cycle time"
+        )
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
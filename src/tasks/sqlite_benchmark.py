@@ -0,0 +1,182 @@
+"""
+SQLite writer benchmark - replays a day of 10 Hz rows through the writer.
+
+Compares the legacy per-item conn.execute() loop against the grouped
+executemany() path used by SQLiteService, on the real raw.db and total.db
+schemas. Reports writer CPU time and per-commit latency.
+
+Usage:
+    python -m src.tasks.sqlite_benchmark --rows 864000
+"""
+
+import argparse
+import logging
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from src.services.database.schemas import (
+    SCHEMAS,
+    RAW_REGISTER_COLUMNS,
+    SENSOR_DATA_COLUMNS,
+)
+from src.services.database.sqlite_service import SQLiteService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+# One day at 10 Hz
+DAY_ROWS_10HZ = 864_000
+
+
+def _insert_sql(table: str, columns) -> str:
+    """INSERT statement in the same form SQLiteService.append_rows() builds."""
+    placeholders = ", ".join("?" for _ in columns)
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+def _make_rows(table: str, count: int) -> List[tuple]:
+    """
+    Generate synthetic rows with realistic types for a table.
+
+    Args:
+        table: 'raw_registers' or 'sensor_data'
+        count: Number of rows
+
+    Returns:
+        List of row tuples in column order
+    """
+    rng = random.Random(42)
+    start = datetime(2026, 1, 1)
+    rows = []
+
+    for i in range(count):
+        ts = (start + timedelta(milliseconds=100 * i)).isoformat()
+        if table == 'raw_registers':
+            rows.append((ts, *(rng.randrange(0, 65536) for _ in range(44))))
+        else:
+            values = [rng.random() * 100 for _ in range(len(SENSOR_DATA_COLUMNS) - 1)]
+            rows.append((ts, *values))
+
+    return rows
+
+
+def _legacy_apply(conn: sqlite3.Connection, batch: List[tuple]):
+    """Pre-executemany writer: one execute() per queued item."""
+    for sql, params, _ in batch:
+        conn.execute(sql, params)
+    conn.commit()
+
+
+def _run(
+    label: str,
+    db_file: Path,
+    schema: str,
+    sql: str,
+    rows: List[tuple],
+    batch_size: int,
+    apply: Callable[[sqlite3.Connection, List[tuple]], None]
+) -> Dict[str, float]:
+    """
+    Replay rows in writer-sized batches and measure cost.
+
+    Returns:
+        Dictionary with wall/cpu seconds and commit latency percentiles (ms)
+    """
+    conn = sqlite3.connect(str(db_file))
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(schema)
+    conn.commit()
+
+    commit_latencies = []
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    for offset in range(0, len(rows), batch_size):
+        batch = [(sql, row, False) for row in rows[offset:offset + batch_size]]
+        t0 = time.perf_counter()
+        apply(conn, batch)
+        commit_latencies.append((time.perf_counter() - t0) * 1000)
+
+    result = {
+        'wall_s': time.perf_counter() - wall_start,
+        'cpu_s': time.process_time() - cpu_start,
+        'commit_p50_ms': statistics.median(commit_latencies),
+        'commit_p99_ms': sorted(commit_latencies)[int(len(commit_latencies) * 0.99) - 1],
+    }
+    conn.close()
+
+    logger.info(
+        f"{label:<22} wall={result['wall_s']:.2f}s cpu={result['cpu_s']:.2f}s "
+        f"commit p50={result['commit_p50_ms']:.2f}ms p99={result['commit_p99_ms']:.2f}ms"
+    )
+    return result
+
+
+def run_benchmark(rows: int, batch_size: int) -> Dict[str, Dict[str, float]]:
+    """
+    Run legacy vs grouped writer for raw_registers and sensor_data.
+
+    Args:
+        rows: Rows per table to replay
+        batch_size: Items per writer batch
+
+    Returns:
+        Results keyed by "<table>/<mode>"
+    """
+    results = {}
+    service = SQLiteService(Path("unused.db"), "")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for db_name, table, columns in (
+            ('raw', 'raw_registers', RAW_REGISTER_COLUMNS),
+            ('total', 'sensor_data', SENSOR_DATA_COLUMNS),
+        ):
+            data = _make_rows(table, rows)
+            sql = _insert_sql(table, columns)
+            logger.info(f"{table}: {rows} rows, batch={batch_size}")
+
+            legacy = _run(
+                f"{table} legacy", tmp_dir / f"{db_name}_legacy.db",
+                SCHEMAS[db_name], sql, data, batch_size, _legacy_apply
+            )
+            grouped = _run(
+                f"{table} executemany", tmp_dir / f"{db_name}_grouped.db",
+                SCHEMAS[db_name], sql, data, batch_size, service._apply_batch
+            )
+
+            logger.info(
+                f"{table}: cpu speedup x{legacy['cpu_s'] / grouped['cpu_s']:.1f}, "
+                f"commit p50 speedup x{legacy['commit_p50_ms'] / grouped['commit_p50_ms']:.1f}"
+            )
+            results[f"{table}/legacy"] = legacy
+            results[f"{table}/executemany"] = grouped
+
+    return results
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="SQLite writer benchmark")
+    parser.add_argument("--rows", type=int, default=DAY_ROWS_10HZ,
+                        help="Rows per table (default: one day at 10 Hz)")
+    parser.add_argument("--batch-size", type=int, default=100,
+                        help="Items per writer batch (SQLiteService default: 100)")
+    args = parser.parse_args()
+
+    run_benchmark(args.rows, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+What-if grid run over recorded cuts - offline tuning of ML controller settings.
+
+Re-simulates MLController decisions (katsayi, write thresholds, Torque
+Guard) for a grid of settings over the cuts in total.db/ml.db and writes
+per-setting command/write counts and mean simulated speeds as CSV. With
+--traces-dir, the written speed targets of every cut and setting are saved
+as kesim_<id>.npz. See src/services/control/what_if.py for the model.
+
+--synthetic N generates N synthetic cuts into temporary databases instead
+(timing and smoke runs without recorded data).
+
+Usage:
+    python -m src.tasks.what_if --since 2025-05-01 --until 2025-06-01 \\
+        --grid katsayi=0.8,1.0,1.2 --grid inme_threshold=0.5,1.0,1.5 \\
+        --grid tg_threshold=30,40,50 --csv what_if.csv
+    python -m src.tasks.what_if --synthetic 300 --grid katsayi=0.6,0.8,1.0,1.2
+"""
+
+import argparse
+import csv
+import logging
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import yaml
+
+from src.services.control.what_if import (
+    GRID_PARAMETERS,
+    SUMMARY_FIELDS,
+    SimulationSettings,
+    base_parameters,
+    build_grid,
+    grid_size,
+    list_cuts,
+    run_grid,
+)
+from src.services.database.schemas import SCHEMA_ML_DB, SCHEMA_TOTAL_DB
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+logger = logging.getLogger(__name__)
+
+CONFIG_PATH = Path("config/config.yaml")
+
+
+def parse_axis(text: str) -> Tuple[str, List[float]]:
+    """Parse 'name=v1,v2,...' into (name, values)."""
+    name, sep, values = text.partition('=')
+    if not sep or name not in GRID_PARAMETERS:
+        raise argparse.ArgumentTypeError(
+            f"expected name=v1,v2,... with name in {', '.join(GRID_PARAMETERS)}"
+        )
+    return name, [float(value) for value in values.split(',') if value]
+
+
+def make_synthetic_databases(directory: Path, cuts: int, duration_s: float = 300.0, seed: int = 0) -> Tuple[Path, Path]:
+    """
+    Write synthetic cuts (10 Hz sensor rows, 5 Hz predictions) to new databases.
+
+    Args:
+        directory: Where total.db and ml.db are created
+        cuts: Number of cuts
+        duration_s: Cut duration in seconds
+        seed: RNG seed
+
+    Returns:
+        (total.db path, ml.db path)
+    """
+    total_db = Path(directory) / "total.db"
+    ml_db = Path(directory) / "ml.db"
+    rng = np.random.default_rng(seed)
+    samples = int(duration_s * 10)
+    start = datetime(2025, 5, 1, 8, 0, 0)
+
+    total = sqlite3.connect(total_db)
+    ml = sqlite3.connect(ml_db)
+    total.executescript(SCHEMA_TOTAL_DB)
+    ml.executescript(SCHEMA_ML_DB)
+    try:
+        for kesim_id in range(1, cuts + 1):
+            cut_start = start + timedelta(minutes=10 * kesim_id)
+            times = [cut_start + timedelta(milliseconds=100 * i) for i in range(samples)]
+            torque = 30.0 + np.cumsum(rng.normal(0.0, 0.3, samples))
+            # Occasional torque spike (Torque Guard candidate)
+            if rng.random() < 0.3:
+                spike = int(rng.integers(samples // 3, samples))
+                torque[spike:] += 25.0
+            height = 300.0 - np.arange(samples) * 0.02
+            outputs = np.clip(rng.normal(-0.1, 0.4, samples), -1.0, 1.0)
+
+            total.execute(
+                "INSERT INTO cutting_sessions (kesim_id, start_time) VALUES (?, ?)",
+                (kesim_id, times[0].isoformat())
+            )
+            total.executemany(
+                "INSERT INTO sensor_data (timestamp, kesim_id, serit_motor_tork_percentage, "
+                "kafa_yuksekligi_mm, serit_kesme_hizi, serit_inme_hizi, testere_durumu) "
+                "VALUES (?, ?, ?, ?, 80.0, 40.0, 3)",
+                [(ts.isoformat(), kesim_id, float(q), float(h)) for ts, q, h in zip(times, torque, height)]
+            )
+            ml.executemany(
+                "INSERT INTO ml_predictions (timestamp, ml_output, katsayi, kesim_id) VALUES (?, ?, 1.0, ?)",
+                [
+                    ((times[i] + timedelta(milliseconds=5)).isoformat(), float(outputs[i]), kesim_id)
+                    for i in range(0, samples, 2)
+                ]
+            )
+        total.commit()
+        ml.commit()
+    finally:
+        total.close()
+        ml.close()
+    return total_db, ml_db
+
+
+def write_csv(path: Path, rows: List[dict]):
+    """Write report rows (parameters + summary fields) as CSV."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(GRID_PARAMETERS) + list(SUMMARY_FIELDS))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="What-if grid run of ML controller settings")
+    parser.add_argument("--config", type=Path, default=CONFIG_PATH, help="Path to config.yaml")
+    parser.add_argument("--total-db", type=Path, help="total.db (default: from config)")
+    parser.add_argument("--ml-db", type=Path, help="ml.db (default: from config)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="First cut start time")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Last cut start time (exclusive)")
+    parser.add_argument("--kesim-id", type=int, action='append', dest='kesim_ids',
+                        help="Simulate only these cuts (repeatable)")
+    parser.add_argument("--grid", type=parse_axis, action='append', default=[],
+                        help="Parameter axis name=v1,v2,... (repeatable)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Worker processes (default: CPU count, 1 = no pool)")
+    parser.add_argument("--traces-dir", type=Path, help="Save per-cut command traces here")
+    parser.add_argument("--csv", type=Path, help="Write per-setting results as CSV")
+    parser.add_argument("--top", type=int, default=10, help="Settings to log, fewest commands first")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Generate this many synthetic cuts instead of reading recorded data")
+    args = parser.parse_args()
+
+    with open(args.config, encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+
+    axes: Dict[str, List[float]] = {}
+    for name, values in args.grid:
+        axes[name] = values
+    grid = build_grid(base_parameters(config['ml']), axes)
+    settings = SimulationSettings.from_config(config)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.synthetic:
+            start = time.perf_counter()
+            total_db, ml_db = make_synthetic_databases(Path(tmp), args.synthetic)
+            logger.info(f"Generated {args.synthetic} synthetic cuts in {time.perf_counter() - start:.1f}s")
+        else:
+            sqlite_config = config['database']['sqlite']
+            db_dir = Path(sqlite_config['path'])
+            total_db = args.total_db or db_dir / sqlite_config['databases']['total']
+            ml_db = args.ml_db or db_dir / sqlite_config['databases']['ml']
+
+        kesim_ids = args.kesim_ids or list_cuts(total_db, args.since, args.until)
+        if not kesim_ids:
+            logger.error("No cuts found")
+            return 1
+
+        logger.info(f"Simulating {grid_size(grid)} settings over {len(kesim_ids)} cuts...")
+        start = time.perf_counter()
+        report = run_grid(total_db, ml_db, kesim_ids, grid, settings, args.processes, args.traces_dir)
+        logger.info(f"Done in {time.perf_counter() - start:.1f}s")
+
+    rows = report.rows()
+    if args.csv:
+        write_csv(args.csv, rows)
+        logger.info(f"Results written to {args.csv}")
+
+    varied = list(axes) or ['katsayi']
+    for row in sorted(rows, key=lambda r: r['commands'])[:args.top]:
+        params = ", ".join(f"{name}={row[name]:g}" for name in varied)
+        logger.info(
+            f"{params}: commands={row['commands']} "
+            f"(kesme={row['kesme_writes']}, inme={row['inme_writes']}), "
+            f"tg_triggers={row['tg_triggers']}, "
+            f"mean kesme={row['mean_kesme_hizi']:.1f} inme={row['mean_inme_hizi']:.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
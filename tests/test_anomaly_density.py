@@ -0,0 +1,90 @@
+"""Unit tests for the incremental 1-D density (DBSCAN-equivalent) method.
+
+Tests cover the noise test against sklearn DBSCAN labels (core, border and
+noise points, ties, inclusive eps), DENSITY_1D detector decisions against
+the sklearn-based DBSCAN method over a stream, config-selected methods and
+batch-mode equivalence.
+"""
+
+import numpy as np
+import pytest
+
+from src.anomaly.base import BaseAnomalyDetector, DetectionMethod
+from src.anomaly.manager import AnomalyManager, SENSOR_DATA_KEYS
+from src.anomaly.rolling import is_density_noise
+
+sklearn_cluster = pytest.importorskip("sklearn.cluster")
+
+
+def _sklearn_noise(values, eps, min_samples):
+    labels = sklearn_cluster.DBSCAN(eps=eps, min_samples=min_samples).fit_predict(
+        np.asarray(values).reshape(-1, 1)
+    )
+    return labels[-1] == -1
+
+
+def test_core_border_and_noise_points():
+    values = [0.0, 0.1, 0.2, 0.3, 1.0, 5.0]
+    ordered = sorted(values)
+    # 0.3 is a border point of the core at 0.2 (eps inclusive)
+    assert not is_density_noise(ordered, 0.3, eps=0.1 + 1e-12, min_samples=3)
+    assert is_density_noise(ordered, 1.0, eps=0.1, min_samples=3)
+    assert is_density_noise(ordered, 5.0, eps=0.5, min_samples=2)
+    assert not is_density_noise(ordered, 0.1, eps=0.1 + 1e-12, min_samples=3)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_sklearn_labels(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(200):
+        n = int(rng.integers(5, 120))
+        values = np.round(rng.normal(0.0, 1.0, n), 1)  # ties
+        values[rng.random(n) < 0.05] += rng.choice([-6.0, 6.0])
+        eps = float(rng.choice([0.05, 0.1, 0.2, 0.35, 1.0]))
+        min_samples = int(rng.integers(2, 12))
+
+        expected = _sklearn_noise(values, eps, min_samples)
+        assert is_density_noise(sorted(values.tolist()), float(values[-1]), eps, min_samples) == expected
+
+
+def test_density_detector_matches_dbscan_detector():
+    rng = np.random.default_rng(9)
+    stream = np.round(rng.normal(20.0, 1.5, 1500), 2)
+    stream[rng.choice(len(stream), 40, replace=False)] += 12.0
+
+    dbscan = BaseAnomalyDetector('s', 's', DetectionMethod.DBSCAN, buffer_size=100, min_samples=10)
+    density = BaseAnomalyDetector('s', 's', DetectionMethod.DENSITY_1D, buffer_size=100, min_samples=10)
+
+    flagged = 0
+    for value in stream:
+        dbscan.add_data_point(value)
+        density.add_data_point(value)
+        result = density.detect()
+        assert result == dbscan.detect()
+        flagged += result
+    assert flagged > 0
+
+
+def test_sensor_methods_from_config():
+    manager = AnomalyManager(sensor_methods={
+        'serit_sapmasi': 'density_1d',
+        'titresim_x': 'z_score',
+        'unknown_sensor': 'iqr',
+        'titresim_y': 'not_a_method',
+    })
+    assert manager.get_detector('serit_sapmasi').method == DetectionMethod.DENSITY_1D
+    assert manager.get_detector('titresim_x').method == DetectionMethod.Z_SCORE
+    assert manager.get_detector('titresim_y').method == DetectionMethod.IQR
+
+
+def test_batch_mode_matches_per_detector_for_density():
+    methods = {'serit_sapmasi': 'density_1d', 'serit_motor_akim': 'density_1d'}
+    legacy = AnomalyManager(buffer_size=60, sensor_methods=methods)
+    batch = AnomalyManager(buffer_size=60, batch_mode=True, sensor_methods=methods)
+
+    rng = np.random.default_rng(4)
+    data = np.round(rng.normal(30.0, 2.0, (400, len(SENSOR_DATA_KEYS))), 1)
+    data[rng.random(data.shape) < 0.03] += 15.0
+    for row in data:
+        sample = dict(zip(SENSOR_DATA_KEYS, row.tolist()))
+        assert batch.process_data(sample) == legacy.process_data(sample)
@@ -0,0 +1,109 @@
+"""Unit tests for the streaming rolling statistics used by anomaly detectors.
+
+Tests cover ring-buffer ordering and eviction, quantiles matching
+np.percentile exactly, Welford mean/variance (including drift resync) and
+Z-score/IQR detector decisions against the legacy full-window computation.
+"""
+
+from collections import deque
+
+import numpy as np
+import pytest
+
+from src.anomaly.base import BaseAnomalyDetector, DetectionMethod
+from src.anomaly.rolling import RollingWindow
+
+
+def _legacy_decision(values, method):
+    """Detector decision as computed from the whole window (pre-rolling code)."""
+    values_array = np.array(values)
+    last = values[-1]
+    if method == DetectionMethod.Z_SCORE:
+        std = np.std(values_array)
+        if std == 0:
+            return False
+        return abs((last - np.mean(values_array)) / std) > 3.0
+
+    q1 = np.percentile(values_array, 25)
+    q3 = np.percentile(values_array, 75)
+    iqr = q3 - q1
+    if iqr == 0:
+        std = np.std(values_array)
+        if std == 0:
+            return False
+        return abs(last - np.mean(values_array)) > 3 * std
+    return last < q1 - 1.5 * iqr or last > q3 + 1.5 * iqr
+
+
+def test_ring_keeps_last_capacity_values_in_order():
+    window = RollingWindow(4)
+    evicted = [window.push(v) for v in range(6)]
+
+    assert evicted == [None, None, None, None, 0.0, 1.0]
+    assert window.values().tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert window.last == 5.0
+    assert (window.min, window.max) == (2.0, 5.0)
+
+    window.clear()
+    assert len(window) == 0
+    assert window.last is None
+
+
+@pytest.mark.parametrize("capacity", [4, 7, 100])
+def test_quantiles_match_numpy_exactly(capacity):
+    rng = np.random.default_rng(1)
+    window = RollingWindow(capacity)
+    # Quantised values produce ties, like real register data
+    for value in np.round(rng.normal(10.0, 3.0, 5 * capacity), 1):
+        window.push(value)
+        values = window.values()
+        for q in (0.0, 0.25, 0.5, 0.75, 1.0):
+            assert window.quantile(q) == np.percentile(values, q * 100)
+
+
+def test_welford_mean_and_variance_track_window():
+    rng = np.random.default_rng(2)
+    window = RollingWindow(50)
+    for value in rng.normal(1e4, 1.0, 1000):
+        window.push(value)
+        values = window.values()
+        assert window.mean == pytest.approx(np.mean(values), rel=1e-12)
+        assert window.variance == pytest.approx(np.var(values), rel=1e-6)
+
+
+def test_constant_window_has_zero_variance():
+    window = RollingWindow(10)
+    for value in [1.0, 5.0] + [0.1] * 10:
+        window.push(value)
+    assert window.is_constant()
+    assert window.variance == 0.0
+    assert window.std == 0.0
+
+
+@pytest.mark.parametrize("method", [DetectionMethod.Z_SCORE, DetectionMethod.IQR])
+def test_detector_matches_legacy_decisions(method):
+    rng = np.random.default_rng(3)
+    stream = np.round(rng.normal(50.0, 2.0, 3000), 2)
+    stream[rng.choice(len(stream), 60, replace=False)] += 25.0  # injected spikes
+    stream[1000:1200] = 42.0                                    # flat section
+
+    detector = BaseAnomalyDetector('s', 's', method, buffer_size=100, min_samples=10)
+    legacy = deque(maxlen=100)
+    flagged = 0
+
+    for value in stream:
+        detector.add_data_point(value)
+        legacy.append(float(value))
+        result = detector.detect()
+        expected = _legacy_decision(list(legacy), method) if len(legacy) >= 10 else False
+        assert result == expected
+        flagged += result
+
+    assert flagged > 0
+
+
+def test_detector_ignores_non_finite_values():
+    detector = BaseAnomalyDetector('s', 's', DetectionMethod.IQR, buffer_size=10, min_samples=1)
+    detector.add_data_point(1.0)
+    detector.add_data_point(float('nan'))
+    assert detector.get_buffer_size() == 1
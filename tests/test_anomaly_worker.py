@@ -0,0 +1,143 @@
+"""Unit tests for the anomaly detection worker thread.
+
+Tests cover result equivalence with inline detection in every_sample mode,
+drop counting when the queue is full, superseding in latest_only mode,
+tracker recording from the worker thread, error isolation and draining
+pending samples on stop.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.anomaly.manager import AnomalyManager, SENSOR_DATA_KEYS
+from src.services.processing.anomaly_worker import (
+    AnomalySample,
+    AnomalyWorker,
+    run_anomaly_detection,
+)
+
+
+class _Tracker:
+    """Records record_anomaly() calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def record_anomaly(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+class _BlockingManager:
+    """Manager stub that blocks until released, to fill the queue."""
+
+    batch_mode = True
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.seen = []
+
+    def process_values(self, values, is_cutting=False):
+        self.release.wait(5.0)
+        self.seen.append(values[0])
+        return {'SeritSapmasi': False}
+
+    def get_method_for_sensor(self, sensor_name):
+        return 'iqr'
+
+
+def _samples(count, seed=3):
+    rng = np.random.default_rng(seed)
+    data = np.round(rng.normal(40.0, 2.0, (count, len(SENSOR_DATA_KEYS))), 1)
+    data[rng.random(data.shape) < 0.03] += 20.0
+    return [AnomalySample(values=tuple(row.tolist()), is_cutting=True, kesim_id=7) for row in data]
+
+
+def test_every_sample_matches_inline_detection():
+    samples = _samples(400)
+    inline_tracker = _Tracker()
+    inline = AnomalyManager(buffer_size=50)
+    expected = [run_anomaly_detection(inline, inline_tracker, s) for s in samples]
+
+    worker_tracker = _Tracker()
+    worker = AnomalyWorker(AnomalyManager(buffer_size=50), worker_tracker, queue_size=len(samples))
+    for sample in _samples(400):
+        assert worker.submit(sample)
+    worker.start()
+    worker.stop(timeout=10.0)
+
+    stats = worker.get_stats()
+    assert stats['processed'] == len(samples)
+    assert stats['dropped'] == 0
+    assert stats['lag_samples'] == 0
+    assert worker.results_seq == len(samples)
+    assert worker.latest_results() == expected[-1]
+    assert worker_tracker.calls == inline_tracker.calls
+    assert len(worker_tracker.calls) > 0
+    assert worker_tracker.calls[0]['kesim_id'] == 7
+
+
+def test_every_sample_drops_when_full():
+    manager = _BlockingManager()
+    worker = AnomalyWorker(manager, _Tracker(), queue_size=3)
+    worker.start()
+
+    accepted = [worker.submit(AnomalySample(values=(float(i),), is_cutting=False)) for i in range(10)]
+    manager.release.set()
+    worker.stop()
+
+    stats = worker.get_stats()
+    assert stats['submitted'] == 10
+    assert stats['dropped'] == 10 - sum(accepted)
+    assert stats['dropped'] >= 6
+    assert stats['processed'] == sum(accepted)
+    assert stats['max_queue_depth'] == 3
+    # Accepted samples are processed in order
+    assert manager.seen == sorted(manager.seen)
+
+
+def test_latest_only_supersedes_stale_samples():
+    manager = _BlockingManager()
+    worker = AnomalyWorker(manager, _Tracker(), mode='latest_only')
+    worker.start()
+
+    for i in range(10):
+        assert worker.submit(AnomalySample(values=(float(i),), is_cutting=False))
+    manager.release.set()
+    worker.stop()
+
+    stats = worker.get_stats()
+    assert stats['dropped'] == 0
+    assert stats['processed'] + stats['superseded'] == 10
+    assert manager.seen[-1] == 9.0
+    assert stats['lag_samples'] == 0
+
+
+def test_errors_do_not_stop_worker():
+    class _FailingManager(_BlockingManager):
+        def process_values(self, values, is_cutting=False):
+            if values[0] < 0:
+                raise RuntimeError("boom")
+            return {'SeritSapmasi': True}
+
+    tracker = _Tracker()
+    worker = AnomalyWorker(_FailingManager(), tracker)
+    worker.start()
+    worker.submit(AnomalySample(values=(-1.0,), is_cutting=False))
+    worker.submit(AnomalySample(values=(2.0,), is_cutting=False))
+    worker.stop()
+
+    stats = worker.get_stats()
+    assert stats['errors'] == 1
+    assert stats['processed'] == 1
+    assert worker.latest_results() == {'SeritSapmasi': True}
+    assert tracker.calls[0]['sensor_value'] == 2.0
+    assert tracker.calls[0]['detection_method'] == 'iqr'
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        AnomalyWorker(AnomalyManager(), _Tracker(), mode='sometimes')
+    with pytest.raises(ValueError):
+        AnomalyWorker(AnomalyManager(), _Tracker(), queue_size=0)
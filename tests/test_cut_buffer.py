@@ -0,0 +1,125 @@
+"""Unit tests for the columnar cut buffer of the sensor page.
+
+Tests cover growth by doubling without a row cap, zero-copy column views
+for axis switching, per-cut reset keyed by kesim_id, and SensorController
+feeding the buffer and rebinding axes without re-adding points.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.gui.controllers.sensor_controller import SensorController
+from src.gui.cut_buffer import CUT_FIELDS, CutBuffer
+
+T0 = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _sample(i):
+    return {
+        'serit_kesme_hizi': 60.0 + i,
+        'serit_motor_akim_a': 10.0 + i / 10,
+        'kafa_yuksekligi_mm': 300.0 - i,
+        'serit_gerginligi_bar': 'n/a',          # Invalid values stored as 0.0
+    }
+
+
+def test_grows_by_doubling_and_keeps_every_sample():
+    buffer = CutBuffer(initial_capacity=4)
+    buffer.start(7, T0)
+    for i in range(5000):
+        buffer.append(_sample(i), T0 + timedelta(seconds=i * 0.2))
+
+    assert len(buffer) == 5000
+    assert buffer.capacity == 8192
+    assert buffer.column('serit_kesme_hizi')[0] == 60.0
+    assert buffer.column('serit_kesme_hizi')[-1] == 60.0 + 4999
+    assert buffer.column('timestamp')[-1] == pytest.approx(999.8)
+    assert buffer.last('serit_gerginligi_bar') == 0.0
+    assert buffer.first_at == T0
+
+
+def test_columns_are_views():
+    buffer = CutBuffer()
+    buffer.start(1, T0)
+    for i in range(10):
+        buffer.append(_sample(i), T0)
+
+    x, y = buffer.columns('kafa_yuksekligi_mm', 'serit_motor_akim_a')
+    assert np.shares_memory(x, buffer._columns['kafa_yuksekligi_mm'])
+    assert np.shares_memory(y, buffer._columns['serit_motor_akim_a'])
+    assert len(x) == len(y) == 10
+
+    with pytest.raises(KeyError):
+        buffer.column('unknown_axis')
+
+
+def test_start_resets_for_next_cut():
+    buffer = CutBuffer(initial_capacity=2)
+    buffer.start(1, T0)
+    for i in range(5):
+        buffer.append(_sample(i), T0)
+
+    buffer.start(2, T0 + timedelta(minutes=5))
+    assert len(buffer) == 0
+    assert buffer.kesim_id == 2
+    assert buffer.first('serit_kesme_hizi') is None
+    assert buffer.capacity == 8                 # Allocation kept
+    assert set(CUT_FIELDS) == set(buffer._columns)
+
+
+@pytest.fixture
+def controller():
+    """SensorController without Qt setup (__new__ + attribute injection)."""
+    ctrl = SensorController.__new__(SensorController)
+    ctrl._buffer_lock = threading.Lock()
+    ctrl.current_cut_buffer = CutBuffer()
+    ctrl.is_cutting = False
+    ctrl.cut_start_time = None
+    graph = MagicMock()
+    graph.x_axis_type = "timestamp"
+    graph.y_axis_type = "serit_kesme_hizi"
+    graph.start_height_value = None
+    ctrl.cutting_graph = graph
+    return ctrl
+
+
+def _tick(ctrl, i, kesim_id, durum=3):
+    ctrl._update_cutting_graph({**_sample(i), 'testere_durumu': durum, 'cutting_session_id': kesim_id})
+
+
+def test_controller_fills_buffer_and_switches_axes_without_copy(controller):
+    _tick(controller, 0, None)                  # Session ID not assigned yet
+    for i in range(1, 2500):
+        _tick(controller, i, 41)
+
+    buffer = controller.current_cut_buffer
+    assert len(buffer) == 2500                  # No 2000-point cap
+    assert buffer.kesim_id == 41
+    assert controller.cutting_graph.start_height_value == 300.0
+    assert controller.cutting_graph.current_height_value == 300.0 - 2499
+    controller.cutting_graph.add_data_point.assert_not_called()
+
+    controller.cutting_graph.x_axis_type = "kafa_yuksekligi_mm"
+    controller.cutting_graph.y_axis_type = "serit_motor_akim_a"
+    controller._rebuild_graph_from_buffer()
+    x, y = controller._graph_columns()
+    assert np.shares_memory(y, buffer._columns['serit_motor_akim_a'])
+    assert x[0] == 300.0 and len(y) == 2500
+    controller.cutting_graph.add_data_point.assert_not_called()
+
+
+def test_controller_new_kesim_id_starts_new_cut(controller):
+    for i in range(3):
+        _tick(controller, i, 41)
+    _tick(controller, 0, 42)                    # Next cut without an idle sample in between
+
+    assert controller.current_cut_buffer.kesim_id == 42
+    assert len(controller.current_cut_buffer) == 1
+
+    _tick(controller, 1, 42, durum=0)
+    assert controller.is_cutting is False
+    assert len(controller.current_cut_buffer) == 1   # Last cut kept for display
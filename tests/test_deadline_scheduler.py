@@ -0,0 +1,137 @@
+"""Unit tests for DeadlineScheduler.
+
+Tests cover the absolute-deadline grid (no drift), the skip and catch_up
+overrun policies, lateness accounting, the blocking/thread variant, and the
+processing pipeline exposing its scheduler stats.
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.processing.data_processor import DataProcessingPipeline
+from src.services.processing.scheduler import DeadlineScheduler
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_deadlines_do_not_drift():
+    clock = _FakeClock()
+    scheduler = DeadlineScheduler(0.1, clock=clock)
+
+    assert scheduler.next_delay() == 0.0
+    start = scheduler.next_deadline
+    for _ in range(1000):
+        clock.now += 0.013                     # Work
+        delay = scheduler.next_delay()
+        clock.now += delay + 0.002             # Every wake-up 2 ms late
+        scheduler._record_wake()
+
+    # Relative sleeps would have drifted 1000 x 2 ms = 2 s by now
+    assert scheduler.next_deadline == pytest.approx(start + 100.0)
+    stats = scheduler.get_stats()
+    assert stats['ticks'] == 1000
+    assert stats['overruns'] == 0
+    assert stats['last_lateness_ms'] == pytest.approx(2.0)
+    assert stats['lateness']['count'] == 1000
+
+
+def test_start_delayed_by_one_period():
+    clock = _FakeClock()
+    scheduler = DeadlineScheduler(30.0, start_immediately=False, clock=clock)
+    assert scheduler.next_delay() == pytest.approx(30.0)
+
+
+def test_skip_policy_drops_missed_ticks():
+    clock = _FakeClock()
+    scheduler = DeadlineScheduler(0.1, policy='skip', clock=clock)
+    scheduler.next_delay()                     # Deadline 100.0
+
+    clock.now = 100.35                         # Tick ran 350 ms
+    assert scheduler.next_delay() == 0.0       # Late tick runs now...
+    assert scheduler.next_deadline == pytest.approx(100.3)
+    assert scheduler.next_delay() == pytest.approx(0.05)   # ...then back on the grid
+
+    stats = scheduler.get_stats()
+    assert stats['overruns'] == 1
+    assert stats['skipped_ticks'] == 2
+
+
+def test_catch_up_policy_runs_missed_ticks_back_to_back():
+    clock = _FakeClock()
+    scheduler = DeadlineScheduler(0.1, policy='catch_up', max_catch_up=2, clock=clock)
+    scheduler.next_delay()                     # Deadline 100.0
+
+    clock.now = 100.55                         # Ticks 100.1 .. 100.5 missed
+    assert scheduler.next_delay() == 0.0       # 100.1
+    assert scheduler.next_delay() == 0.0       # 100.2
+    assert scheduler.next_delay() == 0.0       # Limit reached: skip to 100.5
+    assert scheduler.next_deadline == pytest.approx(100.5)
+    assert scheduler.next_delay() == pytest.approx(0.05)
+
+    stats = scheduler.get_stats()
+    assert stats['caught_up_ticks'] == 2
+    assert stats['skipped_ticks'] == 2
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        DeadlineScheduler(0)
+    with pytest.raises(ValueError):
+        DeadlineScheduler(0.1, policy='burst')
+
+
+def test_wait_blocking_stops_on_event():
+    scheduler = DeadlineScheduler(0.01)
+    stop_event = threading.Event()
+    ticks = 0
+    while scheduler.wait_blocking(stop_event):
+        ticks += 1
+        if ticks == 3:
+            stop_event.set()
+
+    assert ticks == 3
+    assert scheduler.get_stats()['ticks'] == 3
+
+
+def test_pipeline_exposes_scheduler_stats():
+    reader = MagicMock()
+
+    async def read_all_sensors():
+        return None                            # PLC not connected
+
+    reader.read_all_sensors = read_all_sensors
+    pipeline = DataProcessingPipeline(
+        config={'processing': {'rate_hz': 50, 'overrun_policy': 'catch_up', 'max_catch_up': 3}},
+        modbus_reader=reader,
+        modbus_writer=MagicMock(),
+        control_manager=MagicMock(),
+        db_services={'raw': MagicMock(), 'total': MagicMock(), 'anomaly': MagicMock()},
+    )
+    assert pipeline.scheduler.policy == 'catch_up'
+    assert pipeline.scheduler.max_catch_up == 3
+
+    async def run_cycles():
+        pipeline._running = True
+        task = asyncio.create_task(pipeline._processing_loop())
+        await asyncio.sleep(0.15)
+        pipeline._running = False
+        await task
+
+    asyncio.run(run_cycles())
+
+    stats = pipeline.get_stats()['scheduler']
+    # Failed reads keep the 20 ms grid instead of adding a full sleep per cycle
+    assert 5 <= stats['ticks'] <= 10
+    assert stats['period_ms'] == pytest.approx(20.0)
+    assert stats['lateness']['count'] == stats['ticks']
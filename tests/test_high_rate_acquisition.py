@@ -0,0 +1,160 @@
+"""Unit tests for high-rate acquisition.
+
+Tests cover the sample ring buffer, window aggregation, the sensor-only
+read path of ModbusReader, and the pipeline consuming acquired windows at
+the control rate (spikes reach control, raw persistence modes).
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.models import RawSensorData
+from src.services.modbus.reader import ModbusReader
+from src.services.processing.acquisition import (
+    AcquisitionLoop, SampleRingBuffer, aggregate_window,
+)
+from src.services.processing.data_processor import DataProcessingPipeline
+
+TORQUE_INDEX = 16       # 1016 serit_motor_tork_percentage (raw /10)
+
+
+class _SpikyModbus:
+    """Sensor block with a one-read torque spike; records every request."""
+
+    def __init__(self, spike_read=5):
+        self.requests = []
+        self.sensor_reads = 0
+        self.spike_read = spike_read
+
+    async def read_holding_registers(self, address, count):
+        self.requests.append((address, count))
+        registers = [0] * count
+        if address == 1000:
+            self.sensor_reads += 1
+            registers[30] = 3                                   # Cutting
+            registers[TORQUE_INDEX] = 900 if self.sensor_reads == self.spike_read else 200
+        elif address == 2041:
+            registers[0] = 1234                                 # inme_hizi_hedef * 100
+        return registers
+
+
+def _raw(torque, sapma=0.0):
+    return RawSensorData(timestamp=datetime.now(), serit_motor_tork_percentage=torque, serit_sapmasi=sapma)
+
+
+def test_ring_buffer_reads_since_and_counts_drops():
+    buffer = SampleRingBuffer(size=3)
+    for i in range(2):
+        buffer.append(_raw(i), [], 0.0)
+
+    window = buffer.read_since(0)
+    assert [s.seq for s in window] == [1, 2]
+    assert buffer.read_since(2) == []
+
+    for i in range(5):
+        buffer.append(_raw(i), [], 0.0)
+    assert [s.seq for s in buffer.read_since(2)] == [5, 6, 7]
+    assert buffer.dropped == 2
+
+
+def test_aggregate_window_peak_and_latest():
+    buffer = SampleRingBuffer()
+    for torque, sapma in ((20.0, 0.1), (90.0, -0.8), (25.0, 0.2)):
+        buffer.append(_raw(torque, sapma), [], 0.0)
+    window = buffer.read_since(0)
+
+    assert aggregate_window(window, 'latest') is window[-1].raw_data
+    peak = aggregate_window(window, 'peak')
+    assert peak.serit_motor_tork_percentage == 90.0
+    assert peak.serit_sapmasi == -0.8                           # Largest magnitude, sign kept
+    assert peak.timestamp == window[-1].raw_data.timestamp
+    assert window[-1].raw_data.serit_motor_tork_percentage == 25.0
+
+
+def test_invalid_acquisition_modes():
+    reader = ModbusReader(_SpikyModbus(), {})
+    with pytest.raises(ValueError):
+        AcquisitionLoop(reader, {'window': 'mean'})
+    with pytest.raises(ValueError):
+        AcquisitionLoop(reader, {'raw_persist': 'sometimes'})
+
+
+def test_sensor_block_read_uses_cached_targets():
+    modbus = _SpikyModbus()
+    reader = ModbusReader(modbus, {})
+
+    async def read():
+        assert await reader.refresh_targets()
+        modbus.requests.clear()
+        return await reader.read_sensor_block()
+
+    raw = asyncio.run(read())
+    assert modbus.requests == [(1000, 44)]                      # One FC03 request
+    assert raw.inme_hizi_hedef == pytest.approx(12.34)
+    assert raw.serit_motor_tork_percentage == pytest.approx(20.0)
+    assert reader.get_stats()['sensor_plan']['executions'] == 1
+
+
+def _make_pipeline(modbus, raw_persist):
+    reader = ModbusReader(modbus, {})
+    seen = []
+    control_manager = MagicMock()
+    control_manager.get_current_mode.return_value = MagicMock(value="manual")
+
+    async def process_data(processed):
+        seen.append(processed.raw_data.serit_motor_tork_percentage)
+        return None
+
+    control_manager.process_data = process_data
+    raw_db = MagicMock()
+    pipeline = DataProcessingPipeline(
+        config={
+            'processing': {
+                'rate_hz': 10,
+                'acquisition': {'enabled': True, 'rate_hz': 50, 'raw_persist': raw_persist},
+            },
+            'anomaly_detection': {'window': 100, 'min_samples': 10},
+        },
+        modbus_reader=reader,
+        modbus_writer=MagicMock(),
+        control_manager=control_manager,
+        db_services={'raw': raw_db, 'total': MagicMock(), 'anomaly': MagicMock()},
+    )
+    return pipeline, seen, raw_db
+
+
+def _run(pipeline, seconds):
+    async def run():
+        await pipeline.start()
+        await asyncio.sleep(seconds)
+        await pipeline.stop()
+
+    asyncio.run(run())
+
+
+def test_pipeline_spike_reaches_control_at_control_rate():
+    modbus = _SpikyModbus(spike_read=5)
+    pipeline, seen, raw_db = _make_pipeline(modbus, 'decimate')
+    _run(pipeline, 0.45)
+
+    stats = pipeline.get_stats()['acquisition']
+    assert stats['samples'] >= 15
+    assert stats['samples'] >= 3 * len(seen)                    # ~5 samples per control cycle
+    assert stats['achieved_rate_hz'] == pytest.approx(50.0, rel=0.2)
+    assert stats['dropped'] == 0
+    assert 90.0 in seen                                         # 20 ms spike seen by control
+    assert raw_db.append_rows.call_count == pipeline.get_stats()['cycles']
+
+
+def test_pipeline_persists_every_sample():
+    modbus = _SpikyModbus()
+    pipeline, seen, raw_db = _make_pipeline(modbus, 'all')
+    _run(pipeline, 0.35)
+
+    rows = raw_db.append_rows.call_count
+    consumed = pipeline._acquired_seq
+    assert rows == consumed
+    assert rows > pipeline.get_stats()['cycles']
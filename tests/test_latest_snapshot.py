@@ -0,0 +1,116 @@
+"""Unit tests for the versioned latest-sample snapshot.
+
+Tests cover version increments per publish, the one-time disconnected
+snapshot when data goes stale, immutability, and DataProcessingPipeline
+publishing one snapshot per cycle (get_latest_data stays compatible).
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.models import ProcessedData, RawSensorData
+from src.services.modbus.reader import ModbusReader
+from src.services.processing.data_processor import DataProcessingPipeline
+from src.services.processing.snapshot import SnapshotPublisher
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeModbus:
+    async def read_holding_registers(self, address, count):
+        registers = [0] * count
+        if address == 1000:
+            registers[15] = 123          # serit_motor_akim_a 12.3
+        return registers
+
+
+def _processed(akim):
+    raw = RawSensorData(timestamp=datetime.now(), serit_motor_akim_a=akim)
+    return ProcessedData(timestamp=datetime.now(), raw_data=raw, controller_type="manual")
+
+
+def test_publish_increments_version():
+    publisher = SnapshotPublisher("10.0.0.5", clock=_FakeClock())
+    initial = publisher.latest()
+    assert initial.version == 0
+    assert initial.data['modbus_connected'] is False
+    assert initial.data['testere_durumu'] == -1
+
+    publisher.publish(_processed(10.0))
+    snapshot = publisher.publish(_processed(11.0))
+    assert snapshot.version == 2
+    assert publisher.latest() is snapshot
+    assert snapshot.data['serit_motor_akim_a'] == 11.0
+    assert snapshot.data['modbus_connected'] is True
+    assert snapshot.data['modbus_ip'] == "10.0.0.5"
+
+
+def test_snapshot_data_is_read_only():
+    publisher = SnapshotPublisher()
+    data = publisher.publish(_processed(10.0)).data
+    with pytest.raises(TypeError):
+        data['serit_motor_akim_a'] = 0.0
+
+
+def test_stale_snapshot_becomes_disconnected_once():
+    clock = _FakeClock()
+    publisher = SnapshotPublisher(clock=clock, stale_after=2.0)
+    fresh = publisher.publish(_processed(10.0))
+
+    clock.now = 1.9
+    assert publisher.latest() is fresh
+
+    clock.now = 2.5
+    stale = publisher.latest()
+    assert stale.version == fresh.version + 1
+    assert stale.data['modbus_connected'] is False
+    assert stale.data['serit_motor_akim_a'] == 10.0     # Last values kept
+    assert publisher.latest() is stale                  # No further version bumps
+
+    assert publisher.publish(_processed(12.0)).version == stale.version + 1
+
+
+def test_pipeline_publishes_one_snapshot_per_cycle():
+    control_manager = MagicMock()
+    control_manager.get_current_mode.return_value = MagicMock(value="manual")
+
+    async def process_data(processed):
+        return None
+
+    control_manager.process_data = process_data
+    pipeline = DataProcessingPipeline(
+        config={'processing': {'rate_hz': 50}, 'modbus': {'host': "192.168.1.10"}},
+        modbus_reader=ModbusReader(_FakeModbus(), {}),
+        modbus_writer=MagicMock(),
+        control_manager=control_manager,
+        db_services={'raw': MagicMock(), 'total': MagicMock(), 'anomaly': MagicMock()},
+    )
+    assert pipeline.get_latest_snapshot().version == 0
+
+    async def run_cycles():
+        pipeline._running = True
+        task = asyncio.create_task(pipeline._processing_loop())
+        await asyncio.sleep(0.15)
+        pipeline._running = False
+        await task
+
+    asyncio.run(run_cycles())
+
+    snapshot = pipeline.get_latest_snapshot()
+    assert snapshot.version == pipeline.get_stats()['cycles']
+    assert snapshot.data['serit_motor_akim_a'] == pytest.approx(12.3)
+    assert pipeline.get_latest_snapshot() is snapshot   # O(1), nothing rebuilt
+
+    data = pipeline.get_latest_data()
+    assert isinstance(data, dict)
+    assert data == dict(snapshot.data)
+    assert data['modbus_ip'] == "192.168.1.10"
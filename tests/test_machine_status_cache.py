@@ -0,0 +1,131 @@
+"""Unit tests for the MachineControl status poller and cache.
+
+Tests use a stateful fake ModbusTcpClient: status registers are read in
+coalesced bulk requests, getters are served from the cache without client
+reads, stale values read as None, and writes invalidate and trigger an
+early re-poll.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.control.machine_control import MachineControl
+
+
+@pytest.fixture(autouse=True)
+def reset_singleton():
+    """Reset MachineControl singleton between tests."""
+    MachineControl._instance = None
+    yield
+    if MachineControl._instance is not None:
+        MachineControl._instance.stop_status_polling()
+    MachineControl._instance = None
+
+
+class _FakeClient:
+    """Holding registers in a dict; records read requests."""
+
+    def __init__(self, *args, **kwargs):
+        self.registers = {20: 1 << MachineControl.REAR_VISE_OPEN_BIT, 2070: 4}
+        self.reads = []
+
+    def connect(self):
+        return True
+
+    def is_socket_open(self):
+        return True
+
+    def _ok(self, registers=None):
+        result = MagicMock()
+        result.isError.return_value = False
+        result.registers = registers
+        return result
+
+    def read_holding_registers(self, address, count):
+        self.reads.append((address, count))
+        return self._ok([self.registers.get(a, 0) for a in range(address, address + count)])
+
+    def write_register(self, address, value):
+        self.registers[address] = value
+        return self._ok()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def _polling_mc():
+    mc = MachineControl()
+    mc.start_status_polling(interval=60.0)      # One poll now, then only on wake
+    _wait_for(lambda: mc.get_status_stats()['polls'] >= 1)
+    return mc, mc.client
+
+
+@patch("src.services.control.machine_control.ModbusTcpClient", _FakeClient)
+def test_status_registers_read_in_coalesced_requests():
+    mc, client = _polling_mc()
+
+    ranges = mc.get_status_stats()['request_ranges']
+    assert client.reads == ranges
+    assert len(ranges) < len(MachineControl.STATUS_REGISTERS)
+    assert all(count <= 125 for _, count in ranges)
+
+
+@patch("src.services.control.machine_control.ModbusTcpClient", _FakeClient)
+def test_getters_served_from_cache_without_reads():
+    mc, client = _polling_mc()
+    client.reads.clear()
+
+    assert mc.is_rear_vise_open() is True
+    assert mc.is_front_vise_open() is False
+    assert mc.is_saw_moving_down() is False
+    assert mc.read_target_x() == 4
+    assert client.reads == []
+    assert mc.get_status_stats()['cache_reads'] == 4
+    assert not mc.is_status_stale()
+
+
+@patch("src.services.control.machine_control.ModbusTcpClient", _FakeClient)
+def test_stale_cache_reads_as_none():
+    mc, client = _polling_mc()
+    value, _ = mc._status_cache[MachineControl.CONTROL_REGISTER]
+    mc._status_cache[MachineControl.CONTROL_REGISTER] = (value, time.monotonic() - 5.0)
+
+    assert mc.is_rear_vise_open() is None
+    assert mc.is_status_stale()
+    assert mc.status_age(MachineControl.CONTROL_REGISTER) > 4.0
+    assert mc.get_status_stats()['stale_reads'] == 1
+
+
+@patch("src.services.control.machine_control.ModbusTcpClient", _FakeClient)
+def test_write_invalidates_and_repolls():
+    mc, client = _polling_mc()
+    polls = mc.get_status_stats()['polls']
+
+    assert mc.write_target_x(9)
+    assert mc.get_status_stats()['invalidations'] == 1
+    _wait_for(lambda: mc.get_status_stats()['polls'] > polls)     # Woken long before 60 s
+    assert mc.read_target_x() == 9
+
+    assert mc.open_front_vise()                                     # Read-modify-write bypasses the cache
+    _wait_for(lambda: mc.is_front_vise_open() is True)
+    assert mc.is_rear_vise_open() is True
+
+
+@patch("src.services.control.machine_control.ModbusTcpClient", _FakeClient)
+def test_direct_reads_when_not_polling():
+    mc = MachineControl()
+    assert mc.is_rear_vise_open() is True
+    assert mc.client.reads == [(MachineControl.CONTROL_REGISTER, 1)]
+
+    mc.start_status_polling(interval=60.0)
+    mc.stop_status_polling()
+    assert not mc.status_polling
+    mc.client.reads.clear()
+    assert mc.read_target_x() == 4
+    assert mc.client.reads == [(MachineControl.TARGET_X_REGISTER, 1)]
@@ -8,6 +8,7 @@ These tests verify the POST-update contract of main_controller.py:
 - _switch_page uses PageIndex enum correctly
 - closeEvent calls stop_timers() on all 5 unconditional pages including
   otomatik_kesim_page
+- the refresh scheduler follows page switches and is stopped on close
 """
 
 from unittest.mock import MagicMock, call
@@ -25,7 +26,7 @@ def ctrl():
     - nav_buttons: 5 items (control_panel, otomatik_kesim, positioning, sensor, tracking)
     - stackedWidget: mock with setCurrentIndex
     - page mocks with stop_timers
-    - timer mocks with stop
+    - refresh scheduler and MachineControl mocks
     camera_page is intentionally NOT set (tests unconditional pages only).
     """
     from src.gui.controllers.main_controller import MainController
@@ -60,9 +61,9 @@ def ctrl():
     # stackedWidget mock
     c.stackedWidget = MagicMock()
 
-    # Main controller timers
-    c._update_timer = MagicMock()
-    c._datetime_timer = MagicMock()
+    # Refresh scheduler (master tick) and PLC status poller
+    c.refresh_scheduler = MagicMock()
+    c.machine_control = MagicMock()
 
     return c
 
@@ -106,6 +107,13 @@ def test_switch_page_unchecks_all_buttons(ctrl):
         assert call(False) in calls, f"setChecked(False) not called on {btn}"
 
 
+def test_switch_page_notifies_refresh_scheduler(ctrl):
+    """_switch_page must make the new page the scheduler's visible page."""
+    ctrl._switch_page(PageIndex.SENSOR)
+
+    ctrl.refresh_scheduler.set_current_page.assert_called_once_with(PageIndex.SENSOR)
+
+
 # ---------------------------------------------------------------------------
 # closeEvent tests
 # ---------------------------------------------------------------------------
@@ -133,3 +141,15 @@ def test_close_event_stops_all_unconditional_pages(ctrl):
         page.stop_timers.assert_called_once(), (
             f"stop_timers not called on {page_name}"
         )
+
+
+def test_close_event_stops_refresh_scheduler(ctrl):
+    """closeEvent must stop the master refresh tick."""
+    ctrl.closeEvent(MagicMock())
+    ctrl.refresh_scheduler.stop.assert_called_once()
+
+
+def test_close_event_stops_status_poller(ctrl):
+    """closeEvent must stop MachineControl's status poller thread."""
+    ctrl.closeEvent(MagicMock())
+    ctrl.machine_control.stop_status_polling.assert_called_once()
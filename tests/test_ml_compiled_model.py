@@ -0,0 +1,158 @@
+"""Equivalence tests for the compiled bagging ensemble.
+
+Tests require predict_one() to return exactly model.predict() for tree
+ensembles, on recorded-style inputs and on inputs that sit exactly on
+split thresholds. They cover feature subsets, joblib chunking (n_jobs),
+feature-name reordering, linear base estimators (within rounding), the
+.npz cache next to the model file and the fallback for unsupported models.
+"""
+
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.ml.compiled_model import CompiledEnsemble, ModelCompileError, compile_model
+from src.ml.model_loader import MLModelLoader
+from src.ml.preprocessor import FEATURE_NAMES
+
+ensemble = pytest.importorskip("sklearn.ensemble")
+linear_model = pytest.importorskip("sklearn.linear_model")
+tree = pytest.importorskip("sklearn.tree")
+
+
+def _training_data(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    features = np.column_stack([
+        rng.normal(20.0, 4.0, n),
+        np.round(rng.normal(0.0, 0.4, n), 2),
+        rng.normal(80.0, 10.0, n),
+        rng.normal(40.0, 8.0, n),
+    ])
+    target = np.clip(
+        -0.08 * (features[:, 0] - 20.0) - 0.5 * np.abs(features[:, 1]) + rng.normal(0.0, 0.1, n),
+        -1.0, 1.0
+    )
+    return features, target
+
+
+def _recorded_inputs(model, features, seed=1):
+    """Held-out rows, training rows and rows placed exactly on split thresholds."""
+    rng = np.random.default_rng(seed)
+    held_out = _training_data(300, seed=seed)[0]
+    on_threshold = features[:200].copy()
+    for i, row in enumerate(on_threshold):
+        est = model.estimators_[i % len(model.estimators_)]
+        node = int(rng.integers(0, est.tree_.node_count))
+        if est.tree_.children_left[node] >= 0:
+            column = model.estimators_features_[i % len(model.estimators_)][est.tree_.feature[node]]
+            row[column] = est.tree_.threshold[node]
+    return np.vstack([held_out, features[:300], on_threshold])
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {'max_features': 0.5, 'n_estimators': 7},
+    {'n_jobs': 3, 'n_estimators': 11},
+    {'estimator': 'extra_tree', 'n_estimators': 6},
+])
+def test_tree_ensemble_outputs_identical(kwargs):
+    kwargs = dict(kwargs)
+    if kwargs.get('estimator') == 'extra_tree':
+        kwargs['estimator'] = tree.ExtraTreeRegressor()
+    features, target = _training_data()
+    # Threads instead of worker processes keep the n_jobs case fast
+    with joblib.parallel_config(backend='threading'):
+        model = ensemble.BaggingRegressor(random_state=0, **kwargs).fit(features, target)
+        inputs = _recorded_inputs(model, features)
+        expected = model.predict(inputs)
+
+    compiled = compile_model(model)
+
+    actual = np.array([compiled.predict_one(row) for row in inputs])
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_feature_names_are_reordered_to_feature_order():
+    features, target = _training_data()
+    model_columns = ['kesme_hizi', 'akim_input', 'inme_hizi', 'sapma_input']
+    frame = pd.DataFrame(features, columns=list(FEATURE_NAMES))[model_columns]
+    model = ensemble.BaggingRegressor(n_estimators=5, random_state=1).fit(frame, target)
+
+    compiled = compile_model(model, FEATURE_NAMES)
+    assert compiled.feature_names == FEATURE_NAMES
+
+    inputs = _training_data(200, seed=5)[0]
+    expected = model.predict(pd.DataFrame(inputs, columns=list(FEATURE_NAMES))[model_columns])
+    np.testing.assert_array_equal(compiled.predict(inputs), expected)
+
+
+def test_linear_ensemble_matches_within_rounding():
+    features, target = _training_data()
+    model = ensemble.BaggingRegressor(
+        estimator=linear_model.LinearRegression(), n_estimators=8, max_features=0.75, random_state=0
+    ).fit(features, target)
+
+    compiled = compile_model(model)
+    inputs = _training_data(200, seed=3)[0]
+    np.testing.assert_allclose(compiled.predict(inputs), model.predict(inputs), rtol=1e-12, atol=1e-12)
+
+
+def test_unsupported_model_raises():
+    features, target = _training_data(200)
+    with pytest.raises(ModelCompileError):
+        compile_model(linear_model.LinearRegression().fit(features, target))
+
+
+def test_loader_caches_compiled_model_next_to_pkl(tmp_path):
+    features, target = _training_data()
+    model = ensemble.BaggingRegressor(n_estimators=4, random_state=2).fit(
+        pd.DataFrame(features, columns=list(FEATURE_NAMES)), target
+    )
+    model_path = tmp_path / "model.pkl"
+    joblib.dump(model, model_path)
+
+    loader = MLModelLoader(model_path)
+    compiled = loader.load_compiled(FEATURE_NAMES)
+    assert loader.compiled_path == tmp_path / "model.compiled.npz"
+    assert loader.compiled_path.exists()
+
+    inputs = features[:100]
+    expected = model.predict(pd.DataFrame(inputs, columns=list(FEATURE_NAMES)))
+    np.testing.assert_array_equal(compiled.predict(inputs), expected)
+
+    # Fresh loader reuses the cache without unpickling the model
+    cached_loader = MLModelLoader(model_path)
+    np.testing.assert_array_equal(cached_loader.load_compiled(FEATURE_NAMES).predict(inputs), expected)
+    assert not cached_loader.is_loaded()
+
+    # A changed model file invalidates the cache
+    stat = model_path.stat()
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    stat = model_path.stat()
+    assert CompiledEnsemble.load(loader.compiled_path, stat.st_size, stat.st_mtime_ns) is None
+    assert MLModelLoader(model_path).load_compiled(FEATURE_NAMES) is not None
+
+
+def test_loader_returns_none_for_unsupported_model(tmp_path):
+    features, target = _training_data(200)
+    model_path = tmp_path / "linear.pkl"
+    joblib.dump(linear_model.LinearRegression().fit(features, target), model_path)
+
+    loader = MLModelLoader(model_path)
+    assert loader.load_compiled(FEATURE_NAMES) is None
+    assert loader.load() is not None
+
+
+def test_linear_ensemble_with_bootstrap_features_matches():
+    features, target = _training_data()
+    model = ensemble.BaggingRegressor(
+        estimator=linear_model.LinearRegression(), n_estimators=8, bootstrap_features=True, random_state=0
+    ).fit(features, target)
+    assert any(len(set(f)) < len(f) for f in model.estimators_features_)     # Repeated columns
+
+    compiled = compile_model(model)
+    inputs = _training_data(200, seed=3)[0]
+    np.testing.assert_allclose(compiled.predict(inputs), model.predict(inputs), rtol=1e-9, atol=1e-9)
@@ -0,0 +1,245 @@
+"""Unit tests for MLController inference executor and deadline fallback.
+
+Tests cover executor results matching inline execution, holding the last
+command when the deadline is missed, skipping only the model step while a
+job overruns,
+applying a late Torque Guard command ahead of a new ML command, keeping
+the accumulated speed changes of dropped ML commands, latency percentiles
+in get_stats() and the state reset after a cut with a job still running.
+"""
+
+import asyncio
+import copy
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from src.domain.models import ControlCommand, ProcessedData, RawSensorData
+from src.services.control.ml_controller import MLController
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.yaml"
+
+
+class _NullDatabase:
+    def write_async(self, sql, params=None) -> bool:
+        return True
+
+
+class _ConstantModel:
+    """Model stub: predicts a fixed coefficient."""
+
+    def __init__(self, value=-0.8):
+        self.value = value
+
+    def predict(self, features):
+        return np.array([self.value])
+
+
+def _controller(**inference):
+    with open(CONFIG_PATH, encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config = copy.deepcopy(config)
+    config['ml']['min_speed_update_interval'] = 0.0
+    config['ml']['compiled_inference'] = False
+    config['ml']['torque_guard']['enabled'] = False
+    config['ml']['inference'] = {'executor': True, 'deadline_ms': 200, **inference}
+
+    controller = MLController(config, modbus_service=None, db_service=_NullDatabase())
+    controller.model_loader._model = _ConstantModel()
+    return controller
+
+
+def _sample(i=0, state=3):
+    raw = RawSensorData(
+        timestamp=datetime.now(),
+        serit_motor_tork_percentage=35.0,
+        serit_kesme_hizi=80.0,
+        serit_inme_hizi=40.0,
+        kafa_yuksekligi_mm=300.0 - i * 0.1,
+        testere_durumu=state,
+    )
+    return ProcessedData(timestamp=raw.timestamp, raw_data=raw, is_cutting=state == 3)
+
+
+def _speeds(command):
+    return None if command is None else (command.kesme_hizi_target, command.inme_hizi_target)
+
+
+def test_executor_matches_inline():
+    async def run(controller):
+        return [_speeds(await controller.calculate_speeds(_sample(i))) for i in range(30)]
+
+    threaded = _controller()
+    inline = _controller(executor=False)
+    expected = asyncio.run(run(inline))
+    assert asyncio.run(run(threaded)) == expected
+    assert any(cmd is not None for cmd in expected)
+
+    latency = threaded.get_stats()['inference_latency']
+    assert latency['samples'] == 30
+    assert 0 <= latency['p50_ms'] <= latency['p95_ms'] <= latency['p99_ms'] <= latency['max_ms']
+    threaded.shutdown()
+
+
+def test_deadline_miss_holds_and_skips_while_busy():
+    controller = _controller(deadline_ms=20)
+    release = threading.Event()
+    compute = controller._compute_command
+
+    def slow_compute(processed_data, now):
+        release.wait(2.0)
+        return compute(processed_data, now)
+
+    controller._compute_command = slow_compute
+
+    async def run():
+        first = await controller.calculate_speeds(_sample(0))
+        second = await controller.calculate_speeds(_sample(1))
+        release.set()
+        await asyncio.sleep(0.05)
+        controller._compute_command = compute
+        third = await controller.calculate_speeds(_sample(2))
+        return first, second, third
+
+    fed = []
+    add_data_point = controller.preprocessor.add_data_point
+
+    def recording_add(raw_data):
+        fed.append(raw_data.kafa_yuksekligi_mm)
+        return add_data_point(raw_data)
+
+    controller.preprocessor.add_data_point = recording_add
+
+    first, second, third = asyncio.run(run())
+    assert first is None and second is None
+    stats = controller.get_stats()
+    assert stats['inference_deadline_misses'] == 1
+    assert stats['inference_busy_skips'] == 1
+    assert third is not None
+    # The busy-skipped sample still reached the buffers, in order
+    assert fed == [_sample(i).raw_data.kafa_yuksekligi_mm for i in range(3)]
+    assert stats['inference_skipped_samples_fed'] == 1
+    controller.shutdown()
+
+
+def test_late_torque_guard_command_is_applied_next_cycle():
+    controller = _controller(deadline_ms=10)
+    guard_command = ControlCommand(
+        timestamp=datetime.now(), source="torque_guard", kesme_hizi_target=60.0, inme_hizi_target=30.0
+    )
+    release = threading.Event()
+
+    def slow_guard(processed_data, now):
+        release.wait(2.0)
+        return guard_command
+
+    controller._compute_command = slow_guard
+
+    async def run():
+        assert await controller.calculate_speeds(_sample(0)) is None
+        release.set()
+        await asyncio.sleep(0.05)
+        controller._compute_command = lambda processed_data, now: None
+        return await controller.calculate_speeds(_sample(1))
+
+    assert asyncio.run(run()) is guard_command
+    controller.shutdown()
+
+
+def test_late_torque_guard_command_wins_over_new_ml_command():
+    controller = _controller(deadline_ms=10)
+    compute = controller._compute_command
+    guard_command = ControlCommand(
+        timestamp=datetime.now(), source="torque_guard", kesme_hizi_target=60.0, inme_hizi_target=30.0
+    )
+    release = threading.Event()
+
+    def slow_guard(processed_data, now):
+        release.wait(2.0)
+        return guard_command
+
+    controller._compute_command = slow_guard
+
+    async def run():
+        assert await controller.calculate_speeds(_sample(0)) is None
+        release.set()
+        await asyncio.sleep(0.05)
+        controller._compute_command = compute
+        same_cycle = await controller.calculate_speeds(_sample(1))     # Late guard + new ML command
+        next_cycle = await controller.calculate_speeds(_sample(2))
+        return same_cycle, next_cycle
+
+    same_cycle, next_cycle = asyncio.run(run())
+    assert same_cycle is guard_command
+    assert controller.get_stats()['ml_commands_superseded'] == 1
+
+    # The superseded command's changes were kept: two cycles of change in one command
+    inline = _controller(executor=False)
+    single = asyncio.run(inline.calculate_speeds(_sample(0)))
+    assert next_cycle.source == "ml"
+    assert next_cycle.kesme_hizi_target == pytest.approx(80.0 - 2 * (80.0 - single.kesme_hizi_target))
+    assert next_cycle.inme_hizi_target == pytest.approx(40.0 - 2 * 0.8)
+    assert controller.get_stats()['accumulated_kesme'] == pytest.approx(0.0)
+    controller.shutdown()
+    inline.shutdown()
+
+
+def test_late_ml_command_keeps_accumulated_changes():
+    controller = _controller(deadline_ms=10)
+    compute = controller._compute_command
+    release = threading.Event()
+
+    def slow_compute(processed_data, now):
+        release.wait(2.0)
+        return compute(processed_data, now)
+
+    controller._compute_command = slow_compute
+
+    async def run():
+        assert await controller.calculate_speeds(_sample(0)) is None
+        release.set()
+        await asyncio.sleep(0.05)
+        controller._compute_command = compute
+        return await controller.calculate_speeds(_sample(1))
+
+    command = asyncio.run(run())
+    stats = controller.get_stats()
+    assert stats['inference_late_commands_dropped'] == 1
+    assert stats['speed_commands_sent'] == 1
+    assert command.inme_hizi_target == pytest.approx(40.0 - 2 * 0.8)
+    controller.shutdown()
+
+
+def test_cut_end_waits_for_running_job_then_resets():
+    controller = _controller(deadline_ms=10)
+    compute = controller._compute_command
+    release = threading.Event()
+
+    def slow_compute(processed_data, now):
+        release.wait(2.0)
+        return compute(processed_data, now)
+
+    async def run():
+        for i in range(5):
+            await controller.calculate_speeds(_sample(i))
+        controller._compute_command = slow_compute
+        await controller.calculate_speeds(_sample(5))
+        threading.Timer(0.05, release.set).start()
+        await controller.calculate_speeds(_sample(6, state=0))
+
+    asyncio.run(run())
+    assert not controller.is_cutting
+    assert not controller.preprocessor.is_ready()
+    assert controller.get_stats()['inference_deadline_misses'] == 1
+    controller.shutdown()
+
+
+def test_latency_empty_before_first_job():
+    controller = _controller()
+    assert controller.get_stats()['inference_latency'] == {
+        'samples': 0, 'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None
+    }
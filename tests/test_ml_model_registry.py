@@ -0,0 +1,167 @@
+"""Unit tests for the ML model registry.
+
+Tests cover background preload, hot swap on a changed model file, keeping
+the old model when a reload fails (without retrying the same file), batched
+shadow scoring into ml_shadow_predictions and MLController holding speeds
+while the preload is still running.
+"""
+
+import asyncio
+import copy
+import os
+from datetime import datetime
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from src.domain.models import ProcessedData, RawSensorData
+from src.ml.model_registry import SHADOW_COLUMNS, SHADOW_TABLE, ModelRegistry
+from src.ml.preprocessor import FEATURE_NAMES
+from src.services.control.ml_controller import MLController
+
+ensemble = pytest.importorskip("sklearn.ensemble")
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.yaml"
+
+
+class _RecordingDatabase:
+    def __init__(self):
+        self.rows = []
+
+    def write_async(self, sql, params=None) -> bool:
+        return True
+
+    def append_rows(self, table, rows, columns=None) -> bool:
+        assert table == SHADOW_TABLE and tuple(columns) == SHADOW_COLUMNS
+        self.rows.extend(rows)
+        return True
+
+
+def _train(offset, seed=0):
+    rng = np.random.default_rng(seed)
+    features = pd.DataFrame(rng.normal(0.0, 1.0, (400, 4)), columns=list(FEATURE_NAMES))
+    target = np.tanh(features['akim_input'].to_numpy()) * 0.5 + offset
+    return ensemble.BaggingRegressor(n_estimators=3, random_state=seed).fit(features, target)
+
+
+def _dump(model, path, mtime_offset=0):
+    joblib.dump(model, path)
+    if mtime_offset:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 1_000_000_000))
+
+
+def _predict(registry, row):
+    return registry.primary_loader.load_compiled(FEATURE_NAMES).predict_one(row)
+
+
+def test_preload_and_hot_swap(tmp_path):
+    path = tmp_path / "model.pkl"
+    _dump(_train(0.0), path)
+    registry = ModelRegistry(path, FEATURE_NAMES, watch_interval=0)
+    registry.start()
+    assert registry.wait_ready(10.0)
+    assert registry.primary_loader.load_compiled(FEATURE_NAMES) is not None
+    first_version = registry.primary_version
+    row = [0.3, 0.0, 0.0, 0.0]
+    before = _predict(registry, row)
+
+    # Unchanged file: nothing reloaded
+    registry.check_for_updates()
+    assert registry.get_stats()['reloads'] == 0
+
+    old_loader = registry.primary_loader
+    _dump(_train(0.25), path, mtime_offset=2)
+    registry.check_for_updates()
+
+    assert registry.primary_loader is not old_loader
+    assert registry.primary_version != first_version
+    assert _predict(registry, row) == pytest.approx(before + 0.25, abs=0.2)
+    assert registry.get_stats()['reloads'] == 1
+    registry.stop()
+
+
+def test_failed_reload_keeps_old_model_and_is_not_retried(tmp_path):
+    path = tmp_path / "model.pkl"
+    _dump(_train(0.0), path)
+    registry = ModelRegistry(path, FEATURE_NAMES, watch_interval=0)
+    assert registry.reload_primary()
+    loader = registry.primary_loader
+
+    path.write_bytes(b"version https://git-lfs.github.com/spec/v1\n")
+    registry.check_for_updates()
+    registry.check_for_updates()
+
+    assert registry.primary_loader is loader
+    assert registry.get_stats()['reload_errors'] == 1
+
+
+def test_shadow_rows_scored_in_batches(tmp_path):
+    primary_path = tmp_path / "primary.pkl"
+    shadow_path = tmp_path / "shadow.pkl"
+    shadow_model = _train(0.1, seed=3)
+    _dump(_train(0.0), primary_path)
+    _dump(shadow_model, shadow_path)
+
+    db = _RecordingDatabase()
+    registry = ModelRegistry(
+        primary_path, FEATURE_NAMES,
+        shadow_models=[{'name': 'candidate', 'path': str(shadow_path)}],
+        db_service=db, compiled=False, watch_interval=0, shadow_batch_size=4
+    )
+
+    rows = np.random.default_rng(1).normal(0.0, 1.0, (10, 4))
+    for i, row in enumerate(rows):
+        registry.submit_shadow(row, primary_output=float(i), kesim_id=7)
+    assert db.rows == []  # Control path only queues
+
+    assert registry.score_pending() == 10
+    expected = shadow_model.predict(pd.DataFrame(rows, columns=list(FEATURE_NAMES)))
+    assert [r[SHADOW_COLUMNS.index('shadow_output')] for r in db.rows] == pytest.approx(expected)
+    assert [r[SHADOW_COLUMNS.index('primary_output')] for r in db.rows] == list(range(10))
+    assert {r[SHADOW_COLUMNS.index('model_name')] for r in db.rows} == {'candidate'}
+    assert registry.get_stats()['shadow_batches'] == 1
+
+
+def test_shadow_queue_drops_oldest_when_full(tmp_path):
+    registry = ModelRegistry(
+        tmp_path / "primary.pkl", FEATURE_NAMES,
+        shadow_models=[{'path': str(tmp_path / "shadow.pkl")}],
+        shadow_queue_size=3
+    )
+    for i in range(5):
+        registry.submit_shadow([0.0] * 4, float(i))
+    stats = registry.get_stats()
+    assert stats['shadow_dropped'] == 2
+    assert stats['shadow_pending'] == 3
+    assert registry.shadow_names == ['shadow']
+
+
+def test_controller_holds_speeds_while_preloading():
+    with open(CONFIG_PATH, encoding='utf-8') as f:
+        config = copy.deepcopy(yaml.safe_load(f))
+    config['ml']['min_speed_update_interval'] = 0.0
+    config['ml']['torque_guard']['enabled'] = False
+    config['ml']['inference'] = {'executor': False}
+    config['ml']['buffer_size'] = 1
+    config['ml']['torque_buffer_size'] = 1
+
+    controller = MLController(config, modbus_service=None, db_service=_RecordingDatabase())
+    # Simulate a preload in progress
+    controller.model_registry._started = True
+
+    raw = RawSensorData(
+        timestamp=datetime.now(), serit_motor_tork_percentage=35.0,
+        serit_kesme_hizi=80.0, serit_inme_hizi=40.0, testere_durumu=3
+    )
+    processed = ProcessedData(timestamp=raw.timestamp, raw_data=raw, is_cutting=True)
+
+    assert asyncio.run(controller.calculate_speeds(processed)) is None
+    stats = controller.get_stats()
+    assert stats['model_not_ready_skips'] == 1
+    assert stats['errors'] == 0
+    assert stats['model_registry']['ready'] is False
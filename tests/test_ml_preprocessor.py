@@ -0,0 +1,86 @@
+"""Unit tests for the ML preprocessor ring buffers and model input.
+
+Tests cover RingMean against np.mean over a deque of the same size
+(including running-sum resyncs), the reusable model input array in
+training feature order, the DataFrame path for named-feature models and
+buffer reset.
+"""
+
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from src.domain.models import RawSensorData
+from src.ml.preprocessor import FEATURE_NAMES, MLPreprocessor, RingMean
+
+
+def _raw(torque, sapma, kesme, inme):
+    return RawSensorData(
+        timestamp=datetime.now(),
+        serit_motor_tork_percentage=torque,
+        serit_sapmasi=sapma,
+        serit_kesme_hizi=kesme,
+        serit_inme_hizi=inme,
+    )
+
+
+@pytest.mark.parametrize("capacity", [1, 3, 10, 50])
+def test_ring_mean_matches_deque_mean(capacity):
+    rng = np.random.default_rng(capacity)
+    ring = RingMean(capacity)
+    reference = deque(maxlen=capacity)
+    for value in rng.normal(1000.0, 50.0, capacity * 40):
+        ring.append(value)
+        reference.append(float(value))
+        assert ring.mean() == pytest.approx(np.mean(list(reference)), rel=1e-12)
+    assert list(ring) == list(reference)
+    assert len(ring) == capacity
+
+
+def test_model_input_array_feature_order_and_reuse():
+    preprocessor = MLPreprocessor({'buffer_size': 3, 'torque_buffer_size': 3})
+    assert preprocessor.get_model_input_array() is None
+
+    samples = [(30.0, 0.1, 80.0, 40.0), (33.0, -0.2, 82.0, 41.0), (36.0, 0.4, 84.0, 39.0)]
+    for sample in samples:
+        preprocessor.add_data_point(_raw(*sample))
+
+    features = preprocessor.get_model_input_array()
+    assert features.shape == (1, len(FEATURE_NAMES))
+
+    torque_avgs = [30.0, 31.5, 33.0]
+    expected_akim = np.mean([preprocessor.torque_to_current(t) for t in torque_avgs])
+    np.testing.assert_allclose(
+        features[0],
+        [expected_akim, np.mean([0.1, -0.2, 0.4]), 82.0, 40.0],
+        rtol=1e-12
+    )
+
+    # Same array is refilled on the next call
+    preprocessor.add_data_point(_raw(39.0, 0.0, 90.0, 45.0))
+    assert preprocessor.get_model_input_array() is features
+    assert features[0, 2] == pytest.approx(np.mean([82.0, 84.0, 90.0]))
+
+
+def test_dataframe_input_matches_array():
+    preprocessor = MLPreprocessor({'buffer_size': 5, 'torque_buffer_size': 10})
+    for i in range(12):
+        preprocessor.add_data_point(_raw(30.0 + i, 0.05 * i, 80.0 - i, 40.0 + i))
+
+    df = preprocessor.get_model_input()
+    assert df.columns.tolist() == list(FEATURE_NAMES)
+    np.testing.assert_array_equal(df.to_numpy(), preprocessor.get_model_input_array())
+
+
+def test_reset_buffers():
+    preprocessor = MLPreprocessor({'buffer_size': 3, 'torque_buffer_size': 3})
+    preprocessor.add_data_point(_raw(30.0, 0.1, 80.0, 40.0))
+    assert preprocessor.is_ready()
+    assert preprocessor.get_average_torque() == 30.0
+
+    preprocessor.reset_buffers()
+    assert not preprocessor.is_ready()
+    assert preprocessor.get_average_torque() is None
+    assert preprocessor.get_averaged_speeds() == (0.0, 0.0)
@@ -0,0 +1,137 @@
+"""Unit tests for ReadPlan.
+
+Tests cover block coalescing (gap tolerance, FC03 size limit), config
+parsing with register-map references, concurrent execution and
+per-block slicing of results, failure isolation between requests, and a
+single reconnect when concurrent requests find the connection down.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.modbus.client import AsyncModbusService
+from src.services.modbus.read_plan import ReadBlock, ReadPlan
+
+
+class _FakeModbus:
+    """Returns register address as value; optional failing addresses."""
+
+    def __init__(self, fail_at=()):
+        self.calls = []
+        self.fail_at = set(fail_at)
+
+    async def read_holding_registers(self, address, count):
+        self.calls.append((address, count))
+        if address in self.fail_at:
+            return None
+        return list(range(address, address + count))
+
+
+def test_default_plan_merges_target_registers():
+    """Default plan reads 1000x44 and one 2041..2066 request (3 blocks -> 2 requests)."""
+    plan = ReadPlan.from_config(None)
+    assert [(r.address, r.count) for r in plan.requests] == [(1000, 44), (2041, 26)]
+
+
+def test_gap_tolerance_zero_keeps_requests_separate():
+    """max_gap=0 only merges adjacent blocks."""
+    plan = ReadPlan(
+        [ReadBlock('a', 10, 2), ReadBlock('b', 12, 1), ReadBlock('c', 20, 1)],
+        max_gap=0,
+    )
+    assert [(r.address, r.count) for r in plan.requests] == [(10, 3), (20, 1)]
+
+
+def test_max_count_prevents_oversized_merge():
+    """Blocks are not merged past the per-request register limit."""
+    plan = ReadPlan(
+        [ReadBlock('a', 0, 100), ReadBlock('b', 110, 20)],
+        max_gap=50,
+        max_count=125,
+    )
+    assert len(plan.requests) == 2
+
+
+def test_register_reference_resolves_from_map():
+    """`register:` entries resolve through the modbus.registers map."""
+    plan = ReadPlan.from_config(
+        {'blocks': {'hedef': {'register': 'KESME_HIZI'}}},
+        {'KESME_HIZI': 2066},
+    )
+    assert plan.blocks[0].address == 2066
+
+    with pytest.raises(ValueError):
+        ReadPlan.from_config({'blocks': {'x': {'register': 'MISSING'}}}, {})
+
+
+def test_execute_slices_blocks_and_records_latency():
+    """Each block gets its own slice of the merged request result."""
+    plan = ReadPlan.from_config(None)
+    modbus = _FakeModbus()
+
+    values = asyncio.run(plan.execute(modbus))
+
+    assert len(modbus.calls) == 2
+    assert values['sensors'] == list(range(1000, 1044))
+    assert values['kesme_hizi_hedef'] == [2066]
+    assert values['inme_hizi_hedef'] == [2041]
+
+    stats = plan.get_stats()
+    assert stats['executions'] == 1
+    assert stats['failures'] == 0
+    assert stats['last_latency_ms'] is not None
+
+
+def test_failed_request_only_affects_its_blocks():
+    """A failed target-speed read does not discard the sensor block."""
+    plan = ReadPlan.from_config(None)
+    values = asyncio.run(plan.execute(_FakeModbus(fail_at={2041})))
+
+    assert values['sensors'] is not None
+    assert values['kesme_hizi_hedef'] is None
+    assert values['inme_hizi_hedef'] is None
+    assert plan.get_stats()['failures'] == 1
+
+
+class _FakeTcpClient:
+    """AsyncModbusTcpClient stand-in counting instances and closes."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.closed = False
+        _FakeTcpClient.instances.append(self)
+
+    async def connect(self):
+        await asyncio.sleep(0.01)
+        return True
+
+    def close(self):
+        self.closed = True
+
+    async def read_holding_registers(self, address, count):
+        result = MagicMock()
+        result.isError.return_value = False
+        result.registers = list(range(address, address + count))
+        return result
+
+
+@patch("src.services.modbus.client.AsyncModbusTcpClient", _FakeTcpClient)
+def test_concurrent_requests_reconnect_once():
+    """Both plan requests see the link down; only one socket is opened."""
+    _FakeTcpClient.instances = []
+    service = AsyncModbusService("127.0.0.1", 502, {'connect_cooldown': 0.0})
+    plan = ReadPlan.from_config(None)
+
+    values = asyncio.run(plan.execute(service))
+
+    assert all(v is not None for v in values.values())
+    assert len(_FakeTcpClient.instances) == 1
+
+    # A later reconnect closes the stale client before opening a new one
+    service._connected = False
+    asyncio.run(service.connect())
+    assert len(_FakeTcpClient.instances) == 2
+    assert _FakeTcpClient.instances[0].closed
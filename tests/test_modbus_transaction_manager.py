@@ -0,0 +1,233 @@
+"""Unit tests for the prioritized Modbus transaction manager.
+
+Tests use a fake AsyncModbusService with a fixed per-transaction delay:
+queued transactions run by priority class, identical queued reads are
+coalesced, the sync facade works from another thread at the thread's
+priority, a timed-out write is never sent after a later stop, and
+MachineControl on the shared client sends stops at SAFETY.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.control.machine_control import MachineControl
+from src.services.modbus.transaction_manager import (
+    ModbusTransactionManager,
+    Priority,
+    SyncModbusClient,
+)
+
+
+class _FakeService:
+    """AsyncModbusService stand-in; records transactions in wire order."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.connected = True
+        self.registers = {}
+        self.log = []
+
+    def _should_attempt_connect(self):
+        return True
+
+    async def connect(self):
+        self.connected = True
+        return True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def read_holding_registers(self, address, count, unit=1):
+        self.log.append(('read', address))
+        await asyncio.sleep(self.delay)
+        return [self.registers.get(a, 0) for a in range(address, address + count)]
+
+    async def write_register(self, address, value, unit=1):
+        self.log.append(('write', address))
+        await asyncio.sleep(self.delay)
+        self.registers[address] = value
+        return True
+
+    async def write_registers(self, address, values, unit=1):
+        self.log.append(('write', address))
+        await asyncio.sleep(self.delay)
+        for i, value in enumerate(values):
+            self.registers[address + i] = value
+        return True
+
+    async def write_coil(self, address, value, unit=1):
+        self.log.append(('coil', address))
+        await asyncio.sleep(self.delay)
+        return True
+
+    def get_health(self):
+        return {'connected': self.connected}
+
+
+async def _started(max_in_flight=1, **config):
+    service = _FakeService()
+    manager = ModbusTransactionManager(service, {'max_in_flight': max_in_flight, **config})
+    await manager.start()
+    return manager, service
+
+
+def test_queued_transactions_run_by_priority():
+    async def scenario():
+        manager, service = await _started()
+        busy = asyncio.create_task(manager.read_holding_registers(1, 1))
+        await asyncio.sleep(0)                      # Occupies the only slot
+        await asyncio.gather(
+            busy,
+            manager.read_holding_registers(2, 1),
+            manager.write_register(3, 7),
+            manager.write_register(4, 0, priority=Priority.SAFETY),
+            manager.write_coil(5, True),
+        )
+        await manager.stop()
+        return service.log
+
+    assert asyncio.run(scenario()) == [('read', 1), ('write', 4), ('coil', 5), ('write', 3), ('read', 2)]
+
+
+def test_identical_queued_reads_are_coalesced():
+    async def scenario():
+        manager, service = await _started()
+        service.registers[10] = 42
+        busy = asyncio.create_task(manager.read_holding_registers(10, 1))
+        await asyncio.sleep(0)                      # On the wire: never joined
+        results = await asyncio.gather(busy, *(manager.read_holding_registers(10, 1) for _ in range(3)))
+        stats = manager.get_stats()
+        await manager.stop()
+        return service.log, results, stats
+
+    log, results, stats = asyncio.run(scenario())
+    assert log == [('read', 10), ('read', 10)]
+    assert results == [[42]] * 4
+    telemetry = stats['classes']['telemetry']
+    assert telemetry['submitted'] == 4
+    assert telemetry['coalesced'] == 2
+    assert telemetry['completed'] == 4
+    assert telemetry['total']['count'] == 2
+
+
+def test_stats_per_class_and_inline_before_start():
+    async def scenario():
+        service = _FakeService(delay=0)
+        manager = ModbusTransactionManager(service)
+        assert await manager.read_holding_registers(0, 2) == [0, 0]     # Not started: direct
+        await manager.start()
+        await manager.write_register(1, 5, priority=Priority.SAFETY)
+        service.connected = False
+        health = manager.get_health()
+        stats = manager.get_stats()
+        await manager.stop()
+        return health, stats
+
+    health, stats = asyncio.run(scenario())
+    assert health['connected'] is False
+    assert stats['transactions'] == 1
+    assert stats['in_flight_limit'] == 2
+    assert stats['classes']['safety']['completed'] == 1
+    assert stats['classes']['safety']['wait']['count'] == 1
+    assert stats['classes']['telemetry']['submitted'] == 0
+
+
+def _run_loop_thread():
+    """Start an event loop in a thread with a started manager."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    manager, service = asyncio.run_coroutine_threadsafe(_started(max_in_flight=2), loop).result(2)
+    return loop, thread, manager, service
+
+
+def _stop_loop_thread(loop, thread, manager):
+    asyncio.run_coroutine_threadsafe(manager.stop(), loop).result(2)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(2)
+    loop.close()
+
+
+def test_sync_client_from_thread_uses_thread_priority():
+    loop, thread, manager, service = _run_loop_thread()
+    try:
+        client = manager.sync_client(timeout=2.0)
+        assert client.connect() is True
+        assert client.is_socket_open() is True
+        assert not client.write_register(address=20, value=3).isError()
+        result = client.read_holding_registers(address=20, count=1)
+        assert not result.isError() and result.registers == [3]
+
+        with client.priority(Priority.SAFETY):
+            assert not client.write_coil(7, True).isError()
+        with client.priority(Priority.TELEMETRY):
+            client.read_holding_registers(address=20, count=1)
+
+        classes = manager.get_stats()['classes']
+        assert classes['operator']['completed'] == 2
+        assert classes['safety']['completed'] == 1
+        assert classes['telemetry']['completed'] == 1
+    finally:
+        _stop_loop_thread(loop, thread, manager)
+
+    # Loop gone: calls fail softly instead of raising into the GUI
+    assert client.read_holding_registers(address=20, count=1).isError()
+
+
+def test_timed_out_write_is_withdrawn_not_sent_after_stop():
+    loop, thread, manager, service = _run_loop_thread()
+    try:
+        service.delay = 0.3
+        client = manager.sync_client(timeout=0.1)
+        stop_client = manager.sync_client(timeout=2.0)
+        # Occupy both slots with telemetry so the jog write has to queue
+        busy = [
+            asyncio.run_coroutine_threadsafe(manager.read_holding_registers(a, 1), loop)
+            for a in (1, 2)
+        ]
+        time.sleep(0.02)
+
+        assert client.write_register(address=20, value=0x400).isError()    # Jog start times out
+        with stop_client.priority(Priority.SAFETY):
+            assert not stop_client.write_register(address=20, value=0x0).isError()
+        for future in busy:
+            future.result(2)
+
+        assert [entry for entry in service.log if entry[0] == 'write'] == [('write', 20)]
+        assert service.registers[20] == 0
+        stats = manager.get_stats()
+        assert stats['classes']['operator']['withdrawn'] == 1
+        assert stats['skipped'] == 1
+    finally:
+        _stop_loop_thread(loop, thread, manager)
+
+
+@pytest.fixture
+def shared_machine_control():
+    """MachineControl singleton on a shared transaction manager client."""
+    loop, thread, manager, service = _run_loop_thread()
+    MachineControl._instance = None
+    MachineControl.use_shared_client(manager.sync_client(timeout=2.0))
+    yield MachineControl(), manager, service
+    MachineControl.use_shared_client(None)
+    MachineControl._instance = None
+    _stop_loop_thread(loop, thread, manager)
+
+
+def test_machine_control_stops_run_at_safety(shared_machine_control):
+    mc, manager, service = shared_machine_control
+    assert isinstance(mc.client, SyncModbusClient)
+
+    assert mc.write_target_x(5)
+    assert mc.stop_cutting()
+    start = time.monotonic()
+    mc.poll_status()
+    assert time.monotonic() - start < 2.0
+
+    classes = manager.get_stats()['classes']
+    assert classes['operator']['completed'] >= 1
+    assert classes['safety']['completed'] >= 1
+    assert classes['telemetry']['completed'] == len(mc.get_status_stats()['request_ranges'])
@@ -0,0 +1,187 @@
+"""Unit tests for ModbusWriteScheduler and the queued ModbusWriter path.
+
+Tests cover latest-value-wins coalescing, FC16 merging of consecutive
+registers, pacing between transactions, non-blocking write_speeds() in
+submission order (cutting speed first), PLC write results reported back
+to the caller, and the stats exposed for queue depth and write latency.
+"""
+
+import asyncio
+import time
+
+from src.services.modbus.write_scheduler import ModbusWriteScheduler
+from src.services.modbus.writer import ModbusWriter
+
+SPEED_LIMITS = {
+    'kesme_hizi': {'min': 40.0, 'max': 90.0},
+    'inme_hizi': {'min': 10.0, 'max': 60.0},
+}
+
+
+class _FakeModbus:
+    """Records write transactions with their timestamps."""
+
+    def __init__(self, fail_at=()):
+        self.single = []
+        self.multi = []
+        self.times = []
+        self.fail_at = set(fail_at)
+
+    async def write_register(self, address, value):
+        self.single.append((address, value))
+        self.times.append(time.perf_counter())
+        return address not in self.fail_at
+
+    async def write_registers(self, address, values):
+        self.multi.append((address, list(values)))
+        self.times.append(time.perf_counter())
+        return True
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_latest_value_wins():
+    """Only the newest pending value for a register is written."""
+    modbus = _FakeModbus()
+
+    async def scenario():
+        scheduler = ModbusWriteScheduler(modbus, {'min_write_interval': 0.0})
+        scheduler.submit(2066, 50)
+        scheduler.submit(2066, 55)
+        scheduler.submit(2066, 60)
+        await scheduler.start()
+        await scheduler.flush()
+        await scheduler.stop()
+        return scheduler.get_stats()
+
+    stats = _run(scenario())
+    assert modbus.single == [(2066, 60)]
+    assert stats['superseded'] == 2
+    assert stats['queue_depth'] == 0
+
+
+def test_consecutive_registers_use_fc16():
+    """Consecutive pending registers are merged into one write_registers call."""
+    modbus = _FakeModbus()
+
+    async def scenario():
+        scheduler = ModbusWriteScheduler(modbus, {'min_write_interval': 0.0})
+        scheduler.submit_many({100: 1, 101: 2, 102: 3, 200: 9})
+        await scheduler.start()
+        await scheduler.flush()
+        await scheduler.stop()
+        return scheduler.get_stats()
+
+    stats = _run(scenario())
+    assert modbus.multi == [(100, [1, 2, 3])]
+    assert modbus.single == [(200, 9)]
+    assert stats['multi_register_transactions'] == 1
+    assert stats['registers_written'] == 4
+
+
+def test_fc16_disabled_writes_singles():
+    """multi_register_writes=False falls back to one FC06 per register."""
+    modbus = _FakeModbus()
+
+    async def scenario():
+        scheduler = ModbusWriteScheduler(
+            modbus, {'min_write_interval': 0.0, 'multi_register_writes': False}
+        )
+        scheduler.submit_many({100: 1, 101: 2})
+        await scheduler.start()
+        await scheduler.flush()
+        await scheduler.stop()
+
+    _run(scenario())
+    assert modbus.multi == []
+    assert modbus.single == [(100, 1), (101, 2)]
+
+
+def test_transactions_are_paced():
+    """Separate transactions are spaced by min_write_interval."""
+    modbus = _FakeModbus()
+
+    async def scenario():
+        scheduler = ModbusWriteScheduler(modbus, {'min_write_interval': 0.05})
+        await scheduler.start()
+        scheduler.submit_many({2041: 2000, 2066: 60})
+        await scheduler.flush()
+        await scheduler.stop()
+
+    _run(scenario())
+    assert len(modbus.times) == 2
+    assert modbus.times[1] - modbus.times[0] >= 0.045
+
+
+def test_write_speeds_does_not_block_caller():
+    """write_speeds() with a scheduler returns before the paced writes happen."""
+    modbus = _FakeModbus()
+
+    async def scenario():
+        scheduler = ModbusWriteScheduler(modbus, {'min_write_interval': 0.2})
+        await scheduler.start()
+        writer = ModbusWriter(modbus, {}, SPEED_LIMITS, scheduler=scheduler)
+
+        start = time.perf_counter()
+        ok = await writer.write_speeds(60.0, 20.0)
+        elapsed = time.perf_counter() - start
+
+        await scheduler.flush()
+        stats = writer.get_stats()['scheduler']
+        await scheduler.stop()
+        return ok, elapsed, stats
+
+    ok, elapsed, stats = _run(scenario())
+    assert ok is True
+    assert elapsed < 0.05
+    assert modbus.single == [(2066, 60), (2041, 2000)]    # Cutting speed first, as before
+    assert modbus.times[1] - modbus.times[0] >= 0.19
+    assert stats['transactions'] == 2
+    assert stats['avg_write_latency_ms'] is not None
+
+
+def test_scheduled_write_results_reach_the_caller():
+    """on_written reports the PLC result once both queued writes ran."""
+    modbus = _FakeModbus(fail_at={2041})
+    results = []
+
+    async def scenario():
+        scheduler = ModbusWriteScheduler(modbus, {'min_write_interval': 0.0})
+        await scheduler.start()
+        writer = ModbusWriter(modbus, {}, SPEED_LIMITS, scheduler=scheduler)
+
+        assert await writer.write_speeds(60.0, 20.0, on_written=results.append)
+        assert results == []                                 # Not written yet
+        await scheduler.flush()
+        assert await writer.write_speeds(65.0, None, on_written=results.append)
+        await scheduler.flush()
+        stats = writer.get_stats()
+        await scheduler.stop()
+        return stats
+
+    stats = _run(scenario())
+    assert results == [False, True]
+    assert stats['commands_failed'] == 1
+    assert stats['commands_written'] == 1
+    assert stats['scheduler']['failures'] == 1
+
+
+def test_superseded_value_reports_replacing_write():
+    """A replaced pending value keeps its place and reports the newer write's result."""
+    modbus = _FakeModbus()
+    results = []
+
+    async def scenario():
+        scheduler = ModbusWriteScheduler(modbus, {'min_write_interval': 0.0})
+        scheduler.submit(2066, 50, results.append)
+        scheduler.submit(2041, 1000)
+        scheduler.submit(2066, 55, results.append)
+        await scheduler.start()
+        await scheduler.flush()
+        await scheduler.stop()
+
+    _run(scenario())
+    assert modbus.single == [(2066, 55), (2041, 1000)]
+    assert results == [True, True]
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.domain.enums import ControlMode
+from src.services.processing.snapshot import LatestSnapshot
 
 
 async def _noop_coro(*args, **kwargs):
@@ -36,6 +37,7 @@ def controller():
     ctrl.control_manager = MagicMock()
     ctrl.control_manager.set_mode.side_effect = lambda mode: _noop_coro(mode)
     ctrl.data_pipeline = None
+    ctrl._data_version = None
     ctrl.event_loop = MagicMock()
     ctrl.machine_control = MagicMock()
 
@@ -212,10 +214,10 @@ def test_ml_reset_on_cut_end(controller):
     controller._prev_testere_durumu = 3  # was cutting
     controller._trigger_ml_state_reset = MagicMock()
     controller.data_pipeline = MagicMock()
-    controller.data_pipeline.get_latest_data.return_value = {
+    controller.data_pipeline.get_latest_snapshot.return_value = LatestSnapshot(1, {
         'testere_durumu': 5,  # şerit yukarı çıkıyor — cut ended
         'kesme_hizi_hedef': 0, 'inme_hizi_hedef': 0,
-    }
+    })
     controller._sync_speeds_from_plc()
     controller._trigger_ml_state_reset.assert_called_once()
 
@@ -226,10 +228,10 @@ def test_ml_no_reset_while_still_cutting(controller):
     controller._prev_testere_durumu = 3
     controller._trigger_ml_state_reset = MagicMock()
     controller.data_pipeline = MagicMock()
-    controller.data_pipeline.get_latest_data.return_value = {
+    controller.data_pipeline.get_latest_snapshot.return_value = LatestSnapshot(1, {
         'testere_durumu': 3,
         'kesme_hizi_hedef': 0, 'inme_hizi_hedef': 0,
-    }
+    })
     controller._sync_speeds_from_plc()
     controller._trigger_ml_state_reset.assert_not_called()
 
@@ -240,14 +242,29 @@ def test_ml_no_reset_when_not_cutting_active(controller):
     controller._prev_testere_durumu = 3
     controller._trigger_ml_state_reset = MagicMock()
     controller.data_pipeline = MagicMock()
-    controller.data_pipeline.get_latest_data.return_value = {
+    controller.data_pipeline.get_latest_snapshot.return_value = LatestSnapshot(1, {
         'testere_durumu': 5,
         'kesme_hizi_hedef': 0, 'inme_hizi_hedef': 0,
-    }
+    })
     controller._sync_speeds_from_plc()
     controller._trigger_ml_state_reset.assert_not_called()
 
 
+def test_speed_sync_skips_unchanged_snapshot(controller):
+    """Pipeline values are applied once per snapshot version."""
+    controller.data_pipeline = MagicMock()
+    controller.data_pipeline.get_latest_snapshot.return_value = LatestSnapshot(7, {
+        'testere_durumu': 3, 'kesme_hizi_hedef': 80, 'inme_hizi_hedef': 40,
+    })
+    controller._sync_speeds_from_plc()
+    controller.labelCValue.setText.assert_called_once_with("80")
+
+    controller._c_value = ""  # Would be re-rendered if the data path ran again
+    controller._sync_speeds_from_plc()
+    controller.labelCValue.setText.assert_called_once_with("80")
+    assert controller._data_version == 7
+
+
 # ---------------------------------------------------------------------------
 # Helper tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,117 @@
+"""Unit tests for the pipeline latency histograms.
+
+Tests cover percentile accuracy of the fixed buckets, rolling-window
+expiry, and DataProcessingPipeline recording every stage (read/decode via
+ModbusReader) into get_stats() and the on-demand JSON dump.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.modbus.reader import ModbusReader
+from src.services.processing.data_processor import DataProcessingPipeline
+from src.services.processing.latency import LatencyHistogram, PipelineLatency
+
+SECOND_NS = 1_000_000_000
+
+
+class _FakeModbus:
+    """Answers every read with zeros (cutting state in 1030)."""
+
+    async def read_holding_registers(self, address, count):
+        registers = [0] * count
+        if address == 1000:
+            registers[30] = 3
+        return registers
+
+
+def test_percentiles_within_bucket_error():
+    hist = LatencyHistogram(window_seconds=60.0, slots=6)
+    for us in range(1, 1001):
+        hist.record(us * 1000, now_ns=5 * SECOND_NS)
+
+    snapshot = hist.snapshot(now_ns=5 * SECOND_NS)
+    assert snapshot['count'] == 1000
+    assert snapshot['max_ms'] == pytest.approx(1.0)
+    for q, exact_ms in ((50, 0.5), (95, 0.95), (99, 0.99)):
+        # Upper bucket bound: never below the true value, at most 20% above
+        assert exact_ms <= snapshot[f'p{q}_ms'] <= min(exact_ms * 1.2, 1.0)
+
+
+def test_rolling_window_expires_old_slots():
+    hist = LatencyHistogram(window_seconds=60.0, slots=6)
+    hist.record(50_000_000, now_ns=1 * SECOND_NS)    # Slow sample in the first slot
+    for t in range(2, 56):
+        hist.record(1_000_000, now_ns=t * SECOND_NS)
+
+    recent = hist.snapshot(now_ns=55 * SECOND_NS)
+    assert recent['max_ms'] == pytest.approx(50.0)
+    assert recent['count'] == 55
+
+    # First slot (0-10 s) is reused for 60-70 s
+    for t in range(56, 70):
+        hist.record(1_000_000, now_ns=t * SECOND_NS)
+    later = hist.snapshot(now_ns=69 * SECOND_NS)
+    assert later['max_ms'] == pytest.approx(1.0)
+    assert later['count'] < 68
+
+    assert hist.snapshot(now_ns=1000 * SECOND_NS)['count'] == 0
+
+
+def test_pipeline_records_every_stage(tmp_path):
+    reader = ModbusReader(_FakeModbus(), {})
+    control_manager = MagicMock()
+    control_manager.get_current_mode.return_value = MagicMock(value="manual")
+
+    async def process_data(processed):
+        return None
+
+    control_manager.process_data = process_data
+    iot = MagicMock()
+
+    async def queue_telemetry(processed, vision_data=None):
+        return None
+
+    iot.queue_telemetry = queue_telemetry
+
+    pipeline = DataProcessingPipeline(
+        config={
+            'processing': {'rate_hz': 50, 'latency': {'dump_path': str(tmp_path / "latency.json")}},
+            'anomaly_detection': {'window': 100, 'min_samples': 10},
+        },
+        modbus_reader=reader,
+        modbus_writer=MagicMock(),
+        control_manager=control_manager,
+        db_services={'raw': MagicMock(), 'total': MagicMock(), 'anomaly': MagicMock()},
+        mqtt_service=iot,
+    )
+    assert reader.latency is pipeline.latency
+
+    async def run_cycles():
+        pipeline._running = True
+        task = asyncio.create_task(pipeline._processing_loop())
+        await asyncio.sleep(0.15)
+        pipeline._running = False
+        await task
+
+    asyncio.run(run_cycles())
+
+    cycles = pipeline.get_stats()['cycles']
+    latency = pipeline.get_stats()['latency']
+    assert cycles >= 2
+    for stage in ('modbus_read', 'decode', 'anomaly', 'control', 'db_enqueue', 'iot_enqueue', 'cycle'):
+        assert latency[stage]['count'] >= cycles, stage
+    assert latency['write']['count'] == 0  # No speed commands
+    assert latency['cycle']['p50_ms'] >= latency['decode']['p50_ms']
+    assert "cycle=" in pipeline.latency.format_summary()
+
+    assert pipeline.dump_latency() == str(tmp_path / "latency.json")
+    dumped = json.loads((tmp_path / "latency.json").read_text())
+    assert dumped['stages']['cycle']['count'] == latency['cycle']['count']
+
+
+def test_pipeline_latency_summary_without_samples():
+    assert PipelineLatency().format_summary() == "no samples"
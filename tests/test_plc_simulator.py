@@ -0,0 +1,154 @@
+"""Unit tests for the replaying PLC simulator.
+
+Tests cover loading samples from legacy raw_registers rows and compact
+chunks, replay clock and wrap-around, the first-order speed plant model and
+a Modbus round trip with the real ModbusReader/ModbusWriter (reads of the
+recorded block, speed writes reaching 1033/1034).
+"""
+
+import asyncio
+import copy
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from src.services.database.raw_store import CompactRawWriter
+from src.services.database.schemas import SCHEMA_RAW_DB
+from src.services.modbus.client import AsyncModbusService
+from src.services.modbus.reader import ModbusReader
+from src.services.modbus.simulator import (
+    CUTTING_STATE,
+    INME_HIZI_TARGET_ADDRESS,
+    KESME_HIZI_TARGET_ADDRESS,
+    PLCSimulator,
+    load_raw_samples,
+)
+from src.services.modbus.writer import ModbusWriter
+from src.tasks.pipeline_benchmark import make_synthetic_raw_db
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.yaml"
+
+
+class _ChunkDatabase:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def append_rows(self, table, rows, columns=None) -> bool:
+        self.connection.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            rows
+        )
+        return True
+
+
+def _samples(count=100, state=CUTTING_STATE):
+    timestamps = 1_700_000_000_000 + np.arange(count, dtype=np.int64) * 100
+    registers = np.zeros((count, 44), dtype=np.uint16)
+    registers[:, 0] = np.arange(count)  # Sample index in makine_id
+    registers[:, 30] = state
+    registers[:, 33] = 800  # 80.0 mm/min
+    registers[:, 34] = 40
+    return timestamps, registers
+
+
+def test_load_legacy_rows_and_compact_chunks(tmp_path):
+    legacy = make_synthetic_raw_db(tmp_path / "legacy.db", duration_s=20.0, cut_s=10.0, idle_s=5.0)
+    timestamps, registers = load_raw_samples(legacy)
+    assert registers.shape == (200, 44)
+    assert (np.diff(timestamps) == 100).all()
+    assert set(registers[:, 30]) == {0, CUTTING_STATE}
+
+    compact = tmp_path / "compact.db"
+    connection = sqlite3.connect(compact)
+    connection.executescript(SCHEMA_RAW_DB)
+    writer = CompactRawWriter(_ChunkDatabase(connection), chunk_samples=7)
+    for ts, regs in zip(timestamps, registers):
+        writer.append(int(ts), regs.tolist())
+    writer.flush()
+    connection.commit()
+    connection.close()
+
+    chunk_ts, chunk_regs = load_raw_samples(compact)
+    np.testing.assert_array_equal(chunk_ts, timestamps)
+    np.testing.assert_array_equal(chunk_regs, registers)
+
+    start = datetime.fromtimestamp(timestamps[50] / 1000.0)
+    assert len(load_raw_samples(compact, start=start)[0]) == 150
+
+
+def test_replay_clock_speed_and_wrap():
+    simulator = PLCSimulator(*_samples(100), speed=10.0)
+    simulator._wall_start = 0.0
+
+    assert simulator.current_registers(now=0.0)[0] == 0
+    assert simulator.current_registers(now=0.5)[0] == 50  # 5 recorded s at 10x
+    assert simulator.current_registers(now=1.05)[0] == 5  # Wrapped after 10 s
+    assert simulator.get_stats()['loops'] == 1
+
+
+def test_plant_model_follows_written_targets():
+    simulator = PLCSimulator(*_samples(1000), speed=1.0, plant_tau=1.0)
+    simulator._wall_start = 0.0
+    assert simulator.current_registers(now=0.0)[33] == 800
+
+    simulator._on_write(KESME_HIZI_TARGET_ADDRESS, 100, now=0.0)
+    simulator._on_write(INME_HIZI_TARGET_ADDRESS, 6000, now=0.0)  # 60.0 mm/min
+
+    one_tau = simulator.current_registers(now=1.0)
+    assert one_tau[33] == pytest.approx(800 + (1000 - 800) * (1 - np.exp(-1)), abs=1)
+    settled = simulator.current_registers(now=10.0)
+    assert settled[33] == 1000
+    assert settled[34] == 60
+    assert simulator.get_stats()['plant_active']
+
+
+def test_plant_resets_when_recorded_cut_ends():
+    timestamps, registers = _samples(100)
+    registers[50:, 30] = 0
+    simulator = PLCSimulator(timestamps, registers, speed=1.0, plant_tau=0.0)
+    simulator._wall_start = 0.0
+
+    simulator.current_registers(now=0.0)
+    simulator._on_write(KESME_HIZI_TARGET_ADDRESS, 95, now=0.0)
+    assert simulator.current_registers(now=1.0)[33] == 950
+    assert simulator.current_registers(now=6.0)[33] == 800  # Idle: recording shows through
+    assert not simulator.get_stats()['plant_active']
+
+
+def test_modbus_round_trip_with_reader_and_writer():
+    with open(CONFIG_PATH, encoding='utf-8') as f:
+        config = copy.deepcopy(yaml.safe_load(f))
+
+    async def scenario():
+        simulator = PLCSimulator(*_samples(1000), speed=1.0, plant_tau=0.0)
+        port = await simulator.start(port=0)
+        service = AsyncModbusService("127.0.0.1", port, {'timeout': 2.0})
+        try:
+            reader = ModbusReader(service, config['modbus']['registers'])
+            writer = ModbusWriter(service, config['modbus']['registers'], config['control']['speed_limits'])
+
+            first = await reader.read_all_sensors()
+            assert first.serit_kesme_hizi == pytest.approx(80.0)
+            assert first.testere_durumu == CUTTING_STATE
+
+            assert await writer.write_speeds(90.0, 55.0)
+            await asyncio.sleep(0.05)
+            second = await reader.read_all_sensors()
+            return first, second, simulator.get_stats()
+        finally:
+            await service.disconnect()
+            await simulator.stop()
+
+    first, second, stats = asyncio.run(scenario())
+    assert second.serit_kesme_hizi == pytest.approx(90.0)
+    assert second.serit_inme_hizi == pytest.approx(55.0)
+    assert second.kesme_hizi_hedef == pytest.approx(90.0)
+    assert second.inme_hizi_hedef == pytest.approx(55.0)
+    assert second.makine_id > first.makine_id  # Replay advanced
+    assert stats['sensor_reads'] == 2
+    assert stats['kesme_writes'] == 1 and stats['inme_writes'] == 1
+    assert stats['write_latency']['count'] == 2
@@ -0,0 +1,76 @@
+"""Unit tests for the shared polyline plot helpers.
+
+Tests cover the NumPy point ring buffer (wrap-around, time-window drops)
+and the LTTB / min-max decimation used to fit series to the pixel width.
+"""
+
+import numpy as np
+
+from src.gui.widgets.polyline_plot import PointBuffer, decimate, lttb, minmax_decimate
+
+
+def test_point_buffer_wraps_and_stays_contiguous():
+    buffer = PointBuffer(4)
+    for i in range(6):
+        buffer.append(i, i * 10)
+
+    x, y = buffer.arrays()
+    assert len(buffer) == 4
+    assert x.tolist() == [2, 3, 4, 5]
+    assert y.tolist() == [20, 30, 40, 50]
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.arrays()[0].size == 0
+
+
+def test_point_buffer_drop_before():
+    buffer = PointBuffer(5)
+    for t in (1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0):
+        buffer.append(t, -t)
+
+    assert buffer.drop_before(4.5) == 2
+    assert buffer.arrays()[0].tolist() == [5.0, 6.0, 7.0]
+    assert buffer.drop_before(1.0) == 0
+
+    buffer.append(8.0, -8.0)
+    assert buffer.arrays()[1].tolist() == [-5.0, -6.0, -7.0, -8.0]
+
+
+def test_lttb_keeps_endpoints_and_spike():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50.0)
+    y[437] = 25.0
+
+    dx, dy = lttb(x, y, 100)
+    assert len(dx) == 100
+    assert dx[0] == 0 and dx[-1] == 999
+    assert 25.0 in dy
+    assert np.all(np.diff(dx) > 0)
+
+
+def test_minmax_keeps_envelope():
+    rng = np.random.default_rng(0)
+    x = np.arange(10000, dtype=float)
+    y = rng.normal(size=10000)
+    y[1234] = -50.0
+    y[8765] = 50.0
+
+    dx, dy = minmax_decimate(x, y, 200)
+    assert len(dx) <= 400
+    assert dy.min() == -50.0 and dy.max() == 50.0
+    assert np.all(np.diff(dx) >= 0)
+
+
+def test_decimate_passthrough_and_auto():
+    x = np.arange(50, dtype=float)
+    y = x * 2
+    dx, dy = decimate(x, y, 800)
+    assert dx is x and dy is y
+
+    x = np.arange(100000, dtype=float)
+    y = np.cos(x)
+    dx, _ = decimate(x, y, 800)             # 125 points per pixel -> min/max
+    assert len(dx) <= 800
+    dx, _ = decimate(x[:2000], y[:2000], 800)   # 2.5 per pixel -> LTTB
+    assert len(dx) == 800
@@ -0,0 +1,100 @@
+"""Unit tests for the compact raw register store.
+
+Tests cover pack/decode round trips (compressed and uncompressed), chunk
+boundaries (size and saw-state change), flush of partial chunks and
+time-range reads back into NumPy arrays through a real SQLite database.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.services.database.raw_store import (
+    CompactRawWriter,
+    TESTERE_DURUMU_INDEX,
+    read_raw_chunks,
+)
+from src.services.database.schemas import SCHEMA_RAW_DB
+
+
+class _DirectDB:
+    """Minimal synchronous stand-in for SQLiteService on a real file."""
+
+    def __init__(self, path: Path):
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript(SCHEMA_RAW_DB)
+
+    def append_rows(self, table, rows, columns):
+        placeholders = ", ".join("?" for _ in columns)
+        self.conn.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows
+        )
+        self.conn.commit()
+        return True
+
+    def read(self, sql, params=()):
+        return self.conn.execute(sql, params).fetchall()
+
+
+def _sample(i: int, state: int = 3) -> list:
+    regs = [(i * 7 + k) % 65536 for k in range(44)]
+    regs[TESTERE_DURUMU_INDEX] = state
+    return regs
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_round_trip(tmp_path: Path, compress: bool):
+    """Samples written in chunks decode back to identical arrays."""
+    db = _DirectDB(tmp_path / "raw.db")
+    writer = CompactRawWriter(db, chunk_samples=10, compress=compress)
+
+    expected = [_sample(i) for i in range(25)]
+    for i, regs in enumerate(expected):
+        writer.append(1_700_000_000_000 + i * 100, regs)
+    writer.flush()
+
+    timestamps, registers = read_raw_chunks(db)
+
+    assert registers.dtype == np.uint16
+    assert registers.shape == (25, 44)
+    np.testing.assert_array_equal(registers, np.array(expected, dtype=np.uint16))
+    np.testing.assert_array_equal(timestamps, 1_700_000_000_000 + np.arange(25) * 100)
+    assert len(db.read("SELECT id FROM raw_register_chunks")) == 3
+
+
+def test_state_change_closes_chunk(tmp_path: Path):
+    """A saw-state change starts a new chunk so chunks never span cuts."""
+    db = _DirectDB(tmp_path / "raw.db")
+    writer = CompactRawWriter(db, chunk_samples=100)
+
+    for i in range(5):
+        writer.append(i * 100, _sample(i, state=0))
+    for i in range(5, 8):
+        writer.append(i * 100, _sample(i, state=3))
+    writer.flush()
+
+    chunks = db.read("SELECT testere_durumu, sample_count FROM raw_register_chunks ORDER BY id")
+    assert chunks == [(0, 5), (3, 3)]
+
+
+def test_read_time_range_trims_partial_chunks(tmp_path: Path):
+    """Range reads return only samples inside [start_ms, end_ms)."""
+    db = _DirectDB(tmp_path / "raw.db")
+    writer = CompactRawWriter(db, chunk_samples=10)
+    for i in range(30):
+        writer.append(i * 100, _sample(i))
+    writer.flush()
+
+    timestamps, registers = read_raw_chunks(db, start_ms=450, end_ms=1250)
+
+    np.testing.assert_array_equal(timestamps, np.arange(5, 13) * 100)
+    assert registers.shape == (8, 44)
+
+
+def test_empty_store_returns_empty_arrays(tmp_path: Path):
+    """Reading an empty store yields zero-length arrays with the right shape."""
+    timestamps, registers = read_raw_chunks(_DirectDB(tmp_path / "raw.db"))
+    assert timestamps.shape == (0,)
+    assert registers.shape == (0, 44)
@@ -0,0 +1,107 @@
+"""Unit tests for the visibility-aware GUI refresh scheduler.
+
+Tests drive tick() with a fake clock (no QApplication, no master QTimer):
+only the visible page and background tasks run, a page switch refreshes
+the new page at once, missed periods collapse into one run, and a failing
+task is counted without stopping the others.
+"""
+
+from src.gui.refresh_scheduler import GuiRefreshScheduler, RefreshTask
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _recorder(calls, name):
+    return lambda: calls.append(name)
+
+
+def _scheduler():
+    clock = _FakeClock()
+    calls = []
+    scheduler = GuiRefreshScheduler(clock=clock)
+    scheduler.add_page(0, [
+        RefreshTask('values', _recorder(calls, 'panel.values'), 200),
+        RefreshTask('status', _recorder(calls, 'panel.status'), 200, background=True),
+    ], 'panel')
+    scheduler.add_page(1, [RefreshTask('graph', _recorder(calls, 'sensor.graph'), 100)], 'sensor')
+    scheduler.add_background('main', [RefreshTask('datetime', _recorder(calls, 'main.datetime'), 1000)])
+    return scheduler, clock, calls
+
+
+def test_only_visible_page_and_background_run():
+    scheduler, clock, calls = _scheduler()
+    scheduler.set_current_page(0)
+    assert sorted(calls) == ['main.datetime', 'panel.status', 'panel.values']
+
+    calls.clear()
+    for _ in range(20):                  # 1 s of 50 ms ticks
+        clock.now += 0.05
+        scheduler.tick()
+    assert 'sensor.graph' not in calls
+    assert calls.count('panel.values') == 5
+    assert calls.count('panel.status') == 5
+    assert calls.count('main.datetime') == 1
+
+
+def test_page_switch_runs_new_page_immediately():
+    scheduler, clock, calls = _scheduler()
+    scheduler.set_current_page(0)
+    clock.now = 0.01
+    calls.clear()
+
+    scheduler.set_current_page(1)
+    assert calls == ['sensor.graph']     # Background tasks are not due yet
+    assert scheduler.get_stats()['current_page'] == 'sensor'
+
+    calls.clear()
+    clock.now = 0.5
+    scheduler.tick()
+    assert 'panel.values' not in calls
+
+
+def test_missed_periods_collapse_into_one_run():
+    scheduler, clock, calls = _scheduler()
+    scheduler.set_current_page(1)
+    calls.clear()
+
+    clock.now = 0.55                     # Five graph periods late (blocked GUI thread)
+    scheduler.tick()
+    assert calls.count('sensor.graph') == 1
+
+    stats = scheduler.get_stats()
+    assert stats['collapsed'] >= 4
+    assert stats['tasks']['sensor.graph']['runs'] == 2
+    assert stats['tasks']['panel.status']['background'] is True
+
+
+def test_switch_from_running_task_does_not_nest_ticks():
+    scheduler, clock, calls = _scheduler()
+    scheduler.add_background('alarm', [
+        RefreshTask('alarms', lambda: scheduler.set_current_page(1), 500, background=True),
+    ])
+    scheduler.set_current_page(0)
+
+    assert scheduler.current_page == 1
+    assert calls.count('sensor.graph') == 1
+    assert 'panel.values' not in calls
+    assert scheduler.get_stats()['ticks'] == 1
+
+
+def test_failing_task_is_counted_and_others_run():
+    scheduler, clock, calls = _scheduler()
+
+    def broken():
+        raise RuntimeError("widget deleted")
+
+    scheduler.add_background('broken', [RefreshTask('broken', broken, 200)])
+    scheduler.set_current_page(0)
+
+    assert scheduler.get_stats()['errors'] == 1
+    assert 'panel.values' in calls
+    assert 'main.datetime' in calls
@@ -0,0 +1,196 @@
+"""Unit tests for daily-partitioned sensor_data storage.
+
+Tests cover partition DDL derived from the sensor_data schema, range query
+routing to overlapping partitions, end-to-end writes through SQLiteService
+(partition + view creation, retention drops) and the one-time migration of
+legacy TEXT-timestamp rows.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.services.database import partitions as partitions_module
+from src.services.database.partitions import (
+    LEGACY_TABLE,
+    PARTITION_COLUMNS,
+    PARTITION_VIEW,
+    SensorDataPartitions,
+    migrate_sensor_data,
+    partition_ddl,
+    partition_name,
+    query_range,
+    range_sql,
+    to_epoch_ms,
+)
+from src.services.database.schemas import SCHEMA_TOTAL_DB, SENSOR_DATA_COLUMNS
+from src.services.database.sqlite_service import SQLiteService
+
+DAY1 = datetime(2026, 3, 1, 23, 59, 59)
+DAY2 = datetime(2026, 3, 2, 0, 0, 1)
+
+
+def _values(kesim_id=1, akim=10.0):
+    """Row values in SENSOR_DATA_COLUMNS order without the timestamp."""
+    values = [None] * (len(SENSOR_DATA_COLUMNS) - 1)
+    values[0] = kesim_id
+    values[1] = akim
+    return values
+
+
+@pytest.fixture()
+def service(tmp_path: Path):
+    svc = SQLiteService(tmp_path / "total.db", SCHEMA_TOTAL_DB)
+    svc.start()
+    yield svc
+    svc.stop()
+
+
+def test_partition_ddl_matches_sensor_data_columns():
+    """Partitions keep every sensor_data column with an integer timestamp."""
+    conn = sqlite3.connect(":memory:")
+    for statement in partition_ddl("sensor_data_p20260301"):
+        conn.execute(statement)
+
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(sensor_data_p20260301)")]
+    assert columns == ["id", *PARTITION_COLUMNS]
+    types = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(sensor_data_p20260301)")}
+    assert types["timestamp_ms"] == "INTEGER"
+
+
+def test_range_sql_selects_only_overlapping_partitions():
+    partitions = [partition_name(DAY1.date() + timedelta(days=d)) for d in range(-10, 10)]
+    start = datetime(2026, 3, 1, 12, 0)
+    end = datetime(2026, 3, 1, 13, 0)
+
+    sql, params = range_sql(partitions, to_epoch_ms(start), to_epoch_ms(end))
+
+    # Same day plus one day of padding on each side
+    assert sql.count("UNION ALL") == 2
+    assert "sensor_data_p20260301" in sql
+    assert "sensor_data_p20260305" not in sql
+    assert params == (to_epoch_ms(start), to_epoch_ms(end)) * 3
+
+    assert range_sql(partitions, 0, 1000) == (None, ())
+
+
+def test_writes_route_to_daily_partitions(service):
+    partitions = SensorDataPartitions(service)
+    partitions.append(DAY1, _values(akim=1.0))
+    partitions.append(DAY2, _values(akim=2.0))
+    partitions.append(DAY2 + timedelta(seconds=1), _values(akim=3.0))
+    service.stop()
+    service.start()
+
+    assert service.read("SELECT COUNT(*) FROM sensor_data_p20260301") == [(1,)]
+    assert service.read("SELECT COUNT(*) FROM sensor_data_p20260302") == [(2,)]
+    assert service.read(f"SELECT COUNT(*) FROM {PARTITION_VIEW}") == [(3,)]
+    assert service.read("SELECT COUNT(*) FROM sensor_data") == [(0,)]
+
+    rows = query_range(service, DAY1, DAY2 + timedelta(seconds=1), "timestamp_ms, serit_motor_akim_a")
+    assert rows == [(to_epoch_ms(DAY1), 1.0), (to_epoch_ms(DAY2), 2.0)]
+    assert partitions.get_stats()['partitions'] == 2
+
+
+def test_retention_drops_whole_partitions(service):
+    partitions = SensorDataPartitions(service, retention_days=1)
+    partitions.append(DAY1 - timedelta(days=2), _values())
+    partitions.append(DAY1, _values())
+    partitions.append(DAY2, _values())
+    service.stop()
+    service.start()
+
+    names = [row[0] for row in service.read(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'sensor_data_p%' ORDER BY name"
+    )]
+    assert names == ["sensor_data_p20260301", "sensor_data_p20260302"]
+    assert service.read(f"SELECT COUNT(*) FROM {PARTITION_VIEW}") == [(2,)]
+
+
+def _write_legacy_rows(db_path: Path, timestamps):
+    """Create total.db's legacy sensor_data table (if missing) and add rows."""
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_TOTAL_DB)
+    placeholders = ", ".join("?" for _ in SENSOR_DATA_COLUMNS)
+    conn.executemany(
+        f"INSERT INTO sensor_data ({', '.join(SENSOR_DATA_COLUMNS)}) VALUES ({placeholders})",
+        [(ts.isoformat(), *_values(akim=i)) for i, ts in enumerate(timestamps)]
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_migration_converts_legacy_rows_once(tmp_path: Path):
+    db_path = tmp_path / "total.db"
+    _write_legacy_rows(db_path, (DAY1, DAY2, DAY2))
+
+    assert migrate_sensor_data(db_path) == 3
+    # Idempotent: legacy table has been moved out of the way
+    assert migrate_sensor_data(db_path) == 0
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        assert conn.execute(f"SELECT COUNT(*) FROM {LEGACY_TABLE}").fetchone() == (3,)
+        assert conn.execute("SELECT COUNT(*) FROM sensor_data_p20260302").fetchone() == (2,)
+        assert conn.execute(
+            f"SELECT timestamp_ms, serit_motor_akim_a FROM {PARTITION_VIEW} ORDER BY timestamp_ms LIMIT 1"
+        ).fetchone() == (to_epoch_ms(DAY1), 0.0)
+    finally:
+        conn.close()
+
+
+def test_interrupted_migration_leaves_no_partial_copy(tmp_path: Path, monkeypatch):
+    db_path = tmp_path / "total.db"
+    _write_legacy_rows(db_path, (DAY1, DAY2, DAY2))
+    monkeypatch.setattr(partitions_module, 'MIGRATION_CHUNK_ROWS', 1)
+
+    calls = []
+
+    def failing_to_epoch_ms(timestamp):
+        calls.append(timestamp)
+        if len(calls) == 3:
+            raise RuntimeError("power loss")
+        return to_epoch_ms(timestamp)
+
+    monkeypatch.setattr(partitions_module, 'to_epoch_ms', failing_to_epoch_ms)
+    with pytest.raises(RuntimeError):
+        migrate_sensor_data(db_path)
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+        assert not any(name.startswith('sensor_data_p') for name in tables)
+        assert conn.execute("SELECT COUNT(*) FROM sensor_data").fetchone() == (3,)
+    finally:
+        conn.close()
+
+    monkeypatch.setattr(partitions_module, 'to_epoch_ms', to_epoch_ms)
+    assert migrate_sensor_data(db_path) == 3
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        assert conn.execute(f"SELECT COUNT(*) FROM {PARTITION_VIEW}").fetchone() == (3,)
+    finally:
+        conn.close()
+
+
+def test_second_migration_appends_to_legacy_backup(tmp_path: Path):
+    db_path = tmp_path / "total.db"
+    _write_legacy_rows(db_path, (DAY1, DAY2))
+    assert migrate_sensor_data(db_path) == 2
+
+    # Legacy storage used again (e.g. total_storage switched back and forth)
+    _write_legacy_rows(db_path, (DAY2,))
+    assert migrate_sensor_data(db_path) == 1
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        assert conn.execute(f"SELECT COUNT(*) FROM {LEGACY_TABLE}").fetchone() == (3,)
+        assert conn.execute(f"SELECT COUNT(*) FROM {PARTITION_VIEW}").fetchone() == (3,)
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sensor_data'"
+        ).fetchone() is None
+    finally:
+        conn.close()
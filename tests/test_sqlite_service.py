@@ -0,0 +1,116 @@
+"""Unit tests for SQLiteService batched writes.
+
+Tests cover grouping of consecutive identical SQL, statement-order
+preservation across different SQL, append_rows() bulk inserts (explicit
+and schema-derived columns) and end-to-end flushing through the writer
+thread.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.services.database.sqlite_service import SQLiteService
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    value REAL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kesim_id INTEGER UNIQUE,
+    data_count INTEGER DEFAULT 0
+);
+"""
+
+INSERT_SAMPLE = "INSERT INTO samples (timestamp, value) VALUES (?, ?)"
+
+
+@pytest.fixture()
+def service(tmp_path: Path):
+    svc = SQLiteService(tmp_path / "test.db", SCHEMA)
+    svc.start()
+    yield svc
+    svc.stop()
+
+
+def _count(db_path: Path, table: str) -> int:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_group_batch_merges_consecutive_items_only():
+    """Consecutive identical SQL is merged; interleaved SQL keeps its order."""
+    batch = [
+        (INSERT_SAMPLE, ("t1", 1.0), False),
+        (INSERT_SAMPLE, ("t2", 2.0), False),
+        ("UPDATE sessions SET data_count = ?", (5,), False),
+        (INSERT_SAMPLE, [("t3", 3.0), ("t4", 4.0)], True),
+    ]
+    groups = SQLiteService._group_batch(batch)
+
+    assert [sql for sql, _ in groups] == [
+        INSERT_SAMPLE,
+        "UPDATE sessions SET data_count = ?",
+        INSERT_SAMPLE,
+    ]
+    assert groups[0][1] == [("t1", 1.0), ("t2", 2.0)]
+    assert groups[2][1] == [("t3", 3.0), ("t4", 4.0)]
+
+
+def test_apply_batch_preserves_insert_then_update(tmp_path: Path):
+    """An UPDATE queued after an INSERT sees the inserted row."""
+    db_path = tmp_path / "order.db"
+    svc = SQLiteService(db_path, SCHEMA)
+    svc._initialize_database()
+
+    conn = sqlite3.connect(str(db_path))
+    svc._apply_batch(conn, [
+        ("INSERT INTO sessions (kesim_id) VALUES (?)", (1,), False),
+        ("UPDATE sessions SET data_count = ? WHERE kesim_id = ?", (7, 1), False),
+    ])
+    assert conn.execute("SELECT data_count FROM sessions").fetchone()[0] == 7
+    conn.close()
+
+
+def test_append_rows_with_explicit_columns(service: SQLiteService):
+    """append_rows() inserts every row and counts them individually."""
+    rows = [(f"t{i}", float(i)) for i in range(250)]
+    assert service.append_rows("samples", rows, ("timestamp", "value"))
+
+    service.stop()
+    assert _count(service.db_path, "samples") == 250
+    stats = service.get_stats()
+    assert stats["writes_queued"] == 250
+    assert stats["writes_completed"] == 250
+
+
+def test_append_rows_derives_columns_from_schema(service: SQLiteService):
+    """Without columns, all non-id columns are used in table order."""
+    assert service.append_rows("samples", [("t0", 1.5)])
+    service.stop()
+
+    conn = sqlite3.connect(str(service.db_path))
+    assert conn.execute("SELECT timestamp, value FROM samples").fetchall() == [("t0", 1.5)]
+    conn.close()
+
+
+def test_append_rows_unknown_table_is_rejected(service: SQLiteService):
+    """Unknown tables are rejected at queue time."""
+    assert service.append_rows("missing", [(1,)]) is False
+
+
+def test_write_async_and_append_rows_mix(service: SQLiteService):
+    """write_async() items and append_rows() items flush together."""
+    for i in range(10):
+        service.write_async(INSERT_SAMPLE, (f"a{i}", float(i)))
+    service.append_rows("samples", [(f"b{i}", float(i)) for i in range(10)], ("timestamp", "value"))
+
+    service.stop()
+    assert _count(service.db_path, "samples") == 20
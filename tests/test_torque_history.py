@@ -0,0 +1,88 @@
+"""Unit tests for the Torque Guard height/torque history.
+
+Tests compare interpolation against the previous implementation (stable
+sort of the full list, linear scan) on descending, jittery and flat head
+paths, including out-of-range targets and ties, and check that distance
+and sample-count eviction keep the history bounded.
+"""
+
+import numpy as np
+import pytest
+
+from src.services.control.torque_history import HeightTorqueHistory
+
+
+def _legacy_interpolate(samples, target_height):
+    """Interpolation as implemented before HeightTorqueHistory."""
+    if len(samples) < 2:
+        return None
+    sorted_buffer = sorted(samples, key=lambda x: x[0])
+    lower = upper = None
+    for height, torque in sorted_buffer:
+        if height <= target_height:
+            lower = (height, torque)
+        elif height > target_height:
+            upper = (height, torque)
+            break
+    if lower is None or upper is None:
+        return min(sorted_buffer, key=lambda x: abs(x[0] - target_height))[1]
+    h1, t1 = lower
+    h2, t2 = upper
+    if h2 == h1:
+        return t1
+    return t1 + (t2 - t1) * (target_height - h1) / (h2 - h1)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_full_sort_without_eviction(seed):
+    rng = np.random.default_rng(seed)
+    heights = 300.0 - np.cumsum(rng.uniform(0.0, 0.1, 600))
+    heights = np.round(heights + rng.normal(0.0, 0.02, heights.size), 2)  # jitter and ties
+    torques = rng.normal(35.0, 4.0, heights.size)
+
+    history = HeightTorqueHistory(max_distance_mm=1e9, max_samples=10_000)
+    samples = []
+    for height, torque in zip(heights.tolist(), torques.tolist()):
+        history.append(height, torque)
+        samples.append((height, torque))
+        for target in (height + 2.5, height - 1.0, heights[0] + 5.0, height):
+            assert history.interpolate(target) == _legacy_interpolate(samples, target)
+
+
+def test_matches_full_sort_within_lookback_on_descent():
+    rng = np.random.default_rng(7)
+    heights = 300.0 - np.arange(3000) * 0.03 + rng.normal(0.0, 0.005, 3000)
+    torques = rng.normal(35.0, 4.0, heights.size)
+
+    history = HeightTorqueHistory(max_distance_mm=5.0)
+    samples = []
+    for height, torque in zip(heights.tolist(), torques.tolist()):
+        history.append(height, torque)
+        samples.append((height, torque))
+        assert history.interpolate(height + 2.5) == _legacy_interpolate(samples, height + 2.5)
+
+    assert len(history) < 200
+    assert history.evicted == len(samples) - len(history)
+
+
+def test_sample_cap_bounds_memory_when_head_stands_still():
+    history = HeightTorqueHistory(max_distance_mm=5.0, max_samples=50)
+    for i in range(5000):
+        history.append(100.0 + (i % 3) * 0.01, float(i))
+    assert len(history) == 50
+    assert len(history._order) <= 100
+
+    # Oldest samples went first: only the last 50 torques remain
+    assert sorted(history._torques) == [float(i) for i in range(4950, 5000)]
+
+
+def test_small_history_and_clear():
+    history = HeightTorqueHistory(max_distance_mm=5.0)
+    assert history.interpolate(10.0) is None
+    history.append(10.0, 20.0)
+    assert history.interpolate(10.0) is None
+    history.append(9.0, 30.0)
+    assert history.interpolate(9.5) == pytest.approx(25.0)
+    history.clear()
+    assert len(history) == 0
+    assert history.interpolate(9.5) is None
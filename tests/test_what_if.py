@@ -0,0 +1,205 @@
+"""Unit tests for the offline what-if engine.
+
+The vectorized simulation must reproduce MLController's commands for each
+grid point when driven with the same recorded stream (speeds following the
+commands, Torque Guard triggering once). Also covers grid construction and
+grid runs over SQLite databases, in-process and with a process pool.
+"""
+
+import asyncio
+import copy
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from src.domain.models import ProcessedData, RawSensorData
+from src.services.control.ml_controller import MLController
+from src.services.control.what_if import (
+    GRID_PARAMETERS,
+    RecordedCut,
+    SimulationSettings,
+    base_parameters,
+    build_grid,
+    first_exceeding,
+    grid_size,
+    run_grid,
+    simulate_cut,
+)
+from src.tasks.what_if import make_synthetic_databases
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.yaml"
+
+
+class _NullDatabase:
+    def write_async(self, sql, params=None) -> bool:
+        return True
+
+
+class _ReplayModel:
+    """Model stub: predicts the recorded output of the current step."""
+
+    def __init__(self):
+        self.output = 0.0
+
+    def predict(self, features):
+        return np.array([self.output])
+
+
+def _config():
+    with open(CONFIG_PATH, encoding='utf-8') as f:
+        return copy.deepcopy(yaml.safe_load(f))
+
+
+def _recorded_cut(samples=400, seed=0):
+    rng = np.random.default_rng(seed)
+    start = datetime(2025, 5, 1, 8, 0, 0).timestamp()
+    torque = 30.0 + np.cumsum(rng.normal(0.0, 0.2, samples))
+    torque[250:] += 20.0  # Spike for Torque Guard
+    timestamps = start + np.arange(samples) * 0.1
+    return RecordedCut(
+        kesim_id=1,
+        timestamps=timestamps,
+        torque=torque,
+        height=300.0 - np.arange(samples) * 0.05,
+        kesme_hizi=np.full(samples, 80.0),
+        inme_hizi=np.full(samples, 40.0),
+        ml_timestamps=timestamps + 0.005,
+        ml_outputs=np.clip(rng.normal(-0.2, 0.5, samples), -1.0, 1.0)
+    )
+
+
+def _controller_commands(cut, params):
+    """Drive MLController with the cut (closed loop) and collect its targets."""
+    config = _config()
+    config['ml']['min_speed_update_interval'] = 0.0
+    config['ml']['compiled_inference'] = False
+    config['ml']['inference'] = {'executor': False}
+    config['ml']['katsayi'] = params['katsayi']
+    config['ml']['write_thresholds'] = {
+        'kesme_hizi': {'enabled': params['kesme_threshold'] > 0, 'threshold': params['kesme_threshold']},
+        'inme_hizi': {'enabled': params['inme_threshold'] > 0, 'threshold': params['inme_threshold']},
+    }
+    tg = config['ml']['torque_guard']
+    tg['enabled'] = bool(params['tg_enabled'])
+    tg['activation_delay_seconds'] = params['tg_delay']
+    tg['height_threshold_mm'] = params['tg_lookback']
+    tg['torque_increase_threshold'] = params['tg_threshold']
+    tg['speed_reduction_factor'] = params['tg_reduction']
+
+    controller = MLController(config, modbus_service=None, db_service=_NullDatabase())
+    model = _ReplayModel()
+    controller.model_loader._model = model
+
+    kesme, inme = float(cut.kesme_hizi[0]), float(cut.inme_hizi[0])
+    commands = []
+
+    async def drive():
+        nonlocal kesme, inme
+        for i in range(len(cut.timestamps)):
+            model.output = cut.ml_outputs[i]
+            raw = RawSensorData(
+                timestamp=datetime.now(),
+                serit_motor_tork_percentage=float(cut.torque[i]),
+                kafa_yuksekligi_mm=float(cut.height[i]),
+                serit_kesme_hizi=kesme,
+                serit_inme_hizi=inme,
+                testere_durumu=3,
+            )
+            command = await controller.calculate_speeds(
+                ProcessedData(timestamp=raw.timestamp, raw_data=raw, is_cutting=True)
+            )
+            if command is None:
+                commands.append((None, None, None))
+                continue
+            commands.append((command.source, command.kesme_hizi_target, command.inme_hizi_target))
+            if command.kesme_hizi_target is not None:
+                kesme = command.kesme_hizi_target
+            if command.inme_hizi_target is not None:
+                inme = command.inme_hizi_target
+
+    asyncio.run(drive())
+    return commands
+
+
+def test_simulation_matches_controller_per_setting():
+    config = _config()
+    base = base_parameters(config['ml'])
+    base['tg_delay'] = 0.0
+    grid = build_grid(base, {
+        'katsayi': [1.0, 0.6],
+        'inme_threshold': [1.0, 0.0],
+        'tg_threshold': [15.0, 1000.0],
+    })
+    settings = SimulationSettings.from_config(config)
+    settings.min_update_interval = 0.0
+
+    cut = _recorded_cut()
+    result = simulate_cut(cut, grid, settings, keep_traces=True)
+    assert (result.tg_step >= 0).any() and (result.tg_step < 0).any()
+
+    for g in range(grid_size(grid)):
+        params = {name: float(grid[name][g]) for name in GRID_PARAMETERS}
+        expected = _controller_commands(cut, params)
+
+        kesme = [None if np.isnan(v) else v for v in result.kesme_targets[:, g].tolist()]
+        inme = [None if np.isnan(v) else v for v in result.inme_targets[:, g].tolist()]
+        np.testing.assert_allclose(
+            [np.nan if v is None else v for _, v, _ in expected],
+            [np.nan if v is None else v for v in kesme],
+            rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            [np.nan if v is None else v for _, _, v in expected],
+            [np.nan if v is None else v for v in inme],
+            rtol=1e-6
+        )
+        assert result.commands[g] == sum(source is not None for source, _, _ in expected)
+        tg_steps = [i for i, (source, _, _) in enumerate(expected) if source == "torque_guard"]
+        assert tg_steps == ([int(result.tg_step[g])] if result.tg_step[g] >= 0 else [])
+
+
+def test_build_grid_product_and_validation():
+    base = base_parameters(_config()['ml'])
+    grid = build_grid(base, {'katsayi': [0.8, 1.0, 1.2], 'tg_threshold': [30, 40]})
+    assert grid_size(grid) == 6
+    assert grid['katsayi'].tolist() == [0.8, 0.8, 1.0, 1.0, 1.2, 1.2]
+    assert set(grid['tg_delay']) == {base['tg_delay']}
+
+    assert grid_size(build_grid(base, {})) == 1
+    with pytest.raises(ValueError):
+        build_grid(base, {'unknown': [1.0]})
+
+
+def test_first_exceeding():
+    series = np.array([np.nan, 10.0, 35.0, np.nan, 60.0])
+    assert first_exceeding(series, np.array([5.0, 30.0, 50.0, 100.0])).tolist() == [1, 2, 4, -1]
+
+
+def test_run_grid_over_databases(tmp_path):
+    total_db, ml_db = make_synthetic_databases(tmp_path, cuts=3, duration_s=30.0)
+    config = _config()
+    grid = build_grid(base_parameters(config['ml']), {'katsayi': [0.5, 1.0], 'inme_threshold': [0.5, 1.5]})
+    settings = SimulationSettings.from_config(config)
+
+    traces_dir = tmp_path / "traces"
+    report = run_grid(total_db, ml_db, [1, 2, 3, 99], grid, settings, processes=1, traces_dir=traces_dir)
+    assert report.cuts == 3
+    assert report.skipped_cuts == [99]
+    assert sorted(p.name for p in traces_dir.iterdir()) == ['kesim_1.npz', 'kesim_2.npz', 'kesim_3.npz']
+    with np.load(traces_dir / "kesim_1.npz") as traces:
+        assert traces['kesme_targets'].shape[1] == grid_size(grid)
+
+    rows = report.rows()
+    assert len(rows) == 4
+    assert all(row['commands'] > 0 for row in rows)
+    # Lower inme threshold writes inme at least as often
+    by_key = {(row['katsayi'], row['inme_threshold']): row for row in rows}
+    assert by_key[(1.0, 0.5)]['inme_writes'] >= by_key[(1.0, 1.5)]['inme_writes']
+
+    pooled = run_grid(total_db, ml_db, [1, 2, 3, 99], grid, settings, processes=2)
+    for name in ('commands', 'kesme_writes', 'inme_writes', 'tg_triggers'):
+        assert pooled.totals[name].tolist() == report.totals[name].tolist()
+    np.testing.assert_allclose(pooled.totals['mean_inme_hizi'], report.totals['mean_inme_hizi'])